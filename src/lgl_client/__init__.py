@@ -3,102 +3,467 @@
 A modular, type-safe Python library for the Little Green Light (LGL) REST API.
 """
 
-from .lgl_api import LGLClient
-from .lgl_api.categories import CategoriesAPI
-from .lgl_api.appeals import AppealsAPI
-from .lgl_api.campaigns import CampaignsAPI
-from .lgl_api.events import EventsAPI
-from .lgl_api.funds import FundsAPI
-from .lgl_api.groups import GroupsAPI
-from .lgl_api.gift_types import GiftTypesAPI
-from .lgl_api.gift_categories import GiftCategoriesAPI
-from .lgl_api.payment_types import PaymentTypesAPI
-from .lgl_api.membership_levels import MembershipLevelsAPI
-from .lgl_api.relationship_types import RelationshipTypesAPI
-from .lgl_api.class_affiliation_types import ClassAffiliationTypesAPI
-from .lgl_api.team_members import TeamMembersAPI
-from .lgl_api.keywords import KeywordsAPI
-from .lgl_api.types import TypesAPI
-from .lgl_api.mailing_templates import MailingTemplatesAPI
-from .lgl_api.custom_attributes import CustomAttributesAPI
-from .lgl_api.invitations import InvitationsAPI
-from .lgl_api.constituents import ConstituentsAPI
-from .lgl_api.email_addresses import EmailAddressesAPI
-from .lgl_api.phone_numbers import PhoneNumbersAPI
-from .lgl_api.street_addresses import StreetAddressesAPI
-from .lgl_api.web_addresses import WebAddressesAPI
-from .lgl_api.notes import NotesAPI
-from .lgl_api.volunteer_times import VolunteerTimesAPI
-from .lgl_api.memberships import MembershipsAPI
-from .lgl_api.group_memberships import GroupMembershipsAPI
-from .lgl_api.class_affiliations import ClassAffiliationsAPI
-from .lgl_api.appeal_requests import AppealRequestsAPI
-from .lgl_api.gifts import GiftsAPI
-from .lgl_api.constituent_relationships import ConstituentRelationshipsAPI
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import httpx
+
+from .lgl_api import (
+    AsyncLGLClient,
+    DiskBackend,
+    EntityCache,
+    FileTokenBucket,
+    LGLClient,
+    MemoryBackend,
+    MetricsCollector,
+    PageSizeTuner,
+    RateLimiter,
+    ReferenceCache,
+    RequestEvent,
+    ResponseCache,
+    RetryPolicy,
+    TokenBucket,
+)
+from .lgl_api.decoding import JSONDecoder
+from .lgl_api.metrics import EventHook
+
+if TYPE_CHECKING:
+    from .bulk import AsyncBulkWriter, BulkReport, BulkWriter, Checkpoint, WriteResult
+    from .lgl_api.gift_query import GiftFilter, GiftQueryPlan
+    from .lgl_api.search_query import SearchQuery
+    from .lgl_api.categories import CategoriesAPI, AsyncCategoriesAPI
+    from .lgl_api.appeals import AppealsAPI, AsyncAppealsAPI
+    from .lgl_api.campaigns import CampaignsAPI, AsyncCampaignsAPI
+    from .lgl_api.events import EventsAPI, AsyncEventsAPI
+    from .lgl_api.funds import FundsAPI, AsyncFundsAPI
+    from .lgl_api.groups import GroupsAPI, AsyncGroupsAPI
+    from .lgl_api.gift_types import GiftTypesAPI, AsyncGiftTypesAPI
+    from .lgl_api.gift_categories import GiftCategoriesAPI, AsyncGiftCategoriesAPI
+    from .lgl_api.payment_types import PaymentTypesAPI, AsyncPaymentTypesAPI
+    from .lgl_api.membership_levels import MembershipLevelsAPI, AsyncMembershipLevelsAPI
+    from .lgl_api.relationship_types import RelationshipTypesAPI, AsyncRelationshipTypesAPI
+    from .lgl_api.class_affiliation_types import ClassAffiliationTypesAPI, AsyncClassAffiliationTypesAPI
+    from .lgl_api.team_members import TeamMembersAPI, AsyncTeamMembersAPI
+    from .lgl_api.keywords import KeywordsAPI, AsyncKeywordsAPI
+    from .lgl_api.types import TypesAPI, AsyncTypesAPI
+    from .lgl_api.mailing_templates import MailingTemplatesAPI, AsyncMailingTemplatesAPI
+    from .lgl_api.custom_attributes import CustomAttributesAPI, AsyncCustomAttributesAPI
+    from .lgl_api.invitations import InvitationsAPI, AsyncInvitationsAPI
+    from .lgl_api.constituents import ConstituentsAPI, AsyncConstituentsAPI
+    from .lgl_api.email_addresses import EmailAddressesAPI, AsyncEmailAddressesAPI
+    from .lgl_api.phone_numbers import PhoneNumbersAPI, AsyncPhoneNumbersAPI
+    from .lgl_api.street_addresses import StreetAddressesAPI, AsyncStreetAddressesAPI
+    from .lgl_api.web_addresses import WebAddressesAPI, AsyncWebAddressesAPI
+    from .lgl_api.notes import NotesAPI, AsyncNotesAPI
+    from .lgl_api.volunteer_times import VolunteerTimesAPI, AsyncVolunteerTimesAPI
+    from .lgl_api.memberships import MembershipsAPI, AsyncMembershipsAPI
+    from .lgl_api.group_memberships import GroupMembershipsAPI, AsyncGroupMembershipsAPI
+    from .lgl_api.class_affiliations import ClassAffiliationsAPI, AsyncClassAffiliationsAPI
+    from .lgl_api.appeal_requests import AppealRequestsAPI, AsyncAppealRequestsAPI
+    from .lgl_api.gifts import GiftsAPI, AsyncGiftsAPI
+    from .lgl_api.constituent_relationships import ConstituentRelationshipsAPI, AsyncConstituentRelationshipsAPI
 
 __version__ = "0.1.0"
 
-def new_client(api_key: str, *, timeout: float = 10.0, debug: bool = False) -> "LGL":
+# Resource attribute -> (lgl_api module, API class, shares the reference cache).
+# LGL and AsyncLGL import the module and create the API on first access.
+_RESOURCES: Dict[str, Tuple[str, str, bool]] = {
+    "categories": ("categories", "CategoriesAPI", True),
+    "appeals": ("appeals", "AppealsAPI", True),
+    "campaigns": ("campaigns", "CampaignsAPI", True),
+    "events": ("events", "EventsAPI", True),
+    "funds": ("funds", "FundsAPI", True),
+    "groups": ("groups", "GroupsAPI", True),
+    "gift_types": ("gift_types", "GiftTypesAPI", True),
+    "gift_categories": ("gift_categories", "GiftCategoriesAPI", True),
+    "payment_types": ("payment_types", "PaymentTypesAPI", True),
+    "membership_levels": ("membership_levels", "MembershipLevelsAPI", True),
+    "relationship_types": ("relationship_types", "RelationshipTypesAPI", True),
+    "class_affiliation_types": ("class_affiliation_types", "ClassAffiliationTypesAPI", True),
+    "team_members": ("team_members", "TeamMembersAPI", False),
+    "keywords": ("keywords", "KeywordsAPI", False),
+    "types": ("types", "TypesAPI", True),
+    "mailing_templates": ("mailing_templates", "MailingTemplatesAPI", False),
+    "custom_attributes": ("custom_attributes", "CustomAttributesAPI", False),
+    "invitations": ("invitations", "InvitationsAPI", False),
+    "constituents": ("constituents", "ConstituentsAPI", False),
+    "email_addresses": ("email_addresses", "EmailAddressesAPI", False),
+    "phone_numbers": ("phone_numbers", "PhoneNumbersAPI", False),
+    "street_addresses": ("street_addresses", "StreetAddressesAPI", False),
+    "web_addresses": ("web_addresses", "WebAddressesAPI", False),
+    "notes": ("notes", "NotesAPI", False),
+    "volunteer_times": ("volunteer_times", "VolunteerTimesAPI", False),
+    "memberships": ("memberships", "MembershipsAPI", False),
+    "group_memberships": ("group_memberships", "GroupMembershipsAPI", False),
+    "class_affiliations": ("class_affiliations", "ClassAffiliationsAPI", False),
+    "appeal_requests": ("appeal_requests", "AppealRequestsAPI", False),
+    "gifts": ("gifts", "GiftsAPI", False),
+    "constituent_relationships": ("constituent_relationships", "ConstituentRelationshipsAPI", False),
+}
+
+# Exports whose modules build pydantic models, imported on first access
+_LAZY: Dict[str, str] = {
+    "GiftFilter": ".lgl_api.gift_query",
+    "GiftQueryPlan": ".lgl_api.gift_query",
+    "SearchQuery": ".lgl_api.search_query",
+    "BulkWriter": ".bulk",
+    "AsyncBulkWriter": ".bulk",
+    "BulkReport": ".bulk",
+    "WriteResult": ".bulk",
+    "Checkpoint": ".bulk",
+    "CategoriesAPI": ".lgl_api.categories",
+    "AsyncCategoriesAPI": ".lgl_api.categories",
+    "AppealsAPI": ".lgl_api.appeals",
+    "AsyncAppealsAPI": ".lgl_api.appeals",
+    "CampaignsAPI": ".lgl_api.campaigns",
+    "AsyncCampaignsAPI": ".lgl_api.campaigns",
+    "EventsAPI": ".lgl_api.events",
+    "AsyncEventsAPI": ".lgl_api.events",
+    "FundsAPI": ".lgl_api.funds",
+    "AsyncFundsAPI": ".lgl_api.funds",
+    "GroupsAPI": ".lgl_api.groups",
+    "AsyncGroupsAPI": ".lgl_api.groups",
+    "GiftTypesAPI": ".lgl_api.gift_types",
+    "AsyncGiftTypesAPI": ".lgl_api.gift_types",
+    "GiftCategoriesAPI": ".lgl_api.gift_categories",
+    "AsyncGiftCategoriesAPI": ".lgl_api.gift_categories",
+    "PaymentTypesAPI": ".lgl_api.payment_types",
+    "AsyncPaymentTypesAPI": ".lgl_api.payment_types",
+    "MembershipLevelsAPI": ".lgl_api.membership_levels",
+    "AsyncMembershipLevelsAPI": ".lgl_api.membership_levels",
+    "RelationshipTypesAPI": ".lgl_api.relationship_types",
+    "AsyncRelationshipTypesAPI": ".lgl_api.relationship_types",
+    "ClassAffiliationTypesAPI": ".lgl_api.class_affiliation_types",
+    "AsyncClassAffiliationTypesAPI": ".lgl_api.class_affiliation_types",
+    "TeamMembersAPI": ".lgl_api.team_members",
+    "AsyncTeamMembersAPI": ".lgl_api.team_members",
+    "KeywordsAPI": ".lgl_api.keywords",
+    "AsyncKeywordsAPI": ".lgl_api.keywords",
+    "TypesAPI": ".lgl_api.types",
+    "AsyncTypesAPI": ".lgl_api.types",
+    "MailingTemplatesAPI": ".lgl_api.mailing_templates",
+    "AsyncMailingTemplatesAPI": ".lgl_api.mailing_templates",
+    "CustomAttributesAPI": ".lgl_api.custom_attributes",
+    "AsyncCustomAttributesAPI": ".lgl_api.custom_attributes",
+    "InvitationsAPI": ".lgl_api.invitations",
+    "AsyncInvitationsAPI": ".lgl_api.invitations",
+    "ConstituentsAPI": ".lgl_api.constituents",
+    "AsyncConstituentsAPI": ".lgl_api.constituents",
+    "EmailAddressesAPI": ".lgl_api.email_addresses",
+    "AsyncEmailAddressesAPI": ".lgl_api.email_addresses",
+    "PhoneNumbersAPI": ".lgl_api.phone_numbers",
+    "AsyncPhoneNumbersAPI": ".lgl_api.phone_numbers",
+    "StreetAddressesAPI": ".lgl_api.street_addresses",
+    "AsyncStreetAddressesAPI": ".lgl_api.street_addresses",
+    "WebAddressesAPI": ".lgl_api.web_addresses",
+    "AsyncWebAddressesAPI": ".lgl_api.web_addresses",
+    "NotesAPI": ".lgl_api.notes",
+    "AsyncNotesAPI": ".lgl_api.notes",
+    "VolunteerTimesAPI": ".lgl_api.volunteer_times",
+    "AsyncVolunteerTimesAPI": ".lgl_api.volunteer_times",
+    "MembershipsAPI": ".lgl_api.memberships",
+    "AsyncMembershipsAPI": ".lgl_api.memberships",
+    "GroupMembershipsAPI": ".lgl_api.group_memberships",
+    "AsyncGroupMembershipsAPI": ".lgl_api.group_memberships",
+    "ClassAffiliationsAPI": ".lgl_api.class_affiliations",
+    "AsyncClassAffiliationsAPI": ".lgl_api.class_affiliations",
+    "AppealRequestsAPI": ".lgl_api.appeal_requests",
+    "AsyncAppealRequestsAPI": ".lgl_api.appeal_requests",
+    "GiftsAPI": ".lgl_api.gifts",
+    "AsyncGiftsAPI": ".lgl_api.gifts",
+    "ConstituentRelationshipsAPI": ".lgl_api.constituent_relationships",
+    "AsyncConstituentRelationshipsAPI": ".lgl_api.constituent_relationships",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+def _resource(lgl: Any, name: str, prefix: str) -> Any:
+    """Create (once) the API object behind a resource attribute of LGL or AsyncLGL."""
+    spec = _RESOURCES.get(name)
+    if spec is None:
+        raise AttributeError(f"{type(lgl).__name__!r} object has no attribute {name!r}")
+    module, class_name, shares_cache = spec
+    api_class = getattr(
+        importlib.import_module(f".lgl_api.{module}", __name__), prefix + class_name
+    )
+    state = lgl.__dict__
+    if shares_cache:
+        api = api_class(state["_client"], state["_reference_cache"])
+    else:
+        api = api_class(state["_client"])
+    # setdefault keeps one instance when threads race on first access
+    return state.setdefault(name, api)
+
+
+def new_client(
+    api_key: str,
+    *,
+    timeout: Union[float, httpx.Timeout] = 10.0,
+    connect_timeout: Optional[float] = None,
+    debug: bool = False,
+    page_concurrency: int = 1,
+    page_prefetch: int = 0,
+    retry: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = False,
+    transport: Any = None,
+    trusted_models: bool = False,
+    reference_cache: Optional[ReferenceCache] = None,
+    event_hooks: Optional[Sequence[EventHook]] = None,
+    json_decoder: Union[str, JSONDecoder, None] = None,
+    coalesce_requests: bool = False,
+    response_cache: Optional[ResponseCache] = None,
+    entity_cache: Optional[EntityCache] = None,
+    page_size_tuner: Optional[PageSizeTuner] = None,
+) -> "LGL":
     """Create a new LGL API client instance.
     
     Args:
         api_key: LGL API bearer token
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds, or a full ``httpx.Timeout``
+        connect_timeout: Separate connect timeout in seconds
         debug: Enable debug mode to log request details
+        page_concurrency: Default number of pages fetched in parallel by
+            ``fetch_all``-style helpers on paginated resources
+        page_prefetch: Pages fetched by a background thread (or task) ahead
+            of the code consuming ``iter_*``/``fetch_all`` results, so network
+            waits overlap per-item work (default: 0, no prefetching)
+        retry: Retry policy for 429/5xx responses and transport errors
+            (default: no retries)
+        rate_limiter: Client-side rate limiter, e.g. ``TokenBucket(rate=5)``
+            or a ``FileTokenBucket`` shared by several worker processes
+        limits: ``httpx.Limits`` for the connection pool (default: sized
+            for ``page_concurrency``)
+        http2: Enable HTTP/2 (requires ``pip install lgl-client[http2]``);
+            ``page_concurrency`` and per-call ``concurrency`` must then be 1,
+            otherwise ValueError is raised (use :func:`new_async_client`)
+        transport: Custom httpx transport
+        trusted_models: Skip validation when bulk-loading gifts and
+            constituents (``fetch_all``/``iter_all``/searches); the payload is
+            trusted to be well formed
+        reference_cache: Opt-in cache for lookup resources such as funds,
+            campaigns or payment types
+        event_hooks: Callables receiving a ``RequestEvent`` after every
+            request, e.g. a ``MetricsCollector``
+        json_decoder: Response decoder: ``"stdlib"`` (default), ``"orjson"``
+            (``lgl-client[fast-json]``), ``"pydantic"`` (bulk reads validate
+            pages straight from the response bytes), ``"auto"`` or a callable
+        coalesce_requests: Let identical GETs issued concurrently, e.g.
+            ``retrieve`` of the same ID from several threads, share one request
+        response_cache: Opt-in ``ResponseCache`` for GET responses,
+            revalidated with ``ETag``/``Last-Modified`` or kept for a short TTL
+        entity_cache: Opt-in ``EntityCache`` of single records: ``retrieve``
+            reads through it, creates and updates store the returned record
+            and deletes evict it; shared by every resource of the client
+        page_size_tuner: Opt-in ``PageSizeTuner`` choosing the page size of
+            ``fetch_all``/``iter_*`` reads per endpoint from observed latency
+            and payload size (default: 100 items per page)
         
     Returns:
         LGL client instance with all API resources
     """
-    base_client = LGLClient(api_key, timeout=timeout, debug=debug)
-    return LGL(base_client)
+    base_client = LGLClient(
+        api_key,
+        timeout=timeout,
+        connect_timeout=connect_timeout,
+        debug=debug,
+        page_concurrency=page_concurrency,
+        page_prefetch=page_prefetch,
+        retry=retry,
+        rate_limiter=rate_limiter,
+        limits=limits,
+        http2=http2,
+        transport=transport,
+        trusted_models=trusted_models,
+        event_hooks=event_hooks,
+        json_decoder=json_decoder,
+        coalesce_requests=coalesce_requests,
+        response_cache=response_cache,
+        entity_cache=entity_cache,
+        page_size_tuner=page_size_tuner,
+    )
+    return LGL(base_client, reference_cache=reference_cache)
+
+
+def new_async_client(
+    api_key: str,
+    *,
+    timeout: Union[float, httpx.Timeout] = 10.0,
+    connect_timeout: Optional[float] = None,
+    debug: bool = False,
+    page_concurrency: int = 1,
+    page_prefetch: int = 0,
+    retry: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = False,
+    transport: Any = None,
+    trusted_models: bool = False,
+    reference_cache: Optional[ReferenceCache] = None,
+    event_hooks: Optional[Sequence[EventHook]] = None,
+    json_decoder: Union[str, JSONDecoder, None] = None,
+    coalesce_requests: bool = False,
+    response_cache: Optional[ResponseCache] = None,
+    entity_cache: Optional[EntityCache] = None,
+    page_size_tuner: Optional[PageSizeTuner] = None,
+) -> "AsyncLGL":
+    """Create a new asynchronous LGL API client instance.
+    
+    Args:
+        api_key: LGL API bearer token
+        timeout: Request timeout in seconds, or a full ``httpx.Timeout``
+        connect_timeout: Separate connect timeout in seconds
+        debug: Enable debug mode to log request details
+        page_concurrency: Default number of pages fetched in parallel by
+            ``fetch_all``-style helpers on paginated resources
+        page_prefetch: Pages fetched by a background thread (or task) ahead
+            of the code consuming ``iter_*``/``fetch_all`` results, so network
+            waits overlap per-item work (default: 0, no prefetching)
+        retry: Retry policy for 429/5xx responses and transport errors
+            (default: no retries)
+        rate_limiter: Client-side rate limiter, e.g. ``TokenBucket(rate=5)``
+            or a ``FileTokenBucket`` shared by several worker processes
+        limits: ``httpx.Limits`` for the connection pool (default: sized
+            for ``page_concurrency``)
+        http2: Enable HTTP/2 (requires ``pip install lgl-client[http2]``)
+        transport: Custom httpx transport
+        trusted_models: Skip validation when bulk-loading gifts and
+            constituents (``fetch_all``/``iter_all``/searches); the payload is
+            trusted to be well formed
+        reference_cache: Opt-in cache for lookup resources such as funds,
+            campaigns or payment types
+        event_hooks: Callables receiving a ``RequestEvent`` after every
+            request, e.g. a ``MetricsCollector``
+        json_decoder: Response decoder: ``"stdlib"`` (default), ``"orjson"``
+            (``lgl-client[fast-json]``), ``"pydantic"`` (bulk reads validate
+            pages straight from the response bytes), ``"auto"`` or a callable
+        coalesce_requests: Let identical GETs issued concurrently, e.g.
+            ``retrieve`` of the same ID from several threads, share one request
+        response_cache: Opt-in ``ResponseCache`` for GET responses,
+            revalidated with ``ETag``/``Last-Modified`` or kept for a short TTL
+        entity_cache: Opt-in ``EntityCache`` of single records: ``retrieve``
+            reads through it, creates and updates store the returned record
+            and deletes evict it; shared by every resource of the client
+        page_size_tuner: Opt-in ``PageSizeTuner`` choosing the page size of
+            ``fetch_all``/``iter_*`` reads per endpoint from observed latency
+            and payload size (default: 100 items per page)
+        
+    Returns:
+        AsyncLGL client instance with all API resources
+    """
+    base_client = AsyncLGLClient(
+        api_key,
+        timeout=timeout,
+        connect_timeout=connect_timeout,
+        debug=debug,
+        page_concurrency=page_concurrency,
+        page_prefetch=page_prefetch,
+        retry=retry,
+        rate_limiter=rate_limiter,
+        limits=limits,
+        http2=http2,
+        transport=transport,
+        trusted_models=trusted_models,
+        event_hooks=event_hooks,
+        json_decoder=json_decoder,
+        coalesce_requests=coalesce_requests,
+        response_cache=response_cache,
+        entity_cache=entity_cache,
+        page_size_tuner=page_size_tuner,
+    )
+    return AsyncLGL(base_client, reference_cache=reference_cache)
 
 
 class LGL:
     """Main LGL API client aggregating all resource APIs.
     
-    This class will be updated as we implement each resource API.
+    Resource APIs such as ``client.gifts`` are created, and their modules
+    imported, on first access.
     """
     
-    def __init__(self, client: LGLClient) -> None:
+    # Resource APIs, created by __getattr__ on first access
+    categories: "CategoriesAPI"
+    appeals: "AppealsAPI"
+    campaigns: "CampaignsAPI"
+    events: "EventsAPI"
+    funds: "FundsAPI"
+    groups: "GroupsAPI"
+    gift_types: "GiftTypesAPI"
+    gift_categories: "GiftCategoriesAPI"
+    payment_types: "PaymentTypesAPI"
+    membership_levels: "MembershipLevelsAPI"
+    relationship_types: "RelationshipTypesAPI"
+    class_affiliation_types: "ClassAffiliationTypesAPI"
+    team_members: "TeamMembersAPI"
+    keywords: "KeywordsAPI"
+    types: "TypesAPI"
+    mailing_templates: "MailingTemplatesAPI"
+    custom_attributes: "CustomAttributesAPI"
+    invitations: "InvitationsAPI"
+    constituents: "ConstituentsAPI"
+    email_addresses: "EmailAddressesAPI"
+    phone_numbers: "PhoneNumbersAPI"
+    street_addresses: "StreetAddressesAPI"
+    web_addresses: "WebAddressesAPI"
+    notes: "NotesAPI"
+    volunteer_times: "VolunteerTimesAPI"
+    memberships: "MembershipsAPI"
+    group_memberships: "GroupMembershipsAPI"
+    class_affiliations: "ClassAffiliationsAPI"
+    appeal_requests: "AppealRequestsAPI"
+    gifts: "GiftsAPI"
+    constituent_relationships: "ConstituentRelationshipsAPI"
+    
+    def __init__(
+        self, client: LGLClient, *, reference_cache: Optional[ReferenceCache] = None
+    ) -> None:
         """Initialize LGL client.
         
         Args:
             client: Base HTTP client instance
+            reference_cache: Cache shared by the lookup resources (default: none)
         """
         self._client = client
-        
-        # Resource APIs
-        self.categories = CategoriesAPI(client)
-        self.appeals = AppealsAPI(client)
-        self.campaigns = CampaignsAPI(client)
-        self.events = EventsAPI(client)
-        self.funds = FundsAPI(client)
-        self.groups = GroupsAPI(client)
-        self.gift_types = GiftTypesAPI(client)
-        self.gift_categories = GiftCategoriesAPI(client)
-        self.payment_types = PaymentTypesAPI(client)
-        self.membership_levels = MembershipLevelsAPI(client)
-        self.relationship_types = RelationshipTypesAPI(client)
-        self.class_affiliation_types = ClassAffiliationTypesAPI(client)
-        self.team_members = TeamMembersAPI(client)
-        self.keywords = KeywordsAPI(client)
-        self.types = TypesAPI(client)
-        self.mailing_templates = MailingTemplatesAPI(client)
-        self.custom_attributes = CustomAttributesAPI(client)
-        self.invitations = InvitationsAPI(client)
-        self.constituents = ConstituentsAPI(client)
-        self.email_addresses = EmailAddressesAPI(client)
-        self.phone_numbers = PhoneNumbersAPI(client)
-        self.street_addresses = StreetAddressesAPI(client)
-        self.web_addresses = WebAddressesAPI(client)
-        self.notes = NotesAPI(client)
-        self.volunteer_times = VolunteerTimesAPI(client)
-        self.memberships = MembershipsAPI(client)
-        self.group_memberships = GroupMembershipsAPI(client)
-        self.class_affiliations = ClassAffiliationsAPI(client)
-        self.appeal_requests = AppealRequestsAPI(client)
-        self.gifts = GiftsAPI(client)
-        self.constituent_relationships = ConstituentRelationshipsAPI(client)
+        self._reference_cache = reference_cache
+        self._bulk: Optional["BulkWriter"] = None
+    
+    def __getattr__(self, name: str) -> Any:
+        return _resource(self, name, "")
+    
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(_RESOURCES))
+    
+    @property
+    def reference_cache(self) -> Optional[ReferenceCache]:
+        """Reference-data cache used by lookup resources, if enabled."""
+        return self._reference_cache
+    
+    @property
+    def entity_cache(self) -> Optional[EntityCache]:
+        """Record cache shared by every resource's ``retrieve``, if enabled."""
+        return self._client.entity_cache
+    
+    @property
+    def bulk(self) -> "BulkWriter":
+        """Concurrent bulk creates and updates with per-row results."""
+        if self._bulk is None:
+            from .bulk import BulkWriter
+            
+            self._bulk = BulkWriter(self)
+        return self._bulk
     
     def close(self) -> None:
         """Close the underlying HTTP client."""
@@ -113,9 +478,123 @@ class LGL:
         self.close()
 
 
+class AsyncLGL:
+    """Asynchronous counterpart of :class:`LGL` aggregating all resource APIs.
+    
+    Every resource method is awaitable and every ``iter_*`` method is an
+    async iterator.
+    """
+    
+    # Resource APIs, created by __getattr__ on first access
+    categories: "AsyncCategoriesAPI"
+    appeals: "AsyncAppealsAPI"
+    campaigns: "AsyncCampaignsAPI"
+    events: "AsyncEventsAPI"
+    funds: "AsyncFundsAPI"
+    groups: "AsyncGroupsAPI"
+    gift_types: "AsyncGiftTypesAPI"
+    gift_categories: "AsyncGiftCategoriesAPI"
+    payment_types: "AsyncPaymentTypesAPI"
+    membership_levels: "AsyncMembershipLevelsAPI"
+    relationship_types: "AsyncRelationshipTypesAPI"
+    class_affiliation_types: "AsyncClassAffiliationTypesAPI"
+    team_members: "AsyncTeamMembersAPI"
+    keywords: "AsyncKeywordsAPI"
+    types: "AsyncTypesAPI"
+    mailing_templates: "AsyncMailingTemplatesAPI"
+    custom_attributes: "AsyncCustomAttributesAPI"
+    invitations: "AsyncInvitationsAPI"
+    constituents: "AsyncConstituentsAPI"
+    email_addresses: "AsyncEmailAddressesAPI"
+    phone_numbers: "AsyncPhoneNumbersAPI"
+    street_addresses: "AsyncStreetAddressesAPI"
+    web_addresses: "AsyncWebAddressesAPI"
+    notes: "AsyncNotesAPI"
+    volunteer_times: "AsyncVolunteerTimesAPI"
+    memberships: "AsyncMembershipsAPI"
+    group_memberships: "AsyncGroupMembershipsAPI"
+    class_affiliations: "AsyncClassAffiliationsAPI"
+    appeal_requests: "AsyncAppealRequestsAPI"
+    gifts: "AsyncGiftsAPI"
+    constituent_relationships: "AsyncConstituentRelationshipsAPI"
+    
+    def __init__(
+        self, client: AsyncLGLClient, *, reference_cache: Optional[ReferenceCache] = None
+    ) -> None:
+        """Initialize async LGL client.
+        
+        Args:
+            client: Async base HTTP client instance
+            reference_cache: Cache shared by the lookup resources (default: none)
+        """
+        self._client = client
+        self._reference_cache = reference_cache
+        self._bulk: Optional["AsyncBulkWriter"] = None
+    
+    def __getattr__(self, name: str) -> Any:
+        return _resource(self, name, "Async")
+    
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(_RESOURCES))
+    
+    @property
+    def reference_cache(self) -> Optional[ReferenceCache]:
+        """Reference-data cache used by lookup resources, if enabled."""
+        return self._reference_cache
+    
+    @property
+    def entity_cache(self) -> Optional[EntityCache]:
+        """Record cache shared by every resource's ``retrieve``, if enabled."""
+        return self._client.entity_cache
+    
+    @property
+    def bulk(self) -> "AsyncBulkWriter":
+        """Concurrent bulk creates and updates with per-row results."""
+        if self._bulk is None:
+            from .bulk import AsyncBulkWriter
+            
+            self._bulk = AsyncBulkWriter(self)
+        return self._bulk
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.close()
+    
+    async def __aenter__(self) -> "AsyncLGL":
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+
 __all__ = [
     "new_client",
+    "new_async_client",
     "LGL", 
+    "AsyncLGL",
     "LGLClient",
+    "AsyncLGLClient",
+    "RetryPolicy",
+    "RateLimiter",
+    "TokenBucket",
+    "FileTokenBucket",
+    "ReferenceCache",
+    "MemoryBackend",
+    "DiskBackend",
+    "ResponseCache",
+    "EntityCache",
+    "PageSizeTuner",
+    "MetricsCollector",
+    "RequestEvent",
+    "GiftFilter",
+    "GiftQueryPlan",
+    "SearchQuery",
+    "BulkWriter",
+    "AsyncBulkWriter",
+    "BulkReport",
+    "WriteResult",
+    "Checkpoint",
     "__version__",
 ]
\ No newline at end of file
@@ -0,0 +1,551 @@
+"""Bulk creates and updates with per-row results.
+
+:class:`BulkWriter` sends many independent writes (one POST or PATCH per
+row) through a bounded pool of workers. Every request still passes the
+client's rate limiter and retry policy. A failing row does not stop the run;
+it is reported with its error::
+
+    client = new_client(api_key, page_concurrency=8, rate_limiter=TokenBucket(rate=5))
+    report = client.bulk.create_gifts(rows, checkpoint="gifts.ckpt")
+    print(report.summary())
+    for failure in report.failures:
+        print(failure.index, failure.error)
+
+With a checkpoint file, every successful write is appended to the file as
+soon as it completes. Rerunning the same import skips those rows, so an
+interrupted or partly failed run is resumed by running it again. Rows are
+identified by their position unless ``key`` derives a stable identifier,
+e.g. ``key=lambda row: row["external_gift_id"]``.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import httpx
+
+from .lgl_api.exceptions import LGLAPIError, UnauthorizedError
+
+if TYPE_CHECKING:
+    from . import LGL, AsyncLGL
+
+# Errors that fail one row; anything else (including 401) aborts the run
+_ROW_ERRORS = (LGLAPIError, httpx.HTTPError, ValueError)
+
+Row = Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class WriteResult:
+    """Outcome of one row.
+
+    Attributes:
+        index: Position of the row in the input
+        key: Checkpoint key of the row
+        value: Object returned by the write (``None`` for skipped rows and
+            writes without a response body)
+        error: Exception raised by the write, if it failed
+        skipped: Row was already written according to the checkpoint
+    """
+
+    index: int
+    key: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the row is written (now or in an earlier run)."""
+        return self.error is None
+
+
+@dataclass
+class BulkReport:
+    """Results of a bulk run, in input order.
+
+    Attributes:
+        operation: Name of the bulk operation
+        results: One result per input row
+        elapsed: Wall-clock duration of the run in seconds
+    """
+
+    operation: str
+    results: List[WriteResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        """Rows written in this run."""
+        return sum(1 for result in self.results if result.ok and not result.skipped)
+
+    @property
+    def skipped(self) -> int:
+        """Rows skipped because the checkpoint records them as written."""
+        return sum(1 for result in self.results if result.skipped)
+
+    @property
+    def failures(self) -> List[WriteResult]:
+        """Rows whose write failed."""
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def throughput(self) -> float:
+        """Writes attempted per second (skipped rows excluded)."""
+        attempted = len(self.results) - self.skipped
+        return attempted / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line summary with counts and throughput."""
+        return (
+            f"{self.operation}: {self.succeeded} written, {len(self.failures)} failed, "
+            f"{self.skipped} skipped in {self.elapsed:.1f}s "
+            f"({self.throughput:.1f} rows/s)"
+        )
+
+
+class Checkpoint:
+    """Append-only JSON-lines file recording the rows already written.
+
+    Each line holds the operation, the row key and the ID of the record the
+    write returned. A line cut short by a crash is ignored on load.
+
+    Args:
+        path: File to read and append to (created on first write)
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _token(key: Any) -> str:
+        return json.dumps(key, sort_keys=True)
+
+    def load(self, operation: str) -> Dict[str, Any]:
+        """IDs of the rows written by ``operation``, by serialized key."""
+        done: Dict[str, Any] = {}
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry.get("op") == operation:
+                        done[self._token(entry["key"])] = entry.get("id")
+        except FileNotFoundError:
+            pass
+        return done
+
+    def record(self, operation: str, key: Any, record_id: Any) -> None:
+        """Append one written row."""
+        line = json.dumps({"op": operation, "key": key, "id": record_id}, sort_keys=True)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+
+
+def _require(row: Row, name: str) -> Any:
+    try:
+        return row[name]
+    except (KeyError, TypeError):
+        raise ValueError(f"Row is missing {name!r}") from None
+
+
+def _split(row: Row, name: str) -> Tuple[Any, Row]:
+    """Separate the path ID from the request body."""
+    value = _require(row, name)
+    data = dict(row)
+    del data[name]
+    return value, data
+
+
+class _Run:
+    """State shared by the workers of one bulk run."""
+
+    def __init__(
+        self,
+        operation: str,
+        rows: Iterable[Row],
+        key: Optional[Callable[[Row], Any]],
+        checkpoint: Optional[Checkpoint],
+        on_result: Optional[Callable[[WriteResult], None]],
+    ) -> None:
+        self.operation = operation
+        self.key = key
+        self.checkpoint = checkpoint
+        self.on_result = on_result
+        self.done = checkpoint.load(operation) if checkpoint is not None else {}
+        self.results: List[WriteResult] = []
+        self._rows: Iterator[Tuple[int, Row]] = enumerate(rows)
+        self._lock = threading.Lock()
+        self.stopped = False
+
+    def next_row(self) -> Optional[Tuple[int, Any, Row]]:
+        """Next row still to be written; already written rows are reported as skipped."""
+        while True:
+            with self._lock:
+                if self.stopped:
+                    return None
+                try:
+                    index, row = next(self._rows)
+                except StopIteration:
+                    return None
+                row_key = self.key(row) if self.key is not None else index
+                token = Checkpoint._token(row_key)
+                if token not in self.done:
+                    return index, row_key, row
+                record_id = self.done[token]
+            self.finish(WriteResult(index, row_key, record_id, skipped=True))
+
+    def finish(self, result: WriteResult) -> None:
+        if result.ok and not result.skipped and self.checkpoint is not None:
+            self.checkpoint.record(
+                self.operation, result.key, getattr(result.value, "id", None)
+            )
+        with self._lock:
+            self.results.append(result)
+        if self.on_result is not None:
+            self.on_result(result)
+
+    def report(self, elapsed: float) -> BulkReport:
+        return BulkReport(
+            self.operation, sorted(self.results, key=lambda result: result.index), elapsed
+        )
+
+
+class _BulkWriterMixin:
+    """Argument handling shared by the sync and async writers."""
+
+    concurrency: int
+
+    def _start(
+        self,
+        operation: str,
+        rows: Iterable[Row],
+        key: Optional[Callable[[Row], Any]],
+        checkpoint: Union[None, str, "os.PathLike[str]", Checkpoint],
+        concurrency: Optional[int],
+        on_result: Optional[Callable[[WriteResult], None]],
+    ) -> Tuple[_Run, int]:
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if checkpoint is not None and not isinstance(checkpoint, Checkpoint):
+            checkpoint = Checkpoint(checkpoint)
+        state = _Run(operation, rows, key, checkpoint, on_result)
+        return state, concurrency or self.concurrency
+
+
+class BulkWriter(_BulkWriterMixin):
+    """Concurrent bulk writes through the resources of an :class:`~lgl_client.LGL`.
+
+    Usually reached as ``client.bulk``. Rows are plain dicts: creates take the
+    parent ``constituent_id`` plus the fields of the new record, updates take
+    the record ``id`` plus the fields to change.
+
+    Args:
+        lgl: Client returned by ``new_client``
+        concurrency: Default number of writes in flight (defaults to the
+            client's ``page_concurrency``)
+    """
+
+    def __init__(self, lgl: "LGL", *, concurrency: Optional[int] = None) -> None:
+        self._lgl = lgl
+        self.concurrency = lgl._client._resolve_concurrency(concurrency)
+
+    def run(
+        self,
+        operation: str,
+        write: Callable[[Row], Any],
+        rows: Iterable[Row],
+        *,
+        key: Optional[Callable[[Row], Any]] = None,
+        checkpoint: Union[None, str, "os.PathLike[str]", Checkpoint] = None,
+        concurrency: Optional[int] = None,
+        on_result: Optional[Callable[[WriteResult], None]] = None,
+    ) -> BulkReport:
+        """Apply ``write`` to every row.
+
+        Args:
+            operation: Name recorded in the report and the checkpoint
+            write: Performs one write and returns its result
+            rows: Input rows; consumed lazily, so a generator works
+            key: Stable, JSON-serialisable identifier of a row (default: its index)
+            checkpoint: Checkpoint or path of a checkpoint file for resuming
+            concurrency: Writes in flight (defaults to :attr:`concurrency`)
+            on_result: Called with every result as it completes, e.g. for
+                progress logging
+
+        Returns:
+            Report with one result per row
+
+        Raises:
+            UnauthorizedError: The API key was rejected; rows written so far
+                are in the checkpoint
+        """
+        state, workers = self._start(operation, rows, key, checkpoint, concurrency, on_result)
+        return self._execute(state, write, workers)
+
+    def _execute(
+        self, state: _Run, write: Callable[[Row], Any], concurrency: int
+    ) -> BulkReport:
+        started = time.perf_counter()
+
+        def worker() -> None:
+            while True:
+                job = state.next_row()
+                if job is None:
+                    return
+                index, row_key, row = job
+                try:
+                    value = write(row)
+                except UnauthorizedError:
+                    state.stopped = True
+                    raise
+                except _ROW_ERRORS as exc:
+                    state.finish(WriteResult(index, row_key, error=exc))
+                else:
+                    state.finish(WriteResult(index, row_key, value))
+
+        if concurrency == 1:
+            worker()
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                futures = [pool.submit(worker) for _ in range(concurrency)]
+            for future in futures:
+                future.result()
+        return state.report(time.perf_counter() - started)
+
+    # Writes by resource
+
+    def create_gifts(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Create gifts; rows hold ``constituent_id`` and the gift fields.
+
+        ``options`` are those of :meth:`run`.
+        """
+        gifts = self._lgl.gifts
+        return self.run(
+            "create_gifts", lambda row: gifts.create(*_split(row, "constituent_id")),
+            rows, **options,
+        )
+
+    def update_gifts(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Update gifts; rows hold the gift ``id`` and the fields to change."""
+        gifts = self._lgl.gifts
+        return self.run(
+            "update_gifts", lambda row: gifts.update(*_split(row, "id")), rows, **options
+        )
+
+    def create_notes(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Create notes; rows hold ``constituent_id`` and the note fields."""
+        notes = self._lgl.notes
+        return self.run(
+            "create_notes", lambda row: notes.create(*_split(row, "constituent_id")),
+            rows, **options,
+        )
+
+    def update_notes(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Update notes; rows hold the note ``id`` and the fields to change."""
+        notes = self._lgl.notes
+        return self.run(
+            "update_notes", lambda row: notes.update(*_split(row, "id")), rows, **options
+        )
+
+    def create_memberships(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Create memberships; rows hold ``constituent_id`` and the membership fields."""
+        memberships = self._lgl.memberships
+        return self.run(
+            "create_memberships",
+            lambda row: memberships.create(*_split(row, "constituent_id")),
+            rows, **options,
+        )
+
+    def update_memberships(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Update memberships; rows hold the membership ``id`` and the fields to change."""
+        memberships = self._lgl.memberships
+        return self.run(
+            "update_memberships", lambda row: memberships.update(*_split(row, "id")),
+            rows, **options,
+        )
+
+    def create_email_addresses(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Create email addresses; rows hold ``constituent_id`` and the address fields."""
+        email_addresses = self._lgl.email_addresses
+        return self.run(
+            "create_email_addresses",
+            lambda row: email_addresses.create(*_split(row, "constituent_id")),
+            rows, **options,
+        )
+
+    def update_email_addresses(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Update email addresses; rows hold the address ``id`` and the fields to change."""
+        email_addresses = self._lgl.email_addresses
+        return self.run(
+            "update_email_addresses",
+            lambda row: email_addresses.update(*_split(row, "id")),
+            rows, **options,
+        )
+
+    def add_keywords(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Tag constituents; rows hold ``constituent_id`` and ``keyword_id``."""
+        keywords = self._lgl.keywords
+        return self.run(
+            "add_keywords",
+            lambda row: keywords.add_to_constituent(
+                _require(row, "constituent_id"), _require(row, "keyword_id")
+            ),
+            rows, **options,
+        )
+
+
+class AsyncBulkWriter(_BulkWriterMixin):
+    """Async variant of :class:`BulkWriter`; every write method is awaitable.
+
+    Writes run as tasks on the event loop instead of threads.
+    """
+
+    def __init__(self, lgl: "AsyncLGL", *, concurrency: Optional[int] = None) -> None:
+        self._lgl = lgl
+        self.concurrency = lgl._client._resolve_concurrency(concurrency)
+
+    async def run(
+        self,
+        operation: str,
+        write: Callable[[Row], Awaitable[Any]],
+        rows: Iterable[Row],
+        *,
+        key: Optional[Callable[[Row], Any]] = None,
+        checkpoint: Union[None, str, "os.PathLike[str]", Checkpoint] = None,
+        concurrency: Optional[int] = None,
+        on_result: Optional[Callable[[WriteResult], None]] = None,
+    ) -> BulkReport:
+        """Await ``write`` for every row (see :meth:`BulkWriter.run`).
+
+        If a write raises :class:`UnauthorizedError`, the writes still in
+        flight are cancelled before it propagates.
+        """
+        state, workers = self._start(operation, rows, key, checkpoint, concurrency, on_result)
+        started = time.perf_counter()
+
+        async def worker() -> None:
+            while True:
+                job = state.next_row()
+                if job is None:
+                    return
+                index, row_key, row = job
+                try:
+                    value = await write(row)
+                except UnauthorizedError:
+                    state.stopped = True
+                    raise
+                except _ROW_ERRORS as exc:
+                    state.finish(WriteResult(index, row_key, error=exc))
+                else:
+                    state.finish(WriteResult(index, row_key, value))
+
+        tasks = [asyncio.ensure_future(worker()) for _ in range(workers)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return state.report(time.perf_counter() - started)
+
+    # Writes by resource
+
+    async def create_gifts(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Create gifts; rows hold ``constituent_id`` and the gift fields."""
+        gifts = self._lgl.gifts
+        return await self.run(
+            "create_gifts", lambda row: gifts.create(*_split(row, "constituent_id")),
+            rows, **options,
+        )
+
+    async def update_gifts(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Update gifts; rows hold the gift ``id`` and the fields to change."""
+        gifts = self._lgl.gifts
+        return await self.run(
+            "update_gifts", lambda row: gifts.update(*_split(row, "id")), rows, **options
+        )
+
+    async def create_notes(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Create notes; rows hold ``constituent_id`` and the note fields."""
+        notes = self._lgl.notes
+        return await self.run(
+            "create_notes", lambda row: notes.create(*_split(row, "constituent_id")),
+            rows, **options,
+        )
+
+    async def update_notes(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Update notes; rows hold the note ``id`` and the fields to change."""
+        notes = self._lgl.notes
+        return await self.run(
+            "update_notes", lambda row: notes.update(*_split(row, "id")), rows, **options
+        )
+
+    async def create_memberships(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Create memberships; rows hold ``constituent_id`` and the membership fields."""
+        memberships = self._lgl.memberships
+        return await self.run(
+            "create_memberships",
+            lambda row: memberships.create(*_split(row, "constituent_id")),
+            rows, **options,
+        )
+
+    async def update_memberships(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Update memberships; rows hold the membership ``id`` and the fields to change."""
+        memberships = self._lgl.memberships
+        return await self.run(
+            "update_memberships", lambda row: memberships.update(*_split(row, "id")),
+            rows, **options,
+        )
+
+    async def create_email_addresses(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Create email addresses; rows hold ``constituent_id`` and the address fields."""
+        email_addresses = self._lgl.email_addresses
+        return await self.run(
+            "create_email_addresses",
+            lambda row: email_addresses.create(*_split(row, "constituent_id")),
+            rows, **options,
+        )
+
+    async def update_email_addresses(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Update email addresses; rows hold the address ``id`` and the fields to change."""
+        email_addresses = self._lgl.email_addresses
+        return await self.run(
+            "update_email_addresses",
+            lambda row: email_addresses.update(*_split(row, "id")),
+            rows, **options,
+        )
+
+    async def add_keywords(self, rows: Iterable[Row], **options: Any) -> BulkReport:
+        """Tag constituents; rows hold ``constituent_id`` and ``keyword_id``."""
+        keywords = self._lgl.keywords
+        return await self.run(
+            "add_keywords",
+            lambda row: keywords.add_to_constituent(
+                _require(row, "constituent_id"), _require(row, "keyword_id")
+            ),
+            rows, **options,
+        )
@@ -0,0 +1,605 @@
+"""Resumable full-account exports.
+
+:class:`ExportJob` downloads every record of a resource into a JSON-lines
+file, one raw API item per line. After each page it records its position in
+a checkpoint file, so an export interrupted by a crash, a network failure
+or Ctrl-C continues where it stopped when run again::
+
+    from lgl_client import new_client
+    from lgl_client.export import ExportJob
+
+    job = ExportJob(new_client(api_key), "constituents", "constituents.jsonl")
+    job.run(on_progress=lambda p: print(p.describe()))
+
+Constituents and gifts are paged in update order with the same
+``updated_from`` cursor as :class:`~lgl_client.sync.IncrementalSync`, so
+records changing during a long export cannot shift pages. A record updated
+mid-export is written again near the end, and the later line wins. Notes
+and volunteer times have no update sort and are paged by offset.
+
+Every page is flushed to disk before the checkpoint that covers it is
+replaced. On resume, anything written after the last checkpoint is cut
+off, so a page is never duplicated or half-written.
+
+:class:`ColumnarExport` streams a resource into a Parquet, Arrow or CSV file
+with one typed column per model field, for loading into analytics tools.
+"""
+
+import csv
+import importlib
+import importlib.util
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic_core import to_jsonable_python
+
+from .lgl_api.search_query import format_timestamp
+from .sync import SYNC_RESOURCES, IncrementalSync, SyncResource, Watermark
+
+if TYPE_CHECKING:
+    from . import LGL
+
+
+@dataclass(frozen=True)
+class ExportProgress:
+    """Where an export stands.
+
+    Attributes:
+        resource: Resource being exported
+        written: Records written so far, across all runs
+        total: Records the account reported when the export started, if known
+        rate: Records per second in the current run
+        complete: Whether the export has finished
+    """
+
+    resource: str
+    written: int
+    total: Optional[int]
+    rate: float
+    complete: bool = False
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Share of the records written (0 to 1), if the total is known."""
+        if self.complete:
+            return 1.0
+        if not self.total:
+            return None
+        return min(1.0, self.written / self.total)
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds until the export completes."""
+        if self.complete:
+            return 0.0
+        if self.total is None or self.rate <= 0:
+            return None
+        return max(0, self.total - self.written) / self.rate
+
+    def describe(self) -> str:
+        """One-line progress report."""
+        total = "?" if self.total is None else str(self.total)
+        line = f"{self.resource}: {self.written}/{total} records ({self.rate:.0f}/s"
+        eta = self.eta
+        if eta is not None and not self.complete:
+            line += f", ETA {eta:.0f}s"
+        return line + ")"
+
+
+class ExportJob:
+    """Resumable export of one resource to a JSON-lines file.
+
+    Args:
+        lgl: Client returned by ``new_client``
+        resource: One of ``constituents``, ``gifts``, ``notes`` or
+            ``volunteer_times``
+        path: Output file (one JSON object per line)
+        checkpoint: Checkpoint file (default: ``<path>.checkpoint``)
+        page_size: Records requested per page
+        expand: Related data to include, for resources that support it
+    """
+
+    def __init__(
+        self,
+        lgl: "LGL",
+        resource: str,
+        path: str,
+        *,
+        checkpoint: Optional[str] = None,
+        page_size: int = 100,
+        expand: Optional[str] = None,
+    ) -> None:
+        spec = _export_spec(resource)
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if expand and not spec.supports_expand:
+            raise ValueError(f"{resource} does not support expand")
+        self._lgl = lgl
+        self._spec = spec
+        self.resource = resource
+        self.path = os.fspath(path)
+        self.checkpoint_path = (
+            os.fspath(checkpoint) if checkpoint is not None else f"{self.path}.checkpoint"
+        )
+        self.page_size = page_size
+        self.expand = expand
+
+    # Checkpoint
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as handle:
+                state: Dict[str, Any] = json.load(handle)
+        except FileNotFoundError:
+            return {}
+        if state.get("resource") != self.resource:
+            raise ValueError(
+                f"{self.checkpoint_path} belongs to an export of {state.get('resource')!r}"
+            )
+        return state
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        # Write then rename so a crash never leaves a truncated checkpoint
+        tmp_path = f"{self.checkpoint_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(state, handle, indent=2, sort_keys=True)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    @property
+    def complete(self) -> bool:
+        """Whether the export has finished."""
+        return bool(self._load_state().get("complete"))
+
+    def progress(self) -> ExportProgress:
+        """Progress recorded in the checkpoint."""
+        state = self._load_state()
+        return ExportProgress(
+            self.resource, state.get("written", 0), state.get("total"), 0.0,
+            bool(state.get("complete")),
+        )
+
+    def watermark(self) -> Optional[Watermark]:
+        """Sync watermark covering the export: the time it started.
+
+        Save it in an :class:`~lgl_client.sync.IncrementalSync` store so the
+        next sync picks up everything changed during and after the export.
+        """
+        started_at = self._load_state().get("started_at")
+        if started_at is None:
+            return None
+        return Watermark.from_dict({"updated_at": started_at})
+
+    def reset(self) -> None:
+        """Delete the output and checkpoint so the next run starts over."""
+        for path in (self.path, self.checkpoint_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    # Running
+
+    def run(
+        self, *, on_progress: Optional[Callable[[ExportProgress], None]] = None
+    ) -> ExportProgress:
+        """Export the resource, resuming from the checkpoint if there is one.
+
+        Args:
+            on_progress: Called with the progress after every page
+
+        Returns:
+            Final progress; ``complete`` is True
+        """
+        state = self._load_state()
+        if state.get("complete"):
+            return self.progress()
+        if not state:
+            state = {
+                "resource": self.resource,
+                "started_at": format_timestamp(datetime.now(timezone.utc)),
+                "position": 0,
+                "written": 0,
+                "total": None,
+                "offset": 0,
+                "cursor": None,
+                "complete": False,
+            }
+
+        run_started = time.monotonic()
+        run_written = 0
+
+        def report() -> ExportProgress:
+            elapsed = time.monotonic() - run_started
+            rate = run_written / elapsed if elapsed > 0 else 0.0
+            return ExportProgress(
+                self.resource, state["written"], state["total"], rate, state["complete"]
+            )
+
+        mode = "r+b" if os.path.exists(self.path) else "wb"
+        with open(self.path, mode) as output:
+            # Drop whatever was written after the last checkpoint
+            output.truncate(state["position"])
+            output.seek(state["position"])
+            for records, fields in self._pages(state):
+                for _, item in records:
+                    output.write(json.dumps(item, separators=(",", ":")).encode("utf-8"))
+                    output.write(b"\n")
+                output.flush()
+                os.fsync(output.fileno())
+                state["position"] = output.tell()
+                state["written"] += len(records)
+                state.update(fields)
+                run_written += len(records)
+                self._save_state(state)
+                if on_progress is not None:
+                    on_progress(report())
+
+        state["complete"] = True
+        self._save_state(state)
+        final = report()
+        if on_progress is not None:
+            on_progress(final)
+        return final
+
+    def _pages(self, state: Dict[str, Any]) -> Iterator[Any]:
+        return _pages(self._lgl, self._spec, state, self.page_size, self.expand)
+
+
+# Columnar exports
+
+COLUMNAR_FORMATS = ("parquet", "arrow", "csv")
+
+_SUFFIX_FORMATS = {
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".csv": "csv",
+}
+
+# Column type of each scalar field type; anything else is stored as JSON text
+_SCALAR_TYPES: Dict[Any, str] = {
+    bool: "bool",
+    int: "int64",
+    float: "float64",
+    str: "string",
+    date: "date",
+    datetime: "timestamp",
+}
+
+
+def _export_spec(resource: str) -> SyncResource:
+    try:
+        return SYNC_RESOURCES[resource]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported export resource: {resource!r} "
+            f"(expected one of {', '.join(SYNC_RESOURCES)})"
+        ) from None
+
+
+def _column_type(annotation: Any) -> str:
+    if get_origin(annotation) is Union:
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) == 1:
+            annotation = members[0]
+    return _SCALAR_TYPES.get(annotation, "json")
+
+
+@lru_cache(maxsize=None)
+def export_schema(resource: str) -> Tuple[Tuple[str, str], ...]:
+    """Columns of a columnar export as ``(name, type)`` pairs.
+
+    There is one column per field of the resource's model, in field order.
+    Types are ``bool``, ``int64``, ``float64``, ``string``, ``date``,
+    ``timestamp`` (UTC) or ``json``: lists and nested records such as
+    ``custom_attrs`` or a gift's ``tribute``, stored as JSON text.
+    """
+    model = _export_spec(resource).model
+    return tuple(
+        (name, _column_type(field.annotation)) for name, field in model.model_fields.items()
+    )
+
+
+def _json_cell(value: Any) -> str:
+    return json.dumps(to_jsonable_python(value), separators=(",", ":"))
+
+
+# Trusted models keep scalars as the API sent them, so coerce to the column type
+_CELL_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "int64": int,
+    "float64": float,
+    "string": str,
+    "json": _json_cell,
+}
+
+
+def _pyarrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _import_pyarrow() -> Any:
+    try:
+        return importlib.import_module("pyarrow")
+    except ImportError:
+        raise ImportError(
+            "Parquet and Arrow exports require pyarrow (pip install 'lgl-client[parquet]')"
+        ) from None
+
+
+class _CSVWriter:
+    """Rows appended to a CSV file with a header line."""
+
+    def __init__(self, path: str, columns: Tuple[Tuple[str, str], ...]) -> None:
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([name for name, _ in columns])
+
+    @staticmethod
+    def _text(value: Any) -> Any:
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+        return value
+
+    def write(self, rows: List[List[Any]]) -> None:
+        self._writer.writerows([[self._text(value) for value in row] for row in rows])
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ArrowWriter:
+    """Rows written as Arrow record batches to a Parquet or Arrow IPC file."""
+
+    def __init__(self, path: str, columns: Tuple[Tuple[str, str], ...], format: str) -> None:
+        pa = _import_pyarrow()
+        types = {
+            "bool": pa.bool_(),
+            "int64": pa.int64(),
+            "float64": pa.float64(),
+            "string": pa.string(),
+            "date": pa.date32(),
+            "timestamp": pa.timestamp("us", tz="UTC"),
+            "json": pa.string(),
+        }
+        self._pa = pa
+        self._schema = pa.schema([(name, types[kind]) for name, kind in columns])
+        if format == "parquet":
+            parquet = importlib.import_module("pyarrow.parquet")
+            self._writer = parquet.ParquetWriter(path, self._schema)
+        else:
+            self._writer = pa.ipc.new_file(path, self._schema)
+
+    def write(self, rows: List[List[Any]]) -> None:
+        arrays = [
+            self._pa.array(list(values), type=field.type)
+            for values, field in zip(zip(*rows), self._schema)
+        ]
+        self._writer.write_batch(self._pa.RecordBatch.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class ColumnarExport:
+    """Export of one resource to a Parquet, Arrow or CSV file.
+
+    Pages stream through a buffer of ``batch_size`` rows into the writer, so
+    memory stays flat however large the account is::
+
+        from lgl_client.export import ColumnarExport
+
+        ColumnarExport(new_client(api_key), "gifts", "gifts.parquet").run()
+
+    Columns follow :func:`export_schema`. Parquet and Arrow files need
+    ``pyarrow`` (``lgl-client[parquet]``); without it, files default to
+    CSV. The file is written under a temporary name and only renamed into
+    place once complete. Unlike :class:`ExportJob` it cannot resume, since
+    neither format can be appended to. Constituents and gifts are paged in
+    update order like :class:`ExportJob`, so a record updated mid-export
+    can appear twice; keep the last row per ``id``.
+
+    Args:
+        lgl: Client returned by ``new_client``
+        resource: One of ``constituents``, ``gifts``, ``notes`` or
+            ``volunteer_times``
+        path: Output file
+        format: ``parquet``, ``arrow`` or ``csv`` (default: from the file
+            suffix, else Parquet when pyarrow is installed and CSV otherwise)
+        page_size: Records requested per page
+        batch_size: Rows per record batch (a Parquet row group)
+        expand: Related data to include, for resources that support it
+    """
+
+    def __init__(
+        self,
+        lgl: "LGL",
+        resource: str,
+        path: str,
+        *,
+        format: Optional[str] = None,
+        page_size: int = 100,
+        batch_size: int = 1000,
+        expand: Optional[str] = None,
+    ) -> None:
+        spec = _export_spec(resource)
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if expand and not spec.supports_expand:
+            raise ValueError(f"{resource} does not support expand")
+        self.path = os.fspath(path)
+        if format is None:
+            suffix = os.path.splitext(self.path)[1].lower()
+            format = _SUFFIX_FORMATS.get(suffix) or (
+                "parquet" if _pyarrow_available() else "csv"
+            )
+        if format not in COLUMNAR_FORMATS:
+            raise ValueError(
+                f"Unsupported export format: {format!r} "
+                f"(expected one of {', '.join(COLUMNAR_FORMATS)})"
+            )
+        if format != "csv":
+            _import_pyarrow()
+        self._lgl = lgl
+        self._spec = spec
+        self.resource = resource
+        self.format = format
+        self.columns = export_schema(resource)
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self.expand = expand
+
+    def _open(self, path: str) -> Any:
+        if self.format == "csv":
+            return _CSVWriter(path, self.columns)
+        return _ArrowWriter(path, self.columns, self.format)
+
+    def run(
+        self, *, on_progress: Optional[Callable[[ExportProgress], None]] = None
+    ) -> ExportProgress:
+        """Download every record into the file, replacing it if it exists.
+
+        Args:
+            on_progress: Called with the progress after every page
+
+        Returns:
+            Final progress; ``complete`` is True
+        """
+        model = self._spec.model
+        converters = [(name, _CELL_CONVERTERS.get(kind)) for name, kind in self.columns]
+        state: Dict[str, Any] = {"total": None, "offset": 0, "cursor": None}
+        started = time.monotonic()
+        written = 0
+
+        def report(complete: bool = False) -> ExportProgress:
+            elapsed = time.monotonic() - started
+            rate = written / elapsed if elapsed > 0 else 0.0
+            return ExportProgress(self.resource, written, state["total"], rate, complete)
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        writer = self._open(tmp_path)
+        try:
+            buffer: List[List[Any]] = []
+            for records, _ in _pages(
+                self._lgl, self._spec, state, self.page_size, self.expand
+            ):
+                for record, item in records:
+                    if record is None:
+                        record = model.from_dict(item, trusted=True)
+                    row = []
+                    for name, convert in converters:
+                        value = getattr(record, name, None)
+                        row.append(value if value is None or convert is None else convert(value))
+                    buffer.append(row)
+                    if len(buffer) >= self.batch_size:
+                        writer.write(buffer)
+                        buffer = []
+                written += len(records)
+                if on_progress is not None:
+                    on_progress(report())
+            if buffer:
+                writer.write(buffer)
+        except BaseException:
+            writer.close()
+            os.remove(tmp_path)
+            raise
+        writer.close()
+        os.replace(tmp_path, self.path)
+
+        final = report(complete=True)
+        if on_progress is not None:
+            on_progress(final)
+        return final
+
+
+def _pages(
+    lgl: "LGL",
+    spec: SyncResource,
+    state: Dict[str, Any],
+    page_size: int,
+    expand: Optional[str],
+) -> Iterator[Any]:
+    """Yield ``(records, checkpoint fields)`` for every remaining page.
+
+    Records pair the model, when paging already built one, with the raw
+    item. ``state`` supplies ``total``, ``offset`` and ``cursor`` and
+    receives the total once known.
+    """
+    if spec.update_sort is not None:
+        yield from _cursor_pages(lgl, spec, state, page_size, expand)
+    else:
+        yield from _offset_pages(lgl, spec, state, page_size, expand)
+
+
+def _offset_pages(
+    lgl: "LGL",
+    spec: SyncResource,
+    state: Dict[str, Any],
+    page_size: int,
+    expand: Optional[str],
+) -> Iterator[Any]:
+    client = lgl._client
+    params = {"expand": expand} if expand else {}
+    offset = state["offset"]
+    while True:
+        page = client._get(spec.path, **params, limit=page_size, offset=offset)
+        items = client._page_items(page) or []
+        if state["total"] is None and isinstance(page, dict) and "total_items" in page:
+            state["total"] = int(page["total_items"])
+        if not items:
+            return
+        offset += len(items)
+        yield [(None, item) for item in items], {"offset": offset}
+        if client._is_last_page(page, items, offset - len(items), page_size):
+            return
+
+
+def _cursor_pages(
+    lgl: "LGL",
+    spec: SyncResource,
+    state: Dict[str, Any],
+    page_size: int,
+    expand: Optional[str],
+) -> Iterator[Any]:
+    if state["total"] is None:
+        probe = lgl._client._get(spec.path, limit=1, offset=0)
+        if isinstance(probe, dict) and "total_items" in probe:
+            state["total"] = int(probe["total_items"])
+    sync = IncrementalSync(lgl, page_size=page_size, trusted=True)
+    start = Watermark.from_dict(state["cursor"]) if state["cursor"] else None
+    for records, watermark in sync.pages(spec.name, start, expand=expand):
+        if not records:
+            continue
+        yield records, {"cursor": watermark.to_dict() if watermark is not None else None}
+
+
+def read_export(path: str) -> Iterator[Dict[str, Any]]:
+    """Iterate over the records of an export file."""
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
@@ -1,12 +1,65 @@
 """LGL API module exports."""
 
-from .client import LGLClient
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from .cache import DiskBackend, MemoryBackend, ReferenceCache
+from .client import AsyncLGLClient, BaseLGLClient, LGLClient
+from .entity_cache import EntityCache
 from .exceptions import LGLAPIError, NotFoundError, UnauthorizedError, ValidationError
+from .http_cache import ResponseCache
+from .metrics import MetricsCollector, RequestEvent
+from .page_size import PageSizeTuner
+from .rate_limit import FileTokenBucket, RateLimiter, TokenBucket
+from .retry import RetryPolicy, RetryStats
+
+if TYPE_CHECKING:
+    from .gift_query import GiftFilter, GiftQueryPlan
+    from .search_query import SearchQuery
+
+# Exports whose modules load pydantic models, imported on first access
+_LAZY: Dict[str, str] = {
+    "GiftFilter": ".gift_query",
+    "GiftQueryPlan": ".gift_query",
+    "SearchQuery": ".search_query",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
+    "AsyncLGLClient",
+    "BaseLGLClient",
     "LGLClient",
-    "LGLAPIError", 
+    "LGLAPIError",
     "NotFoundError",
-    "UnauthorizedError", 
+    "UnauthorizedError",
     "ValidationError",
-]
\ No newline at end of file
+    "RetryPolicy",
+    "RetryStats",
+    "RateLimiter",
+    "TokenBucket",
+    "FileTokenBucket",
+    "ReferenceCache",
+    "MemoryBackend",
+    "DiskBackend",
+    "ResponseCache",
+    "EntityCache",
+    "PageSizeTuner",
+    "MetricsCollector",
+    "RequestEvent",
+    "GiftFilter",
+    "GiftQueryPlan",
+    "SearchQuery",
+]
@@ -1,12 +1,47 @@
 """Appeal Requests API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.appeal_request import AppealRequest
 
 
-class AppealRequestsAPI:
+class _AppealRequestsMixin:
+    """Query parameters and payloads shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _request_data(
+        constituent_id: int, ask_amount: float, assigned_to: Optional[str], status: str
+    ) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "constituent_id": constituent_id,
+            "ask_amount": ask_amount,
+            "status": status
+        }
+        
+        if assigned_to:
+            data["assigned_to"] = assigned_to
+        
+        return data
+    
+    @staticmethod
+    def _completion_data(raised_amount: Optional[float]) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"status": "Completed"}
+        if raised_amount is not None:
+            data["raised"] = raised_amount
+        return data
+
+
+class AppealRequestsAPI(_AppealRequestsMixin):
     """API for managing appeal requests."""
     
     def __init__(self, client: LGLClient):
@@ -28,12 +63,7 @@ class AppealRequestsAPI:
         Returns:
             Paginated response with appeal request items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'appeals/{appeal_id}/appeal_requests', **params)
     
     def list_by_constituent(
@@ -52,14 +82,24 @@ class AppealRequestsAPI:
         Returns:
             Paginated response with appeal request items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/appeal_requests', **params)
     
+    def iter_all_by_appeal(self, appeal_id: int) -> Iterator[AppealRequest]:
+        """Iterate over all appeal requests for an appeal, one page at a time.
+        
+        Args:
+            appeal_id: The appeal ID
+        
+        Yields:
+            AppealRequest objects
+        """
+        def _list_page(**kwargs):
+            return self.list_by_appeal(appeal_id, **kwargs)
+        
+        for item in self.client._paginate(_list_page):
+            yield AppealRequest(**item)
+    
     def fetch_all_by_appeal(self, appeal_id: int) -> List[AppealRequest]:
         """Fetch all appeal requests for an appeal with automatic pagination.
         
@@ -69,11 +109,22 @@ class AppealRequestsAPI:
         Returns:
             List of all AppealRequest objects
         """
+        return list(self.iter_all_by_appeal(appeal_id))
+    
+    def iter_all_by_constituent(self, constituent_id: int) -> Iterator[AppealRequest]:
+        """Iterate over all appeal requests for a constituent, one page at a time.
+        
+        Args:
+            constituent_id: The constituent ID
+        
+        Yields:
+            AppealRequest objects
+        """
         def _list_page(**kwargs):
-            return self.list_by_appeal(appeal_id, **kwargs)
+            return self.list_by_constituent(constituent_id, **kwargs)
         
-        items = list(self.client._paginate(_list_page))
-        return [AppealRequest(**item) for item in items]
+        for item in self.client._paginate(_list_page):
+            yield AppealRequest(**item)
     
     def fetch_all_by_constituent(self, constituent_id: int) -> List[AppealRequest]:
         """Fetch all appeal requests for a constituent with automatic pagination.
@@ -84,11 +135,7 @@ class AppealRequestsAPI:
         Returns:
             List of all AppealRequest objects
         """
-        def _list_page(**kwargs):
-            return self.list_by_constituent(constituent_id, **kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [AppealRequest(**item) for item in items]
+        return list(self.iter_all_by_constituent(constituent_id))
     
     def retrieve(self, appeal_request_id: int) -> AppealRequest:
         """Retrieve a specific appeal request by ID.
@@ -185,15 +232,7 @@ class AppealRequestsAPI:
         Returns:
             Created AppealRequest object
         """
-        data = {
-            "constituent_id": constituent_id,
-            "ask_amount": ask_amount,
-            "status": status
-        }
-        
-        if assigned_to:
-            data["assigned_to"] = assigned_to
-        
+        data = self._request_data(constituent_id, ask_amount, assigned_to, status)
         return self.create_for_appeal(appeal_id, data)
     
     def assign_request(self, appeal_request_id: int, assigned_to: str) -> AppealRequest:
@@ -242,11 +281,7 @@ class AppealRequestsAPI:
         Returns:
             Updated AppealRequest object
         """
-        data = {"status": "Completed"}
-        if raised_amount is not None:
-            data["raised"] = raised_amount
-        
-        return self.update(appeal_request_id, data)
+        return self.update(appeal_request_id, self._completion_data(raised_amount))
     
     def get_pending_requests_by_appeal(self, appeal_id: int) -> List[AppealRequest]:
         """Get all pending appeal requests for an appeal.
@@ -271,4 +306,118 @@ class AppealRequestsAPI:
             List of AppealRequest objects assigned to the person
         """
         all_requests = self.fetch_all_by_appeal(appeal_id)
-        return [req for req in all_requests if req.assigned_to == assigned_to]
\ No newline at end of file
+        return [req for req in all_requests if req.assigned_to == assigned_to]
+
+
+class AsyncAppealRequestsAPI(_AppealRequestsMixin):
+    """Async variant of :class:`AppealRequestsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list_by_appeal(
+        self,
+        appeal_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all appeal requests for a specific appeal."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'appeals/{appeal_id}/appeal_requests', **params)
+    
+    async def list_by_constituent(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all appeal requests for a specific constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/appeal_requests', **params)
+    
+    async def iter_all_by_appeal(self, appeal_id: int) -> AsyncIterator[AppealRequest]:
+        """Iterate over all appeal requests for an appeal, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list_by_appeal(appeal_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield AppealRequest(**item)
+    
+    async def fetch_all_by_appeal(self, appeal_id: int) -> List[AppealRequest]:
+        """Fetch all appeal requests for an appeal with automatic pagination."""
+        return [item async for item in self.iter_all_by_appeal(appeal_id)]
+    
+    async def iter_all_by_constituent(self, constituent_id: int) -> AsyncIterator[AppealRequest]:
+        """Iterate over all appeal requests for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list_by_constituent(constituent_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield AppealRequest(**item)
+    
+    async def fetch_all_by_constituent(self, constituent_id: int) -> List[AppealRequest]:
+        """Fetch all appeal requests for a constituent with automatic pagination."""
+        return [item async for item in self.iter_all_by_constituent(constituent_id)]
+    
+    async def retrieve(self, appeal_request_id: int) -> AppealRequest:
+        """Retrieve a specific appeal request by ID."""
+        response = await self.client._get(f'appeal_requests/{appeal_request_id}')
+        return AppealRequest(**response)
+    
+    async def create_for_appeal(self, appeal_id: int, appeal_request_data: Dict) -> AppealRequest:
+        """Create a new appeal request for an appeal."""
+        response = await self.client._post(f'appeals/{appeal_id}/appeal_requests', appeal_request_data)
+        return AppealRequest(**response)
+    
+    async def create_for_constituent(self, constituent_id: int, appeal_request_data: Dict) -> AppealRequest:
+        """Create a new appeal request for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/appeal_requests', appeal_request_data)
+        return AppealRequest(**response)
+    
+    async def update(self, appeal_request_id: int, appeal_request_data: Dict) -> AppealRequest:
+        """Update an existing appeal request."""
+        response = await self.client._patch(f'appeal_requests/{appeal_request_id}', appeal_request_data)
+        return AppealRequest(**response)
+    
+    async def delete(self, appeal_request_id: int) -> Dict:
+        """Delete an appeal request."""
+        await self.client._delete(f'appeal_requests/{appeal_request_id}')
+        return {"result": "success"}
+    
+    async def create_simple_request(
+        self,
+        appeal_id: int,
+        constituent_id: int,
+        ask_amount: float,
+        assigned_to: Optional[str] = None,
+        status: str = "Pending"
+    ) -> AppealRequest:
+        """Create a simple appeal request with common parameters."""
+        data = self._request_data(constituent_id, ask_amount, assigned_to, status)
+        return await self.create_for_appeal(appeal_id, data)
+    
+    async def assign_request(self, appeal_request_id: int, assigned_to: str) -> AppealRequest:
+        """Assign an appeal request to someone."""
+        return await self.update(appeal_request_id, {"assigned_to": assigned_to})
+    
+    async def update_status(self, appeal_request_id: int, status: str) -> AppealRequest:
+        """Update the status of an appeal request."""
+        return await self.update(appeal_request_id, {"status": status})
+    
+    async def update_ask_amount(self, appeal_request_id: int, ask_amount: float) -> AppealRequest:
+        """Update the ask amount for an appeal request."""
+        return await self.update(appeal_request_id, {"ask_amount": ask_amount})
+    
+    async def mark_completed(self, appeal_request_id: int, raised_amount: Optional[float] = None) -> AppealRequest:
+        """Mark an appeal request as completed."""
+        return await self.update(appeal_request_id, self._completion_data(raised_amount))
+    
+    async def get_pending_requests_by_appeal(self, appeal_id: int) -> List[AppealRequest]:
+        """Get all pending appeal requests for an appeal."""
+        all_requests = await self.fetch_all_by_appeal(appeal_id)
+        return [req for req in all_requests if req.status == 'Pending']
+    
+    async def get_requests_by_assignee(self, appeal_id: int, assigned_to: str) -> List[AppealRequest]:
+        """Get appeal requests assigned to a specific person."""
+        all_requests = await self.fetch_all_by_appeal(appeal_id)
+        return [req for req in all_requests if req.assigned_to == assigned_to]
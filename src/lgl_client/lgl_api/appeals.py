@@ -1,27 +1,41 @@
 """Appeals API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.appeal import Appeal
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class AppealsAPI:
+class _AppealsMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "appeals"
+    
+    def _appeal_path(self, appeal_id: int) -> str:
+        return f"{self._resource}/{appeal_id}"
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[Appeal]:
+        return [Appeal.from_dict(item) for item in data.get("items", [])]
+
+
+class AppealsAPI(_AppealsMixin):
     """API for managing appeals in Little Green Light.
     
     Appeals represent fundraising campaigns or solicitation efforts
     targeting specific groups of constituents.
     """
     
-    _resource = "appeals"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Appeals API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(self, *, limit: int = 25, offset: int = 0) -> List[Appeal]:
         """List appeals for the account.
@@ -33,8 +47,19 @@ class AppealsAPI:
         Returns:
             List of Appeal objects
         """
-        data = self._client._get(self._resource, limit=limit, offset=offset)
-        return [Appeal.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(self._client._get(self._resource, limit=limit, offset=offset))
+    
+    def iter_all(self) -> Iterator[Appeal]:
+        """Iterate over all appeals, one page at a time.
+        
+        Yields:
+            Appeal objects
+        """
+        def _list_page(**kwargs: Any) -> List[Appeal]:
+            return self.list(**kwargs)
+            
+        for item in self._client._paginate(_list_page):
+            yield Appeal.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[Appeal]:
         """Fetch all appeals using automatic pagination.
@@ -42,11 +67,7 @@ class AppealsAPI:
         Returns:
             List of all Appeal objects
         """
-        def _list_page(**kwargs: Any) -> List[Appeal]:
-            return self.list(**kwargs)
-            
-        items = list(self._client._paginate(_list_page))
-        return [Appeal.from_dict(item) if isinstance(item, dict) else item for item in items]
+        return self._cached("fetch_all", lambda: list(self.iter_all()))
     
     def retrieve(self, appeal_id: int) -> Appeal:
         """Retrieve a specific appeal by ID.
@@ -57,7 +78,7 @@ class AppealsAPI:
         Returns:
             Appeal object
         """
-        data = self._client._get(f"{self._resource}/{appeal_id}")
+        data = self._client._get(self._appeal_path(appeal_id))
         return Appeal.from_dict(data)
     
     def create(self, appeal: Appeal) -> Appeal:
@@ -70,6 +91,7 @@ class AppealsAPI:
             Created Appeal object
         """
         data = self._client._post(self._resource, appeal.to_dict())
+        self._invalidate_cache()
         return Appeal.from_dict(data)
     
     def update(self, appeal_id: int, appeal: Appeal) -> Appeal:
@@ -82,7 +104,8 @@ class AppealsAPI:
         Returns:
             Updated Appeal object
         """
-        data = self._client._patch(f"{self._resource}/{appeal_id}", appeal.to_dict())
+        data = self._client._patch(self._appeal_path(appeal_id), appeal.to_dict())
+        self._invalidate_cache()
         return Appeal.from_dict(data)
     
     def delete(self, appeal_id: int) -> None:
@@ -91,4 +114,54 @@ class AppealsAPI:
         Args:
             appeal_id: Appeal ID to delete
         """
-        self._client._delete(f"{self._resource}/{appeal_id}")
\ No newline at end of file
+        self._client._delete(self._appeal_path(appeal_id))
+        self._invalidate_cache()
+
+
+class AsyncAppealsAPI(_AppealsMixin):
+    """Async variant of :class:`AppealsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Appeals API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[Appeal]:
+        """List appeals for the account."""
+        return self._parse_page(await self._client._get(self._resource, limit=limit, offset=offset))
+    
+    async def iter_all(self) -> AsyncIterator[Appeal]:
+        """Iterate over all appeals, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[Appeal]:
+        """Fetch all appeals using automatic pagination."""
+        return await self._acached("fetch_all", lambda: self._collect(self.iter_all()))
+    
+    async def retrieve(self, appeal_id: int) -> Appeal:
+        """Retrieve a specific appeal by ID."""
+        data = await self._client._get(self._appeal_path(appeal_id))
+        return Appeal.from_dict(data)
+    
+    async def create(self, appeal: Appeal) -> Appeal:
+        """Create a new appeal."""
+        data = await self._client._post(self._resource, appeal.to_dict())
+        self._invalidate_cache()
+        return Appeal.from_dict(data)
+    
+    async def update(self, appeal_id: int, appeal: Appeal) -> Appeal:
+        """Update an existing appeal."""
+        data = await self._client._patch(self._appeal_path(appeal_id), appeal.to_dict())
+        self._invalidate_cache()
+        return Appeal.from_dict(data)
+    
+    async def delete(self, appeal_id: int) -> None:
+        """Delete an appeal."""
+        await self._client._delete(self._appeal_path(appeal_id))
+        self._invalidate_cache()
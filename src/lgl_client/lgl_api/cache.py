@@ -0,0 +1,294 @@
+"""Reference-data cache for slowly changing lookup resources.
+
+Lookup resources such as payment types, funds or campaigns change rarely,
+so their ``fetch_all`` results can be reused across calls. Caching is
+opt-in: pass a :class:`ReferenceCache` to ``new_client`` and every lookup
+resource of that client shares it.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+_MISS = object()
+
+
+class CacheBackend:
+    """Storage for cached lookup results, grouped by resource."""
+
+    def get(self, resource: str, key: str) -> Optional[Tuple[float, Any]]:
+        """Return ``(expires_at, value)`` for a key, or None if absent."""
+        raise NotImplementedError
+
+    def set(self, resource: str, key: str, value: Any, expires_at: float) -> None:
+        """Store a value until the wall-clock time ``expires_at``."""
+        raise NotImplementedError
+
+    def invalidate(self, resource: str) -> None:
+        """Drop every entry cached for a resource."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """Thread-safe in-process storage (the default).
+
+    Args:
+        max_entries: Keep at most this many entries, evicting the least
+            recently used (default: unbounded)
+    """
+
+    def __init__(self, max_entries: Optional[int] = None) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict[str, Tuple[float, Any]]] = {}
+        self._order: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, resource: str, key: str) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            entry = self._entries.get(resource, {}).get(key)
+            if entry is not None and self.max_entries is not None:
+                self._order.move_to_end((resource, key))
+            return entry
+
+    def set(self, resource: str, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries.setdefault(resource, {})[key] = (expires_at, value)
+            if self.max_entries is None:
+                return
+            self._order[(resource, key)] = None
+            self._order.move_to_end((resource, key))
+            while len(self._order) > self.max_entries:
+                (old_resource, old_key), _ = self._order.popitem(last=False)
+                self._entries[old_resource].pop(old_key, None)
+
+    def invalidate(self, resource: str) -> None:
+        with self._lock:
+            keys = self._entries.pop(resource, {})
+            for key in keys:
+                self._order.pop((resource, key), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._order.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._entries.values())
+
+
+class DiskBackend(CacheBackend):
+    """On-disk storage so several processes (or runs) share lookup data.
+
+    Entries are JSON files under ``directory/<resource>/``. Models are stored
+    as plain data and rebuilt on read; only classes from ``lgl_client.models``
+    are ever instantiated, so a tampered cache file cannot run code.
+    """
+
+    _MODEL_PACKAGE = "lgl_client.models."
+
+    def __init__(self, directory: str) -> None:
+        self.directory = os.fspath(directory)
+
+    def _path(self, resource: str, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, resource, f"{digest}.json")
+
+    def get(self, resource: str, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            with open(self._path(resource, key), encoding="utf-8") as handle:
+                entry = json.load(handle)
+            return entry["expires_at"], self._decode(entry["value"])
+        except (OSError, ValueError, KeyError, TypeError, ImportError, AttributeError):
+            return None
+
+    def set(self, resource: str, key: str, value: Any, expires_at: float) -> None:
+        path = self._path(resource, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"expires_at": expires_at, "value": self._encode(value)}, handle)
+        os.replace(tmp_path, path)
+
+    def invalidate(self, resource: str) -> None:
+        resource_dir = os.path.join(self.directory, resource)
+        try:
+            names = os.listdir(resource_dir)
+        except FileNotFoundError:
+            return
+        for name in names:
+            try:
+                os.remove(os.path.join(resource_dir, name))
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        try:
+            resources = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for resource in resources:
+            if os.path.isdir(os.path.join(self.directory, resource)):
+                self.invalidate(resource)
+
+    @staticmethod
+    def _encode(value: Any) -> Any:
+        # Imported here so creating a client does not build the pydantic models
+        from ..models import LGLModel
+
+        if isinstance(value, list) and value and isinstance(value[0], LGLModel):
+            model = type(value[0])
+            return {
+                "model": f"{model.__module__}.{model.__qualname__}",
+                "items": [item.model_dump(mode="json") for item in value],
+            }
+        return {"model": None, "items": value}
+
+    @classmethod
+    def _decode(cls, data: Dict[str, Any]) -> Any:
+        if data["model"] is None:
+            return data["items"]
+        module_name, _, class_name = data["model"].rpartition(".")
+        if not module_name.startswith(cls._MODEL_PACKAGE):
+            raise ImportError(f"Refusing to load {data['model']} from cache")
+        model = getattr(importlib.import_module(module_name), class_name)
+        return [model.model_validate(item) for item in data["items"]]
+
+
+@dataclass
+class _ResourceStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class ReferenceCache:
+    """TTL cache for lookup resources such as funds, campaigns or gift types.
+
+    Attributes:
+        ttl: Default time-to-live in seconds for every resource
+        ttls: Per-resource overrides keyed by resource path (e.g.
+            ``{"payment_types": 86400, "events": 300}``); 0 disables caching
+        backend: Storage backend (default: :class:`MemoryBackend`)
+    """
+
+    ttl: float = 3600.0
+    ttls: Dict[str, float] = field(default_factory=dict)
+    backend: CacheBackend = field(default_factory=MemoryBackend)
+    _stats: Dict[str, _ResourceStats] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def ttl_for(self, resource: str) -> float:
+        """Time-to-live in seconds for a resource."""
+        return self.ttls.get(resource, self.ttl)
+
+    @staticmethod
+    def make_key(operation: str, args: Tuple[Any, ...]) -> str:
+        """Build the cache key for an operation and its arguments."""
+        return f"{operation}:{json.dumps(args, default=str)}"
+
+    def _record(self, resource: str, outcome: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(resource, _ResourceStats())
+            setattr(stats, outcome, getattr(stats, outcome) + 1)
+
+    def lookup(self, resource: str, key: str) -> Any:
+        """Return the cached value, or the module-level miss sentinel."""
+        if self.ttl_for(resource) <= 0:
+            return _MISS
+        entry = self.backend.get(resource, key)
+        if entry is None or entry[0] <= time.time():
+            self._record(resource, "misses")
+            return _MISS
+        self._record(resource, "hits")
+        return entry[1]
+
+    def store(self, resource: str, key: str, value: Any) -> None:
+        """Cache a freshly loaded value for the resource's TTL."""
+        ttl = self.ttl_for(resource)
+        if ttl > 0:
+            self.backend.set(resource, key, value, time.time() + ttl)
+
+    def get_or_load(self, resource: str, key: str, loader: Callable[[], Any]) -> Any:
+        """Return the cached value, calling ``loader`` and caching it on a miss."""
+        value = self.lookup(resource, key)
+        if value is _MISS:
+            value = loader()
+            self.store(resource, key, value)
+        return value
+
+    def invalidate(self, resource: Optional[str] = None) -> None:
+        """Drop cached data for one resource, or for every resource."""
+        if resource is None:
+            self.backend.clear()
+            return
+        self.backend.invalidate(resource)
+        self._record(resource, "invalidations")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit, miss and invalidation counts per resource."""
+        with self._lock:
+            return {
+                resource: {
+                    "hits": stats.hits,
+                    "misses": stats.misses,
+                    "invalidations": stats.invalidations,
+                }
+                for resource, stats in self._stats.items()
+            }
+
+
+class CachedLookupMixin:
+    """Adds opt-in reference caching to a lookup resource API.
+
+    Resources set ``self._cache`` in ``__init__``; when it is None every
+    call goes straight to the API as before.
+    """
+
+    _resource: str
+    _cache: Optional[ReferenceCache] = None
+
+    def _cached(self, operation: str, loader: Callable[[], List[Any]], *args: Any) -> List[Any]:
+        """Serve ``operation(*args)`` from the cache, loading it on a miss."""
+        if self._cache is None:
+            return loader()
+        key = ReferenceCache.make_key(operation, args)
+        # Hand out a copy so callers cannot reorder or truncate the cached list
+        return list(self._cache.get_or_load(self._resource, key, loader))
+
+    async def _acached(
+        self, operation: str, loader: Callable[[], Awaitable[List[Any]]], *args: Any
+    ) -> List[Any]:
+        """Async counterpart of :meth:`_cached`."""
+        if self._cache is None:
+            return await loader()
+        key = ReferenceCache.make_key(operation, args)
+        value = self._cache.lookup(self._resource, key)
+        if value is _MISS:
+            value = await loader()
+            self._cache.store(self._resource, key, value)
+        return list(value)
+
+    @staticmethod
+    async def _collect(items: AsyncIterator[Any]) -> List[Any]:
+        """Drain an async iterator into a list."""
+        return [item async for item in items]
+
+    def _invalidate_cache(self) -> None:
+        """Forget cached data for this resource after a write."""
+        if self._cache is not None:
+            self._cache.invalidate(self._resource)
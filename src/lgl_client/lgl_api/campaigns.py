@@ -1,27 +1,41 @@
 """Campaigns API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.campaign import Campaign
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class CampaignsAPI:
+class _CampaignsMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "campaigns"
+    
+    def _campaign_path(self, campaign_id: int) -> str:
+        return f"{self._resource}/{campaign_id}"
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[Campaign]:
+        return [Campaign.from_dict(item) for item in data.get("items", [])]
+
+
+class CampaignsAPI(_CampaignsMixin):
     """API for managing campaigns in Little Green Light.
     
     Campaigns represent fundraising initiatives or drives
     that span multiple appeals and activities.
     """
     
-    _resource = "campaigns"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Campaigns API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(self, *, limit: int = 25, offset: int = 0) -> List[Campaign]:
         """List campaigns for the account.
@@ -33,8 +47,19 @@ class CampaignsAPI:
         Returns:
             List of Campaign objects
         """
-        data = self._client._get(self._resource, limit=limit, offset=offset)
-        return [Campaign.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(self._client._get(self._resource, limit=limit, offset=offset))
+    
+    def iter_all(self) -> Iterator[Campaign]:
+        """Iterate over all campaigns, one page at a time.
+        
+        Yields:
+            Campaign objects
+        """
+        def _list_page(**kwargs: Any) -> List[Campaign]:
+            return self.list(**kwargs)
+            
+        for item in self._client._paginate(_list_page):
+            yield Campaign.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[Campaign]:
         """Fetch all campaigns using automatic pagination.
@@ -42,11 +67,7 @@ class CampaignsAPI:
         Returns:
             List of all Campaign objects
         """
-        def _list_page(**kwargs: Any) -> List[Campaign]:
-            return self.list(**kwargs)
-            
-        items = list(self._client._paginate(_list_page))
-        return [Campaign.from_dict(item) if isinstance(item, dict) else item for item in items]
+        return self._cached("fetch_all", lambda: list(self.iter_all()))
     
     def retrieve(self, campaign_id: int) -> Campaign:
         """Retrieve a specific campaign by ID.
@@ -57,7 +78,7 @@ class CampaignsAPI:
         Returns:
             Campaign object
         """
-        data = self._client._get(f"{self._resource}/{campaign_id}")
+        data = self._client._get(self._campaign_path(campaign_id))
         return Campaign.from_dict(data)
     
     def create(self, campaign: Campaign) -> Campaign:
@@ -70,6 +91,7 @@ class CampaignsAPI:
             Created Campaign object
         """
         data = self._client._post(self._resource, campaign.to_dict())
+        self._invalidate_cache()
         return Campaign.from_dict(data)
     
     def update(self, campaign_id: int, campaign: Campaign) -> Campaign:
@@ -82,7 +104,8 @@ class CampaignsAPI:
         Returns:
             Updated Campaign object
         """
-        data = self._client._patch(f"{self._resource}/{campaign_id}", campaign.to_dict())
+        data = self._client._patch(self._campaign_path(campaign_id), campaign.to_dict())
+        self._invalidate_cache()
         return Campaign.from_dict(data)
     
     def delete(self, campaign_id: int) -> None:
@@ -91,4 +114,54 @@ class CampaignsAPI:
         Args:
             campaign_id: Campaign ID to delete
         """
-        self._client._delete(f"{self._resource}/{campaign_id}")
\ No newline at end of file
+        self._client._delete(self._campaign_path(campaign_id))
+        self._invalidate_cache()
+
+
+class AsyncCampaignsAPI(_CampaignsMixin):
+    """Async variant of :class:`CampaignsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Campaigns API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[Campaign]:
+        """List campaigns for the account."""
+        return self._parse_page(await self._client._get(self._resource, limit=limit, offset=offset))
+    
+    async def iter_all(self) -> AsyncIterator[Campaign]:
+        """Iterate over all campaigns, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[Campaign]:
+        """Fetch all campaigns using automatic pagination."""
+        return await self._acached("fetch_all", lambda: self._collect(self.iter_all()))
+    
+    async def retrieve(self, campaign_id: int) -> Campaign:
+        """Retrieve a specific campaign by ID."""
+        data = await self._client._get(self._campaign_path(campaign_id))
+        return Campaign.from_dict(data)
+    
+    async def create(self, campaign: Campaign) -> Campaign:
+        """Create a new campaign."""
+        data = await self._client._post(self._resource, campaign.to_dict())
+        self._invalidate_cache()
+        return Campaign.from_dict(data)
+    
+    async def update(self, campaign_id: int, campaign: Campaign) -> Campaign:
+        """Update an existing campaign."""
+        data = await self._client._patch(self._campaign_path(campaign_id), campaign.to_dict())
+        self._invalidate_cache()
+        return Campaign.from_dict(data)
+    
+    async def delete(self, campaign_id: int) -> None:
+        """Delete a campaign."""
+        await self._client._delete(self._campaign_path(campaign_id))
+        self._invalidate_cache()
@@ -1,27 +1,48 @@
 """Categories API for LGL client."""
 
-from typing import Any, Dict, Iterator, List, Literal, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional
 
 from ..models.category import Category
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class CategoriesAPI:
+class _CategoriesMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "categories"
+    
+    def _category_path(self, category_id: int) -> str:
+        return f"{self._resource}/{category_id}"
+    
+    @staticmethod
+    def _list_params(item_type: Optional[str], limit: int, offset: int) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"limit": limit, "offset": offset}
+        if item_type is not None:
+            params["item_type"] = item_type
+        return params
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[Category]:
+        return [Category.from_dict(item) for item in data.get("items", [])]
+
+
+class CategoriesAPI(_CategoriesMixin):
     """API for managing categories in Little Green Light.
     
     Categories are used to organize constituents, gifts, and volunteer time
     with custom fields and categorization.
     """
     
-    _resource = "categories"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Categories API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(
         self, 
@@ -40,25 +61,21 @@ class CategoriesAPI:
         Returns:
             List of Category objects
         """
-        params: Dict[str, Any] = {"limit": limit, "offset": offset}
-        if item_type is not None:
-            params["item_type"] = item_type
-        
-        data = self._client._get(self._resource, **params)
-        return [Category.from_dict(item) for item in data.get("items", [])]
+        params = self._list_params(item_type, limit, offset)
+        return self._parse_page(self._client._get(self._resource, **params))
     
-    def fetch_all(
+    def iter_all(
         self, 
         *, 
         item_type: Optional[Literal["Constituent", "Gift", "VolunteerTime"]] = None
-    ) -> List[Category]:
-        """Fetch all categories using automatic pagination.
+    ) -> Iterator[Category]:
+        """Iterate over all categories, one page at a time.
         
         Args:
             item_type: Filter by category type (default: Constituent)
             
-        Returns:
-            List of all Category objects
+        Yields:
+            Category objects
         """
         def _list_page(**kwargs: Any) -> List[Category]:
             return self.list(**kwargs)
@@ -67,8 +84,25 @@ class CategoriesAPI:
         if item_type is not None:
             kwargs["item_type"] = item_type
             
-        items = list(self._client._paginate(_list_page, **kwargs))
-        return [Category.from_dict(item) if isinstance(item, dict) else item for item in items]
+        for item in self._client._paginate(_list_page, **kwargs):
+            yield Category.from_dict(item) if isinstance(item, dict) else item
+    
+    def fetch_all(
+        self, 
+        *, 
+        item_type: Optional[Literal["Constituent", "Gift", "VolunteerTime"]] = None
+    ) -> List[Category]:
+        """Fetch all categories using automatic pagination.
+        
+        Args:
+            item_type: Filter by category type (default: Constituent)
+            
+        Returns:
+            List of all Category objects
+        """
+        return self._cached(
+            "fetch_all", lambda: list(self.iter_all(item_type=item_type)), item_type
+        )
     
     def retrieve(self, category_id: int) -> Category:
         """Retrieve a specific category by ID.
@@ -79,7 +113,7 @@ class CategoriesAPI:
         Returns:
             Category object
         """
-        data = self._client._get(f"{self._resource}/{category_id}")
+        data = self._client._get(self._category_path(category_id))
         return Category.from_dict(data)
     
     def create(self, category: Category) -> Category:
@@ -92,6 +126,7 @@ class CategoriesAPI:
             Created Category object
         """
         data = self._client._post(self._resource, category.to_dict())
+        self._invalidate_cache()
         return Category.from_dict(data)
     
     def update(self, category_id: int, category: Category) -> Category:
@@ -104,7 +139,8 @@ class CategoriesAPI:
         Returns:
             Updated Category object
         """
-        data = self._client._patch(f"{self._resource}/{category_id}", category.to_dict())
+        data = self._client._patch(self._category_path(category_id), category.to_dict())
+        self._invalidate_cache()
         return Category.from_dict(data)
     
     def delete(self, category_id: int) -> None:
@@ -113,7 +149,8 @@ class CategoriesAPI:
         Args:
             category_id: Category ID to delete
         """
-        self._client._delete(f"{self._resource}/{category_id}")
+        self._client._delete(self._category_path(category_id))
+        self._invalidate_cache()
     
     def list_for_constituent(
         self, 
@@ -137,4 +174,89 @@ class CategoriesAPI:
             limit=limit,
             offset=offset
         )
-        return [Category.from_dict(item) for item in data.get("items", [])]
\ No newline at end of file
+        return self._parse_page(data)
+
+
+class AsyncCategoriesAPI(_CategoriesMixin):
+    """Async variant of :class:`CategoriesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Categories API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(
+        self, 
+        *, 
+        item_type: Optional[Literal["Constituent", "Gift", "VolunteerTime"]] = None,
+        limit: int = 25, 
+        offset: int = 0
+    ) -> List[Category]:
+        """List categories for the account."""
+        params = self._list_params(item_type, limit, offset)
+        return self._parse_page(await self._client._get(self._resource, **params))
+    
+    async def iter_all(
+        self, 
+        *, 
+        item_type: Optional[Literal["Constituent", "Gift", "VolunteerTime"]] = None
+    ) -> AsyncIterator[Category]:
+        """Iterate over all categories, fetching pages as they are consumed."""
+        kwargs: Dict[str, Any] = {}
+        if item_type is not None:
+            kwargs["item_type"] = item_type
+        
+        async for item in self._client._paginate(self.list, **kwargs):
+            yield item
+    
+    async def fetch_all(
+        self, 
+        *, 
+        item_type: Optional[Literal["Constituent", "Gift", "VolunteerTime"]] = None
+    ) -> List[Category]:
+        """Fetch all categories using automatic pagination."""
+        return await self._acached(
+            "fetch_all", lambda: self._collect(self.iter_all(item_type=item_type)), item_type
+        )
+    
+    async def retrieve(self, category_id: int) -> Category:
+        """Retrieve a specific category by ID."""
+        data = await self._client._get(self._category_path(category_id))
+        return Category.from_dict(data)
+    
+    async def create(self, category: Category) -> Category:
+        """Create a new category."""
+        data = await self._client._post(self._resource, category.to_dict())
+        self._invalidate_cache()
+        return Category.from_dict(data)
+    
+    async def update(self, category_id: int, category: Category) -> Category:
+        """Update an existing category."""
+        data = await self._client._patch(self._category_path(category_id), category.to_dict())
+        self._invalidate_cache()
+        return Category.from_dict(data)
+    
+    async def delete(self, category_id: int) -> None:
+        """Delete a category."""
+        await self._client._delete(self._category_path(category_id))
+        self._invalidate_cache()
+    
+    async def list_for_constituent(
+        self, 
+        constituent_id: int, 
+        *, 
+        limit: int = 25, 
+        offset: int = 0
+    ) -> List[Category]:
+        """List categories for a specific constituent."""
+        data = await self._client._get(
+            f"constituents/{constituent_id}/categories",
+            limit=limit,
+            offset=offset
+        )
+        return self._parse_page(data)
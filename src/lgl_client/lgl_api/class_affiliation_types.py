@@ -1,27 +1,38 @@
 """Class Affiliation Types API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.class_affiliation_type import ClassAffiliationType
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class ClassAffiliationTypesAPI:
+class _ClassAffiliationTypesMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "class_affiliation_types"
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[ClassAffiliationType]:
+        return [ClassAffiliationType.from_dict(item) for item in data.get("items", [])]
+
+
+class ClassAffiliationTypesAPI(_ClassAffiliationTypesMixin):
     """API for managing class affiliation types in Little Green Light.
     
     Class affiliation types define different types of relationships 
     to educational institutions (e.g., Student, Parent, Grandparent).
     """
     
-    _resource = "class_affiliation_types"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Class Affiliation Types API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(self, *, limit: int = 25, offset: int = 0) -> List[ClassAffiliationType]:
         """List class affiliation types for the account.
@@ -33,8 +44,19 @@ class ClassAffiliationTypesAPI:
         Returns:
             List of ClassAffiliationType objects
         """
-        data = self._client._get(self._resource, limit=limit, offset=offset)
-        return [ClassAffiliationType.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(self._client._get(self._resource, limit=limit, offset=offset))
+    
+    def iter_all(self) -> Iterator[ClassAffiliationType]:
+        """Iterate over all class affiliation types, one page at a time.
+        
+        Yields:
+            ClassAffiliationType objects
+        """
+        def _list_page(**kwargs: Any) -> List[ClassAffiliationType]:
+            return self.list(**kwargs)
+        
+        for item in self._client._paginate(_list_page):
+            yield ClassAffiliationType.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[ClassAffiliationType]:
         """Fetch all class affiliation types using automatic pagination.
@@ -42,8 +64,31 @@ class ClassAffiliationTypesAPI:
         Returns:
             List of all ClassAffiliationType objects
         """
-        def _list_page(**kwargs: Any) -> List[ClassAffiliationType]:
-            return self.list(**kwargs)
+        return self._cached("fetch_all", lambda: list(self.iter_all()))
+
+
+class AsyncClassAffiliationTypesAPI(_ClassAffiliationTypesMixin):
+    """Async variant of :class:`ClassAffiliationTypesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Class Affiliation Types API.
         
-        items = list(self._client._paginate(_list_page))
-        return [ClassAffiliationType.from_dict(item) if isinstance(item, dict) else item for item in items]
\ No newline at end of file
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[ClassAffiliationType]:
+        """List class affiliation types for the account."""
+        return self._parse_page(await self._client._get(self._resource, limit=limit, offset=offset))
+    
+    async def iter_all(self) -> AsyncIterator[ClassAffiliationType]:
+        """Iterate over all class affiliation types, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[ClassAffiliationType]:
+        """Fetch all class affiliation types using automatic pagination."""
+        return await self._acached("fetch_all", lambda: self._collect(self.iter_all()))
@@ -1,12 +1,33 @@
 """Class Affiliations API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.constituent import ClassAffiliation
 
 
-class ClassAffiliationsAPI:
+class _ClassAffiliationsMixin:
+    """Query parameters and payloads shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _affiliation_data(type_id: int, year: int, note: Optional[str]) -> Dict[str, Any]:
+        return {
+            "class_affiliation_type_id": type_id,
+            "year": year,
+            "note": note
+        }
+
+
+class ClassAffiliationsAPI(_ClassAffiliationsMixin):
     """API for managing constituent class affiliations."""
     
     def __init__(self, client: LGLClient):
@@ -28,14 +49,24 @@ class ClassAffiliationsAPI:
         Returns:
             Paginated response with class affiliation items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/class_affiliations', **params)
     
+    def iter_all(self, constituent_id: int) -> Iterator[ClassAffiliation]:
+        """Iterate over all class affiliations for a constituent, one page at a time.
+        
+        Args:
+            constituent_id: The constituent ID
+        
+        Yields:
+            ClassAffiliation objects
+        """
+        def _list_page(**kwargs):
+            return self.list(constituent_id, **kwargs)
+        
+        for item in self.client._paginate(_list_page):
+            yield ClassAffiliation(**item)
+    
     def fetch_all(self, constituent_id: int) -> List[ClassAffiliation]:
         """Fetch all class affiliations for a constituent with automatic pagination.
         
@@ -45,11 +76,7 @@ class ClassAffiliationsAPI:
         Returns:
             List of all ClassAffiliation objects
         """
-        def _list_page(**kwargs):
-            return self.list(constituent_id, **kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [ClassAffiliation(**item) for item in items]
+        return list(self.iter_all(constituent_id))
     
     def retrieve(self, class_affiliation_id: int) -> ClassAffiliation:
         """Retrieve a specific class affiliation by ID.
@@ -125,11 +152,7 @@ class ClassAffiliationsAPI:
         Returns:
             Created ClassAffiliation object
         """
-        return self.create(constituent_id, {
-            "class_affiliation_type_id": 1,  # Assuming 1 is Student type
-            "year": year,
-            "note": note
-        })
+        return self.create(constituent_id, self._affiliation_data(1, year, note))  # Assuming 1 is Student type
     
     def create_parent_affiliation(
         self, 
@@ -147,11 +170,7 @@ class ClassAffiliationsAPI:
         Returns:
             Created ClassAffiliation object
         """
-        return self.create(constituent_id, {
-            "class_affiliation_type_id": 2,  # Assuming 2 is Parent type
-            "year": year,
-            "note": note
-        })
+        return self.create(constituent_id, self._affiliation_data(2, year, note))  # Assuming 2 is Parent type
     
     def create_custom_affiliation(
         self, 
@@ -171,11 +190,7 @@ class ClassAffiliationsAPI:
         Returns:
             Created ClassAffiliation object
         """
-        return self.create(constituent_id, {
-            "class_affiliation_type_id": affiliation_type_id,
-            "year": year,
-            "note": note
-        })
+        return self.create(constituent_id, self._affiliation_data(affiliation_type_id, year, note))
     
     def update_year(self, class_affiliation_id: int, new_year: int) -> ClassAffiliation:
         """Update the year for a class affiliation.
@@ -238,4 +253,104 @@ class ClassAffiliationsAPI:
         """
         all_affiliations = self.fetch_all(constituent_id)
         return [affiliation for affiliation in all_affiliations 
-                if affiliation.class_affiliation_type_id == type_id]
\ No newline at end of file
+                if affiliation.class_affiliation_type_id == type_id]
+
+
+class AsyncClassAffiliationsAPI(_ClassAffiliationsMixin):
+    """Async variant of :class:`ClassAffiliationsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all class affiliations for a constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/class_affiliations', **params)
+    
+    async def iter_all(self, constituent_id: int) -> AsyncIterator[ClassAffiliation]:
+        """Iterate over all class affiliations for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list(constituent_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield ClassAffiliation(**item)
+    
+    async def fetch_all(self, constituent_id: int) -> List[ClassAffiliation]:
+        """Fetch all class affiliations for a constituent with automatic pagination."""
+        return [item async for item in self.iter_all(constituent_id)]
+    
+    async def retrieve(self, class_affiliation_id: int) -> ClassAffiliation:
+        """Retrieve a specific class affiliation by ID."""
+        response = await self.client._get(f'class_affiliations/{class_affiliation_id}')
+        return ClassAffiliation(**response)
+    
+    async def create(self, constituent_id: int, class_affiliation_data: Dict) -> ClassAffiliation:
+        """Create a new class affiliation for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/class_affiliations', class_affiliation_data)
+        return ClassAffiliation(**response)
+    
+    async def update(self, class_affiliation_id: int, class_affiliation_data: Dict) -> ClassAffiliation:
+        """Update an existing class affiliation."""
+        response = await self.client._patch(f'class_affiliations/{class_affiliation_id}', class_affiliation_data)
+        return ClassAffiliation(**response)
+    
+    async def delete(self, class_affiliation_id: int) -> Dict:
+        """Delete a class affiliation."""
+        await self.client._delete(f'class_affiliations/{class_affiliation_id}')
+        return {"result": "success"}
+    
+    async def create_student_affiliation(
+        self,
+        constituent_id: int,
+        year: int,
+        note: Optional[str] = None
+    ) -> ClassAffiliation:
+        """Create a student class affiliation."""
+        return await self.create(constituent_id, self._affiliation_data(1, year, note))  # Assuming 1 is Student type
+    
+    async def create_parent_affiliation(
+        self,
+        constituent_id: int,
+        year: int,
+        note: Optional[str] = None
+    ) -> ClassAffiliation:
+        """Create a parent class affiliation."""
+        return await self.create(constituent_id, self._affiliation_data(2, year, note))  # Assuming 2 is Parent type
+    
+    async def create_custom_affiliation(
+        self,
+        constituent_id: int,
+        affiliation_type_id: int,
+        year: int,
+        note: Optional[str] = None
+    ) -> ClassAffiliation:
+        """Create a class affiliation with custom type."""
+        return await self.create(constituent_id, self._affiliation_data(affiliation_type_id, year, note))
+    
+    async def update_year(self, class_affiliation_id: int, new_year: int) -> ClassAffiliation:
+        """Update the year for a class affiliation."""
+        return await self.update(class_affiliation_id, {"year": new_year})
+    
+    async def add_note(self, class_affiliation_id: int, note: str) -> ClassAffiliation:
+        """Add or update a note on a class affiliation."""
+        return await self.update(class_affiliation_id, {"note": note})
+    
+    async def change_type(self, class_affiliation_id: int, new_type_id: int) -> ClassAffiliation:
+        """Change the affiliation type."""
+        return await self.update(class_affiliation_id, {"class_affiliation_type_id": new_type_id})
+    
+    async def get_affiliations_by_year(self, constituent_id: int, year: int) -> List[ClassAffiliation]:
+        """Get all class affiliations for a constituent in a specific year."""
+        all_affiliations = await self.fetch_all(constituent_id)
+        return [affiliation for affiliation in all_affiliations if affiliation.year == year]
+    
+    async def get_affiliations_by_type(self, constituent_id: int, type_id: int) -> List[ClassAffiliation]:
+        """Get all class affiliations for a constituent of a specific type."""
+        all_affiliations = await self.fetch_all(constituent_id)
+        return [affiliation for affiliation in all_affiliations 
+                if affiliation.class_affiliation_type_id == type_id]
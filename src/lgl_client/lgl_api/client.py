@@ -1,39 +1,280 @@
 """LGL API HTTP Client - Core HTTP functionality and pagination."""
 
+import asyncio
+import inspect
+import json
 import logging
+import queue
 import re
-from typing import Any, Dict, Iterator, List, Optional, Union
-from urllib.parse import urljoin
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import httpx
 
+from .decoding import JSONDecoder, page_adapter, resolve_decoder
+from .entity_cache import EntityCache
 from .exceptions import LGLAPIError, NotFoundError, UnauthorizedError, ValidationError
+from .http_cache import CacheLookup, ResponseCache
+from .metrics import EventHook, RequestEvent
+from .page_size import PageSizeTuner
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, RetryStats, parse_retry_after
+from .single_flight import AsyncSingleFlight, SingleFlight
+
+if TYPE_CHECKING:
+    from ..models import LGLModel
 
 logger = logging.getLogger(__name__)
 
+# Numeric path segments (record IDs) collapse to "{id}" in endpoint templates
+_ID_SEGMENT = re.compile(r'(^|/)\d+(?=/|$)')
 
-class LGLClient:
-    """Base HTTP client for Little Green Light API.
+# Single records (``gifts/7``) and the collections records are created in
+# (``gifts``, ``constituents/42/gifts``)
+_ENTITY_PATH = re.compile(r'([a-z_]+)/(\d+)')
+_COLLECTION_PATH = re.compile(r'(?:[a-z_]+/\d+/)?([a-z_]+)')
+
+# Alphanumerics, underscores, dashes and square brackets (API array parameters)
+_PARAM_NAME = re.compile(r'[a-zA-Z0-9_\[\]-]+')
+
+# Injection patterns logged for monitoring, scanned in one pass per value
+_SUSPICIOUS_PATTERNS = (
+    r'<script',  # XSS
+    r'javascript:',  # JavaScript injection
+    r'[\'"];',  # SQL injection attempts
+    r'<!--',  # HTML injection
+    r'\\x[0-9a-fA-F]{2}',  # Hex-encoded characters
+)
+_SUSPICIOUS = re.compile(
+    '|'.join(f'(?P<p{i}>{pattern})' for i, pattern in enumerate(_SUSPICIOUS_PATTERNS)),
+    re.IGNORECASE,
+)
+# First characters of the patterns; values without any skip the full scan
+_SUSPICIOUS_LEAD = re.compile(r'[<j\'"\\]', re.IGNORECASE)
+
+_MAX_PAYLOAD_SIZE = 10000
+
+# Page size used by _paginate when neither a limit nor a tuner is given
+_DEFAULT_PAGE_SIZE = 100
+
+
+class _PageProbe:
+    """Requests sent, and time taken, while one page was fetched."""
     
-    Provides core HTTP methods, error handling, and pagination support.
+    __slots__ = ("page", "started", "latency", "responses")
+    
+    def __init__(self, page: Optional[int] = None) -> None:
+        self.page = page
+        self.started = time.perf_counter()
+        self.latency = 0.0
+        self.responses: List[Tuple[str, int]] = []
+
+
+# Set while _paginate fetches a page; _send reports each final response to it
+_PAGE_PROBE: ContextVar[Optional[_PageProbe]] = ContextVar('lgl_page_probe', default=None)
+
+# Handed from a prefetching producer to the consumer after the last page
+_PAGES_DONE = object()
+
+
+class _PageError:
+    """An exception raised while prefetching, re-raised by the consumer."""
+    
+    __slots__ = ("error",)
+    
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+@lru_cache(maxsize=1024)
+def _safe_param_name(name: str) -> bool:
+    """Whether a parameter name is safe; the same few names recur on every request."""
+    return len(name) <= 100 and _PARAM_NAME.fullmatch(name) is not None
+
+
+def _payload_size(data: Any, limit: int) -> int:
+    """Estimate ``len(str(data))`` without building the string.
+    
+    Stops counting once ``limit`` is exceeded, so oversized payloads are
+    rejected after a partial walk.
+    """
+    if isinstance(data, str):
+        return len(data) + 2
+    if isinstance(data, dict):
+        size = 2
+        for key, value in data.items():
+            size += _payload_size(key, limit) + _payload_size(value, limit - size) + 4
+            if size > limit:
+                break
+        return size
+    if isinstance(data, (list, tuple)):
+        size = 2
+        for item in data:
+            size += _payload_size(item, limit - size) + 2
+            if size > limit:
+                break
+        return size
+    if data is None or isinstance(data, (bool, int, float)):
+        return len(repr(data))
+    return len(str(data))
+
+
+class BaseLGLClient:
+    """Transport-independent core shared by the sync and async clients.
+    
+    Holds request validation, debug output, error mapping and the page
+    bookkeeping used by pagination, so that :class:`LGLClient` and
+    :class:`AsyncLGLClient` only differ in how they perform I/O.
     """
     
     BASE_URL = "https://api.littlegreenlight.com/api/v1/"
     
-    def __init__(self, api_key: str, *, timeout: float = 10.0, debug: bool = False) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        timeout: Union[float, httpx.Timeout] = 10.0,
+        connect_timeout: Optional[float] = None,
+        debug: bool = False,
+        page_concurrency: int = 1,
+        page_prefetch: int = 0,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Any = None,
+        trusted_models: bool = False,
+        event_hooks: Optional[Sequence[EventHook]] = None,
+        json_decoder: Union[str, JSONDecoder, None] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        entity_cache: Optional[EntityCache] = None,
+        page_size_tuner: Optional[PageSizeTuner] = None,
+    ) -> None:
         """Initialize the LGL API client.
         
         Args:
             api_key: LGL API bearer token
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds, or a full ``httpx.Timeout``
+            connect_timeout: Separate limit for establishing connections
+                (default: same as ``timeout``)
             debug: Enable debug mode to log request details
+            page_concurrency: Default number of pages fetched in parallel
+                by :meth:`_paginate` (1 fetches pages one after another)
+            page_prefetch: Default number of pages :meth:`_paginate` fetches
+                in the background ahead of the caller (0 disables prefetching)
+            retry: Retry policy for throttled or failed requests (default: no retries)
+            rate_limiter: Client-side limiter consulted before every request
+                attempt, e.g. a :class:`TokenBucket` (default: unlimited)
+            limits: Connection pool limits (default: :meth:`default_limits`)
+            http2: Negotiate HTTP/2 so concurrent requests share one
+                connection; requires the ``h2`` package (``lgl-client[http2]``).
+                :class:`LGLClient` then rejects any concurrency above 1
+                (see :meth:`LGLClient._resolve_concurrency`); multiplex with
+                :class:`AsyncLGLClient` instead
+            transport: Custom httpx transport, e.g. for proxies or testing;
+                must match the client flavour (sync or async)
+            trusted_models: Build models from bulk reads without validation
+                (see :mod:`lgl_client.models.trusted`); overridable per call
+            event_hooks: Callables receiving a :class:`RequestEvent` after
+                every request, e.g. a :class:`MetricsCollector`
+            json_decoder: Response decoder: ``"stdlib"`` (default),
+                ``"orjson"``, ``"pydantic"``, ``"auto"`` or a callable
+                taking the body bytes (see :mod:`lgl_client.lgl_api.decoding`)
+            coalesce_requests: Share one request between identical GETs
+                in flight at the same time (see
+                :mod:`lgl_client.lgl_api.single_flight`)
+            response_cache: Cache for GET responses, revalidated with
+                ``ETag``/``Last-Modified`` (see :class:`ResponseCache`)
+            entity_cache: Cache of single records read by ``retrieve`` and
+                kept current by writes (see :class:`EntityCache`)
+            page_size_tuner: Chooses the page size of :meth:`_paginate`
+                from observed latency and payload size (see
+                :class:`PageSizeTuner`); without it pages hold 100 items
         """
-        self._client = httpx.Client(
+        if page_concurrency < 1:
+            raise ValueError("page_concurrency must be at least 1")
+        if page_prefetch < 0:
+            raise ValueError("page_prefetch must not be negative")
+        self.http2 = http2
+        # Reject a default concurrency the client cannot run, before connecting
+        self._resolve_concurrency(page_concurrency)
+        
+        if connect_timeout is not None:
+            timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        
+        self._client = self._create_http_client(
             base_url=self.BASE_URL,
             headers={"Authorization": f"Bearer {api_key}"},
             timeout=timeout,
+            limits=limits if limits is not None else self.default_limits(page_concurrency),
+            http2=http2,
+            transport=transport,
         )
         self.debug = debug
+        self.page_concurrency = page_concurrency
+        self.page_prefetch = page_prefetch
+        self.retry_policy = retry if retry is not None else RetryPolicy.disabled()
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.trusted_models = trusted_models
+        self.event_hooks: List[EventHook] = list(event_hooks or ())
+        self.json_decoder, self._loads = resolve_decoder(json_decoder)
+        self.single_flight: Optional[SingleFlight] = (
+            self._create_single_flight() if coalesce_requests else None
+        )
+        self.response_cache = response_cache
+        self.entity_cache = entity_cache
+        self.page_size_tuner = page_size_tuner
+    
+    @staticmethod
+    def default_limits(page_concurrency: int = 1) -> httpx.Limits:
+        """Connection pool limits sized for concurrent pagination.
+        
+        Keeps enough idle connections alive for every page worker to reuse
+        one, and holds them for longer than httpx's 5 second default so the
+        pool survives the gap between consecutive ``fetch_all`` calls.
+        """
+        return httpx.Limits(
+            max_connections=max(20, page_concurrency * 2),
+            max_keepalive_connections=max(10, page_concurrency),
+            keepalive_expiry=30.0,
+        )
+    
+    def _create_http_client(self, **kwargs: Any) -> Any:
+        """Create the underlying httpx client."""
+        raise NotImplementedError
+    
+    def _create_single_flight(self) -> SingleFlight:
+        """Create the group coalescing identical GETs."""
+        return SingleFlight()
+    
+    @staticmethod
+    def _request_key(path: str, params: Dict[str, Any]) -> Any:
+        """Hashable identity of a GET: its path and query, in key order."""
+        return (path, tuple(sorted(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in params.items()
+        )))
     
     def _debug_request(self, method: str, path: str, **kwargs) -> None:
         """Debug print request details if debug mode is enabled.
@@ -130,12 +371,7 @@ class LGLClient:
     
     def _is_safe_param_name(self, name: str) -> bool:
         """Check if parameter name is safe (alphanumeric, underscore, dash, square brackets only)."""
-        if not isinstance(name, str):
-            return False
-        
-        # Allow alphanumeric characters, underscores, dashes, and square brackets for API array parameters
-        pattern = r'^[a-zA-Z0-9_\[\]-]+$'
-        return bool(re.match(pattern, name)) and len(name) <= 100
+        return isinstance(name, str) and _safe_param_name(name)
     
     def _sanitize_param_value(self, value: Any) -> Any:
         """Sanitize parameter values to prevent injection attacks."""
@@ -153,20 +389,12 @@ class LGLClient:
             if len(value) > 1000:
                 raise ValueError(f"String parameter too long: {len(value)} characters")
             
-            # Check for potential injection patterns
-            suspicious_patterns = [
-                r'<script',  # XSS
-                r'javascript:',  # JavaScript injection
-                r'[\'"];',  # SQL injection attempts
-                r'<!--',  # HTML injection
-                r'\\x[0-9a-fA-F]{2}',  # Hex-encoded characters
-            ]
-            
-            value_lower = value.lower()
-            for pattern in suspicious_patterns:
-                if re.search(pattern, value_lower):
-                    logger.warning(f"Suspicious pattern detected in parameter: {pattern}")
-                    # Don't reject, but log for monitoring
+            # Log potential injection patterns for monitoring, without rejecting
+            if _SUSPICIOUS_LEAD.search(value):
+                found = {match.lastgroup for match in _SUSPICIOUS.finditer(value)}
+                for i, pattern in enumerate(_SUSPICIOUS_PATTERNS):
+                    if f"p{i}" in found:
+                        logger.warning(f"Suspicious pattern detected in parameter: {pattern}")
             
             return value
         elif isinstance(value, list):
@@ -183,10 +411,10 @@ class LGLClient:
         if not isinstance(payload, dict):
             raise ValueError("Payload must be a dictionary")
         
-        # Check payload size (rough estimate)
-        payload_str = str(payload)
-        if len(payload_str) > 10000:  # 10KB limit for safety
-            raise ValueError(f"Payload too large: {len(payload_str)} characters")
+        # Check payload size (rough estimate of its repr, 10KB limit for safety)
+        size = _payload_size(payload, _MAX_PAYLOAD_SIZE)
+        if size > _MAX_PAYLOAD_SIZE:
+            raise ValueError(f"Payload too large: more than {_MAX_PAYLOAD_SIZE} characters")
         
         # Recursively validate payload structure
         return self._validate_nested_dict(payload, max_depth=5, current_depth=0)
@@ -213,6 +441,494 @@ class LGLClient:
         else:
             return self._sanitize_param_value(data)
     
+    @staticmethod
+    def _path_template(path: str) -> str:
+        """Path with numeric IDs replaced, e.g. ``constituents/{id}/gifts``."""
+        return _ID_SEGMENT.sub(r'\1{id}', path.strip('/'))
+    
+    @classmethod
+    def _endpoint(cls, method: str, path: str) -> str:
+        """Endpoint key for per-endpoint stats, e.g. ``GET constituents/{id}/gifts``."""
+        return f"{method} {cls._path_template(path)}"
+    
+    def _emit_event(
+        self,
+        method: str,
+        path: str,
+        kwargs: Dict[str, Any],
+        attempt: int,
+        started: float,
+        attempt_started: float,
+        response: Optional[httpx.Response] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Report a finished request to the event hooks.
+        
+        Only called when hooks are registered; a failing hook is logged and
+        never affects the request.
+        """
+        finished = time.perf_counter()
+        probe = _PAGE_PROBE.get()
+        page = probe.page if probe is not None else None
+        params = kwargs.get('params')
+        if page is None and params and 'offset' in params and params.get('limit'):
+            page = int(params['offset']) // int(params['limit']) + 1
+        event = RequestEvent(
+            method=method,
+            endpoint=self._path_template(path),
+            status=response.status_code if response is not None else None,
+            bytes=len(response.content) if response is not None else 0,
+            latency=finished - attempt_started,
+            elapsed=finished - started,
+            retries=attempt - 1,
+            page=page,
+            error=type(error).__name__ if error is not None else None,
+        )
+        for hook in self.event_hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception(f"Event hook {hook!r} failed")
+    
+    def _rate_limit_delay(self) -> float:
+        """Reserve a request slot from the rate limiter, returning the wait in seconds."""
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.reserve()
+    
+    def _observe_response(self, response: httpx.Response) -> None:
+        """Let the rate limiter adapt to a 429 response."""
+        if self.rate_limiter is not None and response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            self.rate_limiter.on_throttle(retry_after)
+    
+    def _retry_delay(
+        self,
+        method: str,
+        path: str,
+        attempt: int,
+        *,
+        response: Optional[httpx.Response] = None,
+        error: Optional[httpx.HTTPError] = None,
+    ) -> Optional[float]:
+        """Decide whether a failed attempt should be retried.
+        
+        Args:
+            method: HTTP method name
+            path: API endpoint path
+            attempt: Number of the attempt that just completed (1-based)
+            response: Response received, if any
+            error: Transport error raised instead of a response, if any
+            
+        Returns:
+            Seconds to wait before retrying, or None to stop here
+        """
+        policy = self.retry_policy
+        retry_after = None
+        if response is not None:
+            if response.is_success or response.status_code not in policy.retry_statuses:
+                return None
+            retry_after = response.headers.get('Retry-After')
+        elif not (policy.retry_on_transport_errors and isinstance(error, httpx.TransportError)):
+            return None
+        
+        endpoint = self._endpoint(method, path)
+        if not policy.allows(method, attempt):
+            if attempt > 1:
+                self.retry_stats.record_exhausted(endpoint)
+            return None
+        
+        delay = policy.delay(attempt, retry_after)
+        self.retry_stats.record_retry(endpoint, delay)
+        reason = response.status_code if response is not None else type(error).__name__
+        logger.warning(
+            f"Retrying {endpoint} after {reason} "
+            f"(attempt {attempt + 1}/{policy.max_attempts}) in {delay:.2f}s"
+        )
+        return delay
+    
+    def _request_url(self, path: str) -> str:
+        """Build the absolute URL for an API path (used in error reports)."""
+        return str(self._client.base_url) + path
+    
+    def _transport_error(
+        self,
+        method: str,
+        path: str,
+        error: httpx.HTTPError,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> LGLAPIError:
+        """Convert an httpx transport error into an LGLAPIError."""
+        logger.error(f"HTTP error during {method} {path}: {error}")
+        return LGLAPIError(
+            f"HTTP error: {error}",
+            status_code=getattr(error, 'response', {}).get('status_code', 0),
+            url=self._request_url(path),
+            payload=payload,
+        )
+    
+    def _decode_response(
+        self,
+        method: str,
+        path: str,
+        response: httpx.Response,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Check the response status and decode its JSON body.
+        
+        Raises:
+            LGLAPIError: For API errors or an undecodable body
+        """
+        self._handle_response(response)
+        if method != "GET":
+            self._invalidate_cached(path)
+        data: Dict[str, Any]
+        try:
+            if self._loads is None:
+                data = response.json()
+            else:
+                data = self._loads(response.content)
+        except ValueError as e:
+            logger.error(f"JSON decode error during {method} {path}: {e}")
+            raise LGLAPIError(
+                f"Invalid JSON response: {e}",
+                status_code=response.status_code,
+                url=self._request_url(path),
+                payload=payload,
+            )
+        if method != "GET" and self.entity_cache is not None:
+            self._write_through(method, path, data, payload)
+        return data
+    
+    def _handle_response(self, response: httpx.Response) -> None:
+        """Handle HTTP response and raise appropriate exceptions.
+        
+        Args:
+            response: HTTP response object
+            
+        Raises:
+            LGLAPIError: For various API error conditions
+        """
+        if response.is_success:
+            return
+        
+        # Try to get error details from response body
+        try:
+            error_data = response.json()
+            # LGL API returns 'error' and 'description' fields
+            if 'error' in error_data:
+                error_message = error_data['error']
+                if 'description' in error_data:
+                    error_message += f": {error_data['description']}"
+            else:
+                # Fallback to standard 'message' field or default
+                error_message = error_data.get('message', f'HTTP {response.status_code}')
+        except Exception:
+            error_message = f'HTTP {response.status_code}'
+        
+        # Map status codes to specific exceptions
+        if response.status_code == 401:
+            raise UnauthorizedError(
+                error_message,
+                status_code=response.status_code,
+                url=str(response.url),
+            )
+        elif response.status_code == 404:
+            raise NotFoundError(
+                error_message,
+                status_code=response.status_code,
+                url=str(response.url),
+            )
+        elif response.status_code == 422:
+            raise ValidationError(
+                error_message,
+                status_code=response.status_code,
+                url=str(response.url),
+            )
+        else:
+            raise LGLAPIError(
+                error_message,
+                status_code=response.status_code,
+                url=str(response.url),
+            )
+    
+    def _cache_lookup(self, path: str, params: Dict[str, Any]) -> Optional[CacheLookup]:
+        """Cached state of a GET, or None if it is not cached at all."""
+        cache = self.response_cache
+        if cache is None:
+            return None
+        template = self._path_template(path)
+        if cache.bypasses(path, template):
+            return None
+        return cache.lookup(path, template, params)
+    
+    def _decode_cached(self, body: str) -> Any:
+        """Decode a response body kept by the response cache."""
+        return (self._loads or json.loads)(body.encode('utf-8'))
+    
+    def _cached_response(
+        self, path: str, response: httpx.Response, lookup: CacheLookup
+    ) -> Any:
+        """Decode a GET response sent after a cache lookup and update the cache."""
+        cache = self.response_cache
+        if cache is None:
+            return self._decode_response("GET", path, response)
+        if response.status_code == 304 and lookup.entry is not None:
+            return self._decode_cached(cache.revalidated(lookup, response)['body'])
+        data = self._decode_response("GET", path, response)
+        cache.store(lookup, response)
+        return data
+    
+    def _invalidate_cached(self, path: str) -> None:
+        """Drop cached GET responses and the record at ``path`` after a write."""
+        if self.response_cache is not None:
+            self.response_cache.invalidate(self._path_template(path))
+        entity = self._entity_key(path)
+        if entity is not None and self.entity_cache is not None:
+            self.entity_cache.evict(*entity)
+    
+    def _entity_key(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Tuple[str, int]]:
+        """``(resource, id)`` of a single-record path such as ``gifts/7``.
+        
+        None when the entity cache is off, the path is not a single record
+        or query parameters (e.g. ``expand``) change its representation.
+        """
+        if self.entity_cache is None or params:
+            return None
+        match = _ENTITY_PATH.fullmatch(path.strip('/'))
+        if match is None:
+            return None
+        return match.group(1), int(match.group(2))
+    
+    def _cached_entity(self, entity: Optional[Tuple[str, int]]) -> Optional[Dict[str, Any]]:
+        """Cached copy of a record, or None."""
+        if entity is None or self.entity_cache is None:
+            return None
+        return self.entity_cache.get(*entity)
+    
+    def _store_entity(
+        self, entity: Optional[Tuple[str, int]], data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Keep a record read with GET and return it."""
+        if entity is not None and self.entity_cache is not None and isinstance(data, dict):
+            self.entity_cache.put(entity[0], entity[1], data)
+        return data
+    
+    def _write_through(
+        self, method: str, path: str, data: Any, payload: Optional[Dict[str, Any]]
+    ) -> None:
+        """Store the record returned by a create (POST) or update (PATCH)."""
+        if not isinstance(data, dict):
+            return
+        entity_id = data.get('id')
+        if not isinstance(entity_id, int) or isinstance(entity_id, bool):
+            return
+        path = path.strip('/')
+        if method == "PATCH":
+            entity = self._entity_key(path)
+            if entity is None or entity[1] != entity_id:
+                return
+            resource = entity[0]
+        elif method == "POST":
+            match = _COLLECTION_PATH.fullmatch(path)
+            # A body carrying an ID links an existing record instead of
+            # creating one, e.g. adding a keyword to a constituent
+            if match is None or (payload and 'id' in payload):
+                return
+            resource = match.group(1)
+        else:
+            return
+        if self.entity_cache is not None:
+            self.entity_cache.put(resource, entity_id, data)
+    
+    def _decode_page(
+        self, path: str, response: httpx.Response, model: Type["LGLModel"]
+    ) -> Any:
+        """Check the response status and validate its body as a page of ``model``.
+        
+        Raises:
+            LGLAPIError: For API errors or an undecodable body
+            pydantic.ValidationError: For items that do not fit the model
+        """
+        from pydantic import ValidationError as ModelValidationError
+        
+        self._handle_response(response)
+        content = response.content
+        try:
+            array = content.lstrip()[:1] == b'['
+            page = page_adapter(model, array).validate_json(content)
+        except ModelValidationError as e:
+            if e.errors()[0]['type'] != 'json_invalid':
+                raise
+            logger.error(f"JSON decode error during GET {path}: {e}")
+            raise LGLAPIError(
+                f"Invalid JSON response: {e}",
+                status_code=response.status_code,
+                url=self._request_url(path),
+            )
+        if isinstance(page, list):
+            return page
+        return {**(page.model_extra or {}), 'items': page.items}
+    
+    @staticmethod
+    def _build_page(result: Any, model: Type["LGLModel"], trusted: bool) -> Any:
+        """Replace the raw items of a decoded page with ``model`` instances."""
+        if isinstance(result, list):
+            return [model.from_dict(item, trusted=trusted) for item in result]
+        if isinstance(result, dict) and 'items' in result:
+            items = [model.from_dict(item, trusted=trusted) for item in result['items']]
+            return {**result, 'items': items}
+        return result
+    
+    def _direct_pages(self, trusted: bool) -> bool:
+        """Whether pages go straight from bytes to validated models."""
+        return self.json_decoder == "pydantic" and not trusted
+    
+    @staticmethod
+    def _page_items(result: Any) -> Optional[List[Any]]:
+        """Extract the items of a page, or None for an unrecognised shape."""
+        if isinstance(result, dict) and 'items' in result:
+            items: List[Any] = result['items']
+            return items
+        if isinstance(result, list):
+            return result
+        return None
+    
+    @staticmethod
+    def _is_last_page(result: Any, items: List[Any], offset: int, limit: int) -> bool:
+        """Decide whether a non-empty page is the final one."""
+        if isinstance(result, dict):
+            total_items = result.get('total_items', 0)
+            items_count = result.get('items_count', len(items))
+            
+            # If we got fewer items than requested, or we've reached total, stop
+            return bool(items_count < limit or offset + items_count >= total_items)
+        
+        # For list responses, if we got fewer than limit, we're done
+        return len(items) < limit
+    
+    @staticmethod
+    def _remaining_offsets(result: Any, items: List[Any], offset: int) -> Optional[List[int]]:
+        """Offsets of the pages still to fetch after a non-final page.
+        
+        Only dict pages carrying ``total_items`` describe the rest of the
+        collection; for any other shape None is returned and the caller
+        has to keep walking the pages one by one.
+        """
+        if not isinstance(result, dict) or 'total_items' not in result:
+            return None
+        page_size = result.get('items_count', len(items))
+        if page_size <= 0:
+            return None
+        return list(range(offset + page_size, result['total_items'], page_size))
+    
+    @staticmethod
+    def _record_page_response(path: str, response: httpx.Response) -> None:
+        """Report a final response to the page being measured, if any."""
+        probe = _PAGE_PROBE.get()
+        if probe is not None:
+            probe.responses.append((path, len(response.content)))
+    
+    @contextmanager
+    def _page_probe(self, page: Optional[int] = None) -> Iterator[_PageProbe]:
+        """Measure the requests made while fetching one page.
+        
+        Args:
+            page: 1-based number of the page, reported in request events
+        """
+        probe = _PageProbe(page)
+        token = _PAGE_PROBE.set(probe)
+        try:
+            yield probe
+        finally:
+            _PAGE_PROBE.reset(token)
+            probe.latency = time.perf_counter() - probe.started
+    
+    @staticmethod
+    def _page_hint(call_func: Any) -> Optional[str]:
+        """Stable name of a page function, e.g. ``NotesAPI.iter_all.<locals>._list_page``."""
+        func = getattr(call_func, '__func__', call_func)
+        name = getattr(func, '__qualname__', None)
+        if name is None:
+            return None
+        return f"{getattr(func, '__module__', '')}.{name}"
+    
+    def _first_page_size(
+        self, endpoint: Optional[str] = None, hint: Optional[str] = None
+    ) -> int:
+        """Page size of the first page of a paginated read."""
+        if self.page_size_tuner is None:
+            return _DEFAULT_PAGE_SIZE
+        return self.page_size_tuner.page_size(endpoint, hint=hint)
+    
+    def _next_page_size(
+        self, probe: _PageProbe, limit: int, items: Optional[List[Any]], hint: Optional[str] = None
+    ) -> int:
+        """Feed a measured page to the tuner and return the next page size.
+        
+        Pages served without a request (from a cache) teach nothing and
+        keep the current size.
+        """
+        tuner = self.page_size_tuner
+        if tuner is None or not probe.responses:
+            return limit
+        path = probe.responses[-1][0]
+        return tuner.observe(
+            self._path_template(path),
+            items=len(items or ()),
+            latency=probe.latency,
+            size=sum(size for _, size in probe.responses),
+            hint=hint,
+        )
+    
+    def _resolve_concurrency(self, concurrency: Optional[int]) -> int:
+        """Return the per-call page concurrency, falling back to the client default."""
+        if concurrency is None:
+            return self.page_concurrency
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        return concurrency
+
+    def _resolve_prefetch(self, prefetch: Optional[int]) -> int:
+        """Return the per-call prefetch depth, falling back to the client default."""
+        if prefetch is None:
+            return self.page_prefetch
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+        return prefetch
+    
+    def _resolve_trusted(self, trusted: Optional[bool]) -> bool:
+        """Return the per-call trusted flag, falling back to the client default."""
+        return self.trusted_models if trusted is None else trusted
+
+
+class LGLClient(BaseLGLClient):
+    """Base HTTP client for Little Green Light API.
+    
+    Provides core HTTP methods, error handling, and pagination support.
+    """
+    
+    def _create_http_client(self, **kwargs: Any) -> httpx.Client:
+        """Create the underlying synchronous httpx client."""
+        return httpx.Client(**kwargs)
+    
+    def _resolve_concurrency(self, concurrency: Optional[int]) -> int:
+        """Return the per-call concurrency, refusing threads on an HTTP/2 client.
+        
+        httpcore's sync HTTP/2 connection can send the headers of streams
+        opened by several threads out of ID order, which servers reject as
+        a protocol error.
+        """
+        concurrency = super()._resolve_concurrency(concurrency)
+        if concurrency > 1 and self.http2:
+            raise ValueError(
+                "http2=True on the sync client requires a concurrency of 1; "
+                "use new_async_client() to multiplex requests over HTTP/2"
+            )
+        return concurrency
+    
     def __enter__(self) -> "LGLClient":
         """Context manager entry."""
         return self
@@ -225,6 +941,59 @@ class LGLClient:
         """Close the HTTP client."""
         self._client.close()
     
+    def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a single request through the httpx client.
+        
+        Args:
+            method: HTTP method name
+            path: API endpoint path
+            **kwargs: Arguments for the httpx request method (params, json)
+            
+        Returns:
+            Raw HTTP response
+            
+        Each attempt first waits for the ``rate_limiter``, if any. Retryable
+        failures are retried according to ``retry_policy``; the final
+        response is returned whatever its status.
+        
+        Raises:
+            LGLAPIError: For transport-level failures
+        """
+        send = getattr(self._client, method.lower())
+        hooks = self.event_hooks
+        started = time.perf_counter() if hooks else 0.0
+        attempt = 1
+        while True:
+            wait = self._rate_limit_delay()
+            if wait > 0:
+                time.sleep(wait)
+            
+            attempt_started = time.perf_counter() if hooks else 0.0
+            try:
+                response: httpx.Response = send(path, **kwargs)
+            except httpx.HTTPError as e:
+                delay = self._retry_delay(method, path, attempt, error=e)
+                if delay is None:
+                    if hooks:
+                        self._emit_event(
+                            method, path, kwargs, attempt, started, attempt_started, error=e
+                        )
+                    raise self._transport_error(method, path, e, kwargs.get('json'))
+            else:
+                self._observe_response(response)
+                delay = self._retry_delay(method, path, attempt, response=response)
+                if delay is None:
+                    if hooks:
+                        self._emit_event(
+                            method, path, kwargs, attempt, started, attempt_started,
+                            response=response,
+                        )
+                    self._record_page_response(path, response)
+                    return response
+            
+            time.sleep(delay)
+            attempt += 1
+    
     def _get(self, path: str, **params: Any) -> Dict[str, Any]:
         """Make a GET request to the LGL API.
         
@@ -241,26 +1010,50 @@ class LGLClient:
         """
         # Validate input parameters for security
         validated_params = self._validate_api_params(params) if params else {}
+        entity = self._entity_key(path, validated_params)
+        cached = self._cached_entity(entity)
+        if cached is not None:
+            return cached
+        
+        def fetch() -> Dict[str, Any]:
+            lookup = self._cache_lookup(path, validated_params)
+            if lookup is not None and lookup.fresh and lookup.entry is not None:
+                return self._store_entity(entity, self._decode_cached(lookup.entry['body']))
+            
+            self._debug_request("GET", path, params=validated_params)
+            if lookup is not None and lookup.headers:
+                response = self._send(
+                    "GET", path, params=validated_params, headers=lookup.headers
+                )
+            else:
+                response = self._send("GET", path, params=validated_params)
+            if lookup is None:
+                return self._store_entity(entity, self._decode_response("GET", path, response))
+            return self._store_entity(entity, self._cached_response(path, response, lookup))
+        
+        if self.single_flight is None:
+            return fetch()
+        return self.single_flight.do(self._request_key(path, validated_params), fetch)
+    
+    def _get_page(
+        self, path: str, model: Type["LGLModel"], *, trusted: bool = False, **params: Any
+    ) -> Any:
+        """Make a GET request for a page and build its items as ``model`` instances.
+        
+        With the ``"pydantic"`` decoder, untrusted pages are validated
+        straight from the response bytes; otherwise the page comes from
+        :meth:`_get` and each item goes through ``model.from_dict``.
+        
+        Returns:
+            The page (a dict with ``items``, or a list) holding models
+        """
+        if not self._direct_pages(trusted):
+            return self._build_page(self._get(path, **params), model, trusted)
+        validated_params = self._validate_api_params(params) if params else {}
         
         self._debug_request("GET", path, params=validated_params)
-        try:
-            response = self._client.get(path, params=validated_params)
-            self._handle_response(response)
-            return response.json()
-        except ValueError as e:
-            logger.error(f"JSON decode error during GET {path}: {e}")
-            raise LGLAPIError(
-                f"Invalid JSON response: {e}",
-                status_code=response.status_code,
-                url=str(self._client.base_url) + path,
-            )
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error during GET {path}: {e}")
-            raise LGLAPIError(
-                f"HTTP error: {e}",
-                status_code=getattr(e, 'response', {}).get('status_code', 0),
-                url=str(self._client.base_url) + path,
-            )
+        response = self._send("GET", path, params=validated_params)
+        return self._decode_page(path, response, model)
     
     def _post(self, path: str, json: Dict[str, Any]) -> Dict[str, Any]:
         """Make a POST request to the LGL API.
@@ -280,26 +1073,8 @@ class LGLClient:
         validated_json = self._validate_json_payload(json)
         
         self._debug_request("POST", path, json=validated_json)
-        try:
-            response = self._client.post(path, json=validated_json)
-            self._handle_response(response)
-            return response.json()
-        except ValueError as e:
-            logger.error(f"JSON decode error during POST {path}: {e}")
-            raise LGLAPIError(
-                f"Invalid JSON response: {e}",
-                status_code=response.status_code,
-                url=str(self._client.base_url) + path,
-                payload=validated_json,
-            )
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error during POST {path}: {e}")
-            raise LGLAPIError(
-                f"HTTP error: {e}",
-                status_code=getattr(e, 'response', {}).get('status_code', 0),
-                url=str(self._client.base_url) + path,
-                payload=validated_json,
-            )
+        response = self._send("POST", path, json=validated_json)
+        return self._decode_response("POST", path, response, validated_json)
     
     def _patch(self, path: str, json: Dict[str, Any]) -> Dict[str, Any]:
         """Make a PATCH request to the LGL API.
@@ -319,153 +1094,513 @@ class LGLClient:
         validated_json = self._validate_json_payload(json)
         
         self._debug_request("PATCH", path, json=validated_json)
-        try:
-            response = self._client.patch(path, json=validated_json)
-            self._handle_response(response)
-            return response.json()
-        except ValueError as e:
-            logger.error(f"JSON decode error during PATCH {path}: {e}")
-            raise LGLAPIError(
-                f"Invalid JSON response: {e}",
-                status_code=response.status_code,
-                url=str(self._client.base_url) + path,
-                payload=validated_json,
-            )
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error during PATCH {path}: {e}")
-            raise LGLAPIError(
-                f"HTTP error: {e}",
-                status_code=getattr(e, 'response', {}).get('status_code', 0),
-                url=str(self._client.base_url) + path,
-                payload=validated_json,
-            )
+        response = self._send("PATCH", path, json=validated_json)
+        return self._decode_response("PATCH", path, response, validated_json)
     
-    def _delete(self, path: str) -> None:
+    def _delete(self, path: str, **params: Any) -> None:
         """Make a DELETE request to the LGL API.
         
         Args:
             path: API endpoint path
+            **params: Query parameters
             
         Raises:
             LGLAPIError: For API errors
         """
-        self._debug_request("DELETE", path)
-        try:
-            response = self._client.delete(path)
-            self._handle_response(response)
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error during DELETE {path}: {e}")
-            raise LGLAPIError(
-                f"HTTP error: {e}",
-                status_code=getattr(e, 'response', {}).get('status_code', 0),
-                url=str(self._client.base_url) + path,
-            )
-    
-    def _handle_response(self, response: httpx.Response) -> None:
-        """Handle HTTP response and raise appropriate exceptions.
-        
-        Args:
-            response: HTTP response object
-            
-        Raises:
-            LGLAPIError: For various API error conditions
-        """
-        if response.is_success:
-            return
-        
-        # Try to get error details from response body
-        try:
-            error_data = response.json()
-            # LGL API returns 'error' and 'description' fields
-            if 'error' in error_data:
-                error_message = error_data['error']
-                if 'description' in error_data:
-                    error_message += f": {error_data['description']}"
-            else:
-                # Fallback to standard 'message' field or default
-                error_message = error_data.get('message', f'HTTP {response.status_code}')
-        except Exception:
-            error_message = f'HTTP {response.status_code}'
+        validated_params = self._validate_api_params(params) if params else {}
         
-        # Map status codes to specific exceptions
-        if response.status_code == 401:
-            raise UnauthorizedError(
-                error_message,
-                status_code=response.status_code,
-                url=str(response.url),
-            )
-        elif response.status_code == 404:
-            raise NotFoundError(
-                error_message,
-                status_code=response.status_code,
-                url=str(response.url),
-            )
-        elif response.status_code == 422:
-            raise ValidationError(
-                error_message,
-                status_code=response.status_code,
-                url=str(response.url),
-            )
+        self._debug_request("DELETE", path, params=validated_params)
+        if validated_params:
+            response = self._send("DELETE", path, params=validated_params)
         else:
-            raise LGLAPIError(
-                error_message,
-                status_code=response.status_code,
-                url=str(response.url),
-            )
+            response = self._send("DELETE", path)
+        self._handle_response(response)
+        self._invalidate_cached(path)
     
-    @staticmethod
     def _paginate(
+        self,
         call_func: Any, 
         *, 
-        limit: int = 100, 
+        limit: Optional[int] = None, 
+        concurrency: Optional[int] = None,
+        prefetch: Optional[int] = None,
         **kwargs: Any
-    ) -> Iterator[Dict[str, Any]]:
+    ) -> Iterator[Any]:
         """Paginate through API results.
         
+        When the first page reports ``total_items`` and ``concurrency`` is
+        greater than one, the remaining pages are downloaded through a
+        bounded thread pool. Items are still yielded in offset order.
+        
+        With ``prefetch`` greater than zero, pages are fetched by a
+        background thread while the caller works through the current one
+        (see :meth:`_prefetch`).
+        
         Args:
             call_func: Function to call for each page
-            limit: Items per page
+            limit: Items per page; by default 100, or chosen page by page
+                by the client's ``page_size_tuner``
+            concurrency: Pages fetched in parallel (defaults to ``page_concurrency``)
+            prefetch: Pages fetched ahead of the caller (defaults to
+                ``page_prefetch``; 0 fetches a page only once the previous
+                one has been consumed)
             **kwargs: Additional arguments to pass to call_func
             
         Yields:
             Individual items from paginated results
         """
+        concurrency = self._resolve_concurrency(concurrency)
+        pages = self._walk_pages(call_func, limit, concurrency, kwargs)
+        yield from self._prefetch(pages, prefetch)
+    
+    def _walk_pages(
+        self,
+        call_func: Any,
+        limit: Optional[int],
+        concurrency: int,
+        kwargs: Dict[str, Any],
+    ) -> Iterator[List[Any]]:
+        """Fetch the pages of :meth:`_paginate`, yielding the items of each."""
+        tuned = limit is None
+        hint = self._page_hint(call_func) if tuned and self.page_size_tuner else None
+        if limit is None:
+            limit = self._first_page_size(hint=hint)
         offset = 0
+        page = 1
         while True:
             # Call the function with current offset
-            result = call_func(limit=limit, offset=offset, **kwargs)
+            with self._page_probe(page) as probe:
+                result = call_func(limit=limit, offset=offset, **kwargs)
             
-            # Handle different response formats
-            if isinstance(result, dict) and 'items' in result:
-                items = result['items']
-            elif isinstance(result, list):
-                items = result
-            else:
+            items = self._page_items(result)
+            if items is None:
                 # If response doesn't have expected structure, yield as-is and stop
                 if result:
-                    yield result
+                    yield [result]
                 break
             
             # If no items, we're done
             if not items:
                 break
             
-            # Yield each item
-            for item in items:
-                yield item
+            yield items
+            
+            if self._is_last_page(result, items, offset, limit):
+                break
             
-            # Check if we have more pages
-            if isinstance(result, dict):
-                total_items = result.get('total_items', 0)
-                items_count = result.get('items_count', len(items))
+            if concurrency > 1 and offset == 0:
+                remaining = self._remaining_offsets(result, items, offset)
+                if remaining is not None:
+                    yield from self._fetch_pages(
+                        call_func, remaining, page + 1, limit, concurrency, kwargs
+                    )
+                    break
+            
+            # Move to next page
+            offset += len(items)
+            page += 1
+            if tuned:
+                limit = self._next_page_size(probe, limit, items, hint)
+    
+    def _fetch_pages(
+        self,
+        call_func: Any,
+        offsets: List[int],
+        first_page: int,
+        limit: int,
+        concurrency: int,
+        kwargs: Dict[str, Any],
+    ) -> Iterator[List[Any]]:
+        """Fetch pages at known offsets on a thread pool, yielding their items in order.
+        
+        At most ``concurrency`` pages are in flight or buffered at once, so
+        memory stays bounded however far the consumer lags behind.
+        ``first_page`` is the number of the page at ``offsets[0]``.
+        """
+        pending: deque = deque()
+        remaining = enumerate(offsets, start=first_page)
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="lgl-page")
+        try:
+            for page, page_offset in islice(remaining, concurrency):
+                pending.append(executor.submit(
+                    self._fetch_page, call_func, page, limit, page_offset, kwargs
+                ))
+            
+            while pending:
+                result = pending.popleft().result()
+                next_page = next(remaining, None)
+                if next_page is not None:
+                    page, page_offset = next_page
+                    pending.append(executor.submit(
+                        self._fetch_page, call_func, page, limit, page_offset, kwargs
+                    ))
                 
-                # If we got fewer items than requested, or we've reached total, stop
-                if items_count < limit or (offset + items_count >= total_items):
+                yield self._page_items(result) or []
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _fetch_page(
+        self, call_func: Any, page: int, limit: int, offset: int, kwargs: Dict[str, Any]
+    ) -> Any:
+        """Fetch one page on a pool thread, reporting its number in request events."""
+        with self._page_probe(page):
+            return call_func(limit=limit, offset=offset, **kwargs)
+    
+    def _prefetch(
+        self, pages: Iterator[List[Any]], depth: Optional[int] = None
+    ) -> Iterator[Any]:
+        """Yield the items of ``pages`` while a background thread fetches ahead.
+        
+        The thread stops once ``depth`` fetched pages are waiting, so at most
+        ``depth`` pages are buffered plus the one being fetched. Errors are
+        raised in the caller when it reaches the failed page; when the caller
+        stops early the thread finishes its current request and exits.
+        
+        Args:
+            pages: Page iterator; advanced only by the background thread
+            depth: Pages fetched ahead (defaults to ``page_prefetch``; 0
+                iterates ``pages`` in the caller)
+        """
+        depth = self._resolve_prefetch(depth)
+        if depth == 0:
+            for page in pages:
+                yield from page
+            return
+        
+        buffer: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+        
+        def produce() -> None:
+            try:
+                for page in pages:
+                    buffer.put(page)
+                    if stop.is_set():
+                        return
+                buffer.put(_PAGES_DONE)
+            except BaseException as e:
+                buffer.put(_PageError(e))
+            finally:
+                pages.close()  # type: ignore[attr-defined]
+        
+        producer = threading.Thread(target=produce, name="lgl-prefetch", daemon=True)
+        producer.start()
+        try:
+            while True:
+                page = buffer.get()
+                if page is _PAGES_DONE:
+                    break
+                if isinstance(page, _PageError):
+                    raise page.error
+                yield from page
+        finally:
+            stop.set()
+            # Free a slot so a producer blocked on a full buffer sees the stop flag
+            while True:
+                try:
+                    buffer.get_nowait()
+                except queue.Empty:
                     break
+            producer.join()
+
+
+class AsyncLGLClient(BaseLGLClient):
+    """Asynchronous HTTP client for Little Green Light API.
+    
+    Mirrors :class:`LGLClient` on top of ``httpx.AsyncClient``; every
+    request method is a coroutine and pagination is an async iterator.
+    """
+    
+    def _create_http_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """Create the underlying asynchronous httpx client."""
+        return httpx.AsyncClient(**kwargs)
+    
+    def _create_single_flight(self) -> SingleFlight:
+        """Create the group coalescing identical GETs on the event loop."""
+        return AsyncSingleFlight()
+    
+    async def __aenter__(self) -> "AsyncLGLClient":
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+    
+    async def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the async httpx client, retrying per ``retry_policy``.
+        
+        Raises:
+            LGLAPIError: For transport-level failures
+        """
+        send = getattr(self._client, method.lower())
+        hooks = self.event_hooks
+        started = time.perf_counter() if hooks else 0.0
+        attempt = 1
+        while True:
+            wait = self._rate_limit_delay()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            
+            attempt_started = time.perf_counter() if hooks else 0.0
+            try:
+                response: httpx.Response = await send(path, **kwargs)
+            except httpx.HTTPError as e:
+                delay = self._retry_delay(method, path, attempt, error=e)
+                if delay is None:
+                    if hooks:
+                        self._emit_event(
+                            method, path, kwargs, attempt, started, attempt_started, error=e
+                        )
+                    raise self._transport_error(method, path, e, kwargs.get('json'))
+            else:
+                self._observe_response(response)
+                delay = self._retry_delay(method, path, attempt, response=response)
+                if delay is None:
+                    if hooks:
+                        self._emit_event(
+                            method, path, kwargs, attempt, started, attempt_started,
+                            response=response,
+                        )
+                    self._record_page_response(path, response)
+                    return response
+            
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def _get(self, path: str, **params: Any) -> Dict[str, Any]:
+        """Make a GET request to the LGL API (see :meth:`LGLClient._get`)."""
+        validated_params = self._validate_api_params(params) if params else {}
+        entity = self._entity_key(path, validated_params)
+        cached = self._cached_entity(entity)
+        if cached is not None:
+            return cached
+        
+        async def fetch() -> Dict[str, Any]:
+            lookup = self._cache_lookup(path, validated_params)
+            if lookup is not None and lookup.fresh and lookup.entry is not None:
+                return self._store_entity(entity, self._decode_cached(lookup.entry['body']))
+            
+            self._debug_request("GET", path, params=validated_params)
+            if lookup is not None and lookup.headers:
+                response = await self._send(
+                    "GET", path, params=validated_params, headers=lookup.headers
+                )
             else:
-                # For list responses, if we got fewer than limit, we're done
-                if len(items) < limit:
+                response = await self._send("GET", path, params=validated_params)
+            if lookup is None:
+                return self._store_entity(entity, self._decode_response("GET", path, response))
+            return self._store_entity(entity, self._cached_response(path, response, lookup))
+        
+        if self.single_flight is None:
+            return await fetch()
+        return await self.single_flight.do(self._request_key(path, validated_params), fetch)
+    
+    async def _get_page(
+        self, path: str, model: Type["LGLModel"], *, trusted: bool = False, **params: Any
+    ) -> Any:
+        """Make a GET request for a page of models (see :meth:`LGLClient._get_page`)."""
+        if not self._direct_pages(trusted):
+            return self._build_page(await self._get(path, **params), model, trusted)
+        validated_params = self._validate_api_params(params) if params else {}
+        
+        self._debug_request("GET", path, params=validated_params)
+        response = await self._send("GET", path, params=validated_params)
+        return self._decode_page(path, response, model)
+    
+    async def _post(self, path: str, json: Dict[str, Any]) -> Dict[str, Any]:
+        """Make a POST request to the LGL API (see :meth:`LGLClient._post`)."""
+        validated_json = self._validate_json_payload(json)
+        
+        self._debug_request("POST", path, json=validated_json)
+        response = await self._send("POST", path, json=validated_json)
+        return self._decode_response("POST", path, response, validated_json)
+    
+    async def _patch(self, path: str, json: Dict[str, Any]) -> Dict[str, Any]:
+        """Make a PATCH request to the LGL API (see :meth:`LGLClient._patch`)."""
+        validated_json = self._validate_json_payload(json)
+        
+        self._debug_request("PATCH", path, json=validated_json)
+        response = await self._send("PATCH", path, json=validated_json)
+        return self._decode_response("PATCH", path, response, validated_json)
+    
+    async def _delete(self, path: str, **params: Any) -> None:
+        """Make a DELETE request to the LGL API (see :meth:`LGLClient._delete`)."""
+        validated_params = self._validate_api_params(params) if params else {}
+        
+        self._debug_request("DELETE", path, params=validated_params)
+        if validated_params:
+            response = await self._send("DELETE", path, params=validated_params)
+        else:
+            response = await self._send("DELETE", path)
+        self._handle_response(response)
+        self._invalidate_cached(path)
+    
+    async def _paginate(
+        self,
+        call_func: Any,
+        *,
+        limit: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        prefetch: Optional[int] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        """Paginate through API results asynchronously.
+        
+        Args:
+            call_func: Function to call for each page; may return an awaitable
+            limit: Items per page; by default 100, or chosen page by page
+                by the client's ``page_size_tuner``
+            concurrency: Pages fetched in parallel (defaults to ``page_concurrency``)
+            prefetch: Pages fetched by a background task ahead of the caller
+                (defaults to ``page_prefetch``; see :meth:`_prefetch`)
+            **kwargs: Additional arguments to pass to call_func
+            
+        Yields:
+            Individual items from paginated results
+        """
+        concurrency = self._resolve_concurrency(concurrency)
+        pages = self._walk_pages(call_func, limit, concurrency, kwargs)
+        async for item in self._prefetch(pages, prefetch):
+            yield item
+    
+    async def _walk_pages(
+        self,
+        call_func: Any,
+        limit: Optional[int],
+        concurrency: int,
+        kwargs: Dict[str, Any],
+    ) -> AsyncIterator[List[Any]]:
+        """Fetch the pages of :meth:`_paginate`, yielding the items of each."""
+        tuned = limit is None
+        hint = self._page_hint(call_func) if tuned and self.page_size_tuner else None
+        if limit is None:
+            limit = self._first_page_size(hint=hint)
+        offset = 0
+        page = 1
+        while True:
+            with self._page_probe(page) as probe:
+                result = await self._call_page(call_func, limit, offset, kwargs)
+            
+            items = self._page_items(result)
+            if items is None:
+                if result:
+                    yield [result]
+                break
+            
+            if not items:
+                break
+            
+            yield items
+            
+            if self._is_last_page(result, items, offset, limit):
+                break
+            
+            if concurrency > 1 and offset == 0:
+                remaining = self._remaining_offsets(result, items, offset)
+                if remaining is not None:
+                    async for fetched in self._fetch_pages(
+                        call_func, remaining, page + 1, limit, concurrency, kwargs
+                    ):
+                        yield fetched
                     break
             
-            # Move to next page
-            offset += len(items)
\ No newline at end of file
+            offset += len(items)
+            page += 1
+            if tuned:
+                limit = self._next_page_size(probe, limit, items, hint)
+    
+    @staticmethod
+    async def _call_page(call_func: Any, limit: int, offset: int, kwargs: Dict[str, Any]) -> Any:
+        """Call a page function, awaiting its result when it is a coroutine."""
+        result = call_func(limit=limit, offset=offset, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    
+    async def _fetch_pages(
+        self,
+        call_func: Any,
+        offsets: List[int],
+        first_page: int,
+        limit: int,
+        concurrency: int,
+        kwargs: Dict[str, Any],
+    ) -> AsyncIterator[List[Any]]:
+        """Fetch pages at known offsets as concurrent tasks, yielding their items in order.
+        
+        ``first_page`` is the number of the page at ``offsets[0]``.
+        """
+        pending: deque = deque()
+        remaining = enumerate(offsets, start=first_page)
+        try:
+            for page, page_offset in islice(remaining, concurrency):
+                pending.append(asyncio.ensure_future(
+                    self._fetch_page(call_func, page, limit, page_offset, kwargs)
+                ))
+            
+            while pending:
+                result = await pending.popleft()
+                next_page = next(remaining, None)
+                if next_page is not None:
+                    page, page_offset = next_page
+                    pending.append(asyncio.ensure_future(
+                        self._fetch_page(call_func, page, limit, page_offset, kwargs)
+                    ))
+                
+                yield self._page_items(result) or []
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def _fetch_page(
+        self, call_func: Any, page: int, limit: int, offset: int, kwargs: Dict[str, Any]
+    ) -> Any:
+        """Fetch one page in its own task, reporting its number in request events."""
+        with self._page_probe(page):
+            return await self._call_page(call_func, limit, offset, kwargs)
+    
+    async def _prefetch(
+        self, pages: AsyncIterator[List[Any]], depth: Optional[int] = None
+    ) -> AsyncIterator[Any]:
+        """Yield the items of ``pages`` while a background task fetches ahead.
+        
+        Async counterpart of :meth:`LGLClient._prefetch`: the task waits
+        once ``depth`` pages are buffered and is cancelled when the caller
+        stops early.
+        """
+        depth = self._resolve_prefetch(depth)
+        if depth == 0:
+            async for page in pages:
+                for item in page:
+                    yield item
+            return
+        
+        buffer: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=depth)
+        
+        async def produce() -> None:
+            try:
+                async for page in pages:
+                    await buffer.put(page)
+                await buffer.put(_PAGES_DONE)
+            except Exception as e:
+                await buffer.put(_PageError(e))
+            finally:
+                await pages.aclose()  # type: ignore[attr-defined]
+        
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                page = await buffer.get()
+                if page is _PAGES_DONE:
+                    break
+                if isinstance(page, _PageError):
+                    raise page.error
+                for item in page:
+                    yield item
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
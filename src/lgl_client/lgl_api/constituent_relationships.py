@@ -1,12 +1,40 @@
 """Constituent Relationships API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.constituent import ConstituentRelationship
 
 
-class ConstituentRelationshipsAPI:
+class _ConstituentRelationshipsMixin:
+    """Query parameters, payloads and type IDs shared by the sync and async APIs."""
+    
+    # This would need to be refined based on actual relationship type IDs
+    # for family relationships in the system
+    _family_type_ids = [1, 2, 4, 5, 6, 7]  # Example family type IDs
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _relationship_data(
+        relationship_type_id: int, related_constituent_id: int, name: str, **extra: Any
+    ) -> Dict[str, Any]:
+        return {
+            "relationship_type_id": relationship_type_id,
+            "related_constituent_id": related_constituent_id,
+            "name": name,
+            **extra
+        }
+
+
+class ConstituentRelationshipsAPI(_ConstituentRelationshipsMixin):
     """API for managing constituent relationships."""
     
     def __init__(self, client: LGLClient):
@@ -28,14 +56,24 @@ class ConstituentRelationshipsAPI:
         Returns:
             Paginated response with constituent relationship items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/constituent_relationships', **params)
     
+    def iter_all(self, constituent_id: int) -> Iterator[ConstituentRelationship]:
+        """Iterate over all constituent relationships for a constituent, one page at a time.
+        
+        Args:
+            constituent_id: The constituent ID
+        
+        Yields:
+            ConstituentRelationship objects
+        """
+        def _list_page(**kwargs):
+            return self.list(constituent_id, **kwargs)
+        
+        for item in self.client._paginate(_list_page):
+            yield ConstituentRelationship(**item)
+    
     def fetch_all(self, constituent_id: int) -> List[ConstituentRelationship]:
         """Fetch all constituent relationships for a constituent with automatic pagination.
         
@@ -45,11 +83,7 @@ class ConstituentRelationshipsAPI:
         Returns:
             List of all ConstituentRelationship objects
         """
-        def _list_page(**kwargs):
-            return self.list(constituent_id, **kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [ConstituentRelationship(**item) for item in items]
+        return list(self.iter_all(constituent_id))
     
     def retrieve(self, relationship_id: int) -> ConstituentRelationship:
         """Retrieve a specific constituent relationship by ID.
@@ -135,14 +169,10 @@ class ConstituentRelationshipsAPI:
         Returns:
             Created ConstituentRelationship object
         """
-        return self.create(constituent_id, {
-            "relationship_type_id": relationship_type_id,
-            "related_constituent_id": related_constituent_id,
-            "name": related_name,
-            "description": description,
-            "auto_soft_credit": auto_soft_credit,
-            "share_address": share_address
-        })
+        return self.create(constituent_id, self._relationship_data(
+            relationship_type_id, related_constituent_id, related_name,
+            description=description, auto_soft_credit=auto_soft_credit, share_address=share_address
+        ))
     
     def create_spouse_relationship(
         self, 
@@ -166,15 +196,11 @@ class ConstituentRelationshipsAPI:
         Returns:
             Created ConstituentRelationship object
         """
-        return self.create(constituent_id, {
-            "relationship_type_id": 1,  # Assuming 1 is spouse/partner type
-            "related_constituent_id": spouse_constituent_id,
-            "name": spouse_name,
-            "auto_soft_credit": auto_soft_credit,
-            "also_acknowledge": also_acknowledge,
-            "share_address": share_address,
-            "share_phone": True
-        })
+        return self.create(constituent_id, self._relationship_data(
+            1, spouse_constituent_id, spouse_name,  # Assuming 1 is spouse/partner type
+            auto_soft_credit=auto_soft_credit, also_acknowledge=also_acknowledge,
+            share_address=share_address, share_phone=True
+        ))
     
     def create_parent_child_relationship(
         self, 
@@ -194,12 +220,9 @@ class ConstituentRelationshipsAPI:
         Returns:
             Created ConstituentRelationship object
         """
-        return self.create(parent_id, {
-            "relationship_type_id": 2,  # Assuming 2 is parent-child type
-            "related_constituent_id": child_id,
-            "name": child_name,
-            "auto_soft_credit": auto_soft_credit
-        })
+        return self.create(parent_id, self._relationship_data(
+            2, child_id, child_name, auto_soft_credit=auto_soft_credit  # Assuming 2 is parent-child type
+        ))
     
     def create_employer_relationship(
         self, 
@@ -219,12 +242,9 @@ class ConstituentRelationshipsAPI:
         Returns:
             Created ConstituentRelationship object
         """
-        return self.create(employee_id, {
-            "relationship_type_id": 3,  # Assuming 3 is employer type
-            "related_constituent_id": employer_id,
-            "name": employer_name,
-            "description": description
-        })
+        return self.create(employee_id, self._relationship_data(
+            3, employer_id, employer_name, description=description  # Assuming 3 is employer type
+        ))
     
     def enable_auto_soft_credit(self, relationship_id: int) -> ConstituentRelationship:
         """Enable auto soft credit for a relationship.
@@ -291,12 +311,9 @@ class ConstituentRelationshipsAPI:
         Returns:
             List of family ConstituentRelationship objects
         """
-        # This would need to be refined based on actual relationship type IDs
-        # for family relationships in the system
         all_relationships = self.fetch_all(constituent_id)
-        family_type_ids = [1, 2, 4, 5, 6, 7]  # Example family type IDs
         return [rel for rel in all_relationships 
-                if rel.relationship_type_id in family_type_ids]
+                if rel.relationship_type_id in self._family_type_ids]
     
     def get_relationships_with_soft_credit(self, constituent_id: int) -> List[ConstituentRelationship]:
         """Get all relationships with auto soft credit enabled.
@@ -322,4 +339,144 @@ class ConstituentRelationshipsAPI:
         """
         all_relationships = self.fetch_all(constituent_id)
         return [rel for rel in all_relationships 
-                if rel.relationship_type_id == relationship_type_id]
\ No newline at end of file
+                if rel.relationship_type_id == relationship_type_id]
+
+
+class AsyncConstituentRelationshipsAPI(_ConstituentRelationshipsMixin):
+    """Async variant of :class:`ConstituentRelationshipsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all constituent relationships for a constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/constituent_relationships', **params)
+    
+    async def iter_all(self, constituent_id: int) -> AsyncIterator[ConstituentRelationship]:
+        """Iterate over all relationships for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list(constituent_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield ConstituentRelationship(**item)
+    
+    async def fetch_all(self, constituent_id: int) -> List[ConstituentRelationship]:
+        """Fetch all relationships for a constituent with automatic pagination."""
+        return [item async for item in self.iter_all(constituent_id)]
+    
+    async def retrieve(self, relationship_id: int) -> ConstituentRelationship:
+        """Retrieve a specific relationship by ID."""
+        response = await self.client._get(f'constituent_relationships/{relationship_id}')
+        return ConstituentRelationship(**response)
+    
+    async def create(self, constituent_id: int, relationship_data: Dict) -> ConstituentRelationship:
+        """Create a new relationship for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/constituent_relationships', relationship_data)
+        return ConstituentRelationship(**response)
+    
+    async def update(self, relationship_id: int, relationship_data: Dict) -> ConstituentRelationship:
+        """Update an existing relationship."""
+        response = await self.client._patch(f'constituent_relationships/{relationship_id}', relationship_data)
+        return ConstituentRelationship(**response)
+    
+    async def delete(self, relationship_id: int) -> Dict:
+        """Delete a relationship."""
+        await self.client._delete(f'constituent_relationships/{relationship_id}')
+        return {"result": "success"}
+    
+    async def create_family_relationship(
+        self,
+        constituent_id: int,
+        related_constituent_id: int,
+        relationship_type_id: int,
+        related_name: str,
+        description: Optional[str] = None,
+        auto_soft_credit: bool = False,
+        share_address: bool = False
+    ) -> ConstituentRelationship:
+        """Create a family relationship."""
+        return await self.create(constituent_id, self._relationship_data(
+            relationship_type_id, related_constituent_id, related_name,
+            description=description, auto_soft_credit=auto_soft_credit, share_address=share_address
+        ))
+    
+    async def create_spouse_relationship(
+        self,
+        constituent_id: int,
+        spouse_constituent_id: int,
+        spouse_name: str,
+        auto_soft_credit: bool = True,
+        share_address: bool = True,
+        also_acknowledge: bool = True
+    ) -> ConstituentRelationship:
+        """Create a spouse/partner relationship."""
+        return await self.create(constituent_id, self._relationship_data(
+            1, spouse_constituent_id, spouse_name,  # Assuming 1 is spouse/partner type
+            auto_soft_credit=auto_soft_credit, also_acknowledge=also_acknowledge,
+            share_address=share_address, share_phone=True
+        ))
+    
+    async def create_parent_child_relationship(
+        self,
+        parent_id: int,
+        child_id: int,
+        child_name: str,
+        auto_soft_credit: bool = True
+    ) -> ConstituentRelationship:
+        """Create a parent-child relationship."""
+        return await self.create(parent_id, self._relationship_data(
+            2, child_id, child_name, auto_soft_credit=auto_soft_credit  # Assuming 2 is parent-child type
+        ))
+    
+    async def create_employer_relationship(
+        self,
+        employee_id: int,
+        employer_id: int,
+        employer_name: str,
+        description: Optional[str] = None
+    ) -> ConstituentRelationship:
+        """Create an employer-employee relationship."""
+        return await self.create(employee_id, self._relationship_data(
+            3, employer_id, employer_name, description=description  # Assuming 3 is employer type
+        ))
+    
+    async def enable_auto_soft_credit(self, relationship_id: int) -> ConstituentRelationship:
+        """Enable auto soft credit for a relationship."""
+        return await self.update(relationship_id, {"auto_soft_credit": True})
+    
+    async def disable_auto_soft_credit(self, relationship_id: int) -> ConstituentRelationship:
+        """Disable auto soft credit for a relationship."""
+        return await self.update(relationship_id, {"auto_soft_credit": False})
+    
+    async def enable_address_sharing(self, relationship_id: int) -> ConstituentRelationship:
+        """Enable address sharing for a relationship."""
+        return await self.update(relationship_id, {"share_address": True})
+    
+    async def enable_phone_sharing(self, relationship_id: int) -> ConstituentRelationship:
+        """Enable phone sharing for a relationship."""
+        return await self.update(relationship_id, {"share_phone": True})
+    
+    async def update_description(self, relationship_id: int, description: str) -> ConstituentRelationship:
+        """Update the description of a relationship."""
+        return await self.update(relationship_id, {"description": description})
+    
+    async def get_family_relationships(self, constituent_id: int) -> List[ConstituentRelationship]:
+        """Get family relationships for a constituent."""
+        all_relationships = await self.fetch_all(constituent_id)
+        return [rel for rel in all_relationships if rel.relationship_type_id in self._family_type_ids]
+    
+    async def get_relationships_with_soft_credit(self, constituent_id: int) -> List[ConstituentRelationship]:
+        """Get relationships that have auto soft credit enabled."""
+        all_relationships = await self.fetch_all(constituent_id)
+        return [rel for rel in all_relationships if rel.auto_soft_credit]
+    
+    async def get_relationships_by_type(self, constituent_id: int, relationship_type_id: int) -> List[ConstituentRelationship]:
+        """Get relationships of a specific type for a constituent."""
+        all_relationships = await self.fetch_all(constituent_id)
+        return [rel for rel in all_relationships if rel.relationship_type_id == relationship_type_id]
@@ -1,12 +1,108 @@
 """Constituents API for LGL client."""
 
-from typing import Dict, List, Optional, Union
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.constituent import Constituent
+from .exceptions import NotFoundError
+from .search_query import SearchQuery
 
+# Related collections of a constituent profile and the per-constituent
+# endpoint serving each one (None: only available embedded in the record)
+PROFILE_COLLECTIONS: Dict[str, Optional[str]] = {
+    'class_affiliations': 'class_affiliations',
+    'relationships': 'constituent_relationships',
+    'street_addresses': 'street_addresses',
+    'phone_numbers': 'phone_numbers',
+    'email_addresses': 'email_addresses',
+    'web_addresses': 'web_addresses',
+    'categories': None,
+    'groups': 'group_memberships',
+    'memberships': 'memberships',
+    'custom_attrs': None,
+}
 
-class ConstituentsAPI:
+
+def _profile_plan(
+    ids: Iterable[int], include: Optional[Sequence[str]]
+) -> Tuple[List[int], Tuple[str, ...]]:
+    """Deduplicate IDs and validate the requested collections."""
+    include = tuple(PROFILE_COLLECTIONS) if include is None else tuple(include)
+    unknown = [name for name in include if name not in PROFILE_COLLECTIONS]
+    if unknown:
+        raise ValueError(
+            f"Unknown profile collection(s): {', '.join(unknown)} "
+            f"(expected any of {', '.join(PROFILE_COLLECTIONS)})"
+        )
+    return list(dict.fromkeys(ids)), include
+
+
+def _missing_collections(
+    details: Dict[int, Dict[str, Any]], include: Tuple[str, ...]
+) -> List[Tuple[int, str]]:
+    """(constituent, collection) pairs the detail responses did not embed."""
+    return [
+        (constituent_id, name)
+        for constituent_id, data in details.items()
+        for name in include
+        if name not in data and PROFILE_COLLECTIONS[name] is not None
+    ]
+
+
+class _ConstituentsMixin:
+    """Query parameters shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _search_params(
+        query_params: Union[List[str], SearchQuery],
+        expand: Optional[str],
+        sort: Optional[str],
+        limit: Optional[int],
+        offset: Optional[int],
+    ) -> Dict[str, Any]:
+        """Query parameters of a constituents search."""
+        params: Dict[str, Any] = {}
+        
+        # Add query parameters - handle multiple q[] parameters
+        if isinstance(query_params, SearchQuery):
+            params.update(query_params.for_resource('constituents').to_params())
+        elif query_params:
+            params['q'] = query_params
+        
+        if expand:
+            params['expand'] = expand
+        if sort:
+            params['sort'] = sort
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+
+
+class ConstituentsAPI(_ConstituentsMixin):
     """API for managing constituents."""
     
     def __init__(self, client: LGLClient):
@@ -14,7 +110,7 @@ class ConstituentsAPI:
     
     def search(
         self,
-        query_params: List[str],
+        query_params: Union[List[str], SearchQuery],
         expand: Optional[str] = None,
         sort: Optional[str] = None,
         limit: Optional[int] = None,
@@ -23,7 +119,8 @@ class ConstituentsAPI:
         """Search for constituents.
         
         Args:
-            query_params: List of query strings (e.g., ["name=brady", "city=Seattle"])
+            query_params: A constituents :class:`SearchQuery`, or a list of raw
+                query strings (e.g., ["name=brady", "city=Seattle"])
             expand: Comma-separated list of data structures to expand:
                    'class_affiliations,relationships,street_addresses,phone_numbers,
                     email_addresses,web_addresses,categories,groups,memberships,custom_attrs'
@@ -36,26 +133,14 @@ class ConstituentsAPI:
         Returns:
             Paginated response with constituent items
         """
-        params = {}
-        
-        # Add query parameters - handle multiple q[] parameters
-        if query_params:
-            params['q'] = query_params
-        
-        if expand:
-            params['expand'] = expand
-        if sort:
-            params['sort'] = sort
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
-        return self.client._get('constituents/search', **params)
+        return self.client._get(
+            'constituents/search',
+            **self._search_params(query_params, expand, sort, limit, offset),
+        )
     
     def search_constituents(
         self,
-        query_params: List[str],
+        query_params: Union[List[str], SearchQuery],
         expand: Optional[str] = None,
         sort: Optional[str] = None,
         limit: Optional[int] = None,
@@ -64,7 +149,7 @@ class ConstituentsAPI:
         """Search for constituents and return as Constituent objects.
         
         Args:
-            query_params: List of query strings (e.g., ["name=brady", "city=Seattle"])
+            query_params: SearchQuery or list of raw query strings
             expand: Comma-separated list of data structures to expand
             sort: Sort field with optional '!' for reverse order
             limit: Number of entries to return (default: 25)
@@ -76,42 +161,85 @@ class ConstituentsAPI:
         response = self.search(query_params, expand, sort, limit, offset)
         return [Constituent(**item) for item in response.get('items', [])]
     
+    def iter_search(
+        self,
+        query_params: Union[List[str], SearchQuery],
+        expand: Optional[str] = None,
+        sort: Optional[str] = None,
+        *,
+        trusted: Optional[bool] = None,
+        prefetch: Optional[int] = None
+    ) -> Iterator[Constituent]:
+        """Iterate over all matching constituents, one page at a time.
+        
+        Only the page currently being consumed, and up to ``prefetch`` pages
+        fetched ahead of it, are held in memory, so this is safe to use on
+        searches matching a large part of the account.
+        
+        Args:
+            query_params: SearchQuery or list of raw query strings
+            expand: Comma-separated list of data structures to expand
+            sort: Sort field with optional '!' for reverse order
+            trusted: Build constituents without validation (defaults to the
+                client's ``trusted_models``)
+            prefetch: Pages fetched in the background while the caller
+                processes the current one (defaults to the client's
+                ``page_prefetch``)
+        
+        Yields:
+            Matching Constituent objects
+        """
+        trusted = self.client._resolve_trusted(trusted)
+        
+        def _pages() -> Iterator[List[Constituent]]:
+            offset = 0
+            page = 1
+            limit = self.client._first_page_size('constituents/search')
+            
+            while True:
+                with self.client._page_probe(page) as probe:
+                    response = self.client._get_page(
+                        'constituents/search', Constituent, trusted=trusted,
+                        **self._search_params(query_params, expand, sort, limit, offset),
+                    )
+                constituents = response.get('items', [])
+                
+                if not constituents:
+                    break
+                
+                yield constituents
+                
+                # Check if there are more items
+                if response.get('next_item') is None:
+                    break
+                
+                offset = response.get('next_item', 0)
+                page += 1
+                limit = self.client._next_page_size(probe, limit, constituents)
+        
+        yield from self.client._prefetch(_pages(), prefetch)
+    
     def search_all_constituents(
         self,
-        query_params: List[str],
+        query_params: Union[List[str], SearchQuery],
         expand: Optional[str] = None,
-        sort: Optional[str] = None
+        sort: Optional[str] = None,
+        *,
+        trusted: Optional[bool] = None
     ) -> List[Constituent]:
         """Search for all matching constituents with automatic pagination.
         
         Args:
-            query_params: List of query strings (e.g., ["name=brady", "city=Seattle"])
+            query_params: SearchQuery or list of raw query strings
             expand: Comma-separated list of data structures to expand
             sort: Sort field with optional '!' for reverse order
+            trusted: Build constituents without validation (defaults to the
+                client's ``trusted_models``)
         
         Returns:
             List of all matching Constituent objects
         """
-        all_constituents = []
-        offset = 0
-        limit = 100
-        
-        while True:
-            response = self.search(query_params, expand, sort, limit, offset)
-            items = response.get('items', [])
-            
-            if not items:
-                break
-            
-            all_constituents.extend([Constituent(**item) for item in items])
-            
-            # Check if there are more items
-            if response.get('next_item') is None:
-                break
-            
-            offset = response.get('next_item', 0)
-        
-        return all_constituents
+        return list(self.iter_search(query_params, expand, sort, trusted=trusted))
     
     def list(self, limit: Optional[int] = None, offset: Optional[int] = None) -> Dict:
         """List all constituents for an account.
@@ -123,25 +251,107 @@ class ConstituentsAPI:
         Returns:
             Paginated response with constituent items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get('constituents', **params)
     
-    def fetch_all(self) -> List[Constituent]:
+    def iter_all(
+        self, *, concurrency: Optional[int] = None, trusted: Optional[bool] = None
+    ) -> Iterator[Constituent]:
+        """Iterate over all constituents, one page at a time.
+        
+        Args:
+            concurrency: Pages fetched in parallel (defaults to the client's
+                ``page_concurrency``)
+            trusted: Build constituents without validation (defaults to the
+                client's ``trusted_models``)
+        
+        Yields:
+            Constituent objects
+        """
+        trusted = self.client._resolve_trusted(trusted)
+        
+        def _list_page(**kwargs: Any) -> Any:
+            return self.client._get_page('constituents', Constituent, trusted=trusted, **kwargs)
+        
+        yield from self.client._paginate(_list_page, concurrency=concurrency)
+    
+    def fetch_all(
+        self, *, concurrency: Optional[int] = None, trusted: Optional[bool] = None
+    ) -> List[Constituent]:
         """Fetch all constituents with automatic pagination.
         
+        Args:
+            concurrency: Pages fetched in parallel (defaults to the client's
+                ``page_concurrency``)
+            trusted: Build constituents without validation (defaults to the
+                client's ``trusted_models``)
+        
         Returns:
             List of all Constituent objects
         """
-        def _list_page(**kwargs):
-            return self.list(**kwargs)
+        return list(self.iter_all(concurrency=concurrency, trusted=trusted))
+    
+    def load_profiles(
+        self,
+        ids: Iterable[int],
+        include: Optional[Sequence[str]] = None,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None,
+        skip_missing: bool = False
+    ) -> List[Constituent]:
+        """Load complete constituent profiles for many constituents at once.
         
-        items = list(self.client._paginate(_list_page))
-        return [Constituent(**item) for item in items]
+        The constituent detail endpoint embeds every related collection, so
+        each profile normally takes a single request, issued concurrently
+        for all IDs. Collections in ``include`` that a response lacks are
+        then fetched from their own endpoints (``constituents/{id}/email_addresses``
+        and so on), also concurrently.
+        
+        Args:
+            ids: Constituent IDs; duplicates are loaded once
+            include: Collections that must be populated (default: all of
+                :data:`PROFILE_COLLECTIONS`)
+            concurrency: Requests in flight at once (defaults to the client's
+                ``page_concurrency``)
+            trusted: Build constituents without validation (defaults to the
+                client's ``trusted_models``)
+            skip_missing: Leave out IDs that no longer exist instead of raising
+                :class:`NotFoundError`
+        
+        Returns:
+            Constituent objects in the order of ``ids``
+        """
+        ids, include = _profile_plan(ids, include)
+        trusted = self.client._resolve_trusted(trusted)
+        workers = max(1, min(self.client._resolve_concurrency(concurrency), len(ids) or 1))
+        
+        def _detail(constituent_id: int) -> Optional[Dict[str, Any]]:
+            try:
+                return self.client._get(f'constituents/{constituent_id}')
+            except NotFoundError:
+                if skip_missing:
+                    return None
+                raise
+        
+        def _collection(task: Tuple[int, str]) -> List[Dict[str, Any]]:
+            constituent_id, name = task
+            path = f'constituents/{constituent_id}/{PROFILE_COLLECTIONS[name]}'
+            return list(self.client._paginate(
+                lambda **kwargs: self.client._get(path, **kwargs), concurrency=1
+            ))
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lgl-profile") as pool:
+            details = {
+                constituent_id: data
+                for constituent_id, data in zip(ids, pool.map(_detail, ids))
+                if data is not None
+            }
+            missing = _missing_collections(details, include)
+            for (constituent_id, name), items in zip(missing, pool.map(_collection, missing)):
+                details[constituent_id][name] = items
+        
+        return [Constituent.from_dict(data, trusted=trusted) for data in details.values()]
     
     def retrieve(self, constituent_id: int) -> Constituent:
         """Retrieve a specific constituent by ID.
@@ -201,7 +411,7 @@ class ConstituentsAPI:
     
     # Helper methods for common search scenarios
     
-    def search_by_name(self, name: str, **kwargs) -> List[Constituent]:
+    def search_by_name(self, name: str, **kwargs: Any) -> List[Constituent]:
         """Search constituents by name.
         
         Args:
@@ -211,9 +421,9 @@ class ConstituentsAPI:
         Returns:
             List of matching Constituent objects
         """
-        return self.search_constituents([f"name={name}"], **kwargs)
+        return self.search_constituents(SearchQuery("constituents").where("name", name), **kwargs)
     
-    def search_by_email(self, email: str, **kwargs) -> List[Constituent]:
+    def search_by_email(self, email: str, **kwargs: Any) -> List[Constituent]:
         """Search constituents by email address.
         
         Args:
@@ -223,9 +433,9 @@ class ConstituentsAPI:
         Returns:
             List of matching Constituent objects
         """
-        return self.search_constituents([f"eaddr={email}"], **kwargs)
+        return self.search_constituents(SearchQuery("constituents").where("eaddr", email), **kwargs)
     
-    def search_by_phone(self, phone: str, **kwargs) -> List[Constituent]:
+    def search_by_phone(self, phone: str, **kwargs: Any) -> List[Constituent]:
         """Search constituents by phone number.
         
         Args:
@@ -235,9 +445,11 @@ class ConstituentsAPI:
         Returns:
             List of matching Constituent objects
         """
-        return self.search_constituents([f"phone_number={phone}"], **kwargs)
+        return self.search_constituents(
+            SearchQuery("constituents").where("phone_number", phone), **kwargs
+        )
     
-    def search_by_external_id(self, external_id: str, **kwargs) -> List[Constituent]:
+    def search_by_external_id(self, external_id: str, **kwargs: Any) -> List[Constituent]:
         """Search constituents by external ID.
         
         Args:
@@ -247,9 +459,11 @@ class ConstituentsAPI:
         Returns:
             List of matching Constituent objects
         """
-        return self.search_constituents([f"external_id={external_id}"], **kwargs)
+        return self.search_constituents(
+            SearchQuery("constituents").where("external_id", external_id), **kwargs
+        )
     
-    def search_organizations(self, **kwargs) -> List[Constituent]:
+    def search_organizations(self, **kwargs: Any) -> List[Constituent]:
         """Search for organization constituents only.
         
         Args:
@@ -258,9 +472,11 @@ class ConstituentsAPI:
         Returns:
             List of organization Constituent objects
         """
-        return self.search_constituents(["constituent_type=1"], **kwargs)
+        return self.search_constituents(
+            SearchQuery("constituents").where("constituent_type", 1), **kwargs
+        )
     
-    def search_individuals(self, **kwargs) -> List[Constituent]:
+    def search_individuals(self, **kwargs: Any) -> List[Constituent]:
         """Search for individual constituents only.
         
         Args:
@@ -269,9 +485,11 @@ class ConstituentsAPI:
         Returns:
             List of individual Constituent objects
         """
-        return self.search_constituents(["constituent_type=0"], **kwargs)
+        return self.search_constituents(
+            SearchQuery("constituents").where("constituent_type", 0), **kwargs
+        )
     
-    def search_by_keyword(self, keyword_id: int, **kwargs) -> List[Constituent]:
+    def search_by_keyword(self, keyword_id: int, **kwargs: Any) -> List[Constituent]:
         """Search constituents by keyword ID.
         
         Args:
@@ -281,9 +499,11 @@ class ConstituentsAPI:
         Returns:
             List of matching Constituent objects
         """
-        return self.search_constituents([f"keyword={keyword_id}"], **kwargs)
+        return self.search_constituents(
+            SearchQuery("constituents").where("keyword", keyword_id), **kwargs
+        )
     
-    def search_by_group(self, group_ids: Union[int, List[int]], **kwargs) -> List[Constituent]:
+    def search_by_group(self, group_ids: Union[int, List[int]], **kwargs: Any) -> List[Constituent]:
         """Search constituents by group membership.
         
         Args:
@@ -293,12 +513,11 @@ class ConstituentsAPI:
         Returns:
             List of matching Constituent objects
         """
-        if isinstance(group_ids, int):
-            group_ids = [group_ids]
-        group_param = ",".join(map(str, group_ids))
-        return self.search_constituents([f"groups={group_param}"], **kwargs)
+        return self.search_constituents(
+            SearchQuery("constituents").where("groups", group_ids), **kwargs
+        )
     
-    def search_by_membership_level(self, level_ids: Union[int, List[int]], **kwargs) -> List[Constituent]:
+    def search_by_membership_level(self, level_ids: Union[int, List[int]], **kwargs: Any) -> List[Constituent]:
         """Search constituents by membership level.
         
         Args:
@@ -308,7 +527,241 @@ class ConstituentsAPI:
         Returns:
             List of matching Constituent objects
         """
-        if isinstance(level_ids, int):
-            level_ids = [level_ids]
-        level_param = ",".join(map(str, level_ids))
-        return self.search_constituents([f"membership_level={level_param}"], **kwargs)
\ No newline at end of file
+        return self.search_constituents(
+            SearchQuery("constituents").where("membership_level", level_ids), **kwargs
+        )
+
+
+class AsyncConstituentsAPI(_ConstituentsMixin):
+    """Async variant of :class:`ConstituentsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def search(
+        self,
+        query_params: Union[List[str], SearchQuery],
+        expand: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """Search for constituents."""
+        return await self.client._get(
+            'constituents/search',
+            **self._search_params(query_params, expand, sort, limit, offset),
+        )
+    
+    async def search_constituents(
+        self,
+        query_params: Union[List[str], SearchQuery],
+        expand: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Constituent]:
+        """Search for constituents and return as Constituent objects."""
+        response = await self.search(query_params, expand, sort, limit, offset)
+        return [Constituent(**item) for item in response.get('items', [])]
+    
+    async def iter_search(
+        self,
+        query_params: Union[List[str], SearchQuery],
+        expand: Optional[str] = None,
+        sort: Optional[str] = None,
+        *,
+        trusted: Optional[bool] = None,
+        prefetch: Optional[int] = None
+    ) -> AsyncIterator[Constituent]:
+        """Iterate over all matching constituents, page by page."""
+        trusted = self.client._resolve_trusted(trusted)
+        
+        async def _pages() -> AsyncIterator[List[Constituent]]:
+            offset = 0
+            page = 1
+            limit = self.client._first_page_size('constituents/search')
+            
+            while True:
+                with self.client._page_probe(page) as probe:
+                    response = await self.client._get_page(
+                        'constituents/search', Constituent, trusted=trusted,
+                        **self._search_params(query_params, expand, sort, limit, offset),
+                    )
+                constituents = response.get('items', [])
+                
+                if not constituents:
+                    break
+                
+                yield constituents
+                
+                if response.get('next_item') is None:
+                    break
+                
+                offset = response.get('next_item', 0)
+                page += 1
+                limit = self.client._next_page_size(probe, limit, constituents)
+        
+        async for constituent in self.client._prefetch(_pages(), prefetch):
+            yield constituent
+    
+    async def search_all_constituents(
+        self,
+        query_params: Union[List[str], SearchQuery],
+        expand: Optional[str] = None,
+        sort: Optional[str] = None,
+        *,
+        trusted: Optional[bool] = None
+    ) -> List[Constituent]:
+        """Search for all matching constituents with automatic pagination."""
+        return [
+            item async for item in self.iter_search(
+                query_params, expand, sort, trusted=trusted
+            )
+        ]
+    
+    async def list(self, limit: Optional[int] = None, offset: Optional[int] = None) -> Dict:
+        """List all constituents for an account."""
+        params = self._page_params(limit, offset)
+        return await self.client._get('constituents', **params)
+    
+    async def iter_all(
+        self, *, concurrency: Optional[int] = None, trusted: Optional[bool] = None
+    ) -> AsyncIterator[Constituent]:
+        """Iterate over all constituents, fetching pages as they are consumed."""
+        trusted = self.client._resolve_trusted(trusted)
+        
+        async def _list_page(**kwargs: Any) -> Any:
+            return await self.client._get_page('constituents', Constituent, trusted=trusted, **kwargs)
+        
+        async for constituent in self.client._paginate(_list_page, concurrency=concurrency):
+            yield constituent
+    
+    async def fetch_all(
+        self, *, concurrency: Optional[int] = None, trusted: Optional[bool] = None
+    ) -> List[Constituent]:
+        """Fetch all constituents with automatic pagination."""
+        return [
+            item async for item in self.iter_all(concurrency=concurrency, trusted=trusted)
+        ]
+    
+    async def load_profiles(
+        self,
+        ids: Iterable[int],
+        include: Optional[Sequence[str]] = None,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None,
+        skip_missing: bool = False
+    ) -> List[Constituent]:
+        """Load complete constituent profiles for many constituents at once."""
+        ids, include = _profile_plan(ids, include)
+        trusted = self.client._resolve_trusted(trusted)
+        semaphore = asyncio.Semaphore(self.client._resolve_concurrency(concurrency))
+        
+        async def _detail(constituent_id: int) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self.client._get(f'constituents/{constituent_id}')
+                except NotFoundError:
+                    if skip_missing:
+                        return None
+                    raise
+        
+        async def _collection(task: Tuple[int, str]) -> List[Dict[str, Any]]:
+            constituent_id, name = task
+            path = f'constituents/{constituent_id}/{PROFILE_COLLECTIONS[name]}'
+            async with semaphore:
+                return [
+                    item async for item in self.client._paginate(
+                        lambda **kwargs: self.client._get(path, **kwargs), concurrency=1
+                    )
+                ]
+        
+        results = await asyncio.gather(*(_detail(constituent_id) for constituent_id in ids))
+        details = {
+            constituent_id: data
+            for constituent_id, data in zip(ids, results)
+            if data is not None
+        }
+        missing = _missing_collections(details, include)
+        collections = await asyncio.gather(*(_collection(task) for task in missing))
+        for (constituent_id, name), items in zip(missing, collections):
+            details[constituent_id][name] = items
+        
+        return [Constituent.from_dict(data, trusted=trusted) for data in details.values()]
+    
+    async def retrieve(self, constituent_id: int) -> Constituent:
+        """Retrieve a specific constituent by ID."""
+        response = await self.client._get(f'constituents/{constituent_id}')
+        return Constituent(**response)
+    
+    async def create(self, constituent_data: Dict) -> Constituent:
+        """Create a new constituent."""
+        response = await self.client._post('constituents', constituent_data)
+        return Constituent(**response)
+    
+    async def update(self, constituent_id: int, constituent_data: Dict) -> Constituent:
+        """Update an existing constituent."""
+        response = await self.client._patch(f'constituents/{constituent_id}', constituent_data)
+        return Constituent(**response)
+    
+    async def delete(self, constituent_id: int) -> Dict:
+        """Delete a constituent."""
+        await self.client._delete(f'constituents/{constituent_id}')
+        return {"result": "success"}
+    
+    async def search_by_name(self, name: str, **kwargs: Any) -> List[Constituent]:
+        """Search constituents by name."""
+        return await self.search_constituents(
+            SearchQuery("constituents").where("name", name), **kwargs
+        )
+    
+    async def search_by_email(self, email: str, **kwargs: Any) -> List[Constituent]:
+        """Search constituents by email address."""
+        return await self.search_constituents(
+            SearchQuery("constituents").where("eaddr", email), **kwargs
+        )
+    
+    async def search_by_phone(self, phone: str, **kwargs: Any) -> List[Constituent]:
+        """Search constituents by phone number."""
+        return await self.search_constituents(
+            SearchQuery("constituents").where("phone_number", phone), **kwargs
+        )
+    
+    async def search_by_external_id(self, external_id: str, **kwargs: Any) -> List[Constituent]:
+        """Search constituents by external ID."""
+        return await self.search_constituents(
+            SearchQuery("constituents").where("external_id", external_id), **kwargs
+        )
+    
+    async def search_organizations(self, **kwargs: Any) -> List[Constituent]:
+        """Search for organization constituents only."""
+        return await self.search_constituents(
+            SearchQuery("constituents").where("constituent_type", 1), **kwargs
+        )
+    
+    async def search_individuals(self, **kwargs: Any) -> List[Constituent]:
+        """Search for individual constituents only."""
+        return await self.search_constituents(
+            SearchQuery("constituents").where("constituent_type", 0), **kwargs
+        )
+    
+    async def search_by_keyword(self, keyword_id: int, **kwargs: Any) -> List[Constituent]:
+        """Search constituents by keyword ID."""
+        return await self.search_constituents(
+            SearchQuery("constituents").where("keyword", keyword_id), **kwargs
+        )
+    
+    async def search_by_group(self, group_ids: Union[int, List[int]], **kwargs: Any) -> List[Constituent]:
+        """Search constituents by group membership."""
+        return await self.search_constituents(
+            SearchQuery("constituents").where("groups", group_ids), **kwargs
+        )
+    
+    async def search_by_membership_level(
+        self, level_ids: Union[int, List[int]], **kwargs: Any
+    ) -> List[Constituent]:
+        """Search constituents by membership level."""
+        return await self.search_constituents(
+            SearchQuery("constituents").where("membership_level", level_ids), **kwargs
+        )
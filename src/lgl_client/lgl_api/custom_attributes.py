@@ -1,20 +1,35 @@
 """Custom Attributes API for LGL client."""
 
-from typing import Any, List, Literal, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional
 
 from ..models.custom_attribute import CustomAttributeDefinition
-from .client import LGLClient
+from .client import AsyncLGLClient, LGLClient
 
 
-class CustomAttributesAPI:
+class _CustomAttributesMixin:
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "attributes"
+    
+    @staticmethod
+    def _list_params(item_type: Optional[str], limit: int, offset: int) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"limit": limit, "offset": offset}
+        if item_type is not None:
+            params["item_type"] = item_type
+        return params
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[CustomAttributeDefinition]:
+        return [CustomAttributeDefinition.from_dict(item) for item in data.get("items", [])]
+
+
+class CustomAttributesAPI(_CustomAttributesMixin):
     """API for managing custom attributes in Little Green Light.
     
     Custom attributes define additional fields that can be associated
     with constituents or invitations beyond the standard fields.
     """
     
-    _resource = "attributes"
-    
     def __init__(self, client: LGLClient) -> None:
         """Initialize Custom Attributes API.
         
@@ -40,12 +55,31 @@ class CustomAttributesAPI:
         Returns:
             List of CustomAttributeDefinition objects
         """
-        params = {"limit": limit, "offset": offset}
-        if item_type is not None:
-            params["item_type"] = item_type
+        params = self._list_params(item_type, limit, offset)
+        return self._parse_page(self._client._get(self._resource, **params))
+    
+    def iter_all(
+        self, 
+        *, 
+        item_type: Optional[Literal["Constituent", "Invitation"]] = None
+    ) -> Iterator[CustomAttributeDefinition]:
+        """Iterate over all custom attribute definitions, one page at a time.
         
-        data = self._client._get(self._resource, **params)
-        return [CustomAttributeDefinition.from_dict(item) for item in data.get("items", [])]
+        Args:
+            item_type: Filter by item type (default: Constituent)
+            
+        Yields:
+            CustomAttributeDefinition objects
+        """
+        def _list_page(**kwargs: Any) -> List[CustomAttributeDefinition]:
+            return self.list(**kwargs)
+        
+        kwargs = {}
+        if item_type is not None:
+            kwargs["item_type"] = item_type
+            
+        for item in self._client._paginate(_list_page, **kwargs):
+            yield CustomAttributeDefinition.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(
         self, 
@@ -60,12 +94,48 @@ class CustomAttributesAPI:
         Returns:
             List of all CustomAttributeDefinition objects
         """
-        def _list_page(**kwargs: Any) -> List[CustomAttributeDefinition]:
-            return self.list(**kwargs)
+        return list(self.iter_all(item_type=item_type))
+
+
+class AsyncCustomAttributesAPI(_CustomAttributesMixin):
+    """Async variant of :class:`CustomAttributesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient) -> None:
+        """Initialize async Custom Attributes API.
         
-        kwargs = {}
+        Args:
+            client: Async LGL HTTP client instance
+        """
+        self._client = client
+    
+    async def list(
+        self, 
+        *, 
+        item_type: Optional[Literal["Constituent", "Invitation"]] = None,
+        limit: int = 25, 
+        offset: int = 0
+    ) -> List[CustomAttributeDefinition]:
+        """List custom attribute definitions for the account."""
+        params = self._list_params(item_type, limit, offset)
+        return self._parse_page(await self._client._get(self._resource, **params))
+    
+    async def iter_all(
+        self, 
+        *, 
+        item_type: Optional[Literal["Constituent", "Invitation"]] = None
+    ) -> AsyncIterator[CustomAttributeDefinition]:
+        """Iterate over all custom attribute definitions, page by page."""
+        kwargs: Dict[str, Any] = {}
         if item_type is not None:
             kwargs["item_type"] = item_type
-            
-        items = list(self._client._paginate(_list_page, **kwargs))
-        return [CustomAttributeDefinition.from_dict(item) if isinstance(item, dict) else item for item in items]
\ No newline at end of file
+        
+        async for item in self._client._paginate(self.list, **kwargs):
+            yield item
+    
+    async def fetch_all(
+        self, 
+        *, 
+        item_type: Optional[Literal["Constituent", "Invitation"]] = None
+    ) -> List[CustomAttributeDefinition]:
+        """Fetch all custom attribute definitions using automatic pagination."""
+        return [item async for item in self.iter_all(item_type=item_type)]
@@ -0,0 +1,90 @@
+"""JSON decoders for API responses.
+
+The client decodes bodies with the standard library by default. Pass
+``json_decoder`` to :class:`~lgl_client.lgl_api.client.LGLClient` to pick
+another backend:
+
+``"stdlib"``
+    ``response.json()`` (the default)
+``"orjson"``
+    :func:`orjson.loads`; requires ``orjson`` (``lgl-client[fast-json]``)
+``"pydantic"``
+    pydantic-core's JSON parser. Pages that bulk reads turn into models
+    (``iter_all``/``iter_search`` of gifts and constituents) are validated
+    straight from the response bytes, without building the intermediate
+    dicts first.
+``"auto"``
+    ``"orjson"`` when installed, otherwise ``"stdlib"``
+
+Any callable taking the body bytes and returning the decoded value works
+as well. orjson rejects integers wider than 64 bits, which the stdlib
+accepts; LGL does not send any.
+"""
+
+import importlib
+import importlib.util
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Type, Union
+
+if TYPE_CHECKING:
+    from ..models import LGLModel
+
+JSONDecoder = Callable[[bytes], Any]
+
+JSON_DECODERS = ("stdlib", "orjson", "pydantic", "auto")
+
+
+def resolve_decoder(
+    decoder: Union[str, JSONDecoder, None],
+) -> Tuple[str, Optional[JSONDecoder]]:
+    """Name and loads function of a ``json_decoder`` setting.
+
+    The stdlib backend returns ``None`` as its function: the client then
+    calls ``response.json()``, which also handles non-UTF-8 bodies.
+
+    Raises:
+        ValueError: For an unknown backend name
+        ImportError: If ``"orjson"`` is requested but not installed
+    """
+    if decoder is None:
+        decoder = "stdlib"
+    if callable(decoder):
+        return "custom", decoder
+    if decoder == "auto":
+        decoder = "orjson" if importlib.util.find_spec("orjson") is not None else "stdlib"
+    if decoder == "stdlib":
+        return "stdlib", None
+    if decoder == "orjson":
+        try:
+            orjson = importlib.import_module("orjson")
+        except ImportError:
+            raise ImportError(
+                "json_decoder='orjson' requires orjson (pip install 'lgl-client[fast-json]')"
+            ) from None
+        return "orjson", orjson.loads
+    if decoder == "pydantic":
+        from pydantic_core import from_json
+
+        return "pydantic", from_json
+    raise ValueError(
+        f"Unknown json_decoder: {decoder!r} (expected one of {', '.join(JSON_DECODERS)})"
+    )
+
+
+@lru_cache(maxsize=None)
+def page_adapter(model: Type["LGLModel"], array: bool = False) -> Any:
+    """``TypeAdapter`` validating a page of ``model`` items from JSON bytes.
+
+    Pages are objects with ``items``, whose other keys are kept as they
+    are, or bare arrays when ``array`` is set.
+    """
+    from pydantic import ConfigDict, TypeAdapter, create_model
+
+    if array:
+        return TypeAdapter(List[model])  # type: ignore[valid-type]
+    envelope = create_model(
+        f"{model.__name__}Page",
+        __config__=ConfigDict(extra="allow"),
+        items=(List[model], ...),  # type: ignore[valid-type]
+    )
+    return TypeAdapter(envelope)
@@ -1,12 +1,34 @@
 """Email Addresses API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.constituent import EmailAddress
 
 
-class EmailAddressesAPI:
+class _EmailAddressesMixin:
+    """Query parameters and payloads shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _typed_email(type_id: int, type_name: str, address: str, is_preferred: bool) -> Dict[str, Any]:
+        return {
+            "address": address,
+            "email_address_type_id": type_id,
+            "email_type_name": type_name,
+            "is_preferred": is_preferred
+        }
+
+
+class EmailAddressesAPI(_EmailAddressesMixin):
     """API for managing constituent email addresses."""
     
     def __init__(self, client: LGLClient):
@@ -28,14 +50,24 @@ class EmailAddressesAPI:
         Returns:
             Paginated response with email address items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/email_addresses', **params)
     
+    def iter_all(self, constituent_id: int) -> Iterator[EmailAddress]:
+        """Iterate over all email addresses for a constituent, one page at a time.
+        
+        Args:
+            constituent_id: The constituent ID
+        
+        Yields:
+            EmailAddress objects
+        """
+        def _list_page(**kwargs):
+            return self.list(constituent_id, **kwargs)
+        
+        for item in self.client._paginate(_list_page):
+            yield EmailAddress(**item)
+    
     def fetch_all(self, constituent_id: int) -> List[EmailAddress]:
         """Fetch all email addresses for a constituent with automatic pagination.
         
@@ -45,11 +77,7 @@ class EmailAddressesAPI:
         Returns:
             List of all EmailAddress objects
         """
-        def _list_page(**kwargs):
-            return self.list(constituent_id, **kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [EmailAddress(**item) for item in items]
+        return list(self.iter_all(constituent_id))
     
     def retrieve(self, email_address_id: int) -> EmailAddress:
         """Retrieve a specific email address by ID.
@@ -119,12 +147,7 @@ class EmailAddressesAPI:
         Returns:
             Created EmailAddress object
         """
-        return self.create(constituent_id, {
-            "address": address,
-            "email_address_type_id": 1,  # Home
-            "email_type_name": "Home",
-            "is_preferred": is_preferred
-        })
+        return self.create(constituent_id, self._typed_email(1, "Home", address, is_preferred))
     
     def create_work_email(self, constituent_id: int, address: str, is_preferred: bool = False) -> EmailAddress:
         """Create a work email address for a constituent.
@@ -137,12 +160,7 @@ class EmailAddressesAPI:
         Returns:
             Created EmailAddress object
         """
-        return self.create(constituent_id, {
-            "address": address,
-            "email_address_type_id": 2,  # Work
-            "email_type_name": "Work",
-            "is_preferred": is_preferred
-        })
+        return self.create(constituent_id, self._typed_email(2, "Work", address, is_preferred))
     
     def set_preferred(self, email_address_id: int) -> EmailAddress:
         """Set an email address as preferred.
@@ -164,4 +182,69 @@ class EmailAddressesAPI:
         Returns:
             Updated EmailAddress object
         """
-        return self.update(email_address_id, {"not_current": True})
\ No newline at end of file
+        return self.update(email_address_id, {"not_current": True})
+
+
+class AsyncEmailAddressesAPI(_EmailAddressesMixin):
+    """Async variant of :class:`EmailAddressesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all email addresses for a constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/email_addresses', **params)
+    
+    async def iter_all(self, constituent_id: int) -> AsyncIterator[EmailAddress]:
+        """Iterate over all email addresses for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list(constituent_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield EmailAddress(**item)
+    
+    async def fetch_all(self, constituent_id: int) -> List[EmailAddress]:
+        """Fetch all email addresses for a constituent with automatic pagination."""
+        return [item async for item in self.iter_all(constituent_id)]
+    
+    async def retrieve(self, email_address_id: int) -> EmailAddress:
+        """Retrieve a specific email address by ID."""
+        response = await self.client._get(f'email_addresses/{email_address_id}')
+        return EmailAddress(**response)
+    
+    async def create(self, constituent_id: int, email_data: Dict) -> EmailAddress:
+        """Create a new email address for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/email_addresses', email_data)
+        return EmailAddress(**response)
+    
+    async def update(self, email_address_id: int, email_data: Dict) -> EmailAddress:
+        """Update an existing email address."""
+        response = await self.client._patch(f'email_addresses/{email_address_id}', email_data)
+        return EmailAddress(**response)
+    
+    async def delete(self, email_address_id: int) -> Dict:
+        """Delete an email address."""
+        await self.client._delete(f'email_addresses/{email_address_id}')
+        return {"result": "success"}
+    
+    async def create_home_email(self, constituent_id: int, address: str, is_preferred: bool = False) -> EmailAddress:
+        """Create a home email address for a constituent."""
+        return await self.create(constituent_id, self._typed_email(1, "Home", address, is_preferred))
+    
+    async def create_work_email(self, constituent_id: int, address: str, is_preferred: bool = False) -> EmailAddress:
+        """Create a work email address for a constituent."""
+        return await self.create(constituent_id, self._typed_email(2, "Work", address, is_preferred))
+    
+    async def set_preferred(self, email_address_id: int) -> EmailAddress:
+        """Set an email address as preferred."""
+        return await self.update(email_address_id, {"is_preferred": True})
+    
+    async def mark_inactive(self, email_address_id: int) -> EmailAddress:
+        """Mark an email address as inactive/not current."""
+        return await self.update(email_address_id, {"not_current": True})
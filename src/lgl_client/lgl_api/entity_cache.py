@@ -0,0 +1,133 @@
+"""Identity map of single records, kept by resource and ID.
+
+Pass an :class:`EntityCache` to ``new_client`` and every ``retrieve`` of
+that client reads through it; the cache is shared by all resource APIs of
+the client::
+
+    entities = EntityCache(max_entries=2048, ttl=300)
+    client = new_client(api_key, entity_cache=entities)
+    client.constituents.retrieve(42)   # GET constituents/42, stored
+    client.constituents.retrieve(42)   # served from the cache
+    client.constituents.update(42, {"last_name": "King"})  # entry refreshed
+    client.constituents.delete(42)     # entry evicted
+    entities.stats()
+
+Writes go through the cache: a PATCH replaces the stored record with the
+response, a DELETE evicts it and a create (POST) stores the new record.
+Changes made elsewhere (another client, the LGL web app) are only seen
+once the entry's TTL has passed.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass
+class _EntityStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class EntityCache:
+    """Bounded LRU cache of records keyed by ``(resource, id)``.
+
+    Records are copied on the way in and out, so callers never share
+    mutable dicts with the cache or with each other.
+
+    Attributes:
+        max_entries: Records kept before the least recently used is dropped
+        ttl: Seconds a record is served without asking the server
+        ttls: Per-resource overrides keyed by resource path (e.g.
+            ``{"gifts": 3600, "constituents": 60}``); 0 disables caching
+    """
+
+    max_entries: int = 1024
+    ttl: float = 300.0
+    ttls: Dict[str, float] = field(default_factory=dict)
+    _entries: "OrderedDict[Tuple[str, int], Tuple[float, Dict[str, Any]]]" = field(
+        default_factory=OrderedDict, repr=False
+    )
+    _stats: Dict[str, _EntityStats] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+    def ttl_for(self, resource: str) -> float:
+        """Time-to-live in seconds for a resource."""
+        return self.ttls.get(resource, self.ttl)
+
+    def _stats_for(self, resource: str) -> _EntityStats:
+        # Callers hold the lock
+        return self._stats.setdefault(resource, _EntityStats())
+
+    def get(self, resource: str, entity_id: int) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached record, or None if absent or expired."""
+        key = (resource, entity_id)
+        with self._lock:
+            stats = self._stats_for(resource)
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            stats.hits += 1
+            record = entry[1]
+        return copy.deepcopy(record)
+
+    def put(self, resource: str, entity_id: int, record: Dict[str, Any]) -> None:
+        """Store a record, replacing any cached version of it."""
+        ttl = self.ttl_for(resource)
+        if ttl <= 0:
+            return
+        record = copy.deepcopy(record)
+        key = (resource, entity_id)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, record)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._stats_for(resource).stores += 1
+
+    def evict(self, resource: str, entity_id: int) -> None:
+        """Drop one record, e.g. after it was deleted."""
+        with self._lock:
+            if self._entries.pop((resource, entity_id), None) is not None:
+                self._stats_for(resource).invalidations += 1
+
+    def invalidate(self, resource: Optional[str] = None) -> None:
+        """Drop every record of one resource, or of all resources."""
+        with self._lock:
+            if resource is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == resource]:
+                del self._entries[key]
+            self._stats_for(resource).invalidations += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit, miss, store and invalidation counts per resource."""
+        with self._lock:
+            return {
+                resource: {
+                    "hits": stats.hits,
+                    "misses": stats.misses,
+                    "stores": stats.stores,
+                    "invalidations": stats.invalidations,
+                }
+                for resource, stats in self._stats.items()
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
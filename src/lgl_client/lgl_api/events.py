@@ -1,27 +1,41 @@
 """Events API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.event import Event
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class EventsAPI:
+class _EventsMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "events"
+    
+    def _event_path(self, event_id: int) -> str:
+        return f"{self._resource}/{event_id}"
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[Event]:
+        return [Event.from_dict(item) for item in data.get("items", [])]
+
+
+class EventsAPI(_EventsMixin):
     """API for managing events in Little Green Light.
     
     Events represent fundraising events, gatherings, or activities
     that may have associated volunteer time or gifts.
     """
     
-    _resource = "events"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Events API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(self, *, limit: int = 25, offset: int = 0) -> List[Event]:
         """List events for the account.
@@ -33,8 +47,19 @@ class EventsAPI:
         Returns:
             List of Event objects
         """
-        data = self._client._get(self._resource, limit=limit, offset=offset)
-        return [Event.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(self._client._get(self._resource, limit=limit, offset=offset))
+    
+    def iter_all(self) -> Iterator[Event]:
+        """Iterate over all events, one page at a time.
+        
+        Yields:
+            Event objects
+        """
+        def _list_page(**kwargs: Any) -> List[Event]:
+            return self.list(**kwargs)
+            
+        for item in self._client._paginate(_list_page):
+            yield Event.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[Event]:
         """Fetch all events using automatic pagination.
@@ -42,11 +67,7 @@ class EventsAPI:
         Returns:
             List of all Event objects
         """
-        def _list_page(**kwargs: Any) -> List[Event]:
-            return self.list(**kwargs)
-            
-        items = list(self._client._paginate(_list_page))
-        return [Event.from_dict(item) if isinstance(item, dict) else item for item in items]
+        return self._cached("fetch_all", lambda: list(self.iter_all()))
     
     def retrieve(self, event_id: int) -> Event:
         """Retrieve a specific event by ID.
@@ -57,7 +78,7 @@ class EventsAPI:
         Returns:
             Event object
         """
-        data = self._client._get(f"{self._resource}/{event_id}")
+        data = self._client._get(self._event_path(event_id))
         return Event.from_dict(data)
     
     def create(self, event: Event) -> Event:
@@ -70,6 +91,7 @@ class EventsAPI:
             Created Event object
         """
         data = self._client._post(self._resource, event.to_dict())
+        self._invalidate_cache()
         return Event.from_dict(data)
     
     def update(self, event_id: int, event: Event) -> Event:
@@ -82,7 +104,8 @@ class EventsAPI:
         Returns:
             Updated Event object
         """
-        data = self._client._patch(f"{self._resource}/{event_id}", event.to_dict())
+        data = self._client._patch(self._event_path(event_id), event.to_dict())
+        self._invalidate_cache()
         return Event.from_dict(data)
     
     def delete(self, event_id: int) -> None:
@@ -91,4 +114,54 @@ class EventsAPI:
         Args:
             event_id: Event ID to delete
         """
-        self._client._delete(f"{self._resource}/{event_id}")
\ No newline at end of file
+        self._client._delete(self._event_path(event_id))
+        self._invalidate_cache()
+
+
+class AsyncEventsAPI(_EventsMixin):
+    """Async variant of :class:`EventsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Events API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[Event]:
+        """List events for the account."""
+        return self._parse_page(await self._client._get(self._resource, limit=limit, offset=offset))
+    
+    async def iter_all(self) -> AsyncIterator[Event]:
+        """Iterate over all events, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[Event]:
+        """Fetch all events using automatic pagination."""
+        return await self._acached("fetch_all", lambda: self._collect(self.iter_all()))
+    
+    async def retrieve(self, event_id: int) -> Event:
+        """Retrieve a specific event by ID."""
+        data = await self._client._get(self._event_path(event_id))
+        return Event.from_dict(data)
+    
+    async def create(self, event: Event) -> Event:
+        """Create a new event."""
+        data = await self._client._post(self._resource, event.to_dict())
+        self._invalidate_cache()
+        return Event.from_dict(data)
+    
+    async def update(self, event_id: int, event: Event) -> Event:
+        """Update an existing event."""
+        data = await self._client._patch(self._event_path(event_id), event.to_dict())
+        self._invalidate_cache()
+        return Event.from_dict(data)
+    
+    async def delete(self, event_id: int) -> None:
+        """Delete an event."""
+        await self._client._delete(self._event_path(event_id))
+        self._invalidate_cache()
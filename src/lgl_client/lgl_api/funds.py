@@ -1,27 +1,41 @@
 """Funds API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.fund import Fund
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class FundsAPI:
+class _FundsMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "funds"
+    
+    def _fund_path(self, fund_id: int) -> str:
+        return f"{self._resource}/{fund_id}"
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[Fund]:
+        return [Fund.from_dict(item) for item in data.get("items", [])]
+
+
+class FundsAPI(_FundsMixin):
     """API for managing funds in Little Green Light.
     
     Funds represent designated accounts or purposes for donations,
     such as building funds, endowments, or special projects.
     """
     
-    _resource = "funds"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Funds API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(self, *, limit: int = 25, offset: int = 0) -> List[Fund]:
         """List funds for the account.
@@ -33,8 +47,19 @@ class FundsAPI:
         Returns:
             List of Fund objects
         """
-        data = self._client._get(self._resource, limit=limit, offset=offset)
-        return [Fund.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(self._client._get(self._resource, limit=limit, offset=offset))
+    
+    def iter_all(self) -> Iterator[Fund]:
+        """Iterate over all funds, one page at a time.
+        
+        Yields:
+            Fund objects
+        """
+        def _list_page(**kwargs: Any) -> List[Fund]:
+            return self.list(**kwargs)
+            
+        for item in self._client._paginate(_list_page):
+            yield Fund.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[Fund]:
         """Fetch all funds using automatic pagination.
@@ -42,11 +67,7 @@ class FundsAPI:
         Returns:
             List of all Fund objects
         """
-        def _list_page(**kwargs: Any) -> List[Fund]:
-            return self.list(**kwargs)
-            
-        items = list(self._client._paginate(_list_page))
-        return [Fund.from_dict(item) if isinstance(item, dict) else item for item in items]
+        return self._cached("fetch_all", lambda: list(self.iter_all()))
     
     def retrieve(self, fund_id: int) -> Fund:
         """Retrieve a specific fund by ID.
@@ -57,7 +78,7 @@ class FundsAPI:
         Returns:
             Fund object
         """
-        data = self._client._get(f"{self._resource}/{fund_id}")
+        data = self._client._get(self._fund_path(fund_id))
         return Fund.from_dict(data)
     
     def create(self, fund: Fund) -> Fund:
@@ -70,6 +91,7 @@ class FundsAPI:
             Created Fund object
         """
         data = self._client._post(self._resource, fund.to_dict())
+        self._invalidate_cache()
         return Fund.from_dict(data)
     
     def update(self, fund_id: int, fund: Fund) -> Fund:
@@ -82,7 +104,8 @@ class FundsAPI:
         Returns:
             Updated Fund object
         """
-        data = self._client._patch(f"{self._resource}/{fund_id}", fund.to_dict())
+        data = self._client._patch(self._fund_path(fund_id), fund.to_dict())
+        self._invalidate_cache()
         return Fund.from_dict(data)
     
     def delete(self, fund_id: int) -> None:
@@ -91,4 +114,54 @@ class FundsAPI:
         Args:
             fund_id: Fund ID to delete
         """
-        self._client._delete(f"{self._resource}/{fund_id}")
\ No newline at end of file
+        self._client._delete(self._fund_path(fund_id))
+        self._invalidate_cache()
+
+
+class AsyncFundsAPI(_FundsMixin):
+    """Async variant of :class:`FundsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Funds API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[Fund]:
+        """List funds for the account."""
+        return self._parse_page(await self._client._get(self._resource, limit=limit, offset=offset))
+    
+    async def iter_all(self) -> AsyncIterator[Fund]:
+        """Iterate over all funds, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[Fund]:
+        """Fetch all funds using automatic pagination."""
+        return await self._acached("fetch_all", lambda: self._collect(self.iter_all()))
+    
+    async def retrieve(self, fund_id: int) -> Fund:
+        """Retrieve a specific fund by ID."""
+        data = await self._client._get(self._fund_path(fund_id))
+        return Fund.from_dict(data)
+    
+    async def create(self, fund: Fund) -> Fund:
+        """Create a new fund."""
+        data = await self._client._post(self._resource, fund.to_dict())
+        self._invalidate_cache()
+        return Fund.from_dict(data)
+    
+    async def update(self, fund_id: int, fund: Fund) -> Fund:
+        """Update an existing fund."""
+        data = await self._client._patch(self._fund_path(fund_id), fund.to_dict())
+        self._invalidate_cache()
+        return Fund.from_dict(data)
+    
+    async def delete(self, fund_id: int) -> None:
+        """Delete a fund."""
+        await self._client._delete(self._fund_path(fund_id))
+        self._invalidate_cache()
@@ -1,27 +1,48 @@
 """Gift Categories API for LGL client."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.gift_category import GiftCategory
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class GiftCategoriesAPI:
+class _GiftCategoriesMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "gift_categories"
+    
+    def _gift_category_path(self, gift_category_id: int) -> str:
+        return f"{self._resource}/{gift_category_id}"
+    
+    @staticmethod
+    def _list_params(gift_type_id: Optional[int], limit: int, offset: int) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"limit": limit, "offset": offset}
+        if gift_type_id is not None:
+            params["gift_type_id"] = str(gift_type_id)  # API expects string
+        return params
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[GiftCategory]:
+        return [GiftCategory.from_dict(item) for item in data.get("items", [])]
+
+
+class GiftCategoriesAPI(_GiftCategoriesMixin):
     """API for managing gift categories in Little Green Light.
     
     Gift categories provide sub-classifications within gift types,
     such as "Donation", "Matching Gift", "Standard Pledge", "Grant", etc.
     """
     
-    _resource = "gift_categories"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Gift Categories API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(
         self, 
@@ -40,21 +61,17 @@ class GiftCategoriesAPI:
         Returns:
             List of GiftCategory objects
         """
-        params: Dict[str, Any] = {"limit": limit, "offset": offset}
-        if gift_type_id is not None:
-            params["gift_type_id"] = str(gift_type_id)  # API expects string
-        
-        data = self._client._get(self._resource, **params)
-        return [GiftCategory.from_dict(item) for item in data.get("items", [])]
+        params = self._list_params(gift_type_id, limit, offset)
+        return self._parse_page(self._client._get(self._resource, **params))
     
-    def fetch_all(self, *, gift_type_id: Optional[int] = None) -> List[GiftCategory]:
-        """Fetch all gift categories using automatic pagination.
+    def iter_all(self, *, gift_type_id: Optional[int] = None) -> Iterator[GiftCategory]:
+        """Iterate over all gift categories, one page at a time.
         
         Args:
             gift_type_id: Filter by gift type ID
             
-        Returns:
-            List of all GiftCategory objects
+        Yields:
+            GiftCategory objects
         """
         def _list_page(**kwargs: Any) -> List[GiftCategory]:
             return self.list(**kwargs)
@@ -63,8 +80,21 @@ class GiftCategoriesAPI:
         if gift_type_id is not None:
             kwargs["gift_type_id"] = gift_type_id
             
-        items = list(self._client._paginate(_list_page, **kwargs))
-        return [GiftCategory.from_dict(item) if isinstance(item, dict) else item for item in items]
+        for item in self._client._paginate(_list_page, **kwargs):
+            yield GiftCategory.from_dict(item) if isinstance(item, dict) else item
+    
+    def fetch_all(self, *, gift_type_id: Optional[int] = None) -> List[GiftCategory]:
+        """Fetch all gift categories using automatic pagination.
+        
+        Args:
+            gift_type_id: Filter by gift type ID
+            
+        Returns:
+            List of all GiftCategory objects
+        """
+        return self._cached(
+            "fetch_all", lambda: list(self.iter_all(gift_type_id=gift_type_id)), gift_type_id
+        )
     
     def retrieve(self, gift_category_id: int) -> GiftCategory:
         """Retrieve a specific gift category by ID.
@@ -75,7 +105,7 @@ class GiftCategoriesAPI:
         Returns:
             GiftCategory object
         """
-        data = self._client._get(f"{self._resource}/{gift_category_id}")
+        data = self._client._get(self._gift_category_path(gift_category_id))
         return GiftCategory.from_dict(data)
     
     def create(self, gift_category: GiftCategory) -> GiftCategory:
@@ -88,6 +118,7 @@ class GiftCategoriesAPI:
             Created GiftCategory object
         """
         data = self._client._post(self._resource, gift_category.to_dict())
+        self._invalidate_cache()
         return GiftCategory.from_dict(data)
     
     def update(self, gift_category_id: int, gift_category: GiftCategory) -> GiftCategory:
@@ -100,7 +131,8 @@ class GiftCategoriesAPI:
         Returns:
             Updated GiftCategory object
         """
-        data = self._client._patch(f"{self._resource}/{gift_category_id}", gift_category.to_dict())
+        data = self._client._patch(self._gift_category_path(gift_category_id), gift_category.to_dict())
+        self._invalidate_cache()
         return GiftCategory.from_dict(data)
     
     def delete(self, gift_category_id: int) -> None:
@@ -109,4 +141,67 @@ class GiftCategoriesAPI:
         Args:
             gift_category_id: Gift Category ID to delete
         """
-        self._client._delete(f"{self._resource}/{gift_category_id}")
\ No newline at end of file
+        self._client._delete(self._gift_category_path(gift_category_id))
+        self._invalidate_cache()
+
+
+class AsyncGiftCategoriesAPI(_GiftCategoriesMixin):
+    """Async variant of :class:`GiftCategoriesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Gift Categories API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(
+        self, 
+        *, 
+        gift_type_id: Optional[int] = None,
+        limit: int = 25, 
+        offset: int = 0
+    ) -> List[GiftCategory]:
+        """List gift categories for the account."""
+        params = self._list_params(gift_type_id, limit, offset)
+        return self._parse_page(await self._client._get(self._resource, **params))
+    
+    async def iter_all(self, *, gift_type_id: Optional[int] = None) -> AsyncIterator[GiftCategory]:
+        """Iterate over all gift categories, fetching pages as they are consumed."""
+        kwargs = {}
+        if gift_type_id is not None:
+            kwargs["gift_type_id"] = gift_type_id
+        
+        async for item in self._client._paginate(self.list, **kwargs):
+            yield item
+    
+    async def fetch_all(self, *, gift_type_id: Optional[int] = None) -> List[GiftCategory]:
+        """Fetch all gift categories using automatic pagination."""
+        return await self._acached(
+            "fetch_all", lambda: self._collect(self.iter_all(gift_type_id=gift_type_id)), gift_type_id
+        )
+    
+    async def retrieve(self, gift_category_id: int) -> GiftCategory:
+        """Retrieve a specific gift category by ID."""
+        data = await self._client._get(self._gift_category_path(gift_category_id))
+        return GiftCategory.from_dict(data)
+    
+    async def create(self, gift_category: GiftCategory) -> GiftCategory:
+        """Create a new gift category."""
+        data = await self._client._post(self._resource, gift_category.to_dict())
+        self._invalidate_cache()
+        return GiftCategory.from_dict(data)
+    
+    async def update(self, gift_category_id: int, gift_category: GiftCategory) -> GiftCategory:
+        """Update an existing gift category."""
+        data = await self._client._patch(self._gift_category_path(gift_category_id), gift_category.to_dict())
+        self._invalidate_cache()
+        return GiftCategory.from_dict(data)
+    
+    async def delete(self, gift_category_id: int) -> None:
+        """Delete a gift category."""
+        await self._client._delete(self._gift_category_path(gift_category_id))
+        self._invalidate_cache()
@@ -0,0 +1,264 @@
+"""Gift filters compiled into ``gifts/search`` queries.
+
+A :class:`GiftFilter` describes which gifts to return. Planning splits it
+into the search terms ``gifts/search`` understands (``q[]=campaigns=in|5``,
+``date_from=...``) and the predicates that have to be checked in Python,
+such as ``acknowledged``, which is not a search term. The resulting
+:class:`GiftQueryPlan` records where each predicate runs.
+
+``constituent_id`` is not a search term either. For a single donor the
+plan picks the smaller of two scans: the donor's own gift list, filtered
+locally, or the account-wide search with the other predicates pushed down.
+"""
+
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from ..models.gift import Gift
+from .search_query import SearchQuery, normalize_timestamp
+
+SEARCH_PATH = "gifts/search"
+
+
+@dataclass(frozen=True)
+class GiftFilter:
+    """Criteria a gift must meet; unset criteria match every gift.
+
+    Attributes:
+        constituent_id: Donor of the gift
+        date_from: Earliest gift date (inclusive)
+        date_to: Latest gift date (inclusive)
+        amount_from: Minimum amount (inclusive)
+        amount_to: Maximum amount (inclusive)
+        gift_type_ids: Gift type is one of these IDs
+        payment_type_ids: Payment type is one of these IDs
+        campaign_ids: Campaign is one of these IDs
+        fund_ids: Fund is one of these IDs
+        appeal_ids: Appeal is one of these IDs
+        event_ids: Event is one of these IDs
+        gift_category_ids: Gift category is one of these IDs
+        gift_ids: Gift ID is one of these
+        external_gift_ids: External gift ID is one of these
+        updated_from: Updated at or after this time
+        updated_to: Updated at or before this time
+        acknowledged: Acknowledgment status (checked locally)
+        predicate: Any further condition (checked locally)
+    """
+
+    constituent_id: Optional[int] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    amount_from: Optional[float] = None
+    amount_to: Optional[float] = None
+    gift_type_ids: Optional[Sequence[int]] = None
+    payment_type_ids: Optional[Sequence[int]] = None
+    campaign_ids: Optional[Sequence[int]] = None
+    fund_ids: Optional[Sequence[int]] = None
+    appeal_ids: Optional[Sequence[int]] = None
+    event_ids: Optional[Sequence[int]] = None
+    gift_category_ids: Optional[Sequence[int]] = None
+    gift_ids: Optional[Sequence[int]] = None
+    external_gift_ids: Optional[Sequence[str]] = None
+    updated_from: Optional[datetime] = None
+    updated_to: Optional[datetime] = None
+    acknowledged: Optional[bool] = None
+    predicate: Optional[Callable[[Gift], bool]] = None
+
+    def __post_init__(self) -> None:
+        for name in _ID_TERMS:
+            value = getattr(self, name)
+            if value is not None and len(value) == 0:
+                raise ValueError(f"{name} must not be empty")
+
+    def active(self) -> Dict[str, Any]:
+        """Criteria that are set, by field name."""
+        return {
+            item.name: getattr(self, item.name)
+            for item in fields(self)
+            if getattr(self, item.name) is not None
+        }
+
+
+# Search term and Gift attribute of every ``op|IDs`` criterion
+_ID_TERMS: Dict[str, Tuple[str, str]] = {
+    "gift_type_ids": ("gift_types", "gift_type_id"),
+    "payment_type_ids": ("payment_types", "payment_type_id"),
+    "campaign_ids": ("campaigns", "campaign_id"),
+    "fund_ids": ("funds", "fund_id"),
+    "appeal_ids": ("appeals", "appeal_id"),
+    "event_ids": ("events", "event_id"),
+    "gift_category_ids": ("categories", "gift_category_id"),
+    "gift_ids": ("gift_ids", "id"),
+    "external_gift_ids": ("external_gift_ids", "external_gift_id"),
+}
+
+# Criteria gifts/search cannot evaluate
+_LOCAL_ONLY = frozenset({"constituent_id", "acknowledged", "predicate"})
+
+
+def search_query(criteria: Dict[str, Any]) -> SearchQuery:
+    """``gifts/search`` query for the criteria the search can evaluate."""
+    query = SearchQuery("gifts")
+    for name in ("date_from", "date_to"):
+        if name in criteria:
+            query = query.where(name, criteria[name])
+    low, high = criteria.get("amount_from"), criteria.get("amount_to")
+    if low is not None and high is not None:
+        query = query.where("gift_amount", low, high, op="btw")
+    elif low is not None:
+        query = query.where("gift_amount", low, op="gte")
+    elif high is not None:
+        query = query.where("gift_amount", high, op="lte")
+    for name, (term, _) in _ID_TERMS.items():
+        if name in criteria:
+            query = query.where(term, criteria[name])
+    for name in ("updated_from", "updated_to"):
+        if name in criteria:
+            query = query.where(name, criteria[name])
+    return query
+
+
+def _check(name: str, value: Any) -> Callable[[Gift], bool]:
+    """Python predicate equivalent to one criterion."""
+    if name == "constituent_id":
+        return lambda gift: gift.constituent_id == value
+    if name == "date_from":
+        return lambda gift: gift.date >= value
+    if name == "date_to":
+        return lambda gift: gift.date <= value
+    if name == "amount_from":
+        return lambda gift: gift.amount >= value
+    if name == "amount_to":
+        return lambda gift: gift.amount <= value
+    if name == "updated_from":
+        bound = normalize_timestamp(value)
+        return lambda gift: normalize_timestamp(gift.updated_at) >= bound
+    if name == "updated_to":
+        bound = normalize_timestamp(value)
+        return lambda gift: normalize_timestamp(gift.updated_at) <= bound
+    if name == "acknowledged":
+        return lambda gift: gift.acknowledged == value
+    if name == "predicate":
+        predicate: Callable[[Gift], bool] = value
+        return predicate
+    attribute = _ID_TERMS[name][1]
+    allowed = frozenset(value)
+    return lambda gift: getattr(gift, attribute) in allowed
+
+
+@dataclass(frozen=True)
+class GiftQueryPlan:
+    """Where a gift query runs.
+
+    Attributes:
+        path: Endpoint paged through
+        params: Query parameters sent with every page
+        server_filters: Criteria the endpoint applies
+        local_filters: Criteria checked in Python on every returned gift
+        estimates: ``total_items`` of each source probed while planning
+        page_size: Gifts requested per page
+    """
+
+    path: str
+    params: Dict[str, Any]
+    server_filters: Tuple[str, ...]
+    local_filters: Tuple[str, ...]
+    estimates: Dict[str, Optional[int]] = field(default_factory=dict)
+    page_size: int = 100
+    # First page fetched while probing, reused by the query
+    first_page: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+    _checks: Tuple[Callable[[Gift], bool], ...] = field(
+        default=(), repr=False, compare=False
+    )
+
+    def matches(self, gift: Gift) -> bool:
+        """Whether a gift returned by the endpoint passes the local filters."""
+        return all(check(gift) for check in self._checks)
+
+    def explain(self) -> str:
+        """Readable summary of the plan."""
+        lines = [f"GET {self.path}"]
+        if self.params.get("q"):
+            lines.append(f"  q[]: {'; '.join(self.params['q'])}")
+        lines.append(f"  server: {', '.join(self.server_filters) or '-'}")
+        lines.append(f"  local:  {', '.join(self.local_filters) or '-'}")
+        for path, total in self.estimates.items():
+            lines.append(f"  estimate {path}: {total} gifts")
+        return "\n".join(lines)
+
+
+def search_plan(criteria: Dict[str, Any], **extra: Any) -> GiftQueryPlan:
+    """Plan paging ``gifts/search`` with every supported criterion pushed down."""
+    local = tuple(name for name in criteria if name in _LOCAL_ONLY)
+    return GiftQueryPlan(
+        path=SEARCH_PATH,
+        params=search_query(criteria).to_params(),
+        server_filters=tuple(name for name in criteria if name not in _LOCAL_ONLY),
+        local_filters=local,
+        _checks=tuple(_check(name, criteria[name]) for name in local),
+        **extra,
+    )
+
+
+def listing_plan(criteria: Dict[str, Any], **extra: Any) -> GiftQueryPlan:
+    """Plan paging one donor's gift list with every other criterion checked locally."""
+    local = tuple(name for name in criteria if name != "constituent_id")
+    return GiftQueryPlan(
+        path=f"constituents/{criteria['constituent_id']}/gifts",
+        params={},
+        server_filters=("constituent_id",),
+        local_filters=local,
+        _checks=tuple(_check(name, criteria[name]) for name in local),
+        **extra,
+    )
+
+
+def needs_probe(criteria: Dict[str, Any]) -> bool:
+    """Whether choosing between the donor list and the search takes a probe."""
+    return "constituent_id" in criteria and bool(search_query(criteria))
+
+
+def static_plan(criteria: Dict[str, Any], page_size: int) -> GiftQueryPlan:
+    """Plan for criteria with only one sensible source."""
+    if "constituent_id" in criteria:
+        return listing_plan(criteria, page_size=page_size)
+    return search_plan(criteria, page_size=page_size)
+
+
+def total_items(page: Any) -> Optional[int]:
+    """``total_items`` reported by a page, if any."""
+    if isinstance(page, dict) and "total_items" in page:
+        return int(page["total_items"])
+    return None
+
+
+def is_complete(page: Any) -> bool:
+    """Whether a first page already holds every result."""
+    items = page.get("items", []) if isinstance(page, dict) else page
+    total = total_items(page)
+    return total is not None and len(items) >= total
+
+
+def choose_plan(
+    criteria: Dict[str, Any],
+    listing_page: Dict[str, Any],
+    search_page: Optional[Dict[str, Any]],
+    page_size: int,
+) -> GiftQueryPlan:
+    """Pick the smaller scan from the probed first pages."""
+    listing_total = total_items(listing_page)
+    estimates = {f"constituents/{criteria['constituent_id']}/gifts": listing_total}
+    if search_page is not None:
+        search_total = total_items(search_page)
+        estimates[SEARCH_PATH] = search_total
+        if search_total is not None and (
+            listing_total is None or search_total < listing_total
+        ):
+            return search_plan(
+                criteria, estimates=estimates, first_page=search_page,
+                page_size=page_size,
+            )
+    return listing_plan(
+        criteria, estimates=estimates, first_page=listing_page, page_size=page_size
+    )
@@ -1,27 +1,41 @@
 """Gift Types API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.gift_type import GiftType
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class GiftTypesAPI:
+class _GiftTypesMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "gift_types"
+    
+    def _gift_type_path(self, gift_type_id: int) -> str:
+        return f"{self._resource}/{gift_type_id}"
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[GiftType]:
+        return [GiftType.from_dict(item) for item in data.get("items", [])]
+
+
+class GiftTypesAPI(_GiftTypesMixin):
     """API for managing gift types in Little Green Light.
     
     Gift types categorize donations by their nature,
     such as "Gift", "Pledge", "In Kind", "Soft Credit", etc.
     """
     
-    _resource = "gift_types"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Gift Types API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(self, *, limit: int = 25, offset: int = 0) -> List[GiftType]:
         """List gift types for the account.
@@ -33,8 +47,19 @@ class GiftTypesAPI:
         Returns:
             List of GiftType objects
         """
-        data = self._client._get(self._resource, limit=limit, offset=offset)
-        return [GiftType.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(self._client._get(self._resource, limit=limit, offset=offset))
+    
+    def iter_all(self) -> Iterator[GiftType]:
+        """Iterate over all gift types, one page at a time.
+        
+        Yields:
+            GiftType objects
+        """
+        def _list_page(**kwargs: Any) -> List[GiftType]:
+            return self.list(**kwargs)
+            
+        for item in self._client._paginate(_list_page):
+            yield GiftType.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[GiftType]:
         """Fetch all gift types using automatic pagination.
@@ -42,11 +67,7 @@ class GiftTypesAPI:
         Returns:
             List of all GiftType objects
         """
-        def _list_page(**kwargs: Any) -> List[GiftType]:
-            return self.list(**kwargs)
-            
-        items = list(self._client._paginate(_list_page))
-        return [GiftType.from_dict(item) if isinstance(item, dict) else item for item in items]
+        return self._cached("fetch_all", lambda: list(self.iter_all()))
     
     def retrieve(self, gift_type_id: int) -> GiftType:
         """Retrieve a specific gift type by ID.
@@ -57,7 +78,7 @@ class GiftTypesAPI:
         Returns:
             GiftType object
         """
-        data = self._client._get(f"{self._resource}/{gift_type_id}")
+        data = self._client._get(self._gift_type_path(gift_type_id))
         return GiftType.from_dict(data)
     
     def create(self, gift_type: GiftType) -> GiftType:
@@ -70,6 +91,7 @@ class GiftTypesAPI:
             Created GiftType object
         """
         data = self._client._post(self._resource, gift_type.to_dict())
+        self._invalidate_cache()
         return GiftType.from_dict(data)
     
     def update(self, gift_type_id: int, gift_type: GiftType) -> GiftType:
@@ -82,7 +104,8 @@ class GiftTypesAPI:
         Returns:
             Updated GiftType object
         """
-        data = self._client._patch(f"{self._resource}/{gift_type_id}", gift_type.to_dict())
+        data = self._client._patch(self._gift_type_path(gift_type_id), gift_type.to_dict())
+        self._invalidate_cache()
         return GiftType.from_dict(data)
     
     def delete(self, gift_type_id: int) -> None:
@@ -91,4 +114,54 @@ class GiftTypesAPI:
         Args:
             gift_type_id: Gift Type ID to delete
         """
-        self._client._delete(f"{self._resource}/{gift_type_id}")
\ No newline at end of file
+        self._client._delete(self._gift_type_path(gift_type_id))
+        self._invalidate_cache()
+
+
+class AsyncGiftTypesAPI(_GiftTypesMixin):
+    """Async variant of :class:`GiftTypesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Gift Types API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[GiftType]:
+        """List gift types for the account."""
+        return self._parse_page(await self._client._get(self._resource, limit=limit, offset=offset))
+    
+    async def iter_all(self) -> AsyncIterator[GiftType]:
+        """Iterate over all gift types, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[GiftType]:
+        """Fetch all gift types using automatic pagination."""
+        return await self._acached("fetch_all", lambda: self._collect(self.iter_all()))
+    
+    async def retrieve(self, gift_type_id: int) -> GiftType:
+        """Retrieve a specific gift type by ID."""
+        data = await self._client._get(self._gift_type_path(gift_type_id))
+        return GiftType.from_dict(data)
+    
+    async def create(self, gift_type: GiftType) -> GiftType:
+        """Create a new gift type."""
+        data = await self._client._post(self._resource, gift_type.to_dict())
+        self._invalidate_cache()
+        return GiftType.from_dict(data)
+    
+    async def update(self, gift_type_id: int, gift_type: GiftType) -> GiftType:
+        """Update an existing gift type."""
+        data = await self._client._patch(self._gift_type_path(gift_type_id), gift_type.to_dict())
+        self._invalidate_cache()
+        return GiftType.from_dict(data)
+    
+    async def delete(self, gift_type_id: int) -> None:
+        """Delete a gift type."""
+        await self._client._delete(self._gift_type_path(gift_type_id))
+        self._invalidate_cache()
@@ -1,13 +1,163 @@
 """Gifts API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
 from datetime import date
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.gift import Gift
+from .gift_query import (
+    SEARCH_PATH,
+    GiftFilter,
+    GiftQueryPlan,
+    choose_plan,
+    is_complete,
+    needs_probe,
+    search_plan,
+    static_plan,
+)
+from .search_query import SearchQuery
 
 
-class GiftsAPI:
+class _GiftsMixin:
+    """Query parameters and payloads shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _search_params(
+        constituent_id: Optional[int] = None,
+        amount_from: Optional[float] = None,
+        amount_to: Optional[float] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        gift_type_id: Optional[int] = None,
+        payment_type_id: Optional[int] = None,
+        campaign_id: Optional[int] = None,
+        fund_id: Optional[int] = None,
+        appeal_id: Optional[int] = None,
+        event_id: Optional[int] = None,
+        acknowledged: Optional[bool] = None,
+        external_gift_id: Optional[str] = None,
+        check_number: Optional[str] = None,
+        note: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        query: Optional[SearchQuery] = None
+    ) -> Dict[str, Any]:
+        q = SearchQuery('gifts') if query is None else query.for_resource('gifts')
+        if date_from is not None:
+            q = q.where('date_from', date_from)
+        if date_to is not None:
+            q = q.where('date_to', date_to)
+        if amount_from is not None and amount_to is not None:
+            q = q.where('gift_amount', amount_from, amount_to, op='btw')
+        elif amount_from is not None:
+            q = q.where('gift_amount', amount_from, op='gte')
+        elif amount_to is not None:
+            q = q.where('gift_amount', amount_to, op='lte')
+        if gift_type_id is not None:
+            q = q.where('gift_types', gift_type_id)
+        if payment_type_id is not None:
+            q = q.where('payment_types', payment_type_id)
+        if campaign_id is not None:
+            q = q.where('campaigns', campaign_id)
+        if fund_id is not None:
+            q = q.where('funds', fund_id)
+        if appeal_id is not None:
+            q = q.where('appeals', appeal_id)
+        if event_id is not None:
+            q = q.where('events', event_id)
+        if external_gift_id is not None:
+            q = q.where('external_gift_ids', external_gift_id)
+        
+        params: Dict[str, Any] = q.to_params()
+        
+        if constituent_id is not None:
+            params['constituent_id'] = constituent_id
+        if acknowledged is not None:
+            params['acknowledged'] = acknowledged
+        if check_number is not None:
+            params['check_number'] = check_number
+        if note is not None:
+            params['note'] = note
+        if sort is not None:
+            params['sort'] = sort
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _donation_data(
+        amount: float,
+        gift_date: date,
+        fund_id: Optional[int],
+        campaign_id: Optional[int],
+        appeal_id: Optional[int],
+        note: Optional[str]
+    ) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "amount": amount,
+            "date": gift_date.strftime('%Y-%m-%d'),
+            "gift_type_id": 1  # Assuming 1 is "Gift" type
+        }
+        
+        if fund_id:
+            data["fund_id"] = fund_id
+        if campaign_id:
+            data["campaign_id"] = campaign_id
+        if appeal_id:
+            data["appeal_id"] = appeal_id
+        if note:
+            data["note"] = note
+        
+        return data
+    
+    @staticmethod
+    def _pledge_data(
+        total_amount: float,
+        pledge_date: date,
+        installment_frequency: str,
+        number_installments: int,
+        fund_id: Optional[int],
+        campaign_id: Optional[int]
+    ) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "amount": total_amount,
+            "date": pledge_date.strftime('%Y-%m-%d'),
+            "gift_type_id": 3,  # Assuming 3 is "Pledge" type
+            "installment_frequency": installment_frequency,
+            "number_installments": number_installments
+        }
+        
+        if fund_id:
+            data["fund_id"] = fund_id
+        if campaign_id:
+            data["campaign_id"] = campaign_id
+        
+        return data
+    
+    @staticmethod
+    def _acknowledgement_data(acknowledge_date: Optional[date]) -> Dict[str, Any]:
+        if acknowledge_date is None:
+            acknowledge_date = date.today()
+        
+        return {
+            "acknowledged": True,
+            "acknowledged_date": acknowledge_date.strftime('%Y-%m-%d')
+        }
+
+
+class GiftsAPI(_GiftsMixin):
     """API for managing gifts."""
     
     def __init__(self, client: LGLClient):
@@ -29,12 +179,7 @@ class GiftsAPI:
         Returns:
             Paginated response with gift items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/gifts', **params)
     
     def search(
@@ -56,10 +201,17 @@ class GiftsAPI:
         note: Optional[str] = None,
         sort: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        query: Optional[SearchQuery] = None
     ) -> Dict:
         """Search for gifts with various criteria.
         
+        The criteria are sent as one ``q[]`` expression (see
+        :class:`SearchQuery`). ``constituent_id``, ``acknowledged``,
+        ``check_number`` and ``note`` are not gifts/search terms; they are
+        passed as plain parameters, which the API may ignore. Use
+        :meth:`query` to have them applied reliably.
+        
         Args:
             constituent_id: Filter by constituent ID
             amount_from: Minimum gift amount
@@ -79,76 +231,78 @@ class GiftsAPI:
             sort: Sort field with optional '!' for reverse order
             limit: Number of entries to return
             offset: Start at given entry
+            query: Further gifts search terms, combined with the above
         
         Returns:
             Paginated response with gift items
         """
-        params = {}
+        params = self._search_params(
+            constituent_id, amount_from, amount_to, date_from, date_to,
+            gift_type_id, payment_type_id, campaign_id, fund_id, appeal_id, event_id,
+            acknowledged, external_gift_id, check_number, note, sort, limit, offset, query
+        )
+        return self.client._get('gifts/search', **params)
+    
+    def iter_all(
+        self,
+        constituent_id: int,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None
+    ) -> Iterator[Gift]:
+        """Iterate over all gifts for a constituent, one page at a time.
         
-        if constituent_id is not None:
-            params['constituent_id'] = constituent_id
-        if amount_from is not None:
-            params['amount_from'] = amount_from
-        if amount_to is not None:
-            params['amount_to'] = amount_to
-        if date_from is not None:
-            params['date_from'] = date_from.strftime('%Y-%m-%d')
-        if date_to is not None:
-            params['date_to'] = date_to.strftime('%Y-%m-%d')
-        if gift_type_id is not None:
-            params['gift_type_id'] = gift_type_id
-        if payment_type_id is not None:
-            params['payment_type_id'] = payment_type_id
-        if campaign_id is not None:
-            params['campaign_id'] = campaign_id
-        if fund_id is not None:
-            params['fund_id'] = fund_id
-        if appeal_id is not None:
-            params['appeal_id'] = appeal_id
-        if event_id is not None:
-            params['event_id'] = event_id
-        if acknowledged is not None:
-            params['acknowledged'] = acknowledged
-        if external_gift_id is not None:
-            params['external_gift_id'] = external_gift_id
-        if check_number is not None:
-            params['check_number'] = check_number
-        if note is not None:
-            params['note'] = note
-        if sort is not None:
-            params['sort'] = sort
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
+        Args:
+            constituent_id: The constituent ID
+            concurrency: Pages fetched in parallel (defaults to the client's
+                ``page_concurrency``)
+            trusted: Build gifts without validation (defaults to the client's
+                ``trusted_models``)
         
-        return self.client._get('gifts/search', **params)
+        Yields:
+            Gift objects
+        """
+        trusted = self.client._resolve_trusted(trusted)
+        path = f'constituents/{constituent_id}/gifts'
+        
+        def _list_page(**kwargs: Any) -> Any:
+            return self.client._get_page(path, Gift, trusted=trusted, **kwargs)
+        
+        yield from self.client._paginate(_list_page, concurrency=concurrency)
     
-    def fetch_all(self, constituent_id: int) -> List[Gift]:
+    def fetch_all(
+        self,
+        constituent_id: int,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None
+    ) -> List[Gift]:
         """Fetch all gifts for a constituent with automatic pagination.
         
         Args:
             constituent_id: The constituent ID
+            concurrency: Pages fetched in parallel (defaults to the client's
+                ``page_concurrency``)
+            trusted: Build gifts without validation (defaults to the client's
+                ``trusted_models``)
         
         Returns:
             List of all Gift objects
         """
-        def _list_page(**kwargs):
-            return self.list(constituent_id, **kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [Gift(**item) for item in items]
+        return list(self.iter_all(constituent_id, concurrency=concurrency, trusted=trusted))
     
-    def search_gifts(
+    def iter_search(
         self,
         constituent_id: Optional[int] = None,
         amount_from: Optional[float] = None,
         amount_to: Optional[float] = None,
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
-        **kwargs
-    ) -> List[Gift]:
-        """Search for gifts and return as Gift objects.
+        *,
+        trusted: Optional[bool] = None,
+        **kwargs: Any
+    ) -> Iterator[Gift]:
+        """Iterate over all matching gifts, one page at a time.
         
         Args:
             constituent_id: Filter by constituent ID
@@ -156,12 +310,14 @@ class GiftsAPI:
             amount_to: Maximum gift amount
             date_from: Start date for gifts
             date_to: End date for gifts
+            trusted: Build gifts without validation (defaults to the client's
+                ``trusted_models``)
             **kwargs: Additional search parameters
         
-        Returns:
-            List of Gift objects
+        Yields:
+            Gift objects
         """
-        def _search_page(**search_kwargs):
+        def _search_page(**search_kwargs: Any) -> Dict:
             return self.search(
                 constituent_id=constituent_id,
                 amount_from=amount_from,
@@ -172,8 +328,147 @@ class GiftsAPI:
                 **search_kwargs
             )
         
-        items = list(self.client._paginate(_search_page))
-        return [Gift(**item) for item in items]
+        trusted = self.client._resolve_trusted(trusted)
+        for item in self.client._paginate(_search_page):
+            yield Gift.from_dict(item, trusted=trusted)
+    
+    def search_gifts(
+        self,
+        constituent_id: Optional[int] = None,
+        amount_from: Optional[float] = None,
+        amount_to: Optional[float] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        *,
+        trusted: Optional[bool] = None,
+        **kwargs: Any
+    ) -> List[Gift]:
+        """Search for gifts and return as Gift objects.
+        
+        Args:
+            constituent_id: Filter by constituent ID
+            amount_from: Minimum gift amount
+            amount_to: Maximum gift amount
+            date_from: Start date for gifts
+            date_to: End date for gifts
+            trusted: Build gifts without validation (defaults to the client's
+                ``trusted_models``)
+            **kwargs: Additional search parameters
+        
+        Returns:
+            List of Gift objects
+        """
+        return list(self.iter_search(
+            constituent_id, amount_from, amount_to, date_from, date_to,
+            trusted=trusted, **kwargs
+        ))
+    
+    def plan_query(self, criteria: GiftFilter, *, page_size: int = 100) -> GiftQueryPlan:
+        """Decide how a gift query runs: which endpoint, and what is filtered where.
+        
+        For a single donor with criteria the search can apply, this fetches
+        the first page of the donor's gift list and, if that list is longer,
+        of the search, then keeps the smaller scan. The probed page is reused
+        when the plan runs.
+        
+        Args:
+            criteria: Gifts to return
+            page_size: Gifts requested per page
+        
+        Returns:
+            Plan to pass to :meth:`iter_plan`; see ``plan.explain()``
+        """
+        active = criteria.active()
+        if not needs_probe(active):
+            return static_plan(active, page_size)
+        listing_page = self.list(active['constituent_id'], limit=page_size, offset=0)
+        search_page = None
+        if not is_complete(listing_page):
+            search_page = self.client._get(
+                SEARCH_PATH, **search_plan(active).params, limit=page_size, offset=0
+            )
+        return choose_plan(active, listing_page, search_page, page_size)
+    
+    def _plan_page(self, plan: GiftQueryPlan) -> Callable[..., Dict[str, Any]]:
+        """Page function for a plan, serving the probed first page from memory."""
+        def _page(limit: int, offset: int, **kwargs: Any) -> Dict[str, Any]:
+            if offset == 0 and plan.first_page is not None and limit == plan.page_size:
+                return plan.first_page
+            return self.client._get(plan.path, **plan.params, limit=limit, offset=offset, **kwargs)
+        
+        return _page
+    
+    def iter_plan(
+        self,
+        plan: GiftQueryPlan,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None
+    ) -> Iterator[Gift]:
+        """Run a query plan, yielding the gifts that pass its local filters.
+        
+        Args:
+            plan: Plan from :meth:`plan_query`
+            concurrency: Pages fetched in parallel (defaults to the client's
+                ``page_concurrency``)
+            trusted: Build gifts without validation (defaults to the client's
+                ``trusted_models``)
+        
+        Yields:
+            Matching Gift objects
+        """
+        trusted = self.client._resolve_trusted(trusted)
+        pages = self.client._paginate(
+            self._plan_page(plan), limit=plan.page_size, concurrency=concurrency
+        )
+        for item in pages:
+            gift = Gift.from_dict(item, trusted=trusted)
+            if plan.matches(gift):
+                yield gift
+    
+    def iter_query(
+        self,
+        criteria: GiftFilter,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None
+    ) -> Iterator[Gift]:
+        """Iterate over gifts matching ``criteria``, filtering server-side where possible.
+        
+        Args:
+            criteria: Gifts to return
+            concurrency: Pages fetched in parallel (defaults to the client's
+                ``page_concurrency``)
+            trusted: Build gifts without validation (defaults to the client's
+                ``trusted_models``)
+        
+        Yields:
+            Matching Gift objects
+        """
+        yield from self.iter_plan(
+            self.plan_query(criteria), concurrency=concurrency, trusted=trusted
+        )
+    
+    def query(
+        self,
+        criteria: GiftFilter,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None
+    ) -> List[Gift]:
+        """Fetch gifts matching ``criteria``, filtering server-side where possible.
+        
+        Args:
+            criteria: Gifts to return
+            concurrency: Pages fetched in parallel (defaults to the client's
+                ``page_concurrency``)
+            trusted: Build gifts without validation (defaults to the client's
+                ``trusted_models``)
+        
+        Returns:
+            List of matching Gift objects
+        """
+        return list(self.iter_query(criteria, concurrency=concurrency, trusted=trusted))
     
     def retrieve(self, gift_id: int) -> Gift:
         """Retrieve a specific gift by ID.
@@ -267,21 +562,7 @@ class GiftsAPI:
         Returns:
             Created Gift object
         """
-        data = {
-            "amount": amount,
-            "date": gift_date.strftime('%Y-%m-%d'),
-            "gift_type_id": 1  # Assuming 1 is "Gift" type
-        }
-        
-        if fund_id:
-            data["fund_id"] = fund_id
-        if campaign_id:
-            data["campaign_id"] = campaign_id
-        if appeal_id:
-            data["appeal_id"] = appeal_id
-        if note:
-            data["note"] = note
-        
+        data = self._donation_data(amount, gift_date, fund_id, campaign_id, appeal_id, note)
         return self.create(constituent_id, data)
     
     def create_pledge(
@@ -308,19 +589,9 @@ class GiftsAPI:
         Returns:
             Created Gift object
         """
-        data = {
-            "amount": total_amount,
-            "date": pledge_date.strftime('%Y-%m-%d'),
-            "gift_type_id": 3,  # Assuming 3 is "Pledge" type
-            "installment_frequency": installment_frequency,
-            "number_installments": number_installments
-        }
-        
-        if fund_id:
-            data["fund_id"] = fund_id
-        if campaign_id:
-            data["campaign_id"] = campaign_id
-        
+        data = self._pledge_data(
+            total_amount, pledge_date, installment_frequency, number_installments, fund_id, campaign_id
+        )
         return self.create(constituent_id, data)
     
     def acknowledge_gift(self, gift_id: int, acknowledge_date: Optional[date] = None) -> Gift:
@@ -333,13 +604,7 @@ class GiftsAPI:
         Returns:
             Updated Gift object
         """
-        if acknowledge_date is None:
-            acknowledge_date = date.today()
-        
-        return self.update(gift_id, {
-            "acknowledged": True,
-            "acknowledged_date": acknowledge_date.strftime('%Y-%m-%d')
-        })
+        return self.update(gift_id, self._acknowledgement_data(acknowledge_date))
     
     def add_note(self, gift_id: int, note: str) -> Gift:
         """Add or update a note on a gift.
@@ -374,8 +639,7 @@ class GiftsAPI:
         Returns:
             List of unacknowledged Gift objects
         """
-        all_gifts = self.fetch_all(constituent_id)
-        return [gift for gift in all_gifts if not gift.acknowledged]
+        return self.query(GiftFilter(constituent_id=constituent_id, acknowledged=False))
     
     def get_gifts_by_campaign(self, constituent_id: int, campaign_id: int) -> List[Gift]:
         """Get all gifts for a constituent associated with a specific campaign.
@@ -387,8 +651,9 @@ class GiftsAPI:
         Returns:
             List of Gift objects for the campaign
         """
-        all_gifts = self.fetch_all(constituent_id)
-        return [gift for gift in all_gifts if gift.campaign_id == campaign_id]
+        return self.query(
+            GiftFilter(constituent_id=constituent_id, campaign_ids=[campaign_id])
+        )
     
     def get_gifts_by_date_range(
         self, 
@@ -406,6 +671,282 @@ class GiftsAPI:
         Returns:
             List of Gift objects within the date range
         """
-        all_gifts = self.fetch_all(constituent_id)
-        return [gift for gift in all_gifts 
-                if start_date <= gift.date <= end_date]
\ No newline at end of file
+        return self.query(GiftFilter(
+            constituent_id=constituent_id, date_from=start_date, date_to=end_date
+        ))
+
+
+class AsyncGiftsAPI(_GiftsMixin):
+    """Async variant of :class:`GiftsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all gifts for a constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/gifts', **params)
+    
+    async def search(
+        self,
+        constituent_id: Optional[int] = None,
+        amount_from: Optional[float] = None,
+        amount_to: Optional[float] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        gift_type_id: Optional[int] = None,
+        payment_type_id: Optional[int] = None,
+        campaign_id: Optional[int] = None,
+        fund_id: Optional[int] = None,
+        appeal_id: Optional[int] = None,
+        event_id: Optional[int] = None,
+        acknowledged: Optional[bool] = None,
+        external_gift_id: Optional[str] = None,
+        check_number: Optional[str] = None,
+        note: Optional[str] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        query: Optional[SearchQuery] = None
+    ) -> Dict:
+        """Search for gifts with various criteria."""
+        params = self._search_params(
+            constituent_id, amount_from, amount_to, date_from, date_to,
+            gift_type_id, payment_type_id, campaign_id, fund_id, appeal_id, event_id,
+            acknowledged, external_gift_id, check_number, note, sort, limit, offset, query
+        )
+        return await self.client._get('gifts/search', **params)
+    
+    async def iter_all(
+        self,
+        constituent_id: int,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None
+    ) -> AsyncIterator[Gift]:
+        """Iterate over all gifts for a constituent, page by page."""
+        trusted = self.client._resolve_trusted(trusted)
+        path = f'constituents/{constituent_id}/gifts'
+        
+        async def _list_page(**kwargs: Any) -> Any:
+            return await self.client._get_page(path, Gift, trusted=trusted, **kwargs)
+        
+        async for gift in self.client._paginate(_list_page, concurrency=concurrency):
+            yield gift
+    
+    async def fetch_all(
+        self,
+        constituent_id: int,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None
+    ) -> List[Gift]:
+        """Fetch all gifts for a constituent with automatic pagination."""
+        return [
+            item async for item in self.iter_all(
+                constituent_id, concurrency=concurrency, trusted=trusted
+            )
+        ]
+    
+    async def iter_search(
+        self,
+        constituent_id: Optional[int] = None,
+        amount_from: Optional[float] = None,
+        amount_to: Optional[float] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        *,
+        trusted: Optional[bool] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[Gift]:
+        """Iterate over all matching gifts, page by page."""
+        async def _search_page(**search_kwargs: Any) -> Dict:
+            return await self.search(
+                constituent_id=constituent_id,
+                amount_from=amount_from,
+                amount_to=amount_to,
+                date_from=date_from,
+                date_to=date_to,
+                **kwargs,
+                **search_kwargs
+            )
+        
+        trusted = self.client._resolve_trusted(trusted)
+        async for item in self.client._paginate(_search_page):
+            yield Gift.from_dict(item, trusted=trusted)
+    
+    async def search_gifts(
+        self,
+        constituent_id: Optional[int] = None,
+        amount_from: Optional[float] = None,
+        amount_to: Optional[float] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        *,
+        trusted: Optional[bool] = None,
+        **kwargs: Any
+    ) -> List[Gift]:
+        """Search for gifts and return as Gift objects."""
+        return [
+            item async for item in self.iter_search(
+                constituent_id, amount_from, amount_to, date_from, date_to,
+                trusted=trusted, **kwargs
+            )
+        ]
+    
+    async def plan_query(
+        self, criteria: GiftFilter, *, page_size: int = 100
+    ) -> GiftQueryPlan:
+        """Decide how a gift query runs (see :meth:`GiftsAPI.plan_query`)."""
+        active = criteria.active()
+        if not needs_probe(active):
+            return static_plan(active, page_size)
+        listing_page = await self.list(active['constituent_id'], limit=page_size, offset=0)
+        search_page = None
+        if not is_complete(listing_page):
+            search_page = await self.client._get(
+                SEARCH_PATH, **search_plan(active).params, limit=page_size, offset=0
+            )
+        return choose_plan(active, listing_page, search_page, page_size)
+    
+    def _plan_page(self, plan: GiftQueryPlan) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        """Page function for a plan, serving the probed first page from memory."""
+        async def _page(limit: int, offset: int, **kwargs: Any) -> Dict[str, Any]:
+            if offset == 0 and plan.first_page is not None and limit == plan.page_size:
+                return plan.first_page
+            return await self.client._get(
+                plan.path, **plan.params, limit=limit, offset=offset, **kwargs
+            )
+        
+        return _page
+    
+    async def iter_plan(
+        self,
+        plan: GiftQueryPlan,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None
+    ) -> AsyncIterator[Gift]:
+        """Run a query plan, yielding the gifts that pass its local filters."""
+        trusted = self.client._resolve_trusted(trusted)
+        pages = self.client._paginate(
+            self._plan_page(plan), limit=plan.page_size, concurrency=concurrency
+        )
+        async for item in pages:
+            gift = Gift.from_dict(item, trusted=trusted)
+            if plan.matches(gift):
+                yield gift
+    
+    async def iter_query(
+        self,
+        criteria: GiftFilter,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None
+    ) -> AsyncIterator[Gift]:
+        """Iterate over gifts matching ``criteria``, filtering server-side where possible."""
+        plan = await self.plan_query(criteria)
+        async for gift in self.iter_plan(plan, concurrency=concurrency, trusted=trusted):
+            yield gift
+    
+    async def query(
+        self,
+        criteria: GiftFilter,
+        *,
+        concurrency: Optional[int] = None,
+        trusted: Optional[bool] = None
+    ) -> List[Gift]:
+        """Fetch gifts matching ``criteria``, filtering server-side where possible."""
+        return [
+            gift async for gift in self.iter_query(
+                criteria, concurrency=concurrency, trusted=trusted
+            )
+        ]
+    
+    async def retrieve(self, gift_id: int) -> Gift:
+        """Retrieve a specific gift by ID."""
+        response = await self.client._get(f'gifts/{gift_id}')
+        return Gift(**response)
+    
+    async def create(self, constituent_id: int, gift_data: Dict) -> Gift:
+        """Create a new gift for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/gifts', gift_data)
+        return Gift(**response)
+    
+    async def update(self, gift_id: int, gift_data: Dict) -> Gift:
+        """Update an existing gift."""
+        response = await self.client._patch(f'gifts/{gift_id}', gift_data)
+        return Gift(**response)
+    
+    async def delete(self, gift_id: int) -> Dict:
+        """Delete a gift."""
+        await self.client._delete(f'gifts/{gift_id}')
+        return {"result": "success"}
+    
+    async def create_donation(
+        self,
+        constituent_id: int,
+        amount: float,
+        gift_date: date,
+        fund_id: Optional[int] = None,
+        campaign_id: Optional[int] = None,
+        appeal_id: Optional[int] = None,
+        note: Optional[str] = None
+    ) -> Gift:
+        """Create a simple donation gift."""
+        data = self._donation_data(amount, gift_date, fund_id, campaign_id, appeal_id, note)
+        return await self.create(constituent_id, data)
+    
+    async def create_pledge(
+        self,
+        constituent_id: int,
+        total_amount: float,
+        pledge_date: date,
+        installment_frequency: str,
+        number_installments: int,
+        fund_id: Optional[int] = None,
+        campaign_id: Optional[int] = None
+    ) -> Gift:
+        """Create a pledge gift."""
+        data = self._pledge_data(
+            total_amount, pledge_date, installment_frequency, number_installments, fund_id, campaign_id
+        )
+        return await self.create(constituent_id, data)
+    
+    async def acknowledge_gift(self, gift_id: int, acknowledge_date: Optional[date] = None) -> Gift:
+        """Mark a gift as acknowledged."""
+        return await self.update(gift_id, self._acknowledgement_data(acknowledge_date))
+    
+    async def add_note(self, gift_id: int, note: str) -> Gift:
+        """Add or update a note on a gift."""
+        return await self.update(gift_id, {"note": note})
+    
+    async def set_deductible_amount(self, gift_id: int, deductible_amount: float) -> Gift:
+        """Set the tax-deductible amount for a gift."""
+        return await self.update(gift_id, {"deductible_amount": deductible_amount})
+    
+    async def get_unacknowledged_gifts(self, constituent_id: int) -> List[Gift]:
+        """Get all unacknowledged gifts for a constituent."""
+        return await self.query(GiftFilter(constituent_id=constituent_id, acknowledged=False))
+    
+    async def get_gifts_by_campaign(self, constituent_id: int, campaign_id: int) -> List[Gift]:
+        """Get all gifts for a constituent associated with a specific campaign."""
+        return await self.query(
+            GiftFilter(constituent_id=constituent_id, campaign_ids=[campaign_id])
+        )
+    
+    async def get_gifts_by_date_range(
+        self, 
+        constituent_id: int, 
+        start_date: date, 
+        end_date: date
+    ) -> List[Gift]:
+        """Get all gifts for a constituent within a date range."""
+        return await self.query(GiftFilter(
+            constituent_id=constituent_id, date_from=start_date, date_to=end_date
+        ))
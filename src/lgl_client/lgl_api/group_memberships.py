@@ -1,13 +1,56 @@
 """Group Memberships API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 from datetime import date
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.constituent import GroupMembership
 
 
-class GroupMembershipsAPI:
+class _GroupMembershipsMixin:
+    """Query parameters and payloads shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _membership_data(
+        group_id: int, start_date: Optional[date], end_date: Optional[date], is_current: bool
+    ) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "group_id": group_id,
+            "is_current": is_current
+        }
+        
+        if start_date:
+            data["date_start"] = start_date.strftime('%Y-%m-%d')
+        if end_date:
+            data["date_end"] = end_date.strftime('%Y-%m-%d')
+        
+        return data
+    
+    @staticmethod
+    def _reactivation_data(start_date: Optional[date]) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "is_current": True,
+            "date_end": None  # Remove end date
+        }
+        
+        if start_date:
+            data["date_start"] = start_date.strftime('%Y-%m-%d')
+        else:
+            data["date_start"] = date.today().strftime('%Y-%m-%d')
+        
+        return data
+
+
+class GroupMembershipsAPI(_GroupMembershipsMixin):
     """API for managing constituent group memberships."""
     
     def __init__(self, client: LGLClient):
@@ -29,14 +72,24 @@ class GroupMembershipsAPI:
         Returns:
             Paginated response with group membership items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/group_memberships', **params)
     
+    def iter_all(self, constituent_id: int) -> Iterator[GroupMembership]:
+        """Iterate over all group memberships for a constituent, one page at a time.
+        
+        Args:
+            constituent_id: The constituent ID
+        
+        Yields:
+            GroupMembership objects
+        """
+        def _list_page(**kwargs):
+            return self.list(constituent_id, **kwargs)
+        
+        for item in self.client._paginate(_list_page):
+            yield GroupMembership(**item)
+    
     def fetch_all(self, constituent_id: int) -> List[GroupMembership]:
         """Fetch all group memberships for a constituent with automatic pagination.
         
@@ -46,11 +99,7 @@ class GroupMembershipsAPI:
         Returns:
             List of all GroupMembership objects
         """
-        def _list_page(**kwargs):
-            return self.list(constituent_id, **kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [GroupMembership(**item) for item in items]
+        return list(self.iter_all(constituent_id))
     
     def retrieve(self, group_membership_id: int) -> GroupMembership:
         """Retrieve a specific group membership by ID.
@@ -135,16 +184,7 @@ class GroupMembershipsAPI:
         Returns:
             Created GroupMembership object
         """
-        data = {
-            "group_id": group_id,
-            "is_current": is_current
-        }
-        
-        if start_date:
-            data["date_start"] = start_date.strftime('%Y-%m-%d')
-        if end_date:
-            data["date_end"] = end_date.strftime('%Y-%m-%d')
-        
+        data = self._membership_data(group_id, start_date, end_date, is_current)
         return self.create(constituent_id, data)
     
     def create_active_membership(self, constituent_id: int, group_id: int, start_date: date) -> GroupMembership:
@@ -190,19 +230,7 @@ class GroupMembershipsAPI:
         Returns:
             Updated GroupMembership object
         """
-        from datetime import date
-        
-        data = {
-            "is_current": True,
-            "date_end": None  # Remove end date
-        }
-        
-        if start_date:
-            data["date_start"] = start_date.strftime('%Y-%m-%d')
-        else:
-            data["date_start"] = date.today().strftime('%Y-%m-%d')
-        
-        return self.update(group_membership_id, data)
+        return self.update(group_membership_id, self._reactivation_data(start_date))
     
     def get_active_memberships(self, constituent_id: int) -> List[GroupMembership]:
         """Get all active group memberships for a constituent.
@@ -239,4 +267,99 @@ class GroupMembershipsAPI:
         Returns:
             Updated GroupMembership object
         """
-        return self.update(group_membership_id, {"group_id": new_group_id})
\ No newline at end of file
+        return self.update(group_membership_id, {"group_id": new_group_id})
+
+
+class AsyncGroupMembershipsAPI(_GroupMembershipsMixin):
+    """Async variant of :class:`GroupMembershipsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all group memberships for a constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/group_memberships', **params)
+    
+    async def iter_all(self, constituent_id: int) -> AsyncIterator[GroupMembership]:
+        """Iterate over all group memberships for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list(constituent_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield GroupMembership(**item)
+    
+    async def fetch_all(self, constituent_id: int) -> List[GroupMembership]:
+        """Fetch all group memberships for a constituent with automatic pagination."""
+        return [item async for item in self.iter_all(constituent_id)]
+    
+    async def retrieve(self, group_membership_id: int) -> GroupMembership:
+        """Retrieve a specific group membership by ID."""
+        response = await self.client._get(f'group_memberships/{group_membership_id}')
+        return GroupMembership(**response)
+    
+    async def create(self, constituent_id: int, group_membership_data: Dict) -> GroupMembership:
+        """Create a new group membership for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/group_memberships', group_membership_data)
+        return GroupMembership(**response)
+    
+    async def update(self, group_membership_id: int, group_membership_data: Dict) -> GroupMembership:
+        """Update an existing group membership."""
+        response = await self.client._patch(f'group_memberships/{group_membership_id}', group_membership_data)
+        return GroupMembership(**response)
+    
+    async def delete(self, group_membership_id: int) -> Dict:
+        """Delete a group membership."""
+        await self.client._delete(f'group_memberships/{group_membership_id}')
+        return {"result": "success"}
+    
+    async def create_group_membership(
+        self,
+        constituent_id: int,
+        group_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        is_current: bool = True
+    ) -> GroupMembership:
+        """Create a group membership with common parameters."""
+        data = self._membership_data(group_id, start_date, end_date, is_current)
+        return await self.create(constituent_id, data)
+    
+    async def create_active_membership(self, constituent_id: int, group_id: int, start_date: date) -> GroupMembership:
+        """Create an active group membership starting on a specific date."""
+        return await self.create_group_membership(
+            constituent_id=constituent_id,
+            group_id=group_id,
+            start_date=start_date,
+            is_current=True
+        )
+    
+    async def end_membership(self, group_membership_id: int, end_date: date) -> GroupMembership:
+        """End a group membership on a specific date."""
+        return await self.update(group_membership_id, {
+            "date_end": end_date.strftime('%Y-%m-%d'),
+            "is_current": False
+        })
+    
+    async def reactivate_membership(self, group_membership_id: int, start_date: Optional[date] = None) -> GroupMembership:
+        """Reactivate a group membership."""
+        return await self.update(group_membership_id, self._reactivation_data(start_date))
+    
+    async def get_active_memberships(self, constituent_id: int) -> List[GroupMembership]:
+        """Get all active group memberships for a constituent."""
+        all_memberships = await self.fetch_all(constituent_id)
+        return [membership for membership in all_memberships if membership.is_current]
+    
+    async def get_memberships_by_group(self, constituent_id: int, group_id: int) -> List[GroupMembership]:
+        """Get memberships for a constituent in a specific group."""
+        all_memberships = await self.fetch_all(constituent_id)
+        return [membership for membership in all_memberships if membership.group_id == group_id]
+    
+    async def change_group(self, group_membership_id: int, new_group_id: int) -> GroupMembership:
+        """Change the group for an existing membership."""
+        return await self.update(group_membership_id, {"group_id": new_group_id})
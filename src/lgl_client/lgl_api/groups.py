@@ -1,27 +1,41 @@
 """Groups API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.group import Group
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class GroupsAPI:
+class _GroupsMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "groups"
+    
+    def _group_path(self, group_id: int) -> str:
+        return f"{self._resource}/{group_id}"
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[Group]:
+        return [Group.from_dict(item) for item in data.get("items", [])]
+
+
+class GroupsAPI(_GroupsMixin):
     """API for managing groups in Little Green Light.
     
     Groups represent organizational categories for constituents,
     such as "Board Member", "Staff", "Volunteer", etc.
     """
     
-    _resource = "groups"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Groups API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(self, *, limit: int = 25, offset: int = 0) -> List[Group]:
         """List groups for the account.
@@ -33,8 +47,19 @@ class GroupsAPI:
         Returns:
             List of Group objects
         """
-        data = self._client._get(self._resource, limit=limit, offset=offset)
-        return [Group.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(self._client._get(self._resource, limit=limit, offset=offset))
+    
+    def iter_all(self) -> Iterator[Group]:
+        """Iterate over all groups, one page at a time.
+        
+        Yields:
+            Group objects
+        """
+        def _list_page(**kwargs: Any) -> List[Group]:
+            return self.list(**kwargs)
+            
+        for item in self._client._paginate(_list_page):
+            yield Group.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[Group]:
         """Fetch all groups using automatic pagination.
@@ -42,11 +67,7 @@ class GroupsAPI:
         Returns:
             List of all Group objects
         """
-        def _list_page(**kwargs: Any) -> List[Group]:
-            return self.list(**kwargs)
-            
-        items = list(self._client._paginate(_list_page))
-        return [Group.from_dict(item) if isinstance(item, dict) else item for item in items]
+        return self._cached("fetch_all", lambda: list(self.iter_all()))
     
     def retrieve(self, group_id: int) -> Group:
         """Retrieve a specific group by ID.
@@ -57,7 +78,7 @@ class GroupsAPI:
         Returns:
             Group object
         """
-        data = self._client._get(f"{self._resource}/{group_id}")
+        data = self._client._get(self._group_path(group_id))
         return Group.from_dict(data)
     
     def create(self, group: Group) -> Group:
@@ -70,6 +91,7 @@ class GroupsAPI:
             Created Group object
         """
         data = self._client._post(self._resource, group.to_dict())
+        self._invalidate_cache()
         return Group.from_dict(data)
     
     def update(self, group_id: int, group: Group) -> Group:
@@ -82,7 +104,8 @@ class GroupsAPI:
         Returns:
             Updated Group object
         """
-        data = self._client._patch(f"{self._resource}/{group_id}", group.to_dict())
+        data = self._client._patch(self._group_path(group_id), group.to_dict())
+        self._invalidate_cache()
         return Group.from_dict(data)
     
     def delete(self, group_id: int) -> None:
@@ -91,4 +114,54 @@ class GroupsAPI:
         Args:
             group_id: Group ID to delete
         """
-        self._client._delete(f"{self._resource}/{group_id}")
\ No newline at end of file
+        self._client._delete(self._group_path(group_id))
+        self._invalidate_cache()
+
+
+class AsyncGroupsAPI(_GroupsMixin):
+    """Async variant of :class:`GroupsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Groups API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[Group]:
+        """List groups for the account."""
+        return self._parse_page(await self._client._get(self._resource, limit=limit, offset=offset))
+    
+    async def iter_all(self) -> AsyncIterator[Group]:
+        """Iterate over all groups, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[Group]:
+        """Fetch all groups using automatic pagination."""
+        return await self._acached("fetch_all", lambda: self._collect(self.iter_all()))
+    
+    async def retrieve(self, group_id: int) -> Group:
+        """Retrieve a specific group by ID."""
+        data = await self._client._get(self._group_path(group_id))
+        return Group.from_dict(data)
+    
+    async def create(self, group: Group) -> Group:
+        """Create a new group."""
+        data = await self._client._post(self._resource, group.to_dict())
+        self._invalidate_cache()
+        return Group.from_dict(data)
+    
+    async def update(self, group_id: int, group: Group) -> Group:
+        """Update an existing group."""
+        data = await self._client._patch(self._group_path(group_id), group.to_dict())
+        self._invalidate_cache()
+        return Group.from_dict(data)
+    
+    async def delete(self, group_id: int) -> None:
+        """Delete a group."""
+        await self._client._delete(self._group_path(group_id))
+        self._invalidate_cache()
@@ -0,0 +1,203 @@
+"""HTTP response cache for GET requests.
+
+Pass a :class:`ResponseCache` to ``new_client`` to keep GET responses.
+Responses carrying an ``ETag`` or ``Last-Modified`` validator are
+revalidated on every later read with ``If-None-Match`` /
+``If-Modified-Since``; an unchanged record then costs a ``304 Not
+Modified`` without a body. Responses without validators are served from
+the cache for ``ttl`` seconds::
+
+    cache = ResponseCache(ttl=30, bypass=("gifts/search",))
+    client = new_client(api_key, response_cache=cache)
+    client.constituents.retrieve(42)   # 200, stored with its ETag
+    client.constituents.retrieve(42)   # 304, body served from the cache
+    cache.stats()
+
+Bodies are stored as received and decoded again on every hit, so callers
+never share mutable results. A successful POST, PATCH or DELETE drops the
+cached responses of every path with the same shape (``constituents/{id}``
+for ``constituents/42``).
+"""
+
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
+
+from .cache import CacheBackend, MemoryBackend
+
+_MAX_AGE = re.compile(r'(?:^|,)\s*max-age\s*=\s*"?(\d+)', re.IGNORECASE)
+_NO_STORE = re.compile(r'(?:^|,)\s*no-store\b', re.IGNORECASE)
+
+
+@dataclass
+class _PathStats:
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    invalidations: int = 0
+
+
+@dataclass(frozen=True)
+class CacheLookup:
+    """Cached state of one GET, found before sending it.
+
+    Attributes:
+        template: Path template the entry is grouped under
+        key: Path and sorted query string
+        entry: Stored response, if any
+        fresh: Whether the entry may be used without asking the server
+    """
+
+    template: str
+    key: str
+    entry: Optional[Dict[str, Any]]
+    fresh: bool
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Conditional request headers for a stored entry with validators."""
+        if self.entry is None:
+            return {}
+        headers = {}
+        if self.entry.get("etag"):
+            headers["If-None-Match"] = self.entry["etag"]
+        if self.entry.get("last_modified"):
+            headers["If-Modified-Since"] = self.entry["last_modified"]
+        return headers
+
+
+@dataclass
+class ResponseCache:
+    """Cache of GET response bodies with validator-based revalidation.
+
+    Attributes:
+        ttl: Seconds a response without ``ETag``/``Last-Modified`` is
+            served without contacting the server; 0 stores only
+            responses with validators
+        max_age: Seconds a response with validators is kept for
+            revalidation
+        backend: Storage (default: in-memory LRU of 1024 responses; use
+            :class:`DiskBackend` to share responses between processes)
+        bypass: Paths or path templates never cached, e.g.
+            ``("gifts/search", "constituents/{id}/notes")``; a path also
+            bypasses everything below it
+    """
+
+    ttl: float = 30.0
+    max_age: float = 86400.0
+    backend: CacheBackend = field(default_factory=lambda: MemoryBackend(max_entries=1024))
+    bypass: Tuple[str, ...] = ()
+    _stats: Dict[str, _PathStats] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @staticmethod
+    def _group(template: str) -> str:
+        # Backends group entries by name; keep it a single path segment on disk
+        return template.replace("/", ".")
+
+    def _record(self, template: str, outcome: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(template, _PathStats())
+            setattr(stats, outcome, getattr(stats, outcome) + 1)
+
+    def bypasses(self, path: str, template: str) -> bool:
+        """Whether a path is excluded from caching."""
+        path = path.strip("/")
+        for prefix in self.bypass:
+            prefix = prefix.strip("/")
+            for candidate in (path, template):
+                if candidate == prefix or candidate.startswith(prefix + "/"):
+                    self._record(template, "bypassed")
+                    return True
+        return False
+
+    def lookup(self, path: str, template: str, params: Dict[str, Any]) -> CacheLookup:
+        """Find the stored response for a GET about to be sent."""
+        query = urlencode(sorted(params.items()), doseq=True)
+        key = f"{path.strip('/')}?{query}" if query else path.strip("/")
+        stored = self.backend.get(self._group(template), key)
+        now = time.time()
+        if stored is None or stored[0] <= now:
+            self._record(template, "misses")
+            return CacheLookup(template, key, None, False)
+        entry = stored[1]
+        fresh = entry["fresh_until"] > now
+        if fresh:
+            self._record(template, "hits")
+        return CacheLookup(template, key, entry, fresh)
+
+    def store(self, lookup: CacheLookup, response: httpx.Response) -> None:
+        """Keep a successful response, unless the server forbids it."""
+        if lookup.entry is not None:
+            # The stored copy was stale or has changed on the server
+            self._record(lookup.template, "misses")
+        cache_control = response.headers.get("Cache-Control", "")
+        if _NO_STORE.search(cache_control):
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        now = time.time()
+        max_age = _MAX_AGE.search(cache_control)
+        if max_age is not None:
+            fresh_until = now + int(max_age.group(1))
+        elif etag or last_modified:
+            fresh_until = now
+        elif self.ttl > 0:
+            fresh_until = now + self.ttl
+        else:
+            return
+        entry = {
+            "body": response.text,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh_until": fresh_until,
+        }
+        keep_until = now + self.max_age if etag or last_modified else fresh_until
+        self.backend.set(
+            self._group(lookup.template), lookup.key, entry, max(keep_until, fresh_until)
+        )
+
+    def revalidated(self, lookup: CacheLookup, response: httpx.Response) -> Dict[str, Any]:
+        """Record a ``304 Not Modified`` and return the still valid entry."""
+        self._record(lookup.template, "revalidated")
+        entry = dict(lookup.entry or {})
+        # A 304 may carry updated validators or freshness
+        for header, name in (("ETag", "etag"), ("Last-Modified", "last_modified")):
+            if response.headers.get(header):
+                entry[name] = response.headers[header]
+        max_age = _MAX_AGE.search(response.headers.get("Cache-Control", ""))
+        if max_age is not None:
+            entry["fresh_until"] = time.time() + int(max_age.group(1))
+        self.backend.set(
+            self._group(lookup.template), lookup.key, entry,
+            max(time.time() + self.max_age, entry["fresh_until"]),
+        )
+        return entry
+
+    def invalidate(self, template: Optional[str] = None) -> None:
+        """Drop the responses of one path template, or all of them."""
+        if template is None:
+            self.backend.clear()
+            return
+        self.backend.invalidate(self._group(template))
+        self._record(template, "invalidations")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hits, revalidations, misses, bypasses and invalidations per path template."""
+        with self._lock:
+            return {
+                template: {
+                    "hits": stats.hits,
+                    "revalidated": stats.revalidated,
+                    "misses": stats.misses,
+                    "bypassed": stats.bypassed,
+                    "invalidations": stats.invalidations,
+                }
+                for template, stats in self._stats.items()
+            }
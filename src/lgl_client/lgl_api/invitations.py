@@ -1,12 +1,20 @@
 """Invitations API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List
 
 from ..models.invitation import Invitation
-from .client import LGLClient
+from .client import AsyncLGLClient, LGLClient
 
 
-class InvitationsAPI:
+class _InvitationsMixin:
+    """Model parsing shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[Invitation]:
+        return [Invitation.from_dict(item) for item in data.get("items", [])]
+
+
+class InvitationsAPI(_InvitationsMixin):
     """API for managing invitations in Little Green Light.
     
     Invitations represent event invitations sent to constituents
@@ -43,7 +51,22 @@ class InvitationsAPI:
             limit=limit,
             offset=offset
         )
-        return [Invitation.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(data)
+    
+    def iter_all_for_constituent(self, constituent_id: int) -> Iterator[Invitation]:
+        """Iterate over all invitations for a constituent, one page at a time.
+        
+        Args:
+            constituent_id: Constituent ID
+            
+        Yields:
+            Invitation objects for the constituent
+        """
+        def _list_page(**kwargs: Any) -> List[Invitation]:
+            return self.list_for_constituent(constituent_id, **kwargs)
+        
+        for item in self._client._paginate(_list_page):
+            yield Invitation.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all_for_constituent(self, constituent_id: int) -> List[Invitation]:
         """Fetch all invitations for a constituent using automatic pagination.
@@ -54,11 +77,7 @@ class InvitationsAPI:
         Returns:
             List of all Invitation objects for the constituent
         """
-        def _list_page(**kwargs: Any) -> List[Invitation]:
-            return self.list_for_constituent(constituent_id, **kwargs)
-        
-        items = list(self._client._paginate(_list_page))
-        return [Invitation.from_dict(item) if isinstance(item, dict) else item for item in items]
+        return list(self.iter_all_for_constituent(constituent_id))
     
     def list_for_event(
         self, 
@@ -82,7 +101,22 @@ class InvitationsAPI:
             limit=limit,
             offset=offset
         )
-        return [Invitation.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(data)
+    
+    def iter_all_for_event(self, event_id: int) -> Iterator[Invitation]:
+        """Iterate over all invitations for an event, one page at a time.
+        
+        Args:
+            event_id: Event ID
+            
+        Yields:
+            Invitation objects for the event
+        """
+        def _list_page(**kwargs: Any) -> List[Invitation]:
+            return self.list_for_event(event_id, **kwargs)
+        
+        for item in self._client._paginate(_list_page):
+            yield Invitation.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all_for_event(self, event_id: int) -> List[Invitation]:
         """Fetch all invitations for an event using automatic pagination.
@@ -93,11 +127,7 @@ class InvitationsAPI:
         Returns:
             List of all Invitation objects for the event
         """
-        def _list_page(**kwargs: Any) -> List[Invitation]:
-            return self.list_for_event(event_id, **kwargs)
-        
-        items = list(self._client._paginate(_list_page))
-        return [Invitation.from_dict(item) if isinstance(item, dict) else item for item in items]
+        return list(self.iter_all_for_event(event_id))
     
     def create_for_constituent(self, constituent_id: int, invitation: Invitation) -> Invitation:
         """Create a new invitation for a constituent.
@@ -110,4 +140,78 @@ class InvitationsAPI:
             Created Invitation object
         """
         data = self._client._post(f"constituents/{constituent_id}/invitations", invitation.to_dict())
-        return Invitation.from_dict(data)
\ No newline at end of file
+        return Invitation.from_dict(data)
+
+
+class AsyncInvitationsAPI(_InvitationsMixin):
+    """Async variant of :class:`InvitationsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient) -> None:
+        """Initialize async Invitations API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+        """
+        self._client = client
+    
+    async def list_for_constituent(
+        self, 
+        constituent_id: int, 
+        *, 
+        limit: int = 25, 
+        offset: int = 0
+    ) -> List[Invitation]:
+        """List invitations for a specific constituent."""
+        data = await self._client._get(
+            f"constituents/{constituent_id}/invitations",
+            limit=limit,
+            offset=offset
+        )
+        return self._parse_page(data)
+    
+    async def iter_all_for_constituent(self, constituent_id: int) -> AsyncIterator[Invitation]:
+        """Iterate over all invitations for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> List[Invitation]:
+            return await self.list_for_constituent(constituent_id, **kwargs)
+        
+        async for item in self._client._paginate(_list_page):
+            yield item
+    
+    async def fetch_all_for_constituent(self, constituent_id: int) -> List[Invitation]:
+        """Fetch all invitations for a constituent using automatic pagination."""
+        return [item async for item in self.iter_all_for_constituent(constituent_id)]
+    
+    async def list_for_event(
+        self, 
+        event_id: int, 
+        *, 
+        limit: int = 25, 
+        offset: int = 0
+    ) -> List[Invitation]:
+        """List invitations for a specific event."""
+        data = await self._client._get(
+            f"events/{event_id}/invitations",
+            limit=limit,
+            offset=offset
+        )
+        return self._parse_page(data)
+    
+    async def iter_all_for_event(self, event_id: int) -> AsyncIterator[Invitation]:
+        """Iterate over all invitations for an event, page by page."""
+        async def _list_page(**kwargs: Any) -> List[Invitation]:
+            return await self.list_for_event(event_id, **kwargs)
+        
+        async for item in self._client._paginate(_list_page):
+            yield item
+    
+    async def fetch_all_for_event(self, event_id: int) -> List[Invitation]:
+        """Fetch all invitations for an event using automatic pagination."""
+        return [item async for item in self.iter_all_for_event(event_id)]
+    
+    async def create_for_constituent(self, constituent_id: int, invitation: Invitation) -> Invitation:
+        """Create a new invitation for a constituent."""
+        data = await self._client._post(
+            f"constituents/{constituent_id}/invitations",
+            invitation.to_dict()
+        )
+        return Invitation.from_dict(data)
@@ -1,12 +1,20 @@
 """Keywords API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List
 
 from ..models.common import Keyword
-from .client import LGLClient
+from .client import AsyncLGLClient, LGLClient
 
 
-class KeywordsAPI:
+class _KeywordsMixin:
+    """Model parsing shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[Keyword]:
+        return [Keyword.from_dict(item) for item in data.get("items", [])]
+
+
+class KeywordsAPI(_KeywordsMixin):
     """API for managing keywords in Little Green Light.
     
     Keywords are labels that can be organized within categories and
@@ -33,7 +41,22 @@ class KeywordsAPI:
             List of Keyword objects
         """
         data = self._client._get(f"categories/{category_id}/keywords", limit=limit, offset=offset)
-        return [Keyword.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(data)
+    
+    def iter_all_for_category(self, category_id: int) -> Iterator[Keyword]:
+        """Iterate over all keywords for a category, one page at a time.
+        
+        Args:
+            category_id: Category ID to get keywords for
+            
+        Yields:
+            Keyword objects for the category
+        """
+        def _list_page(**kwargs: Any) -> List[Keyword]:
+            return self.list_for_category(category_id, **kwargs)
+        
+        for item in self._client._paginate(_list_page):
+            yield Keyword.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all_for_category(self, category_id: int) -> List[Keyword]:
         """Fetch all keywords for a category using automatic pagination.
@@ -44,11 +67,7 @@ class KeywordsAPI:
         Returns:
             List of all Keyword objects for the category
         """
-        def _list_page(**kwargs: Any) -> List[Keyword]:
-            return self.list_for_category(category_id, **kwargs)
-        
-        items = list(self._client._paginate(_list_page))
-        return [Keyword.from_dict(item) if isinstance(item, dict) else item for item in items]
+        return list(self.iter_all_for_category(category_id))
     
     def retrieve(self, keyword_id: int) -> Keyword:
         """Retrieve a specific keyword by ID.
@@ -115,4 +134,66 @@ class KeywordsAPI:
             constituent_id: Constituent ID
             keyword_id: Keyword ID to remove
         """
-        self._client._delete(f"constituents/{constituent_id}/keywords/{keyword_id}")
\ No newline at end of file
+        self._client._delete(f"constituents/{constituent_id}/keywords/{keyword_id}")
+
+
+class AsyncKeywordsAPI(_KeywordsMixin):
+    """Async variant of :class:`KeywordsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient) -> None:
+        """Initialize async Keywords API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+        """
+        self._client = client
+    
+    async def list_for_category(self, category_id: int, *, limit: int = 25, offset: int = 0) -> List[Keyword]:
+        """List keywords for a specific category."""
+        data = await self._client._get(
+            f"categories/{category_id}/keywords",
+            limit=limit,
+            offset=offset
+        )
+        return self._parse_page(data)
+    
+    async def iter_all_for_category(self, category_id: int) -> AsyncIterator[Keyword]:
+        """Iterate over all keywords for a category, page by page."""
+        async def _list_page(**kwargs: Any) -> List[Keyword]:
+            return await self.list_for_category(category_id, **kwargs)
+        
+        async for item in self._client._paginate(_list_page):
+            yield item
+    
+    async def fetch_all_for_category(self, category_id: int) -> List[Keyword]:
+        """Fetch all keywords for a category using automatic pagination."""
+        return [item async for item in self.iter_all_for_category(category_id)]
+    
+    async def retrieve(self, keyword_id: int) -> Keyword:
+        """Retrieve a specific keyword by ID."""
+        data = await self._client._get(f"keywords/{keyword_id}")
+        return Keyword.from_dict(data)
+    
+    async def create_for_category(self, category_id: int, keyword: Keyword) -> Keyword:
+        """Create a new keyword in a category."""
+        data = await self._client._post(f"categories/{category_id}/keywords", keyword.to_dict())
+        return Keyword.from_dict(data)
+    
+    async def update(self, keyword_id: int, keyword: Keyword) -> Keyword:
+        """Update an existing keyword."""
+        data = await self._client._patch(f"keywords/{keyword_id}", keyword.to_dict())
+        return Keyword.from_dict(data)
+    
+    async def delete(self, keyword_id: int, *, permanent: bool = False) -> None:
+        """Delete a keyword."""
+        params = {"permanent": 1} if permanent else {}
+        await self._client._delete(f"keywords/{keyword_id}", **params)
+    
+    async def add_to_constituent(self, constituent_id: int, keyword_id: int) -> None:
+        """Add a keyword to a constituent."""
+        data = {"id": keyword_id}
+        await self._client._post(f"constituents/{constituent_id}/keywords", data)
+    
+    async def remove_from_constituent(self, constituent_id: int, keyword_id: int) -> None:
+        """Remove a keyword from a constituent."""
+        await self._client._delete(f"constituents/{constituent_id}/keywords/{keyword_id}")
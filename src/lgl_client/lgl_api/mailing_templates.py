@@ -1,20 +1,35 @@
 """Mailing Templates API for LGL client."""
 
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.mailing_template import MailingTemplate
-from .client import LGLClient
+from .client import AsyncLGLClient, LGLClient
 
 
-class MailingTemplatesAPI:
+class _MailingTemplatesMixin:
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "mailing_templates"
+    
+    @staticmethod
+    def _list_params(mailing_type_id: Optional[int], limit: int, offset: int) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"limit": limit, "offset": offset}
+        if mailing_type_id is not None:
+            params["mailing_type_id"] = mailing_type_id
+        return params
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[MailingTemplate]:
+        return [MailingTemplate.from_dict(item) for item in data.get("items", [])]
+
+
+class MailingTemplatesAPI(_MailingTemplatesMixin):
     """API for managing mailing templates in Little Green Light.
     
     Mailing templates define pre-configured templates for different types 
     of mailings (acknowledgments, appeals, newsletters, etc.).
     """
     
-    _resource = "mailing_templates"
-    
     def __init__(self, client: LGLClient) -> None:
         """Initialize Mailing Templates API.
         
@@ -40,12 +55,27 @@ class MailingTemplatesAPI:
         Returns:
             List of MailingTemplate objects
         """
-        params = {"limit": limit, "offset": offset}
+        params = self._list_params(mailing_type_id, limit, offset)
+        return self._parse_page(self._client._get(self._resource, **params))
+    
+    def iter_all(self, *, mailing_type_id: Optional[int] = None) -> Iterator[MailingTemplate]:
+        """Iterate over all mailing templates, one page at a time.
+        
+        Args:
+            mailing_type_id: Filter by mailing type ID (optional)
+            
+        Yields:
+            MailingTemplate objects
+        """
+        def _list_page(**kwargs: Any) -> List[MailingTemplate]:
+            return self.list(**kwargs)
+        
+        kwargs = {}
         if mailing_type_id is not None:
-            params["mailing_type_id"] = mailing_type_id
+            kwargs["mailing_type_id"] = mailing_type_id
         
-        data = self._client._get(self._resource, **params)
-        return [MailingTemplate.from_dict(item) for item in data.get("items", [])]
+        for item in self._client._paginate(_list_page, **kwargs):
+            yield MailingTemplate.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self, *, mailing_type_id: Optional[int] = None) -> List[MailingTemplate]:
         """Fetch all mailing templates using automatic pagination.
@@ -56,12 +86,40 @@ class MailingTemplatesAPI:
         Returns:
             List of all MailingTemplate objects
         """
-        def _list_page(**kwargs: Any) -> List[MailingTemplate]:
-            return self.list(**kwargs)
+        return list(self.iter_all(mailing_type_id=mailing_type_id))
+
+
+class AsyncMailingTemplatesAPI(_MailingTemplatesMixin):
+    """Async variant of :class:`MailingTemplatesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient) -> None:
+        """Initialize async Mailing Templates API.
         
-        kwargs = {}
+        Args:
+            client: Async LGL HTTP client instance
+        """
+        self._client = client
+    
+    async def list(
+        self, 
+        *, 
+        mailing_type_id: Optional[int] = None,
+        limit: int = 25, 
+        offset: int = 0
+    ) -> List[MailingTemplate]:
+        """List mailing templates for the account."""
+        params = self._list_params(mailing_type_id, limit, offset)
+        return self._parse_page(await self._client._get(self._resource, **params))
+    
+    async def iter_all(self, *, mailing_type_id: Optional[int] = None) -> AsyncIterator[MailingTemplate]:
+        """Iterate over all mailing templates, fetching pages as they are consumed."""
+        kwargs: Dict[str, Any] = {}
         if mailing_type_id is not None:
             kwargs["mailing_type_id"] = mailing_type_id
         
-        items = list(self._client._paginate(_list_page, **kwargs))
-        return [MailingTemplate.from_dict(item) if isinstance(item, dict) else item for item in items]
\ No newline at end of file
+        async for item in self._client._paginate(self.list, **kwargs):
+            yield item
+    
+    async def fetch_all(self, *, mailing_type_id: Optional[int] = None) -> List[MailingTemplate]:
+        """Fetch all mailing templates using automatic pagination."""
+        return [item async for item in self.iter_all(mailing_type_id=mailing_type_id)]
@@ -1,27 +1,41 @@
 """Membership Levels API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.membership_level import MembershipLevel
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class MembershipLevelsAPI:
+class _MembershipLevelsMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "membership_levels"
+    
+    def _membership_level_path(self, membership_level_id: int) -> str:
+        return f"{self._resource}/{membership_level_id}"
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[MembershipLevel]:
+        return [MembershipLevel.from_dict(item) for item in data.get("items", [])]
+
+
+class MembershipLevelsAPI(_MembershipLevelsMixin):
     """API for managing membership levels in Little Green Light.
     
     Membership levels define different tiers of membership
     for constituents (e.g., General, Friend, Gold, Silver, Diamond, Bronze).
     """
     
-    _resource = "membership_levels"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Membership Levels API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(self, *, limit: int = 25, offset: int = 0) -> List[MembershipLevel]:
         """List membership levels for the account.
@@ -33,8 +47,19 @@ class MembershipLevelsAPI:
         Returns:
             List of MembershipLevel objects
         """
-        data = self._client._get(self._resource, limit=limit, offset=offset)
-        return [MembershipLevel.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(self._client._get(self._resource, limit=limit, offset=offset))
+    
+    def iter_all(self) -> Iterator[MembershipLevel]:
+        """Iterate over all membership levels, one page at a time.
+        
+        Yields:
+            MembershipLevel objects
+        """
+        def _list_page(**kwargs: Any) -> List[MembershipLevel]:
+            return self.list(**kwargs)
+        
+        for item in self._client._paginate(_list_page):
+            yield MembershipLevel.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[MembershipLevel]:
         """Fetch all membership levels using automatic pagination.
@@ -42,11 +67,7 @@ class MembershipLevelsAPI:
         Returns:
             List of all MembershipLevel objects
         """
-        def _list_page(**kwargs: Any) -> List[MembershipLevel]:
-            return self.list(**kwargs)
-        
-        items = list(self._client._paginate(_list_page))
-        return [MembershipLevel.from_dict(item) if isinstance(item, dict) else item for item in items]
+        return self._cached("fetch_all", lambda: list(self.iter_all()))
     
     def retrieve(self, membership_level_id: int) -> MembershipLevel:
         """Retrieve a specific membership level by ID.
@@ -57,7 +78,7 @@ class MembershipLevelsAPI:
         Returns:
             MembershipLevel object
         """
-        data = self._client._get(f"{self._resource}/{membership_level_id}")
+        data = self._client._get(self._membership_level_path(membership_level_id))
         return MembershipLevel.from_dict(data)
     
     def create(self, membership_level: MembershipLevel) -> MembershipLevel:
@@ -70,6 +91,7 @@ class MembershipLevelsAPI:
             Created MembershipLevel object
         """
         data = self._client._post(self._resource, membership_level.to_dict())
+        self._invalidate_cache()
         return MembershipLevel.from_dict(data)
     
     def update(self, membership_level_id: int, membership_level: MembershipLevel) -> MembershipLevel:
@@ -82,7 +104,8 @@ class MembershipLevelsAPI:
         Returns:
             Updated MembershipLevel object
         """
-        data = self._client._patch(f"{self._resource}/{membership_level_id}", membership_level.to_dict())
+        data = self._client._patch(self._membership_level_path(membership_level_id), membership_level.to_dict())
+        self._invalidate_cache()
         return MembershipLevel.from_dict(data)
     
     def delete(self, membership_level_id: int) -> None:
@@ -91,4 +114,54 @@ class MembershipLevelsAPI:
         Args:
             membership_level_id: Membership level ID to delete
         """
-        self._client._delete(f"{self._resource}/{membership_level_id}")
\ No newline at end of file
+        self._client._delete(self._membership_level_path(membership_level_id))
+        self._invalidate_cache()
+
+
+class AsyncMembershipLevelsAPI(_MembershipLevelsMixin):
+    """Async variant of :class:`MembershipLevelsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Membership Levels API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[MembershipLevel]:
+        """List membership levels for the account."""
+        return self._parse_page(await self._client._get(self._resource, limit=limit, offset=offset))
+    
+    async def iter_all(self) -> AsyncIterator[MembershipLevel]:
+        """Iterate over all membership levels, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[MembershipLevel]:
+        """Fetch all membership levels using automatic pagination."""
+        return await self._acached("fetch_all", lambda: self._collect(self.iter_all()))
+    
+    async def retrieve(self, membership_level_id: int) -> MembershipLevel:
+        """Retrieve a specific membership level by ID."""
+        data = await self._client._get(self._membership_level_path(membership_level_id))
+        return MembershipLevel.from_dict(data)
+    
+    async def create(self, membership_level: MembershipLevel) -> MembershipLevel:
+        """Create a new membership level."""
+        data = await self._client._post(self._resource, membership_level.to_dict())
+        self._invalidate_cache()
+        return MembershipLevel.from_dict(data)
+    
+    async def update(self, membership_level_id: int, membership_level: MembershipLevel) -> MembershipLevel:
+        """Update an existing membership level."""
+        data = await self._client._patch(self._membership_level_path(membership_level_id), membership_level.to_dict())
+        self._invalidate_cache()
+        return MembershipLevel.from_dict(data)
+    
+    async def delete(self, membership_level_id: int) -> None:
+        """Delete a membership level."""
+        await self._client._delete(self._membership_level_path(membership_level_id))
+        self._invalidate_cache()
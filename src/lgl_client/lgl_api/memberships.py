@@ -1,13 +1,42 @@
 """Memberships API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 from datetime import date
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.constituent import Membership
 
 
-class MembershipsAPI:
+class _MembershipsMixin:
+    """Query parameters and payloads shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _membership_data(
+        level: Dict[str, Any], start_date: date, end_date: Optional[date], note: Optional[str]
+    ) -> Dict[str, Any]:
+        data = {
+            **level,
+            "date_start": start_date.strftime('%Y-%m-%d')
+        }
+        
+        if end_date:
+            data["finish_date"] = end_date.strftime('%Y-%m-%d')
+        if note:
+            data["note"] = note
+        
+        return data
+
+
+class MembershipsAPI(_MembershipsMixin):
     """API for managing constituent memberships."""
     
     def __init__(self, client: LGLClient):
@@ -29,14 +58,24 @@ class MembershipsAPI:
         Returns:
             Paginated response with membership items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/memberships', **params)
     
+    def iter_all(self, constituent_id: int) -> Iterator[Membership]:
+        """Iterate over all memberships for a constituent, one page at a time.
+        
+        Args:
+            constituent_id: The constituent ID
+        
+        Yields:
+            Membership objects
+        """
+        def _list_page(**kwargs):
+            return self.list(constituent_id, **kwargs)
+        
+        for item in self.client._paginate(_list_page):
+            yield Membership(**item)
+    
     def fetch_all(self, constituent_id: int) -> List[Membership]:
         """Fetch all memberships for a constituent with automatic pagination.
         
@@ -46,11 +85,7 @@ class MembershipsAPI:
         Returns:
             List of all Membership objects
         """
-        def _list_page(**kwargs):
-            return self.list(constituent_id, **kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [Membership(**item) for item in items]
+        return list(self.iter_all(constituent_id))
     
     def retrieve(self, membership_id: int) -> Membership:
         """Retrieve a specific membership by ID.
@@ -129,16 +164,7 @@ class MembershipsAPI:
         Returns:
             Created Membership object
         """
-        data = {
-            "membership_level_id": membership_level_id,
-            "date_start": start_date.strftime('%Y-%m-%d')
-        }
-        
-        if end_date:
-            data["finish_date"] = end_date.strftime('%Y-%m-%d')
-        if note:
-            data["note"] = note
-        
+        data = self._membership_data({"membership_level_id": membership_level_id}, start_date, end_date, note)
         return self.create(constituent_id, data)
     
     def create_membership_by_level_name(
@@ -161,16 +187,7 @@ class MembershipsAPI:
         Returns:
             Created Membership object
         """
-        data = {
-            "membership_level_name": membership_level_name,
-            "date_start": start_date.strftime('%Y-%m-%d')
-        }
-        
-        if end_date:
-            data["finish_date"] = end_date.strftime('%Y-%m-%d')
-        if note:
-            data["note"] = note
-        
+        data = self._membership_data({"membership_level_name": membership_level_name}, start_date, end_date, note)
         return self.create(constituent_id, data)
     
     def extend_membership(self, membership_id: int, new_end_date: date) -> Membership:
@@ -231,4 +248,98 @@ class MembershipsAPI:
             if membership.finish_date is None or membership.finish_date > today:
                 active_memberships.append(membership)
         
-        return active_memberships
\ No newline at end of file
+        return active_memberships
+
+
+class AsyncMembershipsAPI(_MembershipsMixin):
+    """Async variant of :class:`MembershipsAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all memberships for a constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/memberships', **params)
+    
+    async def iter_all(self, constituent_id: int) -> AsyncIterator[Membership]:
+        """Iterate over all memberships for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list(constituent_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield Membership(**item)
+    
+    async def fetch_all(self, constituent_id: int) -> List[Membership]:
+        """Fetch all memberships for a constituent with automatic pagination."""
+        return [item async for item in self.iter_all(constituent_id)]
+    
+    async def retrieve(self, membership_id: int) -> Membership:
+        """Retrieve a specific membership by ID."""
+        response = await self.client._get(f'memberships/{membership_id}')
+        return Membership(**response)
+    
+    async def create(self, constituent_id: int, membership_data: Dict) -> Membership:
+        """Create a new membership for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/memberships', membership_data)
+        return Membership(**response)
+    
+    async def update(self, membership_id: int, membership_data: Dict) -> Membership:
+        """Update an existing membership."""
+        response = await self.client._patch(f'memberships/{membership_id}', membership_data)
+        return Membership(**response)
+    
+    async def delete(self, membership_id: int) -> Dict:
+        """Delete a membership."""
+        await self.client._delete(f'memberships/{membership_id}')
+        return {"result": "success"}
+    
+    async def create_membership_by_level_id(
+        self,
+        constituent_id: int,
+        membership_level_id: int,
+        start_date: date,
+        end_date: Optional[date] = None,
+        note: Optional[str] = None
+    ) -> Membership:
+        """Create a membership using membership level ID."""
+        data = self._membership_data({"membership_level_id": membership_level_id}, start_date, end_date, note)
+        return await self.create(constituent_id, data)
+    
+    async def create_membership_by_level_name(
+        self,
+        constituent_id: int,
+        membership_level_name: str,
+        start_date: date,
+        end_date: Optional[date] = None,
+        note: Optional[str] = None
+    ) -> Membership:
+        """Create a membership using membership level name."""
+        data = self._membership_data({"membership_level_name": membership_level_name}, start_date, end_date, note)
+        return await self.create(constituent_id, data)
+    
+    async def extend_membership(self, membership_id: int, new_end_date: date) -> Membership:
+        """Extend a membership to a new end date."""
+        return await self.update(membership_id, {
+            "finish_date": new_end_date.strftime('%Y-%m-%d')
+        })
+    
+    async def add_note(self, membership_id: int, note: str) -> Membership:
+        """Add or update a note on a membership."""
+        return await self.update(membership_id, {"note": note})
+    
+    async def change_level(self, membership_id: int, new_level_id: int) -> Membership:
+        """Change the membership level."""
+        return await self.update(membership_id, {"membership_level_id": new_level_id})
+    
+    async def get_active_memberships(self, constituent_id: int) -> List[Membership]:
+        """Get all active memberships for a constituent."""
+        all_memberships = await self.fetch_all(constituent_id)
+        today = date.today()
+        return [membership for membership in all_memberships
+                if membership.finish_date is None or membership.finish_date > today]
@@ -0,0 +1,240 @@
+"""Request events and an in-memory metrics collector.
+
+Every callable in a client's ``event_hooks`` is called with a
+:class:`RequestEvent` once a request has finished, successfully or not.
+:class:`MetricsCollector` is such a hook and keeps per-endpoint latency
+histograms that can be exported in the Prometheus text format::
+
+    metrics = MetricsCollector()
+    client = new_client(api_key, event_hooks=[metrics])
+    client.gifts.fetch_all()
+    print(metrics.to_prometheus())
+
+Endpoints are path templates with numeric IDs replaced by ``{id}``, so
+``constituents/12/gifts`` and ``constituents/34/gifts`` share a histogram.
+"""
+
+import bisect
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Upper bounds of the latency buckets, in seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0, 10.0,
+)
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """One finished request.
+
+    Attributes:
+        method: HTTP method
+        endpoint: Path template, e.g. ``constituents/{id}/gifts``
+        status: HTTP status of the final response (``None`` after a
+            transport error)
+        bytes: Size of the final response body
+        latency: Round trip of the final attempt in seconds
+        elapsed: Total time including rate-limiter waits and retries
+        retries: Attempts made after the first one
+        page: 1-based number of the page being fetched while paginating
+            (for a single request, derived from ``offset``/``limit``),
+            otherwise ``None``
+        error: Exception type name for transport errors
+    """
+
+    method: str
+    endpoint: str
+    status: Optional[int]
+    bytes: int
+    latency: float
+    elapsed: float
+    retries: int = 0
+    page: Optional[int] = None
+    error: Optional[str] = None
+
+
+EventHook = Callable[[RequestEvent], None]
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters and latency histogram of one endpoint.
+
+    Attributes:
+        buckets: Upper bounds of the histogram buckets
+        bucket_counts: Requests per bucket (not cumulative); the final
+            entry counts requests slower than the last bound
+        count: Requests observed
+        latency_sum: Sum of the latencies in seconds
+        bytes: Response bytes received
+        retries: Retries made
+        errors: Requests that ended in a transport error
+        statuses: Requests per final HTTP status
+    """
+
+    buckets: Tuple[float, ...]
+    bucket_counts: List[int] = field(default_factory=list)
+    count: int = 0
+    latency_sum: float = 0.0
+    bytes: int = 0
+    retries: int = 0
+    errors: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, event: RequestEvent) -> None:
+        """Add one request."""
+        self.bucket_counts[bisect.bisect_left(self.buckets, event.latency)] += 1
+        self.count += 1
+        self.latency_sum += event.latency
+        self.bytes += event.bytes
+        self.retries += event.retries
+        if event.status is None:
+            self.errors += 1
+        else:
+            self.statuses[event.status] = self.statuses.get(event.status, 0) + 1
+
+    @property
+    def mean_latency(self) -> float:
+        """Average latency in seconds."""
+        return self.latency_sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Latency quantile estimated from the histogram, like Prometheus does.
+
+        Interpolates linearly inside the bucket holding the quantile;
+        requests beyond the last bound are reported at that bound.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for upper, in_bucket in zip(self.buckets, self.bucket_counts):
+            if in_bucket and seen + in_bucket >= rank:
+                return lower + (upper - lower) * (rank - seen) / in_bucket
+            seen += in_bucket
+            lower = upper
+        return self.buckets[-1]
+
+
+def _labels(**labels: object) -> str:
+    """Prometheus label set with escaped values."""
+    parts = []
+    for name, value in labels.items():
+        text = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{name}="{text}"')
+    return "{" + ",".join(parts) + "}"
+
+
+class MetricsCollector:
+    """Thread-safe event hook aggregating requests per ``"METHOD endpoint"``.
+
+    Args:
+        buckets: Upper bounds of the latency buckets in seconds
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        if list(buckets) != sorted(set(buckets)) or not buckets:
+            raise ValueError("buckets must be strictly increasing")
+        self.buckets = tuple(buckets)
+        self._endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def __call__(self, event: RequestEvent) -> None:
+        key = (event.method, event.endpoint)
+        with self._lock:
+            entry = self._endpoints.get(key)
+            if entry is None:
+                entry = self._endpoints[key] = EndpointMetrics(self.buckets)
+            entry.observe(event)
+
+    def endpoint(self, method: str, endpoint: str) -> Optional[EndpointMetrics]:
+        """Metrics of one endpoint, or None if it saw no requests."""
+        with self._lock:
+            return self._endpoints.get((method, endpoint))
+
+    def throughput(self) -> float:
+        """Requests per second since the collector was created or reset."""
+        elapsed = time.monotonic() - self._started
+        with self._lock:
+            count = sum(entry.count for entry in self._endpoints.values())
+        return count / elapsed if elapsed > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Summary per ``"METHOD endpoint"``: count, mean/p50/p95/p99 latency, bytes, retries, errors."""
+        with self._lock:
+            return {
+                f"{method} {endpoint}": {
+                    "count": entry.count,
+                    "mean": entry.mean_latency,
+                    "p50": entry.quantile(0.5),
+                    "p95": entry.quantile(0.95),
+                    "p99": entry.quantile(0.99),
+                    "bytes": entry.bytes,
+                    "retries": entry.retries,
+                    "errors": entry.errors,
+                }
+                for (method, endpoint), entry in sorted(self._endpoints.items())
+            }
+
+    def reset(self) -> None:
+        """Clear all metrics."""
+        with self._lock:
+            self._endpoints.clear()
+            self._started = time.monotonic()
+
+    def to_prometheus(self, namespace: str = "lgl_client") -> str:
+        """Metrics in the Prometheus text exposition format."""
+        duration = f"{namespace}_request_duration_seconds"
+        requests = f"{namespace}_requests_total"
+        received = f"{namespace}_response_bytes_total"
+        retried = f"{namespace}_retries_total"
+        lines = [
+            f"# HELP {duration} Latency of LGL API requests.",
+            f"# TYPE {duration} histogram",
+        ]
+        with self._lock:
+            entries = sorted(self._endpoints.items())
+            for (method, endpoint), entry in entries:
+                cumulative = 0
+                for upper, in_bucket in zip(self.buckets, entry.bucket_counts):
+                    cumulative += in_bucket
+                    labels = _labels(method=method, endpoint=endpoint, le=repr(upper))
+                    lines.append(f"{duration}_bucket{labels} {cumulative}")
+                labels = _labels(method=method, endpoint=endpoint, le="+Inf")
+                lines.append(f"{duration}_bucket{labels} {entry.count}")
+                labels = _labels(method=method, endpoint=endpoint)
+                lines.append(f"{duration}_sum{labels} {entry.latency_sum!r}")
+                lines.append(f"{duration}_count{labels} {entry.count}")
+
+            lines += [
+                f"# HELP {requests} LGL API requests by final status.",
+                f"# TYPE {requests} counter",
+            ]
+            for (method, endpoint), entry in entries:
+                outcomes = [(str(status), n) for status, n in sorted(entry.statuses.items())]
+                if entry.errors:
+                    outcomes.append(("error", entry.errors))
+                for status, n in outcomes:
+                    labels = _labels(method=method, endpoint=endpoint, status=status)
+                    lines.append(f"{requests}{labels} {n}")
+
+            for name, help_text, attribute in (
+                (received, "Response bytes received from the LGL API.", "bytes"),
+                (retried, "Retried LGL API request attempts.", "retries"),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (method, endpoint), entry in entries:
+                    labels = _labels(method=method, endpoint=endpoint)
+                    lines.append(f"{name}{labels} {getattr(entry, attribute)}")
+        return "\n".join(lines) + "\n"
@@ -1,13 +1,34 @@
 """Notes API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 from datetime import date
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.note import Note
 
 
-class NotesAPI:
+class _NotesMixin:
+    """Query parameters and payloads shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _typed_note(type_name: str, text: str, original_date: date) -> Dict[str, Any]:
+        return {
+            "text": text,
+            "original_date": original_date.strftime('%Y-%m-%d'),
+            "note_type_name": type_name
+        }
+
+
+class NotesAPI(_NotesMixin):
     """API for managing constituent notes."""
     
     def __init__(self, client: LGLClient):
@@ -29,12 +50,7 @@ class NotesAPI:
         Returns:
             Paginated response with note items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/notes', **params)
     
     def list_all(
@@ -51,14 +67,24 @@ class NotesAPI:
         Returns:
             Paginated response with note items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get('notes', **params)
     
+    def iter_all(self, constituent_id: int) -> Iterator[Note]:
+        """Iterate over all notes for a constituent, one page at a time.
+        
+        Args:
+            constituent_id: The constituent ID
+        
+        Yields:
+            Note objects
+        """
+        def _list_page(**kwargs):
+            return self.list(constituent_id, **kwargs)
+        
+        for item in self.client._paginate(_list_page):
+            yield Note(**item)
+    
     def fetch_all(self, constituent_id: int) -> List[Note]:
         """Fetch all notes for a constituent with automatic pagination.
         
@@ -68,23 +94,35 @@ class NotesAPI:
         Returns:
             List of all Note objects
         """
+        return list(self.iter_all(constituent_id))
+    
+    def iter_all_account_notes(self, *, concurrency: Optional[int] = None) -> Iterator[Note]:
+        """Iterate over all notes for the account, one page at a time.
+        
+        Args:
+            concurrency: Pages fetched in parallel (defaults to the client's
+                ``page_concurrency``)
+        
+        Yields:
+            Note objects in the account
+        """
         def _list_page(**kwargs):
-            return self.list(constituent_id, **kwargs)
+            return self.list_all(**kwargs)
         
-        items = list(self.client._paginate(_list_page))
-        return [Note(**item) for item in items]
+        for item in self.client._paginate(_list_page, concurrency=concurrency):
+            yield Note(**item)
     
-    def fetch_all_account_notes(self) -> List[Note]:
+    def fetch_all_account_notes(self, *, concurrency: Optional[int] = None) -> List[Note]:
         """Fetch all notes for the account with automatic pagination.
         
+        Args:
+            concurrency: Pages fetched in parallel (defaults to the client's
+                ``page_concurrency``)
+        
         Returns:
             List of all Note objects in the account
         """
-        def _list_page(**kwargs):
-            return self.list_all(**kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [Note(**item) for item in items]
+        return list(self.iter_all_account_notes(concurrency=concurrency))
     
     def retrieve(self, note_id: int) -> Note:
         """Retrieve a specific note by ID.
@@ -159,11 +197,7 @@ class NotesAPI:
         Returns:
             Created Note object
         """
-        return self.create(constituent_id, {
-            "text": text,
-            "original_date": original_date.strftime('%Y-%m-%d'),
-            "note_type_name": "General"
-        })
+        return self.create(constituent_id, self._typed_note("General", text, original_date))
     
     def create_contact_note(self, constituent_id: int, text: str, original_date: date) -> Note:
         """Create a contact note for a constituent.
@@ -176,11 +210,7 @@ class NotesAPI:
         Returns:
             Created Note object
         """
-        return self.create(constituent_id, {
-            "text": text,
-            "original_date": original_date.strftime('%Y-%m-%d'),
-            "note_type_name": "Contact"
-        })
+        return self.create(constituent_id, self._typed_note("Contact", text, original_date))
     
     def create_meeting_note(self, constituent_id: int, text: str, original_date: date) -> Note:
         """Create a meeting note for a constituent.
@@ -193,11 +223,7 @@ class NotesAPI:
         Returns:
             Created Note object
         """
-        return self.create(constituent_id, {
-            "text": text,
-            "original_date": original_date.strftime('%Y-%m-%d'),
-            "note_type_name": "Meeting"
-        })
+        return self.create(constituent_id, self._typed_note("Meeting", text, original_date))
     
     def create_phone_call_note(self, constituent_id: int, text: str, original_date: date) -> Note:
         """Create a phone call note for a constituent.
@@ -210,8 +236,92 @@ class NotesAPI:
         Returns:
             Created Note object
         """
-        return self.create(constituent_id, {
-            "text": text,
-            "original_date": original_date.strftime('%Y-%m-%d'),
-            "note_type_name": "Phone Call"
-        })
\ No newline at end of file
+        return self.create(constituent_id, self._typed_note("Phone Call", text, original_date))
+
+
+class AsyncNotesAPI(_NotesMixin):
+    """Async variant of :class:`NotesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all notes for a constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/notes', **params)
+    
+    async def list_all(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all notes for the account."""
+        params = self._page_params(limit, offset)
+        return await self.client._get('notes', **params)
+    
+    async def iter_all(self, constituent_id: int) -> AsyncIterator[Note]:
+        """Iterate over all notes for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list(constituent_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield Note(**item)
+    
+    async def fetch_all(self, constituent_id: int) -> List[Note]:
+        """Fetch all notes for a constituent with automatic pagination."""
+        return [item async for item in self.iter_all(constituent_id)]
+    
+    async def iter_all_account_notes(
+        self, *, concurrency: Optional[int] = None
+    ) -> AsyncIterator[Note]:
+        """Iterate over all notes in the account, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list_all(**kwargs)
+        
+        async for item in self.client._paginate(_list_page, concurrency=concurrency):
+            yield Note(**item)
+    
+    async def fetch_all_account_notes(self, *, concurrency: Optional[int] = None) -> List[Note]:
+        """Fetch all notes for the account with automatic pagination."""
+        return [item async for item in self.iter_all_account_notes(concurrency=concurrency)]
+    
+    async def retrieve(self, note_id: int) -> Note:
+        """Retrieve a specific note by ID."""
+        response = await self.client._get(f'notes/{note_id}')
+        return Note(**response)
+    
+    async def create(self, constituent_id: int, note_data: Dict) -> Note:
+        """Create a new note for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/notes', note_data)
+        return Note(**response)
+    
+    async def update(self, note_id: int, note_data: Dict) -> Note:
+        """Update an existing note."""
+        response = await self.client._patch(f'notes/{note_id}', note_data)
+        return Note(**response)
+    
+    async def delete(self, note_id: int) -> Dict:
+        """Delete a note."""
+        await self.client._delete(f'notes/{note_id}')
+        return {"result": "success"}
+    
+    async def create_general_note(self, constituent_id: int, text: str, original_date: date) -> Note:
+        """Create a general note for a constituent."""
+        return await self.create(constituent_id, self._typed_note("General", text, original_date))
+    
+    async def create_contact_note(self, constituent_id: int, text: str, original_date: date) -> Note:
+        """Create a contact note for a constituent."""
+        return await self.create(constituent_id, self._typed_note("Contact", text, original_date))
+    
+    async def create_meeting_note(self, constituent_id: int, text: str, original_date: date) -> Note:
+        """Create a meeting note for a constituent."""
+        return await self.create(constituent_id, self._typed_note("Meeting", text, original_date))
+    
+    async def create_phone_call_note(self, constituent_id: int, text: str, original_date: date) -> Note:
+        """Create a phone call note for a constituent."""
+        return await self.create(constituent_id, self._typed_note("Phone Call", text, original_date))
@@ -0,0 +1,165 @@
+"""Adaptive page sizes for paginated reads.
+
+Larger pages mean fewer round trips, but with ``expand=`` a page of 100
+constituents can take seconds and megabytes. Pass a
+:class:`PageSizeTuner` to ``new_client`` and ``_paginate`` measures every
+page it fetches (latency and response bytes per item) and picks the next
+``limit`` so a page stays within ``target_latency`` and ``max_bytes``,
+never above the server's maximum::
+
+    tuner = PageSizeTuner(target_latency=1.5, overrides={"gifts/search": 50})
+    client = new_client(api_key, page_size_tuner=tuner)
+    client.constituents.search_all_constituents(query, expand="email_addresses")
+    tuner.stats()
+    # {'constituents/search': {'page_size': 40, 'pages': 12, ...}}
+
+Sizes are learned per path template (``constituents/{id}/gifts``) and kept
+for the life of the tuner, so later calls start from the tuned size. An
+explicit ``limit`` passed to ``_paginate`` is always used as is.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class _EndpointTuning:
+    page_size: int
+    pages: int = 0
+    seconds_per_item: float = 0.0
+    bytes_per_item: float = 0.0
+    latency: float = 0.0
+    bytes: int = 0
+
+
+@dataclass
+class PageSizeTuner:
+    """Chooses the page size of each paginated endpoint from observed pages.
+
+    Attributes:
+        initial: Page size of an endpoint before any page was measured
+        min_size: Smallest page size chosen
+        max_size: Largest page size chosen (the server's maximum ``limit``)
+        target_latency: Seconds one page should take to fetch and decode
+        max_bytes: Response bytes one page should not exceed
+        smoothing: Weight of the newest page in the per-item averages
+            (1 uses only the last page)
+        overrides: Fixed page sizes per path template, e.g.
+            ``{"constituents/search": 50}``; never tuned
+    """
+
+    initial: int = 100
+    min_size: int = 10
+    max_size: int = 100
+    target_latency: float = 2.0
+    max_bytes: int = 2_000_000
+    smoothing: float = 0.3
+    overrides: Dict[str, int] = field(default_factory=dict)
+    _endpoints: Dict[str, _EndpointTuning] = field(default_factory=dict, repr=False)
+    _hints: Dict[str, str] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.min_size <= self.max_size:
+            raise ValueError("min_size must be at least 1 and at most max_size")
+        if not self.min_size <= self.initial <= self.max_size:
+            raise ValueError("initial must lie between min_size and max_size")
+        if self.target_latency <= 0 or self.max_bytes <= 0:
+            raise ValueError("target_latency and max_bytes must be positive")
+        if not 0 < self.smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        if any(size < 1 for size in self.overrides.values()):
+            raise ValueError("override page sizes must be at least 1")
+
+    def page_size(self, endpoint: Optional[str] = None, *, hint: Optional[str] = None) -> int:
+        """Page size to request next from an endpoint.
+
+        Args:
+            endpoint: Path template; when unknown, ``hint`` names the
+                caller whose endpoint was recorded by :meth:`observe`
+            hint: Stable name of the page function
+        """
+        with self._lock:
+            if endpoint is None and hint is not None:
+                endpoint = self._hints.get(hint)
+            if endpoint is None:
+                return self.initial
+            if endpoint in self.overrides:
+                return self.overrides[endpoint]
+            tuning = self._endpoints.get(endpoint)
+            return self.initial if tuning is None else tuning.page_size
+
+    def observe(
+        self,
+        endpoint: str,
+        *,
+        items: int,
+        latency: float,
+        size: int,
+        hint: Optional[str] = None,
+    ) -> int:
+        """Record one fetched page and return the endpoint's next page size.
+
+        Args:
+            endpoint: Path template the page came from
+            items: Records on the page
+            latency: Seconds taken to fetch and decode the page
+            size: Response body bytes
+            hint: Name of the page function, remembered for :meth:`page_size`
+        """
+        with self._lock:
+            if hint is not None:
+                self._hints[hint] = endpoint
+            if endpoint in self.overrides:
+                return self.overrides[endpoint]
+            tuning = self._endpoints.setdefault(endpoint, _EndpointTuning(self.initial))
+            if items <= 0:
+                return tuning.page_size
+            per_second, per_byte = latency / items, size / items
+            if tuning.pages:
+                weight = self.smoothing
+                per_second = weight * per_second + (1 - weight) * tuning.seconds_per_item
+                per_byte = weight * per_byte + (1 - weight) * tuning.bytes_per_item
+            tuning.seconds_per_item, tuning.bytes_per_item = per_second, per_byte
+            tuning.pages += 1
+            tuning.latency, tuning.bytes = latency, size
+            fits = min(
+                self.target_latency / per_second if per_second > 0 else self.max_size,
+                self.max_bytes / per_byte if per_byte > 0 else self.max_size,
+            )
+            # Grow at most twofold per page so one fast page cannot overshoot
+            tuning.page_size = max(
+                self.min_size, min(self.max_size, tuning.page_size * 2, int(fits))
+            )
+            return tuning.page_size
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """Forget what was learned about one endpoint, or about all of them."""
+        with self._lock:
+            if endpoint is None:
+                self._endpoints.clear()
+                self._hints.clear()
+            else:
+                self._endpoints.pop(endpoint, None)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Current page size and the last measurements per path template."""
+        with self._lock:
+            report = {}
+            endpoints = list(self._endpoints) + [
+                endpoint for endpoint in self.overrides if endpoint not in self._endpoints
+            ]
+            for endpoint in endpoints:
+                tuning = self._endpoints.get(endpoint) or _EndpointTuning(self.initial)
+                overridden = endpoint in self.overrides
+                report[endpoint] = {
+                    "page_size": self.overrides[endpoint] if overridden else tuning.page_size,
+                    "pages": tuning.pages,
+                    "seconds_per_item": tuning.seconds_per_item,
+                    "bytes_per_item": tuning.bytes_per_item,
+                    "last_latency": tuning.latency,
+                    "last_bytes": tuning.bytes,
+                    "overridden": overridden,
+                }
+            return report
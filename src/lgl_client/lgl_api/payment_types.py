@@ -1,27 +1,38 @@
 """Payment Types API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.payment_type import PaymentType
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class PaymentTypesAPI:
+class _PaymentTypesMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "payment_types"
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[PaymentType]:
+        return [PaymentType.from_dict(item) for item in data.get("items", [])]
+
+
+class PaymentTypesAPI(_PaymentTypesMixin):
     """API for managing payment types in Little Green Light.
     
     Payment types define the different methods of payment that can be used
     for gifts (e.g., Cash, Check, Credit Card, Stock).
     """
     
-    _resource = "payment_types"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Payment Types API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(self, *, limit: int = 25, offset: int = 0) -> List[PaymentType]:
         """List payment types for the account.
@@ -33,8 +44,19 @@ class PaymentTypesAPI:
         Returns:
             List of PaymentType objects
         """
-        data = self._client._get(self._resource, limit=limit, offset=offset)
-        return [PaymentType.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(self._client._get(self._resource, limit=limit, offset=offset))
+    
+    def iter_all(self) -> Iterator[PaymentType]:
+        """Iterate over all payment types, one page at a time.
+        
+        Yields:
+            PaymentType objects
+        """
+        def _list_page(**kwargs: Any) -> List[PaymentType]:
+            return self.list(**kwargs)
+        
+        for item in self._client._paginate(_list_page):
+            yield PaymentType.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[PaymentType]:
         """Fetch all payment types using automatic pagination.
@@ -42,8 +64,31 @@ class PaymentTypesAPI:
         Returns:
             List of all PaymentType objects
         """
-        def _list_page(**kwargs: Any) -> List[PaymentType]:
-            return self.list(**kwargs)
+        return self._cached("fetch_all", lambda: list(self.iter_all()))
+
+
+class AsyncPaymentTypesAPI(_PaymentTypesMixin):
+    """Async variant of :class:`PaymentTypesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Payment Types API.
         
-        items = list(self._client._paginate(_list_page))
-        return [PaymentType.from_dict(item) if isinstance(item, dict) else item for item in items]
\ No newline at end of file
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[PaymentType]:
+        """List payment types for the account."""
+        return self._parse_page(await self._client._get(self._resource, limit=limit, offset=offset))
+    
+    async def iter_all(self) -> AsyncIterator[PaymentType]:
+        """Iterate over all payment types, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[PaymentType]:
+        """Fetch all payment types using automatic pagination."""
+        return await self._acached("fetch_all", lambda: self._collect(self.iter_all()))
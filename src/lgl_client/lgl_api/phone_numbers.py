@@ -1,12 +1,33 @@
 """Phone Numbers API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.constituent import PhoneNumber
 
 
-class PhoneNumbersAPI:
+class _PhoneNumbersMixin:
+    """Query parameters and payloads shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _typed_phone(type_name: str, number: str, is_preferred: bool) -> Dict[str, Any]:
+        return {
+            "number": number,
+            "phone_type_name": type_name,
+            "is_preferred": is_preferred
+        }
+
+
+class PhoneNumbersAPI(_PhoneNumbersMixin):
     """API for managing constituent phone numbers."""
     
     def __init__(self, client: LGLClient):
@@ -28,14 +49,24 @@ class PhoneNumbersAPI:
         Returns:
             Paginated response with phone number items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/phone_numbers', **params)
     
+    def iter_all(self, constituent_id: int) -> Iterator[PhoneNumber]:
+        """Iterate over all phone numbers for a constituent, one page at a time.
+        
+        Args:
+            constituent_id: The constituent ID
+        
+        Yields:
+            PhoneNumber objects
+        """
+        def _list_page(**kwargs):
+            return self.list(constituent_id, **kwargs)
+        
+        for item in self.client._paginate(_list_page):
+            yield PhoneNumber(**item)
+    
     def fetch_all(self, constituent_id: int) -> List[PhoneNumber]:
         """Fetch all phone numbers for a constituent with automatic pagination.
         
@@ -45,11 +76,7 @@ class PhoneNumbersAPI:
         Returns:
             List of all PhoneNumber objects
         """
-        def _list_page(**kwargs):
-            return self.list(constituent_id, **kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [PhoneNumber(**item) for item in items]
+        return list(self.iter_all(constituent_id))
     
     def retrieve(self, phone_number_id: int) -> PhoneNumber:
         """Retrieve a specific phone number by ID.
@@ -119,11 +146,7 @@ class PhoneNumbersAPI:
         Returns:
             Created PhoneNumber object
         """
-        return self.create(constituent_id, {
-            "number": number,
-            "phone_type_name": "Home",
-            "is_preferred": is_preferred
-        })
+        return self.create(constituent_id, self._typed_phone("Home", number, is_preferred))
     
     def create_work_phone(self, constituent_id: int, number: str, is_preferred: bool = False) -> PhoneNumber:
         """Create a work phone number for a constituent.
@@ -136,11 +159,7 @@ class PhoneNumbersAPI:
         Returns:
             Created PhoneNumber object
         """
-        return self.create(constituent_id, {
-            "number": number,
-            "phone_type_name": "Work",
-            "is_preferred": is_preferred
-        })
+        return self.create(constituent_id, self._typed_phone("Work", number, is_preferred))
     
     def create_mobile_phone(self, constituent_id: int, number: str, is_preferred: bool = False) -> PhoneNumber:
         """Create a mobile phone number for a constituent.
@@ -153,11 +172,7 @@ class PhoneNumbersAPI:
         Returns:
             Created PhoneNumber object
         """
-        return self.create(constituent_id, {
-            "number": number,
-            "phone_type_name": "Mobile",
-            "is_preferred": is_preferred
-        })
+        return self.create(constituent_id, self._typed_phone("Mobile", number, is_preferred))
     
     def set_preferred(self, phone_number_id: int) -> PhoneNumber:
         """Set a phone number as preferred.
@@ -179,4 +194,73 @@ class PhoneNumbersAPI:
         Returns:
             Updated PhoneNumber object
         """
-        return self.update(phone_number_id, {"not_current": True})
\ No newline at end of file
+        return self.update(phone_number_id, {"not_current": True})
+
+
+class AsyncPhoneNumbersAPI(_PhoneNumbersMixin):
+    """Async variant of :class:`PhoneNumbersAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all phone numbers for a constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/phone_numbers', **params)
+    
+    async def iter_all(self, constituent_id: int) -> AsyncIterator[PhoneNumber]:
+        """Iterate over all phone numbers for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list(constituent_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield PhoneNumber(**item)
+    
+    async def fetch_all(self, constituent_id: int) -> List[PhoneNumber]:
+        """Fetch all phone numbers for a constituent with automatic pagination."""
+        return [item async for item in self.iter_all(constituent_id)]
+    
+    async def retrieve(self, phone_number_id: int) -> PhoneNumber:
+        """Retrieve a specific phone number by ID."""
+        response = await self.client._get(f'phone_numbers/{phone_number_id}')
+        return PhoneNumber(**response)
+    
+    async def create(self, constituent_id: int, phone_data: Dict) -> PhoneNumber:
+        """Create a new phone number for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/phone_numbers', phone_data)
+        return PhoneNumber(**response)
+    
+    async def update(self, phone_number_id: int, phone_data: Dict) -> PhoneNumber:
+        """Update an existing phone number."""
+        response = await self.client._patch(f'phone_numbers/{phone_number_id}', phone_data)
+        return PhoneNumber(**response)
+    
+    async def delete(self, phone_number_id: int) -> Dict:
+        """Delete a phone number."""
+        await self.client._delete(f'phone_numbers/{phone_number_id}')
+        return {"result": "success"}
+    
+    async def create_home_phone(self, constituent_id: int, number: str, is_preferred: bool = False) -> PhoneNumber:
+        """Create a home phone number for a constituent."""
+        return await self.create(constituent_id, self._typed_phone("Home", number, is_preferred))
+    
+    async def create_work_phone(self, constituent_id: int, number: str, is_preferred: bool = False) -> PhoneNumber:
+        """Create a work phone number for a constituent."""
+        return await self.create(constituent_id, self._typed_phone("Work", number, is_preferred))
+    
+    async def create_mobile_phone(self, constituent_id: int, number: str, is_preferred: bool = False) -> PhoneNumber:
+        """Create a mobile phone number for a constituent."""
+        return await self.create(constituent_id, self._typed_phone("Mobile", number, is_preferred))
+    
+    async def set_preferred(self, phone_number_id: int) -> PhoneNumber:
+        """Set a phone number as preferred."""
+        return await self.update(phone_number_id, {"is_preferred": True})
+    
+    async def mark_inactive(self, phone_number_id: int) -> PhoneNumber:
+        """Mark a phone number as inactive/not current."""
+        return await self.update(phone_number_id, {"not_current": True})
@@ -0,0 +1,188 @@
+"""Client-side rate limiting for LGL API requests."""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import IO, Any, Iterator, Optional
+
+if sys.platform == "win32":  # pragma: no cover - Windows
+    import msvcrt
+else:
+    import fcntl
+
+
+class RateLimiter:
+    """Interface for rate limiters pluggable into :class:`LGLClient`.
+
+    ``reserve`` never blocks: it books a slot and returns how long the caller
+    must wait before sending, so the sync client can ``time.sleep`` and the
+    async client can ``asyncio.sleep`` on the same limiter.
+    """
+
+    def reserve(self) -> float:
+        """Reserve one request and return the seconds to wait before sending it."""
+        raise NotImplementedError
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Report a 429 response so the limiter can slow down."""
+
+
+@dataclass
+class _BucketState:
+    tokens: float
+    updated: float
+    rate: float
+
+
+class TokenBucket(RateLimiter):
+    """Thread-safe token bucket shared by every thread using one client.
+
+    Tokens refill at ``rate`` per second up to ``burst``. When ``adaptive`` is
+    on, every 429 multiplies the refill rate by ``backoff_factor`` (never below
+    ``min_rate``), and the rate climbs back to ``rate`` linearly over
+    ``recovery_time`` seconds.
+
+    Args:
+        rate: Sustained requests per second
+        burst: Bucket size, i.e. requests allowed back to back (default: ``rate``)
+        adaptive: Lower the rate automatically when 429s are observed
+        min_rate: Floor for the adapted rate (default: 5% of ``rate``)
+        backoff_factor: Multiplier applied to the rate on each 429
+        recovery_time: Seconds to climb back from zero to the full rate
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        adaptive: bool = True,
+        min_rate: Optional[float] = None,
+        backoff_factor: float = 0.5,
+        recovery_time: float = 60.0,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+        if not 0 < backoff_factor <= 1:
+            raise ValueError("backoff_factor must be in (0, 1]")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.adaptive = adaptive
+        self.min_rate = float(min_rate if min_rate is not None else rate * 0.05)
+        self.backoff_factor = backoff_factor
+        self.recovery_time = recovery_time
+        self.throttle_count = 0
+        self._lock = threading.Lock()
+        self._bucket = _BucketState(tokens=self.burst, updated=self._now(), rate=self.rate)
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    @contextmanager
+    def _state(self) -> Iterator[_BucketState]:
+        """Exclusive access to the bucket state."""
+        with self._lock:
+            yield self._bucket
+
+    def _refill(self, state: _BucketState, now: float) -> None:
+        elapsed = max(0.0, now - state.updated)
+        if self.adaptive and state.rate < self.rate and self.recovery_time > 0:
+            state.rate = min(self.rate, state.rate + elapsed * self.rate / self.recovery_time)
+        state.tokens = min(self.burst, state.tokens + elapsed * state.rate)
+        state.updated = now
+
+    def reserve(self) -> float:
+        """Take a token, returning how long to wait until it is actually available."""
+        with self._state() as state:
+            self._refill(state, self._now())
+            state.tokens -= 1
+            if state.tokens >= 0:
+                return 0.0
+            return -state.tokens / state.rate
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Drain the bucket and, when adaptive, cut the refill rate."""
+        with self._state() as state:
+            self.throttle_count += 1
+            self._refill(state, self._now())
+            if self.adaptive:
+                state.rate = max(self.min_rate, state.rate * self.backoff_factor)
+            # Nobody may send before the server's Retry-After has elapsed
+            debt = (retry_after or 0.0) * state.rate
+            state.tokens = min(state.tokens, -debt)
+
+    @property
+    def current_rate(self) -> float:
+        """Refill rate currently in effect (lower than ``rate`` after 429s)."""
+        with self._state() as state:
+            self._refill(state, self._now())
+            return state.rate
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket kept in a lock-protected file, shared across processes.
+
+    Every process (and thread) that points at the same ``path`` draws from a
+    single budget, which is what LGL enforces per API key. The state is a
+    small JSON document updated under an exclusive ``flock`` (``msvcrt``
+    locking on Windows), using wall-clock time so processes agree on it.
+
+    Args:
+        path: State file location; created on first use
+        rate: Sustained requests per second across all processes
+        burst: Bucket size (default: ``rate``)
+        **kwargs: Adaptive settings as for :class:`TokenBucket`
+    """
+
+    def __init__(self, path: str, rate: float, burst: Optional[float] = None, **kwargs: Any) -> None:
+        self.path = os.fspath(path)
+        super().__init__(rate, burst, **kwargs)
+
+    @staticmethod
+    def _now() -> float:
+        return time.time()
+
+    @contextmanager
+    def _state(self) -> Iterator[_BucketState]:
+        with self._lock, open(self.path, "a+", encoding="utf-8") as handle:
+            _lock_file(handle)
+            try:
+                handle.seek(0)
+                state = self._read_state(handle.read())
+                yield state
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(asdict(state)))
+                handle.flush()
+            finally:
+                _unlock_file(handle)
+
+    def _read_state(self, raw: str) -> _BucketState:
+        try:
+            return _BucketState(**json.loads(raw))
+        except (TypeError, ValueError):
+            # Missing or corrupt file: start from a full bucket
+            return _BucketState(tokens=self.burst, updated=self._now(), rate=self.rate)
+
+
+def _lock_file(handle: IO[str]) -> None:
+    if sys.platform == "win32":  # pragma: no cover - Windows
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(handle: IO[str]) -> None:
+    if sys.platform == "win32":  # pragma: no cover - Windows
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
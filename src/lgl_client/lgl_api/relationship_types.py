@@ -1,27 +1,38 @@
 """Relationship Types API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..models.relationship_type import RelationshipType
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class RelationshipTypesAPI:
+class _RelationshipTypesMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "relationship_types"
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[RelationshipType]:
+        return [RelationshipType.from_dict(item) for item in data.get("items", [])]
+
+
+class RelationshipTypesAPI(_RelationshipTypesMixin):
     """API for managing relationship types in Little Green Light.
     
     Relationship types define the different types of relationships between
     constituents (e.g., Parent, Mother, Father, Child, Spouse, Friend).
     """
     
-    _resource = "relationship_types"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Relationship Types API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(self, *, limit: int = 25, offset: int = 0) -> List[RelationshipType]:
         """List relationship types for the account.
@@ -33,8 +44,19 @@ class RelationshipTypesAPI:
         Returns:
             List of RelationshipType objects
         """
-        data = self._client._get(self._resource, limit=limit, offset=offset)
-        return [RelationshipType.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(self._client._get(self._resource, limit=limit, offset=offset))
+    
+    def iter_all(self) -> Iterator[RelationshipType]:
+        """Iterate over all relationship types, one page at a time.
+        
+        Yields:
+            RelationshipType objects
+        """
+        def _list_page(**kwargs: Any) -> List[RelationshipType]:
+            return self.list(**kwargs)
+        
+        for item in self._client._paginate(_list_page):
+            yield RelationshipType.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[RelationshipType]:
         """Fetch all relationship types using automatic pagination.
@@ -42,8 +64,31 @@ class RelationshipTypesAPI:
         Returns:
             List of all RelationshipType objects
         """
-        def _list_page(**kwargs: Any) -> List[RelationshipType]:
-            return self.list(**kwargs)
+        return self._cached("fetch_all", lambda: list(self.iter_all()))
+
+
+class AsyncRelationshipTypesAPI(_RelationshipTypesMixin):
+    """Async variant of :class:`RelationshipTypesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Relationship Types API.
         
-        items = list(self._client._paginate(_list_page))
-        return [RelationshipType.from_dict(item) if isinstance(item, dict) else item for item in items]
\ No newline at end of file
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[RelationshipType]:
+        """List relationship types for the account."""
+        return self._parse_page(await self._client._get(self._resource, limit=limit, offset=offset))
+    
+    async def iter_all(self) -> AsyncIterator[RelationshipType]:
+        """Iterate over all relationship types, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[RelationshipType]:
+        """Fetch all relationship types using automatic pagination."""
+        return await self._acached("fetch_all", lambda: self._collect(self.iter_all()))
@@ -0,0 +1,157 @@
+"""Retry policy for transient LGL API failures."""
+
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, FrozenSet, Optional
+
+DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How the client retries throttled or failed requests.
+
+    Delays use exponential backoff with full jitter: attempt ``n`` waits a
+    random time between zero and ``min(backoff_cap, backoff_base * 2**(n-1))``
+    seconds. A ``Retry-After`` header on the response takes precedence,
+    bounded by ``max_retry_after``.
+
+    Only idempotent methods (GET and DELETE) are retried by default. Add
+    ``"POST"`` or ``"PATCH"`` to ``retry_methods`` to opt in for writes, for
+    example when the payload carries an ``external_id`` that makes a
+    duplicate harmless.
+
+    Attributes:
+        max_attempts: Total attempts per request, including the first one
+        backoff_base: Base delay in seconds for the first retry
+        backoff_cap: Upper bound in seconds for a computed backoff delay
+        max_retry_after: Upper bound in seconds for a server-sent Retry-After
+        retry_statuses: HTTP status codes that trigger a retry
+        retry_methods: HTTP methods that may be retried
+        retry_on_transport_errors: Also retry timeouts and connection errors
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 30.0
+    max_retry_after: float = 60.0
+    retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES
+    retry_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    retry_on_transport_errors: bool = True
+
+    def __post_init__(self) -> None:
+        """Validate and normalise the policy settings."""
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.backoff_base < 0 or self.backoff_cap < 0 or self.max_retry_after < 0:
+            raise ValueError("Retry delays must not be negative")
+        object.__setattr__(self, "retry_statuses", frozenset(self.retry_statuses))
+        object.__setattr__(
+            self, "retry_methods", frozenset(m.upper() for m in self.retry_methods)
+        )
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """Policy that never retries (the client default)."""
+        return cls(max_attempts=1)
+
+    def allows(self, method: str, attempt: int) -> bool:
+        """Whether a failed ``attempt`` of ``method`` may be followed by another."""
+        return attempt < self.max_attempts and method.upper() in self.retry_methods
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay after ``attempt`` failed."""
+        ceiling = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def delay(self, attempt: int, retry_after: Any = None) -> float:
+        """Seconds to wait before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            retry_after: Raw ``Retry-After`` header value, if any
+        """
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            return min(server_delay, self.max_retry_after)
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date.
+
+    Returns:
+        Delay in seconds, or None when the value is missing or malformed
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class _EndpointRetries:
+    retries: int = 0
+    exhausted: int = 0
+    delay: float = 0.0
+
+
+@dataclass
+class RetryStats:
+    """Thread-safe retry counters keyed by ``"METHOD endpoint"``.
+
+    Endpoints are path templates with numeric IDs replaced by ``{id}``, so
+    ``constituents/12/gifts`` and ``constituents/34/gifts`` share a counter.
+    """
+
+    _endpoints: Dict[str, _EndpointRetries] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_retry(self, endpoint: str, delay: float) -> None:
+        """Count a retry and the time spent waiting for it."""
+        with self._lock:
+            entry = self._endpoints.setdefault(endpoint, _EndpointRetries())
+            entry.retries += 1
+            entry.delay += delay
+
+    def record_exhausted(self, endpoint: str) -> None:
+        """Count a request that still failed after its last allowed attempt."""
+        with self._lock:
+            self._endpoints.setdefault(endpoint, _EndpointRetries()).exhausted += 1
+
+    @property
+    def total_retries(self) -> int:
+        """Number of retries across all endpoints."""
+        with self._lock:
+            return sum(entry.retries for entry in self._endpoints.values())
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Copy of the counters as ``{endpoint: {retries, exhausted, delay}}``."""
+        with self._lock:
+            return {
+                endpoint: {
+                    "retries": entry.retries,
+                    "exhausted": entry.exhausted,
+                    "delay": entry.delay,
+                }
+                for endpoint, entry in self._endpoints.items()
+            }
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._endpoints.clear()
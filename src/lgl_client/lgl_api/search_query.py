@@ -0,0 +1,295 @@
+"""Typed builder for LGL ``q[]`` search expressions.
+
+The search endpoints take one ``q[]`` parameter holding ``field=value``
+terms joined by ``;`` (all terms must match). Values follow per-field
+formats such as ``in|1,7`` for ID lists or ``btw|100|1000`` for amounts.
+:class:`SearchQuery` checks field names and operators against the schema
+of each searchable resource and serializes the values::
+
+    query = (
+        SearchQuery("gifts")
+        .where("gift_types", [1, 7])
+        .where("gift_amount", 100, 1000, op="btw")
+        .where("updated_from", datetime(2025, 1, 1))
+    )
+    query.to_params()
+    # {"q": ["gift_types=in|1,7;gift_amount=btw|100|1000;updated_from=2025-01-01T00:00:00Z"]}
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# Value formats
+TEXT = "text"              # name=brady
+IDS = "ids"                # groups=1,2
+OP_IDS = "op_ids"          # campaigns=in|1,2   campaigns=bl
+NUMBER = "number"          # gift_amount=btw|100|1000
+DATE = "date"              # date_from=2025-01-01
+TIMESTAMP = "timestamp"    # updated_from=2025-01-01T00:00:00Z
+FLAG = "flag"              # constituent_type=1
+CLASS = "class"            # class=516,517|2000-01-01 to 2009-12-31
+CUSTOM_TEXT = "custom_text"      # custom_attr=key|ft|value
+CUSTOM_NUMBER = "custom_number"  # custom_attr_int=key|btw|5|50
+CUSTOM_DATE = "custom_date"      # custom_attr_from=key|2025-01-01
+
+NUMBER_OPS = ("gte", "lte", "btw", "gt", "lt", "eq", "ne")
+TEXT_OPS = ("ft", "nft", "eq", "ne", "sw", "bl", "nb")
+
+# Operators that take no value
+_VALUELESS_OPS = frozenset({"bl", "nb"})
+
+
+@dataclass(frozen=True)
+class SearchField:
+    """Format of one search term.
+
+    Attributes:
+        kind: Value format (one of the module-level format constants)
+        operators: Accepted operators; the first is the default
+    """
+
+    kind: str
+    operators: Tuple[str, ...] = ()
+
+
+def _fields(kind: str, *names: str, operators: Tuple[str, ...] = ()) -> Dict[str, SearchField]:
+    return {name: SearchField(kind, operators) for name in names}
+
+
+SEARCH_SCHEMAS: Dict[str, Dict[str, SearchField]] = {
+    "constituents": {
+        **_fields(
+            TEXT, "name", "eaddr", "phone_number", "street", "city", "state",
+            "postal_code", "country", "external_id",
+        ),
+        **_fields(IDS, "keyword", "membership_level", "groups"),
+        **_fields(TIMESTAMP, "updated_from", "updated_to"),
+        **_fields(DATE, "membership_end_date_from", "membership_end_date_to"),
+        **_fields(FLAG, "membership_status", "constituent_type"),
+        "class": SearchField(CLASS),
+        "custom_attr": SearchField(CUSTOM_TEXT, TEXT_OPS),
+        "custom_attr_int": SearchField(CUSTOM_NUMBER, NUMBER_OPS),
+        **_fields(CUSTOM_DATE, "custom_attr_from", "custom_attr_to"),
+    },
+    "gifts": {
+        **_fields(DATE, "date_from", "date_to"),
+        **_fields(OP_IDS, "gift_types", "appeal_types", "event_types", operators=("in", "ni")),
+        **_fields(
+            OP_IDS, "payment_types", "campaigns", "funds", "appeals", "events",
+            "categories", operators=("in", "ni", "bl"),
+        ),
+        "gift_amount": SearchField(NUMBER, NUMBER_OPS),
+        **_fields(IDS, "gift_ids", "external_gift_ids"),
+        **_fields(TIMESTAMP, "created_from", "created_to", "updated_from", "updated_to"),
+    },
+    "volunteer_times": {
+        **_fields(DATE, "date_from", "date_to"),
+        "description": SearchField(TEXT),
+        **_fields(IDS, "volunteering_category_id", "constituent_id", "const_keyword"),
+        **_fields(TIMESTAMP, "updated_from", "updated_to"),
+    },
+    # Documented alongside constituent relationships; served by contact_reports/search
+    "contact_reports": {
+        **_fields(DATE, "original_date_from", "original_date_to"),
+        **_fields(TEXT, "name", "text"),
+        **_fields(IDS, "contact_report_type_id", "constituent_id", "const_keyword"),
+        **_fields(TIMESTAMP, "updated_from", "updated_to"),
+    },
+}
+
+
+def normalize_timestamp(value: datetime) -> datetime:
+    """Convert to UTC at whole-second resolution, the precision of ``updated_from``."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def format_timestamp(value: datetime) -> str:
+    """Format a timestamp as ``updated_from`` expects (YYYY-MM-DDTHH:MM:SSZ)."""
+    return normalize_timestamp(value).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _text(value: Any) -> str:
+    text = str(value)
+    # ';' separates terms and '|' separates arguments; neither can be escaped
+    if ";" in text or "|" in text:
+        raise ValueError(f"Search values cannot contain ';' or '|': {text!r}")
+    return text
+
+
+def _date(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return _text(value)
+
+
+def _timestamp(value: Any) -> str:
+    if isinstance(value, datetime):
+        return format_timestamp(value)
+    return _date(value)
+
+
+def _ids(values: Any) -> str:
+    if isinstance(values, (str, int)):
+        values = [values]
+    values = list(values)
+    if not values:
+        raise ValueError("ID lists must not be empty")
+    return ",".join(_text(value) for value in values)
+
+
+@dataclass(frozen=True)
+class SearchTerm:
+    """One serialized ``field=value`` term."""
+
+    field: str
+    value: str
+
+    def __str__(self) -> str:
+        return f"{self.field}={self.value}"
+
+
+def _arity(name: str, values: Tuple[Any, ...], count: int) -> None:
+    if len(values) != count:
+        raise ValueError(f"{name} takes {count} value(s), got {len(values)}")
+
+
+def _serialize(name: str, spec: SearchField, values: Tuple[Any, ...], op: Optional[str]) -> str:
+    """Value of a term in the format the field expects."""
+    if spec.operators:
+        op = op or spec.operators[0]
+        if op not in spec.operators:
+            raise ValueError(
+                f"Operator {op!r} is not valid for {name} "
+                f"(expected one of {', '.join(spec.operators)})"
+            )
+    elif op is not None:
+        raise ValueError(f"{name} does not take an operator")
+
+    kind = spec.kind
+    if kind == TEXT:
+        _arity(name, values, 1)
+        return _text(values[0])
+    if kind == IDS:
+        _arity(name, values, 1)
+        return _ids(values[0])
+    if kind == OP_IDS:
+        if op in _VALUELESS_OPS:
+            _arity(name, values, 0)
+            return op
+        _arity(name, values, 1)
+        return f"{op}|{_ids(values[0])}"
+    if kind == NUMBER:
+        _arity(name, values, 2 if op == "btw" else 1)
+        return "|".join([str(op)] + [_text(value) for value in values])
+    if kind == DATE:
+        _arity(name, values, 1)
+        return _date(values[0])
+    if kind == TIMESTAMP:
+        _arity(name, values, 1)
+        return _timestamp(values[0])
+    if kind == FLAG:
+        _arity(name, values, 1)
+        return str(int(values[0]))
+    if kind == CLASS:
+        if len(values) not in (2, 3):
+            raise ValueError(f"{name} takes type IDs and one or two dates")
+        dates = " to ".join(_date(value) for value in values[1:])
+        return f"{_ids(values[0])}|{dates}"
+    if kind == CUSTOM_TEXT:
+        _arity(name, values, 1 if op in _VALUELESS_OPS else 2)
+        return "|".join([_text(values[0]), str(op)] + [_text(value) for value in values[1:]])
+    if kind == CUSTOM_NUMBER:
+        _arity(name, values, 3 if op == "btw" else 2)
+        return "|".join([_text(values[0]), str(op)] + [_text(value) for value in values[1:]])
+    if kind == CUSTOM_DATE:
+        _arity(name, values, 2)
+        return f"{_text(values[0])}|{_date(values[1])}"
+    raise ValueError(f"Unknown search field kind: {kind!r}")
+
+
+class SearchQuery:
+    """AND-combination of search terms for one resource.
+
+    Queries are immutable: :meth:`where` and ``&`` return new queries.
+
+    Args:
+        resource: Searchable resource (``constituents``, ``gifts``,
+            ``volunteer_times`` or ``contact_reports``)
+        terms: Serialized terms (use :meth:`where` instead)
+    """
+
+    def __init__(self, resource: str, terms: Tuple[SearchTerm, ...] = ()) -> None:
+        if resource not in SEARCH_SCHEMAS:
+            raise ValueError(
+                f"Unknown search resource: {resource!r} "
+                f"(expected one of {', '.join(SEARCH_SCHEMAS)})"
+            )
+        self.resource = resource
+        self.terms = tuple(terms)
+
+    def where(self, field: str, *values: Any, op: Optional[str] = None) -> "SearchQuery":
+        """Add a term every result must match.
+
+        Args:
+            field: Search term name from the resource's schema
+            *values: Term arguments, e.g. an ID list, one or two numbers, or a
+                custom attribute key followed by its value
+            op: Operator for fields that take one (``in``/``ni``/``bl`` for
+                ID lists, ``gte``/``btw``/... for numbers, ``ft``/``eq``/...
+                for custom text attributes)
+
+        Returns:
+            New query including the term
+        """
+        schema = SEARCH_SCHEMAS[self.resource]
+        spec = schema.get(field)
+        if spec is None:
+            raise ValueError(
+                f"{field!r} is not a search term for {self.resource} "
+                f"(expected one of {', '.join(sorted(schema))})"
+            )
+        term = SearchTerm(field, _serialize(field, spec, values, op))
+        return SearchQuery(self.resource, self.terms + (term,))
+
+    def __and__(self, other: "SearchQuery") -> "SearchQuery":
+        if not isinstance(other, SearchQuery):
+            return NotImplemented
+        if other.resource != self.resource:
+            raise ValueError(
+                f"Cannot combine {self.resource} and {other.resource} queries"
+            )
+        return SearchQuery(self.resource, self.terms + other.terms)
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SearchQuery):
+            return NotImplemented
+        return (self.resource, self.terms) == (other.resource, other.terms)
+
+    def __hash__(self) -> int:
+        return hash((self.resource, self.terms))
+
+    def __str__(self) -> str:
+        return ";".join(str(term) for term in self.terms)
+
+    def __repr__(self) -> str:
+        return f"SearchQuery({self.resource!r}, {str(self)!r})"
+
+    def to_params(self) -> Dict[str, List[str]]:
+        """Request parameters carrying the query (empty when there are no terms)."""
+        return {"q": [str(self)]} if self.terms else {}
+
+    def for_resource(self, resource: str) -> "SearchQuery":
+        """Check the query targets ``resource`` before sending it there."""
+        if self.resource != resource:
+            raise ValueError(
+                f"A {self.resource} query cannot be sent to {resource}/search"
+            )
+        return self
@@ -0,0 +1,147 @@
+"""Coalescing of identical concurrent GET requests.
+
+With ``coalesce_requests=True`` the client runs at most one request per
+path and query at a time. Callers asking for the same resource while it is
+in flight wait for that request and receive its result (or its error)
+instead of sending their own::
+
+    client = new_client(api_key, coalesce_requests=True)
+    # Ten threads calling client.constituents.retrieve(42) at once
+    # produce one HTTP request
+    client._client.single_flight.snapshot()
+    # {'calls': 1, 'deduplicated': 9}
+
+Only requests that overlap in time are shared; nothing is cached once the
+request completes. All waiters receive the same decoded object, so callers
+must not mutate the dicts returned by ``_get``.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar, cast
+
+T = TypeVar('T')
+
+
+class _Call:
+    """A request in flight and the callers waiting for it."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Thread-safe single-flight group.
+
+    Attributes:
+        calls: Functions actually executed
+        deduplicated: Callers served by another caller's execution
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.deduplicated = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Run ``func`` unless a call with the same key is running; share its outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+                leader = True
+            else:
+                self.deduplicated += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return cast(T, call.result)
+
+        try:
+            result = call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return result
+
+    @property
+    def in_flight(self) -> int:
+        """Keys currently being fetched."""
+        with self._lock:
+            return len(self._calls)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Copy of the counters as ``{calls, deduplicated}``."""
+        with self._lock:
+            return {"calls": self.calls, "deduplicated": self.deduplicated}
+
+    def reset(self) -> None:
+        """Clear the counters."""
+        with self._lock:
+            self.calls = 0
+            self.deduplicated = 0
+
+
+class AsyncSingleFlight(SingleFlight):
+    """Single-flight group for coroutines running on one event loop.
+
+    If the task running a shared request is cancelled, its waiters are not:
+    the first of them runs the request again.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._futures: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(  # type: ignore[override]
+        self, key: Hashable, func: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Await ``func`` unless a call with the same key is running; share its outcome."""
+        while True:
+            future = self._futures.get(key)
+            if future is None:
+                break
+            self.deduplicated += 1
+            try:
+                return cast(T, await asyncio.shield(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was cancelled, not us: run the request ourselves
+                self.deduplicated -= 1
+
+        future = self._futures[key] = asyncio.get_running_loop().create_future()
+        self.calls += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark it retrieved: with no waiters asyncio would log it as lost
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._futures[key]
+
+    @property
+    def in_flight(self) -> int:
+        """Keys currently being fetched."""
+        return len(self._futures)
@@ -1,12 +1,38 @@
 """Street Addresses API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.constituent import StreetAddress
 
 
-class StreetAddressesAPI:
+class _StreetAddressesMixin:
+    """Query parameters and payloads shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _address_data(
+        street: str, city: str, state: str, postal_code: str, country: str, **extra: Any
+    ) -> Dict[str, Any]:
+        return {
+            "street": street,
+            "city": city,
+            "state": state,
+            "postal_code": postal_code,
+            "country": country,
+            **extra
+        }
+
+
+class StreetAddressesAPI(_StreetAddressesMixin):
     """API for managing constituent street addresses."""
     
     def __init__(self, client: LGLClient):
@@ -28,14 +54,24 @@ class StreetAddressesAPI:
         Returns:
             Paginated response with street address items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/street_addresses', **params)
     
+    def iter_all(self, constituent_id: int) -> Iterator[StreetAddress]:
+        """Iterate over all street addresses for a constituent, one page at a time.
+        
+        Args:
+            constituent_id: The constituent ID
+        
+        Yields:
+            StreetAddress objects
+        """
+        def _list_page(**kwargs):
+            return self.list(constituent_id, **kwargs)
+        
+        for item in self.client._paginate(_list_page):
+            yield StreetAddress(**item)
+    
     def fetch_all(self, constituent_id: int) -> List[StreetAddress]:
         """Fetch all street addresses for a constituent with automatic pagination.
         
@@ -45,11 +81,7 @@ class StreetAddressesAPI:
         Returns:
             List of all StreetAddress objects
         """
-        def _list_page(**kwargs):
-            return self.list(constituent_id, **kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [StreetAddress(**item) for item in items]
+        return list(self.iter_all(constituent_id))
     
     def retrieve(self, street_address_id: int) -> StreetAddress:
         """Retrieve a specific street address by ID.
@@ -140,15 +172,10 @@ class StreetAddressesAPI:
         Returns:
             Created StreetAddress object
         """
-        return self.create(constituent_id, {
-            "street": street,
-            "city": city,
-            "state": state,
-            "postal_code": postal_code,
-            "country": country,
-            "street_type_name": "Home",
-            "is_preferred": is_preferred
-        })
+        return self.create(constituent_id, self._address_data(
+            street, city, state, postal_code, country,
+            street_type_name="Home", is_preferred=is_preferred
+        ))
     
     def create_work_address(
         self, 
@@ -174,15 +201,10 @@ class StreetAddressesAPI:
         Returns:
             Created StreetAddress object
         """
-        return self.create(constituent_id, {
-            "street": street,
-            "city": city,
-            "state": state,
-            "postal_code": postal_code,
-            "country": country,
-            "street_type_name": "Work",
-            "is_preferred": is_preferred
-        })
+        return self.create(constituent_id, self._address_data(
+            street, city, state, postal_code, country,
+            street_type_name="Work", is_preferred=is_preferred
+        ))
     
     def create_seasonal_address(
         self, 
@@ -210,17 +232,11 @@ class StreetAddressesAPI:
         Returns:
             Created StreetAddress object
         """
-        return self.create(constituent_id, {
-            "street": street,
-            "city": city,
-            "state": state,
-            "postal_code": postal_code,
-            "country": country,
-            "seasonal": True,
-            "seasonal_from": seasonal_from,
-            "seasonal_to": seasonal_to,
-            "street_type_name": "Seasonal"
-        })
+        return self.create(constituent_id, self._address_data(
+            street, city, state, postal_code, country,
+            seasonal=True, seasonal_from=seasonal_from, seasonal_to=seasonal_to,
+            street_type_name="Seasonal"
+        ))
     
     def set_preferred(self, street_address_id: int) -> StreetAddress:
         """Set a street address as preferred.
@@ -242,4 +258,111 @@ class StreetAddressesAPI:
         Returns:
             Updated StreetAddress object
         """
-        return self.update(street_address_id, {"not_current": True})
\ No newline at end of file
+        return self.update(street_address_id, {"not_current": True})
+
+
+class AsyncStreetAddressesAPI(_StreetAddressesMixin):
+    """Async variant of :class:`StreetAddressesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all street addresses for a constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/street_addresses', **params)
+    
+    async def iter_all(self, constituent_id: int) -> AsyncIterator[StreetAddress]:
+        """Iterate over all street addresses for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list(constituent_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield StreetAddress(**item)
+    
+    async def fetch_all(self, constituent_id: int) -> List[StreetAddress]:
+        """Fetch all street addresses for a constituent with automatic pagination."""
+        return [item async for item in self.iter_all(constituent_id)]
+    
+    async def retrieve(self, street_address_id: int) -> StreetAddress:
+        """Retrieve a specific street address by ID."""
+        response = await self.client._get(f'street_addresses/{street_address_id}')
+        return StreetAddress(**response)
+    
+    async def create(self, constituent_id: int, address_data: Dict) -> StreetAddress:
+        """Create a new street address for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/street_addresses', address_data)
+        return StreetAddress(**response)
+    
+    async def update(self, street_address_id: int, address_data: Dict) -> StreetAddress:
+        """Update an existing street address."""
+        response = await self.client._patch(f'street_addresses/{street_address_id}', address_data)
+        return StreetAddress(**response)
+    
+    async def delete(self, street_address_id: int) -> Dict:
+        """Delete a street address."""
+        await self.client._delete(f'street_addresses/{street_address_id}')
+        return {"result": "success"}
+    
+    async def create_home_address(
+        self,
+        constituent_id: int,
+        street: str,
+        city: str,
+        state: str,
+        postal_code: str,
+        country: str = "United States",
+        is_preferred: bool = False
+    ) -> StreetAddress:
+        """Create a home address for a constituent."""
+        return await self.create(constituent_id, self._address_data(
+            street, city, state, postal_code, country,
+            street_type_name="Home", is_preferred=is_preferred
+        ))
+    
+    async def create_work_address(
+        self,
+        constituent_id: int,
+        street: str,
+        city: str,
+        state: str,
+        postal_code: str,
+        country: str = "United States",
+        is_preferred: bool = False
+    ) -> StreetAddress:
+        """Create a work address for a constituent."""
+        return await self.create(constituent_id, self._address_data(
+            street, city, state, postal_code, country,
+            street_type_name="Work", is_preferred=is_preferred
+        ))
+    
+    async def create_seasonal_address(
+        self,
+        constituent_id: int,
+        street: str,
+        city: str,
+        state: str,
+        postal_code: str,
+        seasonal_from: str,
+        seasonal_to: str,
+        country: str = "United States"
+    ) -> StreetAddress:
+        """Create a seasonal address for a constituent."""
+        return await self.create(constituent_id, self._address_data(
+            street, city, state, postal_code, country,
+            seasonal=True, seasonal_from=seasonal_from, seasonal_to=seasonal_to,
+            street_type_name="Seasonal"
+        ))
+    
+    async def set_preferred(self, street_address_id: int) -> StreetAddress:
+        """Set a street address as preferred."""
+        return await self.update(street_address_id, {"is_preferred": True})
+    
+    async def mark_inactive(self, street_address_id: int) -> StreetAddress:
+        """Mark a street address as inactive/not current."""
+        return await self.update(street_address_id, {"not_current": True})
@@ -1,20 +1,28 @@
 """Team Members API for LGL client."""
 
-from typing import Any, List
+from typing import Any, AsyncIterator, Dict, Iterator, List
 
 from ..models.team_member import TeamMember
-from .client import LGLClient
+from .client import AsyncLGLClient, LGLClient
 
 
-class TeamMembersAPI:
+class _TeamMembersMixin:
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "team_members"
+    
+    @staticmethod
+    def _parse_page(data: Dict[str, Any]) -> List[TeamMember]:
+        return [TeamMember.from_dict(item) for item in data.get("items", [])]
+
+
+class TeamMembersAPI(_TeamMembersMixin):
     """API for managing team members in Little Green Light.
     
     Team members represent users who have access to the LGL account
     with various roles and permission levels.
     """
     
-    _resource = "team_members"
-    
     def __init__(self, client: LGLClient) -> None:
         """Initialize Team Members API.
         
@@ -33,8 +41,19 @@ class TeamMembersAPI:
         Returns:
             List of TeamMember objects
         """
-        data = self._client._get(self._resource, limit=limit, offset=offset)
-        return [TeamMember.from_dict(item) for item in data.get("items", [])]
+        return self._parse_page(self._client._get(self._resource, limit=limit, offset=offset))
+    
+    def iter_all(self) -> Iterator[TeamMember]:
+        """Iterate over all team members, one page at a time.
+        
+        Yields:
+            TeamMember objects
+        """
+        def _list_page(**kwargs: Any) -> List[TeamMember]:
+            return self.list(**kwargs)
+        
+        for item in self._client._paginate(_list_page):
+            yield TeamMember.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[TeamMember]:
         """Fetch all team members using automatic pagination.
@@ -42,8 +61,29 @@ class TeamMembersAPI:
         Returns:
             List of all TeamMember objects
         """
-        def _list_page(**kwargs: Any) -> List[TeamMember]:
-            return self.list(**kwargs)
+        return list(self.iter_all())
+
+
+class AsyncTeamMembersAPI(_TeamMembersMixin):
+    """Async variant of :class:`TeamMembersAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient) -> None:
+        """Initialize async Team Members API.
         
-        items = list(self._client._paginate(_list_page))
-        return [TeamMember.from_dict(item) if isinstance(item, dict) else item for item in items]
\ No newline at end of file
+        Args:
+            client: Async LGL HTTP client instance
+        """
+        self._client = client
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[TeamMember]:
+        """List team members for the account."""
+        return self._parse_page(await self._client._get(self._resource, limit=limit, offset=offset))
+    
+    async def iter_all(self) -> AsyncIterator[TeamMember]:
+        """Iterate over all team members, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[TeamMember]:
+        """Fetch all team members using automatic pagination."""
+        return [item async for item in self.iter_all()]
@@ -1,27 +1,56 @@
 """Types API for LGL client."""
 
-from typing import Any, List, Literal
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional
 
 from ..models.type import Type, TypeValue
-from .client import LGLClient
+from .cache import CachedLookupMixin, ReferenceCache
+from .client import AsyncLGLClient, LGLClient
 
 
-class TypesAPI:
+class _TypesMixin(CachedLookupMixin):
+    """Paths and model parsing shared by the sync and async APIs."""
+    
+    _resource = "types"
+    
+    @staticmethod
+    def _parse_types(data: Dict[str, Any]) -> List[Type]:
+        """Build Type objects (with their values) from a types page."""
+        types = []
+        for item in data.get("items", []):
+            # Convert values to TypeValue objects
+            values = [TypeValue.from_dict(value) for value in item.get("values", [])]
+            
+            # Create Type object with values
+            type_data = {
+                "name": item["name"],
+                "key": item["key"],
+                "values": values
+            }
+            types.append(Type.from_dict(type_data))
+        
+        return types
+    
+    @staticmethod
+    def _parse_values(data: Dict[str, Any]) -> List[TypeValue]:
+        return [TypeValue.from_dict(item) for item in data.get("items", [])]
+
+
+class TypesAPI(_TypesMixin):
     """API for managing types in Little Green Light.
     
     Types define various categorization systems used throughout LGL
     (e.g., phone number types, email address types, mailing types).
     """
     
-    _resource = "types"
-    
-    def __init__(self, client: LGLClient) -> None:
+    def __init__(self, client: LGLClient, cache: Optional[ReferenceCache] = None) -> None:
         """Initialize Types API.
         
         Args:
             client: LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
         """
         self._client = client
+        self._cache = cache
     
     def list(self, *, limit: int = 25, offset: int = 0) -> List[Type]:
         """List all type groups for the account.
@@ -34,21 +63,19 @@ class TypesAPI:
             List of Type objects with their values
         """
         data = self._client._get(self._resource, limit=limit, offset=offset)
+        return self._parse_types(data)
+    
+    def iter_all(self) -> Iterator[Type]:
+        """Iterate over all type groups, one page at a time.
         
-        types = []
-        for item in data.get("items", []):
-            # Convert values to TypeValue objects
-            values = [TypeValue.from_dict(value) for value in item.get("values", [])]
-            
-            # Create Type object with values
-            type_data = {
-                "name": item["name"],
-                "key": item["key"],
-                "values": values
-            }
-            types.append(Type.from_dict(type_data))
+        Yields:
+            Type objects
+        """
+        def _list_page(**kwargs: Any) -> List[Type]:
+            return self.list(**kwargs)
         
-        return types
+        for item in self._client._paginate(_list_page):
+            yield Type.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all(self) -> List[Type]:
         """Fetch all type groups using automatic pagination.
@@ -56,11 +83,7 @@ class TypesAPI:
         Returns:
             List of all Type objects
         """
-        def _list_page(**kwargs: Any) -> List[Type]:
-            return self.list(**kwargs)
-        
-        items = list(self._client._paginate(_list_page))
-        return [Type.from_dict(item) if isinstance(item, dict) else item for item in items]
+        return self._cached("fetch_all", lambda: list(self.iter_all()))
     
     def list_values(
         self, 
@@ -84,7 +107,29 @@ class TypesAPI:
             List of TypeValue objects
         """
         data = self._client._get(f"{self._resource}/{type_key}", limit=limit, offset=offset)
-        return [TypeValue.from_dict(item) for item in data.get("items", [])]
+        return self._parse_values(data)
+    
+    def iter_all_values(
+        self, 
+        type_key: Literal[
+            "contact_report_types", "email_address_types", "mailing_types", 
+            "street_address_types", "phone_number_types", "web_address_types", 
+            "volunteering_categories", "appeal_types", "event_types", "note_types"
+        ]
+    ) -> Iterator[TypeValue]:
+        """Iterate over all values for a type, one page at a time.
+        
+        Args:
+            type_key: Type key to get values for
+            
+        Yields:
+            TypeValue objects for the type
+        """
+        def _list_page(**kwargs: Any) -> List[TypeValue]:
+            return self.list_values(type_key, **kwargs)
+        
+        for item in self._client._paginate(_list_page):
+            yield TypeValue.from_dict(item) if isinstance(item, dict) else item
     
     def fetch_all_values(
         self, 
@@ -102,8 +147,77 @@ class TypesAPI:
         Returns:
             List of all TypeValue objects for the type
         """
-        def _list_page(**kwargs: Any) -> List[TypeValue]:
-            return self.list_values(type_key, **kwargs)
+        return self._cached(
+            "fetch_all_values", lambda: list(self.iter_all_values(type_key)), type_key
+        )
+
+
+class AsyncTypesAPI(_TypesMixin):
+    """Async variant of :class:`TypesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient, cache: Optional[ReferenceCache] = None) -> None:
+        """Initialize async Types API.
+        
+        Args:
+            client: Async LGL HTTP client instance
+            cache: Optional reference-data cache shared by lookup resources
+        """
+        self._client = client
+        self._cache = cache
+    
+    async def list(self, *, limit: int = 25, offset: int = 0) -> List[Type]:
+        """List all type groups for the account."""
+        data = await self._client._get(self._resource, limit=limit, offset=offset)
+        return self._parse_types(data)
+    
+    async def iter_all(self) -> AsyncIterator[Type]:
+        """Iterate over all type groups, fetching pages as they are consumed."""
+        async for item in self._client._paginate(self.list):
+            yield item
+    
+    async def fetch_all(self) -> List[Type]:
+        """Fetch all type groups using automatic pagination."""
+        return await self._acached("fetch_all", lambda: self._collect(self.iter_all()))
+    
+    async def list_values(
+        self, 
+        type_key: Literal[
+            "contact_report_types", "email_address_types", "mailing_types", 
+            "street_address_types", "phone_number_types", "web_address_types", 
+            "volunteering_categories", "appeal_types", "event_types", "note_types"
+        ], 
+        *, 
+        limit: int = 25, 
+        offset: int = 0
+    ) -> List[TypeValue]:
+        """List values for a specific type."""
+        data = await self._client._get(f"{self._resource}/{type_key}", limit=limit, offset=offset)
+        return self._parse_values(data)
+    
+    async def iter_all_values(
+        self, 
+        type_key: Literal[
+            "contact_report_types", "email_address_types", "mailing_types", 
+            "street_address_types", "phone_number_types", "web_address_types", 
+            "volunteering_categories", "appeal_types", "event_types", "note_types"
+        ]
+    ) -> AsyncIterator[TypeValue]:
+        """Iterate over all values for a type, fetching pages as they are consumed."""
+        async def _list_page(**kwargs: Any) -> List[TypeValue]:
+            return await self.list_values(type_key, **kwargs)
         
-        items = list(self._client._paginate(_list_page))
-        return [TypeValue.from_dict(item) if isinstance(item, dict) else item for item in items]
\ No newline at end of file
+        async for item in self._client._paginate(_list_page):
+            yield item
+    
+    async def fetch_all_values(
+        self, 
+        type_key: Literal[
+            "contact_report_types", "email_address_types", "mailing_types", 
+            "street_address_types", "phone_number_types", "web_address_types", 
+            "volunteering_categories", "appeal_types", "event_types", "note_types"
+        ]
+    ) -> List[TypeValue]:
+        """Fetch all values for a type using automatic pagination."""
+        return await self._acached(
+            "fetch_all_values", lambda: self._collect(self.iter_all_values(type_key)), type_key
+        )
@@ -1,13 +1,95 @@
 """Volunteer Times API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 from datetime import date
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.volunteer_time import VolunteerTime
+from .search_query import SearchQuery
 
 
-class VolunteerTimesAPI:
+class _VolunteerTimesMixin:
+    """Query parameters and payloads shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _search_params(
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        description: Optional[str] = None,
+        volunteering_category_id: Optional[int] = None,
+        constituent_id: Optional[int] = None,
+        constituent_keyword: Optional[str] = None,
+        updated_from: Optional[date] = None,
+        updated_to: Optional[date] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        query: Optional[SearchQuery] = None
+    ) -> Dict[str, Any]:
+        q = (
+            SearchQuery('volunteer_times') if query is None
+            else query.for_resource('volunteer_times')
+        )
+        if date_from is not None:
+            q = q.where('date_from', date_from)
+        if date_to is not None:
+            q = q.where('date_to', date_to)
+        if description is not None:
+            q = q.where('description', description)
+        if volunteering_category_id is not None:
+            q = q.where('volunteering_category_id', volunteering_category_id)
+        if constituent_id is not None:
+            q = q.where('constituent_id', constituent_id)
+        if constituent_keyword is not None:
+            q = q.where('const_keyword', constituent_keyword)
+        if updated_from is not None:
+            q = q.where('updated_from', updated_from)
+        if updated_to is not None:
+            q = q.where('updated_to', updated_to)
+        
+        params: Dict[str, Any] = q.to_params()
+        if sort is not None:
+            params['sort'] = sort
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _volunteer_time_data(
+        category_id: int,
+        hours: float,
+        volunteer_date: date,
+        description: Optional[str],
+        completed_hours: Optional[float]
+    ) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "volunteering_category_id": category_id,
+            "hours": hours,
+            "date": volunteer_date.strftime('%Y-%m-%d')
+        }
+        
+        if description:
+            data["description"] = description
+        if completed_hours is not None:
+            data["completed_hours"] = completed_hours
+        else:
+            data["completed_hours"] = hours  # Default completed to planned
+        
+        return data
+
+
+class VolunteerTimesAPI(_VolunteerTimesMixin):
     """API for managing volunteer time records."""
     
     def __init__(self, client: LGLClient):
@@ -29,12 +111,7 @@ class VolunteerTimesAPI:
         Returns:
             Paginated response with volunteer time items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/volunteer_times', **params)
     
     def list_all(
@@ -51,12 +128,7 @@ class VolunteerTimesAPI:
         Returns:
             Paginated response with volunteer time items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get('volunteer_times', **params)
     
     def search(
@@ -71,10 +143,14 @@ class VolunteerTimesAPI:
         updated_to: Optional[date] = None,
         sort: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        query: Optional[SearchQuery] = None
     ) -> Dict:
         """Search for volunteer times with various criteria.
         
+        The criteria are sent as one ``q[]`` expression (see
+        :class:`SearchQuery`).
+        
         Args:
             date_from: Start date for volunteer time records (YYYY-MM-DD)
             date_to: End date for volunteer time records (YYYY-MM-DD)
@@ -87,36 +163,31 @@ class VolunteerTimesAPI:
             sort: Sort field (date, constituent_id) with optional '!' for reverse
             limit: Number of entries to return
             offset: Start at given entry
+            query: Further volunteer_times search terms, combined with the above
         
         Returns:
             Paginated response with volunteer time items
         """
-        params = {}
+        params = self._search_params(
+            date_from, date_to, description, volunteering_category_id, constituent_id,
+            constituent_keyword, updated_from, updated_to, sort, limit, offset, query
+        )
+        return self.client._get('volunteer_times/search', **params)
+    
+    def iter_all(self, constituent_id: int) -> Iterator[VolunteerTime]:
+        """Iterate over all volunteer times for a constituent, one page at a time.
         
-        if date_from is not None:
-            params['date_from'] = date_from.strftime('%Y-%m-%d')
-        if date_to is not None:
-            params['date_to'] = date_to.strftime('%Y-%m-%d')
-        if description is not None:
-            params['description'] = description
-        if volunteering_category_id is not None:
-            params['volunteering_category_id'] = volunteering_category_id
-        if constituent_id is not None:
-            params['constituent_id'] = constituent_id
-        if constituent_keyword is not None:
-            params['constituent_keyword'] = constituent_keyword
-        if updated_from is not None:
-            params['updated_from'] = updated_from.strftime('%Y-%m-%d')
-        if updated_to is not None:
-            params['updated_to'] = updated_to.strftime('%Y-%m-%d')
-        if sort is not None:
-            params['sort'] = sort
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
+        Args:
+            constituent_id: The constituent ID
         
-        return self.client._get('volunteer_times/search', **params)
+        Yields:
+            VolunteerTime objects
+        """
+        def _list_page(**kwargs):
+            return self.list(constituent_id, **kwargs)
+        
+        for item in self.client._paginate(_list_page):
+            yield VolunteerTime(**item)
     
     def fetch_all(self, constituent_id: int) -> List[VolunteerTime]:
         """Fetch all volunteer times for a constituent with automatic pagination.
@@ -127,25 +198,41 @@ class VolunteerTimesAPI:
         Returns:
             List of all VolunteerTime objects
         """
+        return list(self.iter_all(constituent_id))
+    
+    def iter_all_account_volunteer_times(
+        self, *, concurrency: Optional[int] = None
+    ) -> Iterator[VolunteerTime]:
+        """Iterate over all volunteer times for the account, one page at a time.
+        
+        Args:
+            concurrency: Pages fetched in parallel (defaults to the client's
+                ``page_concurrency``)
+        
+        Yields:
+            VolunteerTime objects in the account
+        """
         def _list_page(**kwargs):
-            return self.list(constituent_id, **kwargs)
+            return self.list_all(**kwargs)
         
-        items = list(self.client._paginate(_list_page))
-        return [VolunteerTime(**item) for item in items]
+        for item in self.client._paginate(_list_page, concurrency=concurrency):
+            yield VolunteerTime(**item)
     
-    def fetch_all_account_volunteer_times(self) -> List[VolunteerTime]:
+    def fetch_all_account_volunteer_times(
+        self, *, concurrency: Optional[int] = None
+    ) -> List[VolunteerTime]:
         """Fetch all volunteer times for the account with automatic pagination.
         
+        Args:
+            concurrency: Pages fetched in parallel (defaults to the client's
+                ``page_concurrency``)
+        
         Returns:
             List of all VolunteerTime objects in the account
         """
-        def _list_page(**kwargs):
-            return self.list_all(**kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [VolunteerTime(**item) for item in items]
+        return list(self.iter_all_account_volunteer_times(concurrency=concurrency))
     
-    def search_volunteer_times(
+    def iter_search(
         self,
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
@@ -153,8 +240,8 @@ class VolunteerTimesAPI:
         volunteering_category_id: Optional[int] = None,
         constituent_id: Optional[int] = None,
         sort: Optional[str] = None
-    ) -> List[VolunteerTime]:
-        """Search for volunteer times and return as VolunteerTime objects.
+    ) -> Iterator[VolunteerTime]:
+        """Iterate over all matching volunteer times, one page at a time.
         
         Args:
             date_from: Start date for volunteer time records
@@ -164,8 +251,8 @@ class VolunteerTimesAPI:
             constituent_id: Filter by constituent ID
             sort: Sort field (date, constituent_id) with optional '!' for reverse
         
-        Returns:
-            List of VolunteerTime objects
+        Yields:
+            VolunteerTime objects
         """
         def _search_page(**kwargs):
             return self.search(
@@ -178,8 +265,34 @@ class VolunteerTimesAPI:
                 **kwargs
             )
         
-        items = list(self.client._paginate(_search_page))
-        return [VolunteerTime(**item) for item in items]
+        for item in self.client._paginate(_search_page):
+            yield VolunteerTime(**item)
+    
+    def search_volunteer_times(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        description: Optional[str] = None,
+        volunteering_category_id: Optional[int] = None,
+        constituent_id: Optional[int] = None,
+        sort: Optional[str] = None
+    ) -> List[VolunteerTime]:
+        """Search for volunteer times and return as VolunteerTime objects.
+        
+        Args:
+            date_from: Start date for volunteer time records
+            date_to: End date for volunteer time records
+            description: Text to search in description field
+            volunteering_category_id: Filter by volunteering category ID
+            constituent_id: Filter by constituent ID
+            sort: Sort field (date, constituent_id) with optional '!' for reverse
+        
+        Returns:
+            List of VolunteerTime objects
+        """
+        return list(self.iter_search(
+            date_from, date_to, description, volunteering_category_id, constituent_id, sort
+        ))
     
     def retrieve(self, volunteer_time_id: int) -> VolunteerTime:
         """Retrieve a specific volunteer time by ID.
@@ -263,19 +376,7 @@ class VolunteerTimesAPI:
         Returns:
             Created VolunteerTime object
         """
-        data = {
-            "volunteering_category_id": category_id,
-            "hours": hours,
-            "date": volunteer_date.strftime('%Y-%m-%d')
-        }
-        
-        if description:
-            data["description"] = description
-        if completed_hours is not None:
-            data["completed_hours"] = completed_hours
-        else:
-            data["completed_hours"] = hours  # Default completed to planned
-        
+        data = self._volunteer_time_data(category_id, hours, volunteer_date, description, completed_hours)
         return self.create(constituent_id, data)
     
     def mark_completed(self, volunteer_time_id: int, completed_hours: float) -> VolunteerTime:
@@ -313,4 +414,167 @@ class VolunteerTimesAPI:
         Returns:
             List of matching VolunteerTime objects
         """
-        return self.search_volunteer_times(date_from=start_date, date_to=end_date, **kwargs)
\ No newline at end of file
+        return self.search_volunteer_times(date_from=start_date, date_to=end_date, **kwargs)
+
+
+class AsyncVolunteerTimesAPI(_VolunteerTimesMixin):
+    """Async variant of :class:`VolunteerTimesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all volunteer times for a constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/volunteer_times', **params)
+    
+    async def list_all(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all volunteer times for the account."""
+        params = self._page_params(limit, offset)
+        return await self.client._get('volunteer_times', **params)
+    
+    async def search(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        description: Optional[str] = None,
+        volunteering_category_id: Optional[int] = None,
+        constituent_id: Optional[int] = None,
+        constituent_keyword: Optional[str] = None,
+        updated_from: Optional[date] = None,
+        updated_to: Optional[date] = None,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        query: Optional[SearchQuery] = None
+    ) -> Dict:
+        """Search for volunteer times with various criteria."""
+        params = self._search_params(
+            date_from, date_to, description, volunteering_category_id, constituent_id,
+            constituent_keyword, updated_from, updated_to, sort, limit, offset, query
+        )
+        return await self.client._get('volunteer_times/search', **params)
+    
+    async def iter_all(self, constituent_id: int) -> AsyncIterator[VolunteerTime]:
+        """Iterate over all volunteer times for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list(constituent_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield VolunteerTime(**item)
+    
+    async def fetch_all(self, constituent_id: int) -> List[VolunteerTime]:
+        """Fetch all volunteer times for a constituent with automatic pagination."""
+        return [item async for item in self.iter_all(constituent_id)]
+    
+    async def iter_all_account_volunteer_times(
+        self, *, concurrency: Optional[int] = None
+    ) -> AsyncIterator[VolunteerTime]:
+        """Iterate over all volunteer times in the account, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list_all(**kwargs)
+        
+        async for item in self.client._paginate(_list_page, concurrency=concurrency):
+            yield VolunteerTime(**item)
+    
+    async def fetch_all_account_volunteer_times(
+        self, *, concurrency: Optional[int] = None
+    ) -> List[VolunteerTime]:
+        """Fetch all volunteer times for the account with automatic pagination."""
+        return [
+            item async for item in self.iter_all_account_volunteer_times(concurrency=concurrency)
+        ]
+    
+    async def iter_search(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        description: Optional[str] = None,
+        volunteering_category_id: Optional[int] = None,
+        constituent_id: Optional[int] = None,
+        sort: Optional[str] = None
+    ) -> AsyncIterator[VolunteerTime]:
+        """Iterate over all matching volunteer times, page by page."""
+        async def _search_page(**kwargs: Any) -> Dict:
+            return await self.search(
+                date_from=date_from,
+                date_to=date_to,
+                description=description,
+                volunteering_category_id=volunteering_category_id,
+                constituent_id=constituent_id,
+                sort=sort,
+                **kwargs
+            )
+        
+        async for item in self.client._paginate(_search_page):
+            yield VolunteerTime(**item)
+    
+    async def search_volunteer_times(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        description: Optional[str] = None,
+        volunteering_category_id: Optional[int] = None,
+        constituent_id: Optional[int] = None,
+        sort: Optional[str] = None
+    ) -> List[VolunteerTime]:
+        """Search for volunteer times with automatic pagination."""
+        return [
+            item async for item in self.iter_search(
+                date_from, date_to, description, volunteering_category_id, constituent_id, sort
+            )
+        ]
+    
+    async def retrieve(self, volunteer_time_id: int) -> VolunteerTime:
+        """Retrieve a specific volunteer time record by ID."""
+        response = await self.client._get(f'volunteer_times/{volunteer_time_id}')
+        return VolunteerTime(**response)
+    
+    async def create(self, constituent_id: int, volunteer_time_data: Dict) -> VolunteerTime:
+        """Create a new volunteer time record for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/volunteer_times', volunteer_time_data)
+        return VolunteerTime(**response)
+    
+    async def update(self, volunteer_time_id: int, volunteer_time_data: Dict) -> VolunteerTime:
+        """Update an existing volunteer time record."""
+        response = await self.client._patch(f'volunteer_times/{volunteer_time_id}', volunteer_time_data)
+        return VolunteerTime(**response)
+    
+    async def delete(self, volunteer_time_id: int) -> Dict:
+        """Delete a volunteer time record."""
+        await self.client._delete(f'volunteer_times/{volunteer_time_id}')
+        return {"result": "success"}
+    
+    async def create_volunteer_time(
+        self,
+        constituent_id: int,
+        category_id: int,
+        hours: float,
+        volunteer_date: date,
+        description: Optional[str] = None,
+        completed_hours: Optional[float] = None
+    ) -> VolunteerTime:
+        """Create a volunteer time record with common parameters."""
+        data = self._volunteer_time_data(category_id, hours, volunteer_date, description, completed_hours)
+        return await self.create(constituent_id, data)
+    
+    async def mark_completed(self, volunteer_time_id: int, completed_hours: float) -> VolunteerTime:
+        """Mark a volunteer time record as completed with actual hours."""
+        return await self.update(volunteer_time_id, {"completed_hours": completed_hours})
+    
+    async def search_by_category(self, category_id: int, **kwargs: Any) -> List[VolunteerTime]:
+        """Search volunteer times by category ID."""
+        return await self.search_volunteer_times(volunteering_category_id=category_id, **kwargs)
+    
+    async def search_by_date_range(self, start_date: date, end_date: date, **kwargs: Any) -> List[VolunteerTime]:
+        """Search volunteer times within a date range."""
+        return await self.search_volunteer_times(date_from=start_date, date_to=end_date, **kwargs)
@@ -1,12 +1,33 @@
 """Web Addresses API for LGL client."""
 
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from ..lgl_api.client import LGLClient
+from ..lgl_api.client import AsyncLGLClient, LGLClient
 from ..models.constituent import WebAddress
 
 
-class WebAddressesAPI:
+class _WebAddressesMixin:
+    """Query parameters and payloads shared by the sync and async APIs."""
+    
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: Optional[int]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+    
+    @staticmethod
+    def _typed_web_address(type_name: str, url: str, is_preferred: bool) -> Dict[str, Any]:
+        return {
+            "url": url,
+            "web_address_type_name": type_name,
+            "is_preferred": is_preferred
+        }
+
+
+class WebAddressesAPI(_WebAddressesMixin):
     """API for managing constituent web addresses."""
     
     def __init__(self, client: LGLClient):
@@ -28,14 +49,24 @@ class WebAddressesAPI:
         Returns:
             Paginated response with web address items
         """
-        params = {}
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
-        
+        params = self._page_params(limit, offset)
         return self.client._get(f'constituents/{constituent_id}/web_addresses', **params)
     
+    def iter_all(self, constituent_id: int) -> Iterator[WebAddress]:
+        """Iterate over all web addresses for a constituent, one page at a time.
+        
+        Args:
+            constituent_id: The constituent ID
+        
+        Yields:
+            WebAddress objects
+        """
+        def _list_page(**kwargs):
+            return self.list(constituent_id, **kwargs)
+        
+        for item in self.client._paginate(_list_page):
+            yield WebAddress(**item)
+    
     def fetch_all(self, constituent_id: int) -> List[WebAddress]:
         """Fetch all web addresses for a constituent with automatic pagination.
         
@@ -45,11 +76,7 @@ class WebAddressesAPI:
         Returns:
             List of all WebAddress objects
         """
-        def _list_page(**kwargs):
-            return self.list(constituent_id, **kwargs)
-        
-        items = list(self.client._paginate(_list_page))
-        return [WebAddress(**item) for item in items]
+        return list(self.iter_all(constituent_id))
     
     def retrieve(self, web_address_id: int) -> WebAddress:
         """Retrieve a specific web address by ID.
@@ -118,11 +145,7 @@ class WebAddressesAPI:
         Returns:
             Created WebAddress object
         """
-        return self.create(constituent_id, {
-            "url": url,
-            "web_address_type_name": "Website",
-            "is_preferred": is_preferred
-        })
+        return self.create(constituent_id, self._typed_web_address("Website", url, is_preferred))
     
     def create_facebook(self, constituent_id: int, url: str, is_preferred: bool = False) -> WebAddress:
         """Create a Facebook address for a constituent.
@@ -135,11 +158,7 @@ class WebAddressesAPI:
         Returns:
             Created WebAddress object
         """
-        return self.create(constituent_id, {
-            "url": url,
-            "web_address_type_name": "Facebook",
-            "is_preferred": is_preferred
-        })
+        return self.create(constituent_id, self._typed_web_address("Facebook", url, is_preferred))
     
     def create_linkedin(self, constituent_id: int, url: str, is_preferred: bool = False) -> WebAddress:
         """Create a LinkedIn address for a constituent.
@@ -152,11 +171,7 @@ class WebAddressesAPI:
         Returns:
             Created WebAddress object
         """
-        return self.create(constituent_id, {
-            "url": url,
-            "web_address_type_name": "LinkedIn",
-            "is_preferred": is_preferred
-        })
+        return self.create(constituent_id, self._typed_web_address("LinkedIn", url, is_preferred))
     
     def create_twitter(self, constituent_id: int, url: str, is_preferred: bool = False) -> WebAddress:
         """Create a Twitter address for a constituent.
@@ -169,11 +184,7 @@ class WebAddressesAPI:
         Returns:
             Created WebAddress object
         """
-        return self.create(constituent_id, {
-            "url": url,
-            "web_address_type_name": "Twitter",
-            "is_preferred": is_preferred
-        })
+        return self.create(constituent_id, self._typed_web_address("Twitter", url, is_preferred))
     
     def set_preferred(self, web_address_id: int) -> WebAddress:
         """Set a web address as preferred.
@@ -184,4 +195,73 @@ class WebAddressesAPI:
         Returns:
             Updated WebAddress object
         """
-        return self.update(web_address_id, {"is_preferred": True})
\ No newline at end of file
+        return self.update(web_address_id, {"is_preferred": True})
+
+
+class AsyncWebAddressesAPI(_WebAddressesMixin):
+    """Async variant of :class:`WebAddressesAPI` backed by :class:`AsyncLGLClient`."""
+    
+    def __init__(self, client: AsyncLGLClient):
+        self.client = client
+    
+    async def list(
+        self,
+        constituent_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict:
+        """List all web addresses for a constituent."""
+        params = self._page_params(limit, offset)
+        return await self.client._get(f'constituents/{constituent_id}/web_addresses', **params)
+    
+    async def iter_all(self, constituent_id: int) -> AsyncIterator[WebAddress]:
+        """Iterate over all web addresses for a constituent, page by page."""
+        async def _list_page(**kwargs: Any) -> Dict:
+            return await self.list(constituent_id, **kwargs)
+        
+        async for item in self.client._paginate(_list_page):
+            yield WebAddress(**item)
+    
+    async def fetch_all(self, constituent_id: int) -> List[WebAddress]:
+        """Fetch all web addresses for a constituent with automatic pagination."""
+        return [item async for item in self.iter_all(constituent_id)]
+    
+    async def retrieve(self, web_address_id: int) -> WebAddress:
+        """Retrieve a specific web address by ID."""
+        response = await self.client._get(f'web_addresses/{web_address_id}')
+        return WebAddress(**response)
+    
+    async def create(self, constituent_id: int, web_data: Dict) -> WebAddress:
+        """Create a new web address for a constituent."""
+        response = await self.client._post(f'constituents/{constituent_id}/web_addresses', web_data)
+        return WebAddress(**response)
+    
+    async def update(self, web_address_id: int, web_data: Dict) -> WebAddress:
+        """Update an existing web address."""
+        response = await self.client._patch(f'web_addresses/{web_address_id}', web_data)
+        return WebAddress(**response)
+    
+    async def delete(self, web_address_id: int) -> Dict:
+        """Delete a web address."""
+        await self.client._delete(f'web_addresses/{web_address_id}')
+        return {"result": "success"}
+    
+    async def create_website(self, constituent_id: int, url: str, is_preferred: bool = False) -> WebAddress:
+        """Create a website address for a constituent."""
+        return await self.create(constituent_id, self._typed_web_address("Website", url, is_preferred))
+    
+    async def create_facebook(self, constituent_id: int, url: str, is_preferred: bool = False) -> WebAddress:
+        """Create a Facebook address for a constituent."""
+        return await self.create(constituent_id, self._typed_web_address("Facebook", url, is_preferred))
+    
+    async def create_linkedin(self, constituent_id: int, url: str, is_preferred: bool = False) -> WebAddress:
+        """Create a LinkedIn address for a constituent."""
+        return await self.create(constituent_id, self._typed_web_address("LinkedIn", url, is_preferred))
+    
+    async def create_twitter(self, constituent_id: int, url: str, is_preferred: bool = False) -> WebAddress:
+        """Create a Twitter address for a constituent."""
+        return await self.create(constituent_id, self._typed_web_address("Twitter", url, is_preferred))
+    
+    async def set_preferred(self, web_address_id: int) -> WebAddress:
+        """Set a web address as preferred."""
+        return await self.update(web_address_id, {"is_preferred": True})
@@ -0,0 +1,25 @@
+"""Local SQLite mirror of an LGL account.
+
+:class:`Mirror` keeps constituents (with their expanded children), gifts,
+notes, volunteer time and lookup tables in a normalized SQLite database,
+refreshed incrementally through ``updated_from``::
+
+    from lgl_client import new_client
+    from lgl_client.mirror import Mirror
+
+    with Mirror("lgl.sqlite", new_client(api_key)) as mirror:
+        mirror.refresh()
+        print(mirror.constituent(123).email_addresses)
+"""
+
+from .schema import ALL_TABLES, LOOKUP_MODELS, Table
+from .store import CONSTITUENT_EXPAND, Mirror, MirrorStateStore
+
+__all__ = [
+    "ALL_TABLES",
+    "CONSTITUENT_EXPAND",
+    "LOOKUP_MODELS",
+    "Mirror",
+    "MirrorStateStore",
+    "Table",
+]
@@ -0,0 +1,227 @@
+"""Table layout of the local mirror database.
+
+Every table stores the full record as JSON in a ``data`` column and copies
+the fields used for lookups and joins into typed, indexed columns. A
+constituent's expanded children (email addresses, memberships, ...) live in
+their own tables keyed by ``constituent_id`` instead of inside the
+constituent row, so they can be queried and replaced independently.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Type
+
+from ..models import LGLModel
+from ..models.appeal import Appeal
+from ..models.campaign import Campaign
+from ..models.category import Category
+from ..models.class_affiliation_type import ClassAffiliationType
+from ..models.constituent import (
+    ClassAffiliation,
+    Constituent,
+    ConstituentCategory,
+    ConstituentRelationship,
+    EmailAddress,
+    GroupMembership,
+    Membership,
+    PhoneNumber,
+    StreetAddress,
+    WebAddress,
+)
+from ..models.event import Event
+from ..models.fund import Fund
+from ..models.gift import Gift
+from ..models.gift_category import GiftCategory
+from ..models.gift_type import GiftType
+from ..models.group import Group
+from ..models.membership_level import MembershipLevel
+from ..models.note import Note
+from ..models.payment_type import PaymentType
+from ..models.relationship_type import RelationshipType
+from ..models.volunteer_time import VolunteerTime
+
+SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Table:
+    """One mirrored record type.
+
+    Attributes:
+        name: Table name
+        model: Model class stored in the table
+        columns: Typed ``(name, SQL type)`` columns copied from the model
+        primary_key: Columns identifying a row
+        indexes: Columns with a secondary index
+        child_of: Constituent field the rows come from, for child tables
+    """
+
+    name: str
+    model: Type[LGLModel]
+    columns: Tuple[Tuple[str, str], ...]
+    primary_key: Tuple[str, ...] = ("id",)
+    indexes: Tuple[str, ...] = ()
+    child_of: Optional[str] = None
+
+    @property
+    def column_names(self) -> List[str]:
+        """Typed columns followed by the JSON ``data`` column."""
+        return [name for name, _ in self.columns] + ["data"]
+
+    def ddl(self) -> List[str]:
+        """CREATE statements for the table and its indexes."""
+        columns = ", ".join(f"{name} {sql_type}" for name, sql_type in self.columns)
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {self.name} ("
+            f"{columns}, data TEXT NOT NULL, "
+            f"PRIMARY KEY ({', '.join(self.primary_key)}))"
+        ]
+        for column in self.indexes:
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS ix_{self.name}_{column} "
+                f"ON {self.name} ({column})"
+            )
+        return statements
+
+
+def _child(
+    name: str,
+    model: Type[LGLModel],
+    field: str,
+    *columns: Tuple[str, str],
+    primary_key: Tuple[str, ...] = ("id",),
+) -> Table:
+    """Table holding one expanded collection of the constituent record."""
+    return Table(
+        name,
+        model,
+        (("id", "INTEGER NOT NULL"), ("constituent_id", "INTEGER NOT NULL")) + columns,
+        primary_key=primary_key,
+        indexes=("constituent_id",) + tuple(column for column, _ in columns),
+        child_of=field,
+    )
+
+
+CONSTITUENTS = Table(
+    "constituents",
+    Constituent,
+    (
+        ("id", "INTEGER NOT NULL"),
+        ("external_constituent_id", "TEXT"),
+        ("is_org", "INTEGER"),
+        ("first_name", "TEXT"),
+        ("last_name", "TEXT"),
+        ("org_name", "TEXT"),
+        ("sort_name", "TEXT"),
+        ("updated_at", "TEXT"),
+    ),
+    indexes=("external_constituent_id", "last_name", "sort_name", "updated_at"),
+)
+
+CHILD_TABLES: Tuple[Table, ...] = (
+    _child("email_addresses", EmailAddress, "email_addresses", ("address", "TEXT")),
+    _child("phone_numbers", PhoneNumber, "phone_numbers", ("number", "TEXT")),
+    _child("street_addresses", StreetAddress, "street_addresses", ("postal_code", "TEXT")),
+    _child("web_addresses", WebAddress, "web_addresses"),
+    _child(
+        "class_affiliations", ClassAffiliation, "class_affiliations",
+        ("class_affiliation_type_id", "INTEGER"),
+    ),
+    _child(
+        "relationships", ConstituentRelationship, "relationships",
+        ("related_constituent_id", "INTEGER"), ("relationship_type_id", "INTEGER"),
+    ),
+    # Category IDs repeat across constituents
+    _child(
+        "constituent_categories", ConstituentCategory, "categories",
+        primary_key=("constituent_id", "id"),
+    ),
+    _child("group_memberships", GroupMembership, "groups", ("group_id", "INTEGER")),
+    _child(
+        "memberships", Membership, "memberships",
+        ("membership_level_id", "INTEGER"), ("finish_date", "TEXT"),
+    ),
+)
+
+GIFTS = Table(
+    "gifts",
+    Gift,
+    (
+        ("id", "INTEGER NOT NULL"),
+        ("constituent_id", "INTEGER NOT NULL"),
+        ("gift_type_id", "INTEGER"),
+        ("fund_id", "INTEGER"),
+        ("campaign_id", "INTEGER"),
+        ("appeal_id", "INTEGER"),
+        ("event_id", "INTEGER"),
+        ("amount", "REAL"),
+        ("date", "TEXT"),
+        ("updated_at", "TEXT"),
+    ),
+    indexes=("constituent_id", "fund_id", "campaign_id", "appeal_id", "date"),
+)
+
+NOTES = Table(
+    "notes",
+    Note,
+    (
+        ("id", "INTEGER NOT NULL"),
+        ("constituent_id", "INTEGER NOT NULL"),
+        ("note_type_id", "INTEGER"),
+        ("updated_at", "TEXT"),
+    ),
+    indexes=("constituent_id",),
+)
+
+VOLUNTEER_TIMES = Table(
+    "volunteer_times",
+    VolunteerTime,
+    (
+        ("id", "INTEGER NOT NULL"),
+        ("constituent_id", "INTEGER NOT NULL"),
+        ("volunteering_category_id", "INTEGER"),
+        ("date", "TEXT"),
+        ("updated_at", "TEXT"),
+    ),
+    indexes=("constituent_id", "date"),
+)
+
+# Lookup resources share one table keyed by resource name
+LOOKUPS = Table(
+    "lookups",
+    LGLModel,
+    (("resource", "TEXT NOT NULL"), ("id", "INTEGER NOT NULL"), ("name", "TEXT")),
+    primary_key=("resource", "id"),
+)
+
+LOOKUP_MODELS: Dict[str, Type[LGLModel]] = {
+    "categories": Category,
+    "appeals": Appeal,
+    "campaigns": Campaign,
+    "events": Event,
+    "funds": Fund,
+    "groups": Group,
+    "gift_types": GiftType,
+    "gift_categories": GiftCategory,
+    "payment_types": PaymentType,
+    "membership_levels": MembershipLevel,
+    "relationship_types": RelationshipType,
+    "class_affiliation_types": ClassAffiliationType,
+}
+
+# Record tables refreshed through IncrementalSync, by sync resource name
+SYNCED_TABLES: Dict[str, Table] = {
+    "constituents": CONSTITUENTS,
+    "gifts": GIFTS,
+    "notes": NOTES,
+    "volunteer_times": VOLUNTEER_TIMES,
+}
+
+ALL_TABLES: Tuple[Table, ...] = (
+    (CONSTITUENTS,) + CHILD_TABLES + (GIFTS, NOTES, VOLUNTEER_TIMES, LOOKUPS)
+)
+
+STATE_DDL = (
+    "CREATE TABLE IF NOT EXISTS sync_state ("
+    "resource TEXT PRIMARY KEY, watermark TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+)
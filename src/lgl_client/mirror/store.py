@@ -0,0 +1,513 @@
+"""SQLite-backed mirror of an LGL account."""
+
+import json
+import sqlite3
+import threading
+from datetime import date, datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from ..lgl_api.search_query import format_timestamp
+from ..models import LGLModel
+from ..models.constituent import (
+    Constituent,
+    ConstituentRelationship,
+    GroupMembership,
+    Membership,
+)
+from ..models.gift import Gift
+from ..models.note import Note
+from ..models.volunteer_time import VolunteerTime
+from ..sync import IncrementalSync, SyncStateStore, Watermark
+from .schema import (
+    ALL_TABLES,
+    CHILD_TABLES,
+    CONSTITUENTS,
+    GIFTS,
+    LOOKUP_MODELS,
+    LOOKUPS,
+    NOTES,
+    SCHEMA_VERSION,
+    STATE_DDL,
+    SYNCED_TABLES,
+    VOLUNTEER_TIMES,
+    Table,
+)
+
+if TYPE_CHECKING:
+    from .. import LGL
+
+T = TypeVar('T', bound=LGLModel)
+
+# Children requested with every constituent so the mirror holds all of them
+CONSTITUENT_EXPAND = ",".join(
+    [table.child_of for table in CHILD_TABLES if table.child_of] + ["custom_attrs"]
+)
+
+# Each child table with the Constituent field its rows come from
+_CHILD_SOURCES = [(table, table.child_of) for table in CHILD_TABLES if table.child_of]
+_CHILD_FIELDS = frozenset(field for _, field in _CHILD_SOURCES)
+_CHILDREN_BY_NAME = {table.name: table for table in CHILD_TABLES}
+
+# Stay below SQLite's default limit on host parameters per statement
+_IN_CHUNK = 500
+
+
+def _sql_value(value: Any) -> Any:
+    """Convert a model attribute to a value SQLite stores and sorts correctly."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, datetime):
+        return format_timestamp(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+class MirrorStateStore(SyncStateStore):
+    """Watermarks kept in the mirror database itself.
+
+    Saving a watermark first writes the records buffered so far and commits
+    both in one transaction, so the database never claims records it does
+    not contain.
+    """
+
+    def __init__(self, mirror: "Mirror") -> None:
+        self._mirror = mirror
+
+    def load(self, resource: str) -> Optional[Watermark]:
+        row = self._mirror._conn.execute(
+            "SELECT watermark FROM sync_state WHERE resource = ?", (resource,)
+        ).fetchone()
+        return Watermark.from_dict(json.loads(row[0])) if row else None
+
+    def save(self, resource: str, watermark: Watermark) -> None:
+        self._mirror._checkpoint(resource, watermark)
+
+    def reset(self, resource: Optional[str] = None) -> None:
+        with self._mirror._lock, self._mirror._conn:
+            if resource is None:
+                self._mirror._conn.execute("DELETE FROM sync_state")
+            else:
+                self._mirror._conn.execute(
+                    "DELETE FROM sync_state WHERE resource = ?", (resource,)
+                )
+
+
+class Mirror:
+    """Normalized local copy of constituents, gifts, notes and lookup tables.
+
+    The first :meth:`refresh` downloads everything with bulk inserts; later
+    calls fetch only records updated since the previous run (see
+    :class:`~lgl_client.sync.IncrementalSync`). Reads come from SQLite and
+    return the same models as the live API::
+
+        mirror = Mirror("lgl.sqlite", new_client(api_key))
+        mirror.refresh()
+        donor = mirror.constituent(123)
+        gifts = mirror.gifts(constituent_id=123, date_from=date(2025, 1, 1))
+
+    Deletions are not visible through ``updated_from``; call :meth:`rebuild`
+    periodically to drop records removed in LGL.
+
+    Args:
+        path: SQLite database file (default: in memory)
+        lgl: Client used by :meth:`refresh`; reads work without one
+        page_size: Records requested per page while refreshing
+        batch_size: Records buffered before each bulk insert
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        lgl: Optional["LGL"] = None,
+        *,
+        page_size: int = 100,
+        batch_size: int = 500,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.lgl = lgl
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._pending: Dict[str, List[Tuple[Any, ...]]] = {}
+        self._pending_constituents: Set[int] = set()
+        self._pending_count = 0
+        self._create_schema()
+        self.state = MirrorStateStore(self)
+
+    def _create_schema(self) -> None:
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for table in ALL_TABLES:
+                for statement in table.ddl():
+                    self._conn.execute(statement)
+            for statement in STATE_DDL:
+                self._conn.execute(statement)
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is None:
+                self._conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+            elif int(row[0]) != SCHEMA_VERSION:
+                raise ValueError(
+                    f"Mirror database has schema version {row[0]}, "
+                    f"expected {SCHEMA_VERSION}; rebuild it"
+                )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "Mirror":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    # Loading
+
+    def refresh(
+        self, resources: Optional[Sequence[str]] = None, *, lookups: bool = True
+    ) -> Dict[str, int]:
+        """Bring the mirror up to date with LGL.
+
+        Args:
+            resources: Record resources to refresh (default: constituents,
+                gifts, notes and volunteer_times)
+            lookups: Also reload the lookup tables
+
+        Returns:
+            Number of records written per resource
+        """
+        if self.lgl is None:
+            raise ValueError("Mirror was created without a client; pass lgl=")
+        names = list(resources) if resources is not None else list(SYNCED_TABLES)
+        unknown = [name for name in names if name not in SYNCED_TABLES]
+        if unknown:
+            raise ValueError(
+                f"Unsupported mirror resource(s): {', '.join(unknown)} "
+                f"(expected one of {', '.join(SYNCED_TABLES)})"
+            )
+        sync = IncrementalSync(self.lgl, self.state, page_size=self.page_size)
+        counts: Dict[str, int] = {}
+        for name in names:
+            expand = CONSTITUENT_EXPAND if name == "constituents" else None
+            count = 0
+            try:
+                for record in sync.changes(name, expand=expand):
+                    self._buffer(SYNCED_TABLES[name], record)
+                    count += 1
+                with self._lock, self._conn:
+                    self._flush()
+            except BaseException:
+                # Records after the last watermark are fetched again next time
+                with self._lock:
+                    self._discard()
+                    self._conn.rollback()
+                raise
+            counts[name] = count
+        if lookups:
+            counts.update(self.refresh_lookups())
+        return counts
+
+    def refresh_lookups(self) -> Dict[str, int]:
+        """Replace the lookup tables (funds, campaigns, ...) with current data.
+
+        Returns:
+            Number of rows per lookup resource
+        """
+        if self.lgl is None:
+            raise ValueError("Mirror was created without a client; pass lgl=")
+        fetched: Dict[str, List[LGLModel]] = {}
+        for resource in LOOKUP_MODELS:
+            api = getattr(self.lgl, resource)
+            if resource == "categories":
+                fetched[resource] = [
+                    category
+                    for item_type in ("Constituent", "Gift", "VolunteerTime")
+                    for category in api.fetch_all(item_type=item_type)
+                ]
+            else:
+                fetched[resource] = api.fetch_all()
+        with self._lock, self._conn:
+            for resource, records in fetched.items():
+                self._conn.execute("DELETE FROM lookups WHERE resource = ?", (resource,))
+                self._insert(
+                    LOOKUPS,
+                    [
+                        (resource, getattr(record, "id", None),
+                         getattr(record, "name", None), record.model_dump_json())
+                        for record in records
+                    ],
+                )
+        return {resource: len(records) for resource, records in fetched.items()}
+
+    def rebuild(self) -> Dict[str, int]:
+        """Drop every mirrored record and download the account again."""
+        with self._lock, self._conn:
+            for table in ALL_TABLES:
+                self._conn.execute(f"DELETE FROM {table.name}")
+            self._conn.execute("DELETE FROM sync_state")
+        return self.refresh()
+
+    def _buffer(self, table: Table, record: LGLModel) -> None:
+        """Queue a record, writing a batch once enough have accumulated."""
+        with self._lock:
+            if isinstance(record, Constituent):
+                if record.id in self._pending_constituents:
+                    # A newer copy of a queued constituent replaces its children
+                    self._flush()
+                self._pending_constituents.add(record.id)
+                for child, field in _CHILD_SOURCES:
+                    self._pending.setdefault(child.name, []).extend(
+                        self._row(child, item, record.id)
+                        for item in getattr(record, field)
+                    )
+            self._pending.setdefault(table.name, []).append(self._row(table, record))
+            self._pending_count += 1
+            if self._pending_count >= self.batch_size:
+                self._flush()
+
+    @staticmethod
+    def _row(
+        table: Table, record: LGLModel, constituent_id: Optional[int] = None
+    ) -> Tuple[Any, ...]:
+        values = [
+            constituent_id
+            if name == "constituent_id" and constituent_id is not None
+            else _sql_value(getattr(record, name, None))
+            for name, _ in table.columns
+        ]
+        exclude = set(_CHILD_FIELDS) if table is CONSTITUENTS else None
+        values.append(record.model_dump_json(exclude=exclude))
+        return tuple(values)
+
+    def _insert(self, table: Table, rows: List[Tuple[Any, ...]]) -> None:
+        columns = table.column_names
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO {table.name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})",
+            rows,
+        )
+
+    def _flush(self) -> None:
+        """Write buffered rows inside the current transaction (lock held)."""
+        if self._pending_constituents:
+            ids = [(constituent_id,) for constituent_id in self._pending_constituents]
+            for child in CHILD_TABLES:
+                self._conn.executemany(
+                    f"DELETE FROM {child.name} WHERE constituent_id = ?", ids
+                )
+        for table in ALL_TABLES:
+            rows = self._pending.get(table.name)
+            if rows:
+                self._insert(table, rows)
+        self._discard()
+
+    def _discard(self) -> None:
+        self._pending.clear()
+        self._pending_constituents.clear()
+        self._pending_count = 0
+
+    def _checkpoint(self, resource: str, watermark: Watermark) -> None:
+        """Commit buffered records together with the watermark covering them."""
+        with self._lock, self._conn:
+            self._flush()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (resource, watermark) VALUES (?, ?)",
+                (resource, json.dumps(watermark.to_dict())),
+            )
+
+    # Reading
+
+    def _select(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _models(
+        self,
+        model: Type[T],
+        table: Table,
+        filters: Dict[str, Any],
+        order_by: str = "id",
+    ) -> List[T]:
+        clauses = []
+        params: List[Any] = []
+        for column, value in filters.items():
+            if value is None:
+                continue
+            operator = "="
+            if column.endswith("_from"):
+                column, operator = column[: -len("_from")], ">="
+            elif column.endswith("_to"):
+                column, operator = column[: -len("_to")], "<="
+            clauses.append(f"{column} {operator} ?")
+            params.append(_sql_value(value))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._select(
+            f"SELECT data FROM {table.name}{where} ORDER BY {order_by}", params
+        )
+        return [model.from_dict(json.loads(data), trusted=True) for (data,) in rows]
+
+    def _assemble(self, rows: List[Tuple[Any, ...]], all_rows: bool) -> List[Constituent]:
+        """Rebuild constituents from their rows and child tables."""
+        records = {constituent_id: json.loads(data) for constituent_id, data in rows}
+        for record in records.values():
+            for field in _CHILD_FIELDS:
+                record[field] = []
+        for child in CHILD_TABLES:
+            if all_rows:
+                child_rows = self._select(
+                    f"SELECT constituent_id, data FROM {child.name} ORDER BY rowid"
+                )
+            else:
+                child_rows = []
+                ids = list(records)
+                for start in range(0, len(ids), _IN_CHUNK):
+                    chunk = ids[start:start + _IN_CHUNK]
+                    child_rows.extend(self._select(
+                        f"SELECT constituent_id, data FROM {child.name} "
+                        f"WHERE constituent_id IN ({', '.join('?' * len(chunk))}) "
+                        f"ORDER BY rowid",
+                        chunk,
+                    ))
+            for constituent_id, data in child_rows:
+                record = records.get(constituent_id)
+                if record is not None:
+                    record[child.child_of].append(json.loads(data))
+        return [Constituent.from_dict(record, trusted=True) for record in records.values()]
+
+    def constituent(self, constituent_id: int) -> Optional[Constituent]:
+        """Mirrored constituent with all expanded children, or None if unknown."""
+        rows = self._select(
+            "SELECT id, data FROM constituents WHERE id = ?", (constituent_id,)
+        )
+        return self._assemble(rows, all_rows=False)[0] if rows else None
+
+    def constituents(self, ids: Optional[Iterable[int]] = None) -> List[Constituent]:
+        """Mirrored constituents ordered by sort name, optionally limited to IDs."""
+        if ids is None:
+            rows = self._select(
+                "SELECT id, data FROM constituents ORDER BY sort_name, id"
+            )
+            return self._assemble(rows, all_rows=True)
+        wanted = list(ids)
+        rows = []
+        for start in range(0, len(wanted), _IN_CHUNK):
+            chunk = wanted[start:start + _IN_CHUNK]
+            rows.extend(self._select(
+                f"SELECT id, data FROM constituents "
+                f"WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ))
+        by_id = {record.id: record for record in self._assemble(rows, all_rows=False)}
+        return sorted(by_id.values(), key=lambda record: (record.sort_name or "", record.id))
+
+    def gifts(
+        self,
+        *,
+        constituent_id: Optional[int] = None,
+        fund_id: Optional[int] = None,
+        campaign_id: Optional[int] = None,
+        appeal_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> List[Gift]:
+        """Mirrored gifts matching every given filter, oldest first."""
+        return self._models(Gift, GIFTS, {
+            "constituent_id": constituent_id,
+            "fund_id": fund_id,
+            "campaign_id": campaign_id,
+            "appeal_id": appeal_id,
+            "date_from": date_from,
+            "date_to": date_to,
+        }, order_by="date, id")
+
+    def notes(self, *, constituent_id: Optional[int] = None) -> List[Note]:
+        """Mirrored notes, optionally for one constituent."""
+        return self._models(Note, NOTES, {"constituent_id": constituent_id})
+
+    def volunteer_times(
+        self, *, constituent_id: Optional[int] = None
+    ) -> List[VolunteerTime]:
+        """Mirrored volunteer time entries, optionally for one constituent."""
+        return self._models(
+            VolunteerTime, VOLUNTEER_TIMES, {"constituent_id": constituent_id},
+            order_by="date, id",
+        )
+
+    def memberships(self, *, constituent_id: Optional[int] = None) -> List[Membership]:
+        """Mirrored memberships, optionally for one constituent."""
+        return self._models(
+            Membership, _CHILDREN_BY_NAME["memberships"],
+            {"constituent_id": constituent_id},
+        )
+
+    def group_memberships(
+        self, *, constituent_id: Optional[int] = None
+    ) -> List[GroupMembership]:
+        """Mirrored group memberships, optionally for one constituent."""
+        return self._models(
+            GroupMembership, _CHILDREN_BY_NAME["group_memberships"],
+            {"constituent_id": constituent_id},
+        )
+
+    def relationships(
+        self, *, constituent_id: Optional[int] = None
+    ) -> List[ConstituentRelationship]:
+        """Mirrored constituent relationships, optionally for one constituent."""
+        return self._models(
+            ConstituentRelationship, _CHILDREN_BY_NAME["relationships"],
+            {"constituent_id": constituent_id},
+        )
+
+    def lookup(self, resource: str) -> List[LGLModel]:
+        """Mirrored rows of a lookup resource such as ``funds``."""
+        try:
+            model = LOOKUP_MODELS[resource]
+        except KeyError:
+            raise ValueError(
+                f"Unknown lookup resource: {resource!r} "
+                f"(expected one of {', '.join(LOOKUP_MODELS)})"
+            ) from None
+        rows = self._select(
+            "SELECT data FROM lookups WHERE resource = ? ORDER BY id", (resource,)
+        )
+        return [model.from_dict(json.loads(data), trusted=True) for (data,) in rows]
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        """Run a read-only SQL query against the mirror, for ad-hoc reporting.
+
+        The statement runs with ``PRAGMA query_only`` set, so anything that
+        would change the database raises :class:`sqlite3.OperationalError`.
+        """
+        with self._lock:
+            self._conn.execute("PRAGMA query_only = ON")
+            try:
+                return self._conn.execute(sql, params).fetchall()
+            finally:
+                self._conn.execute("PRAGMA query_only = OFF")
+
+    def counts(self) -> Dict[str, int]:
+        """Number of rows in every mirrored table."""
+        return {
+            table.name: self._select(f"SELECT COUNT(*) FROM {table.name}")[0][0]
+            for table in ALL_TABLES
+        }
@@ -26,15 +26,19 @@ class LGLModel(BaseModel):
     )
     
     @classmethod
-    def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
+    def from_dict(cls: Type[T], data: Dict[str, Any], *, trusted: bool = False) -> T:
         """Create model instance from dictionary data.
         
         Args:
             data: Dictionary containing model data
-            
+            trusted: Skip validation for a well-formed API payload (see
+                :mod:`lgl_client.models.trusted`); only use for API responses
+        
         Returns:
             Model instance
         """
+        if trusted:
+            return build_trusted(cls, data)
         return cls.model_validate(data)
     
     def to_dict(self, *, by_alias: bool = True, exclude_none: bool = True) -> Dict[str, Any]:
@@ -50,4 +54,8 @@ class LGLModel(BaseModel):
         return self.model_dump(
             by_alias=by_alias,
             exclude_none=exclude_none,
-        )
\ No newline at end of file
+        )
+
+
+# Imported last: the fast path builds on LGLModel defined above
+from .trusted import build_trusted  # noqa: E402
@@ -17,6 +17,11 @@ def parse_date(value: Union[str, date, None]) -> Optional[date]:
     if isinstance(value, str):
         if not value.strip():
             return None
+        try:
+            # C-level fast path for the canonical API format
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
         try:
             return datetime.strptime(value, "%Y-%m-%d").date()
         except ValueError:
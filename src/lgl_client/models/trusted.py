@@ -0,0 +1,143 @@
+"""Fast model construction for trusted API payloads.
+
+Validating a page of gifts or constituents runs every field through
+pydantic and the ``parse_date``/``parse_datetime`` validators. Data that
+comes straight from the LGL API is already well typed, so bulk loads can
+skip that work: :func:`build_trusted` copies the payload into a model
+instance and only converts date, datetime and nested model fields, which
+is what validation would change for a well-formed response.
+"""
+
+import copy
+from datetime import date, datetime
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from . import LGLModel
+from .common import parse_date, parse_datetime
+
+T = TypeVar('T', bound=LGLModel)
+
+Converter = Callable[[Any], Any]
+
+
+def build_trusted(cls: Type[T], data: Dict[str, Any]) -> T:
+    """Create a model instance from an API payload without validating it.
+
+    Only date, datetime and nested model fields are converted; every other
+    value is stored as given. Use this for responses the API produced, never
+    for user input.
+
+    Args:
+        cls: Model class to instantiate
+        data: Dictionary containing model data
+
+    Returns:
+        Model instance equal to ``cls.model_validate(data)`` for well-formed data
+    """
+    field_names, defaults, factories, converters = _compile(cls)
+    values = {**defaults, **data}
+    for name, converter in converters:
+        value = data.get(name)
+        if value is not None:
+            values[name] = converter(value)
+    for name, factory, takes_data in factories:
+        if name not in data:
+            values[name] = factory(values) if takes_data else factory()
+    extra = {}
+    if not field_names.issuperset(data):
+        extra = {key: values.pop(key) for key in data.keys() - field_names}
+    instance = cls.__new__(cls)
+    object.__setattr__(instance, '__dict__', values)
+    # Extra keys count as explicitly set, as they do after validation
+    object.__setattr__(instance, '__pydantic_fields_set__', set(data))
+    object.__setattr__(instance, '__pydantic_extra__', extra)
+    object.__setattr__(instance, '__pydantic_private__', None)
+    return instance
+
+
+_CompiledModel = Tuple[
+    frozenset,
+    Dict[str, Any],
+    List[Tuple[str, Callable[..., Any], bool]],
+    List[Tuple[str, Converter]],
+]
+
+
+@lru_cache(maxsize=None)
+def _compile(cls: Type[LGLModel]) -> _CompiledModel:
+    """Precompute field names, defaults and converters for a model class."""
+    defaults = {}
+    factories = []
+    converters = []
+    for name, field in cls.model_fields.items():
+        if field.default_factory is not None:
+            # pydantic >= 2.10 lets a factory take the data built so far
+            takes_data = getattr(field, 'default_factory_takes_validated_data', False)
+            factories.append((name, field.default_factory, takes_data))
+        elif not field.is_required():
+            if isinstance(field.default, (list, dict, set)):
+                # Like pydantic, never share a mutable default between instances
+                factories.append((name, partial(copy.deepcopy, field.default), False))
+            else:
+                defaults[name] = field.default
+        converter = _converter_for(field.annotation)
+        if converter is not None:
+            converters.append((name, converter))
+    return frozenset(cls.model_fields), defaults, factories, converters
+
+
+def _converter_for(annotation: Any) -> Optional[Converter]:
+    """Converter turning raw JSON into the annotated type, or None if not needed."""
+    origin = get_origin(annotation)
+    if origin is Union:
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _converter_for(members[0]) if len(members) == 1 else None
+    if origin in (list, List):
+        (item_type,) = get_args(annotation) or (Any,)
+        item_converter = _converter_for(item_type)
+        if item_converter is None:
+            return None
+        return lambda items: [item_converter(item) for item in items]
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, datetime):
+        return _iso_or(datetime.fromisoformat, parse_datetime)
+    if issubclass(annotation, date):
+        return _iso_or(date.fromisoformat, parse_date)
+    if issubclass(annotation, LGLModel):
+        model = annotation
+
+        def _build(value: Any) -> Any:
+            return value if isinstance(value, model) else build_trusted(model, value)
+
+        return _build
+    if issubclass(annotation, BaseModel):
+        return annotation.model_validate
+    return None
+
+
+def _iso_or(fromisoformat: Converter, fallback: Converter) -> Converter:
+    """Parse with the C-level ``fromisoformat``, deferring odd values to ``fallback``."""
+    def convert(value: Any) -> Any:
+        try:
+            return fromisoformat(value)
+        except (TypeError, ValueError):
+            # Empty strings, other formats, "Z" suffixes before Python 3.11
+            return fallback(value)
+
+    return convert
@@ -0,0 +1,166 @@
+"""Tests for the asyncio client and async resource APIs."""
+import inspect
+
+import pytest
+import httpx
+from unittest.mock import AsyncMock, Mock, patch
+
+from lgl_client import LGL, AsyncLGL, new_async_client, new_client
+from lgl_client.lgl_api.client import AsyncLGLClient, BaseLGLClient, LGLClient
+from lgl_client.lgl_api.exceptions import LGLAPIError, NotFoundError
+from tests.fixtures import APIResponseMocker
+
+
+class TestAsyncClient:
+    """Test AsyncLGLClient and the AsyncLGL aggregate."""
+
+    @pytest.fixture
+    def client(self):
+        """Create async test client."""
+        return new_async_client(api_key="test_key")
+
+    def test_async_aggregate_mirrors_sync_resources(self, client):
+        """Test AsyncLGL exposes an async variant of every sync resource API."""
+        sync_client = new_client(api_key="test_key")
+        sync_resources = {name: getattr(sync_client, name) for name in LGL.__annotations__}
+
+        assert len(sync_resources) == 31
+        for name, sync_api in sync_resources.items():
+            sync_cls, async_cls = type(sync_api), type(getattr(client, name))
+            assert async_cls.__name__ == f"Async{sync_cls.__name__}"
+            assert not issubclass(async_cls, sync_cls)
+            assert async_cls.__mro__[1] is sync_cls.__mro__[1]
+
+            for method_name, method in vars(sync_cls).items():
+                if method_name.startswith("_") or not inspect.isfunction(method):
+                    continue
+                async_method = getattr(async_cls, method_name)
+                assert async_method is not method, f"{async_cls.__name__}.{method_name}"
+                assert (
+                    inspect.iscoroutinefunction(async_method)
+                    or inspect.isasyncgenfunction(async_method)
+                ), f"{async_cls.__name__}.{method_name}"
+
+    def test_clients_share_validation_core(self, client):
+        """Test sync and async clients share the same validation code."""
+        assert isinstance(client._client, AsyncLGLClient)
+        assert issubclass(LGLClient, BaseLGLClient)
+        assert AsyncLGLClient._validate_api_params is LGLClient._validate_api_params
+        assert AsyncLGLClient._handle_response is LGLClient._handle_response
+
+        with pytest.raises(ValueError):
+            client._client._validate_api_params({"bad;name": "value"})
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_paginates(self, client):
+        """Test async fetch_all walks every page."""
+        all_items = [
+            {"id": i, "first_name": f"First{i}", "last_name": "Doe",
+             "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-01T10:00:00Z"}
+            for i in range(1, 251)
+        ]
+
+        async def mock_get(path, **kwargs):
+            offset, limit = kwargs["offset"], kwargs["limit"]
+            return APIResponseMocker.paginated_response(
+                all_items[offset:offset + limit], total=len(all_items), per_page=limit
+            )
+
+        with patch.object(client.constituents.client, "_get", side_effect=mock_get) as mock:
+            constituents = await client.constituents.fetch_all()
+
+        assert [c.id for c in constituents] == list(range(1, 251))
+        assert mock.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_concurrent_pages_keep_order(self, client):
+        """Test concurrent async page fetching preserves offset order."""
+        import asyncio
+
+        all_items = [
+            {"id": i, "first_name": f"First{i}", "last_name": "Doe",
+             "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-01T10:00:00Z"}
+            for i in range(1, 1001)
+        ]
+        in_flight = {"active": 0, "peak": 0}
+
+        async def mock_get(path, **kwargs):
+            offset, limit = kwargs["offset"], kwargs["limit"]
+            in_flight["active"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["active"])
+            # Earlier pages take longer, so they complete out of order
+            await asyncio.sleep((1000 - offset) / 50000)
+            in_flight["active"] -= 1
+            return APIResponseMocker.paginated_response(
+                all_items[offset:offset + limit], total=len(all_items), per_page=limit
+            )
+
+        with patch.object(client.constituents.client, "_get", side_effect=mock_get) as mock:
+            constituents = await client.constituents.fetch_all(concurrency=4)
+
+        assert [c.id for c in constituents] == list(range(1, 1001))
+        assert mock.await_count == 10
+        assert 1 < in_flight["peak"] <= 4
+
+    @pytest.mark.asyncio
+    async def test_iter_all_is_async_iterator(self, client):
+        """Test iter_all yields typed models lazily."""
+        response = APIResponseMocker.paginated_response(
+            [{"id": 1, "name": "Cash", "key": "cash"}], total=1
+        )
+        with patch.object(client.payment_types._client, "_get", AsyncMock(return_value=response)):
+            names = [item.name async for item in client.payment_types.iter_all()]
+
+        assert names == ["Cash"]
+
+    @pytest.mark.asyncio
+    async def test_inherited_helpers_are_awaitable(self, client):
+        """Test helper methods inherited from sync APIs return awaitables."""
+        created = {
+            "id": 10, "address": "a@example.com", "email_address_type_id": 1,
+            "email_type_name": "Home", "created_at": "2025-01-01T10:00:00Z",
+            "updated_at": "2025-01-01T10:00:00Z",
+        }
+        with patch.object(client.email_addresses.client, "_post", AsyncMock(return_value=created)) as mock_post:
+            email = await client.email_addresses.create_home_email(5, "a@example.com")
+
+        assert email.id == 10
+        mock_post.assert_awaited_once()
+        assert mock_post.await_args.args[0] == "constituents/5/email_addresses"
+
+    @pytest.mark.asyncio
+    async def test_error_mapping_is_shared(self, client):
+        """Test HTTP status codes map to the same exceptions as the sync client."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.is_success = False
+        mock_response.json.return_value = {"error": "Gift not found"}
+        mock_response.url = "https://api.littlegreenlight.com/api/v1/gifts/999"
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get = AsyncMock(return_value=mock_response)
+            with pytest.raises(NotFoundError) as exc_info:
+                await client.gifts.retrieve(999)
+
+        assert exc_info.value.status_code == 404
+        assert "Gift not found" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_transport_error_mapping(self, client):
+        """Test httpx transport errors become LGLAPIError."""
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get = AsyncMock(side_effect=httpx.ConnectError("boom"))
+            with pytest.raises(LGLAPIError) as exc_info:
+                await client.categories.list()
+
+        assert "HTTP error" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_client(self):
+        """Test AsyncLGL closes the httpx client on exit."""
+        client = new_async_client(api_key="test_key")
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.aclose = AsyncMock()
+            async with client as entered:
+                assert isinstance(entered, AsyncLGL)
+            mock_httpx.aclose.assert_awaited_once()
@@ -0,0 +1,145 @@
+"""Tests for concurrent bulk writes."""
+import asyncio
+import pytest
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+from lgl_client import new_async_client, new_client
+from lgl_client.lgl_api.exceptions import UnauthorizedError, ValidationError
+
+STAMP = "2025-01-01T00:00:00Z"
+
+
+def created_gift(path, json):
+    """Gift returned by the create endpoint."""
+    constituent_id = int(path.split("/")[1])
+    return {
+        "id": 1000 + constituent_id, "constituent_id": constituent_id, "gift_type_id": 1,
+        "amount": json["amount"], "date": "2025-02-01",
+        "created_at": STAMP, "updated_at": STAMP,
+    }
+
+
+def rows(*constituent_ids):
+    """Gift rows for the given donors."""
+    return [
+        {"constituent_id": cid, "amount": 10.0 * cid, "date": "2025-02-01", "gift_type_id": 1}
+        for cid in constituent_ids
+    ]
+
+
+class TestBulkWriter:
+    """Test BulkWriter runs and reports."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client."""
+        return new_client(api_key="test_key", page_concurrency=4)
+
+    def test_writes_run_concurrently_with_per_row_results(self, client):
+        """Test rows are written in parallel and failures do not stop the run."""
+        in_flight, peak = [0], [0]
+        lock = threading.Lock()
+
+        def mock_post(path, json):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            if path == "constituents/3/gifts":
+                raise ValidationError("Invalid", status_code=422, url=path)
+            return created_gift(path, json)
+
+        with patch.object(client._client, "_post", side_effect=mock_post) as mock:
+            report = client.bulk.create_gifts(rows(1, 2, 3, 4, 5))
+
+        assert peak[0] > 1
+        assert mock.call_count == 5
+        assert "constituent_id" not in mock.call_args.args[1]
+        assert [r.index for r in report.results] == [0, 1, 2, 3, 4]
+        assert [r.value.id for r in report.results if r.ok] == [1001, 1002, 1004, 1005]
+        assert [f.index for f in report.failures] == [2]
+        assert isinstance(report.failures[0].error, ValidationError)
+        assert report.succeeded == 4 and report.throughput > 0
+        assert "4 written, 1 failed, 0 skipped" in report.summary()
+
+    def test_checkpoint_resumes_after_failures(self, client, tmp_path):
+        """Test a rerun only writes the rows not yet recorded in the checkpoint."""
+        checkpoint = tmp_path / "gifts.ckpt"
+        failing = {"constituents/2/gifts"}
+
+        def mock_post(path, json):
+            if path in failing:
+                raise ValidationError("Invalid", status_code=422, url=path)
+            return created_gift(path, json)
+
+        def key(row):
+            return f"donor-{row['constituent_id']}"
+
+        with patch.object(client._client, "_post", side_effect=mock_post) as mock:
+            first = client.bulk.create_gifts(rows(1, 2, 3), checkpoint=checkpoint, key=key)
+            failing.clear()
+            mock.reset_mock()
+            second = client.bulk.create_gifts(rows(1, 2, 3), checkpoint=checkpoint, key=key)
+
+        assert len(first.failures) == 1
+        assert [call.args[0] for call in mock.call_args_list] == ["constituents/2/gifts"]
+        assert (second.succeeded, second.skipped) == (1, 2)
+        assert [r.value for r in second.results if r.skipped] == [1001, 1003]
+        # A truncated trailing line from a crash is ignored
+        with open(checkpoint, "a") as handle:
+            handle.write('{"op": "create_gifts", "ke')
+        assert client.bulk.create_gifts(rows(1, 2, 3), checkpoint=checkpoint, key=key).skipped == 3
+
+    def test_unauthorized_aborts_and_bad_rows_fail(self, client):
+        """Test a rejected key stops the run while malformed rows only fail themselves."""
+        with patch.object(client._client, "_post", return_value=None) as mock:
+            report = client.bulk.add_keywords(
+                [{"constituent_id": 1}, {"constituent_id": 2, "keyword_id": 7}]
+            )
+        assert [r.ok for r in report.results] == [False, True]
+        mock.assert_called_once_with("constituents/2/keywords", {"id": 7})
+
+        error = UnauthorizedError("Unauthorized", status_code=401, url="gifts/1")
+        with patch.object(client._client, "_patch", side_effect=error):
+            with pytest.raises(UnauthorizedError):
+                client.bulk.update_gifts([{"id": 1, "amount": 5}] * 10, concurrency=2)
+
+    @pytest.mark.asyncio
+    async def test_async_bulk_writer(self):
+        """Test the async writer awaits every write."""
+        client = new_async_client(api_key="test_key", page_concurrency=3)
+
+        async def mock_post(path, json):
+            return created_gift(path, json)
+
+        with patch.object(client._client, "_post", AsyncMock(side_effect=mock_post)):
+            report = await client.bulk.create_gifts(rows(1, 2, 3, 4))
+
+        assert [r.value.id for r in report.results] == [1001, 1002, 1003, 1004]
+
+    @pytest.mark.asyncio
+    async def test_async_unauthorized_cancels_other_writes(self):
+        """Test a rejected key cancels the writes still in flight."""
+        client = new_async_client(api_key="test_key", page_concurrency=3)
+        cancelled = []
+
+        async def mock_patch(path, json):
+            if path == "gifts/1":
+                raise UnauthorizedError("Unauthorized", status_code=401, url=path)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(path)
+                raise
+
+        with patch.object(client._client, "_patch", AsyncMock(side_effect=mock_patch)):
+            with pytest.raises(UnauthorizedError):
+                await client.bulk.update_gifts(
+                    [{"id": 2, "amount": 5}, {"id": 3, "amount": 5}, {"id": 1, "amount": 5}]
+                )
+
+        assert sorted(cancelled) == ["gifts/2", "gifts/3"]
@@ -0,0 +1,124 @@
+"""Tests for the pluggable JSON decoders."""
+import json
+import pytest
+import sys
+import httpx
+from pydantic import ValidationError as ModelValidationError
+from unittest.mock import AsyncMock, patch
+
+from lgl_client import new_async_client, new_client
+from lgl_client.lgl_api.decoding import resolve_decoder
+from lgl_client.lgl_api.exceptions import LGLAPIError
+from lgl_client.models.constituent import Constituent
+from lgl_client.models.gift import Gift
+
+DECODERS = ["stdlib", "orjson", "pydantic", "auto", json.loads]
+
+
+def make_response(json=None, content=None, path="constituents/search"):
+    """Build a real httpx response with a JSON or raw body."""
+    request = httpx.Request("GET", f"https://api.littlegreenlight.com/api/v1/{path}")
+    if content is not None:
+        return httpx.Response(200, content=content, request=request)
+    return httpx.Response(200, json=json, request=request)
+
+
+def constituent(constituent_id):
+    """Constituent payload with expanded email addresses and custom attributes."""
+    return {
+        "id": constituent_id, "first_name": "Ada", "last_name": f"Donor {constituent_id}",
+        "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-02T15:30:00Z",
+        "email_addresses": [{
+            "id": constituent_id * 10, "address": "ada@example.com",
+            "email_address_type_id": 1, "email_type_name": "Home", "is_preferred": True,
+            "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-01T10:00:00Z",
+        }],
+        "custom_attrs": [{"id": 3, "name": "Source", "value": "Web"}],
+    }
+
+
+class TestDecoders:
+    """Test every backend decodes responses the same way."""
+
+    @pytest.mark.parametrize("decoder", DECODERS)
+    def test_backends_agree(self, decoder):
+        """Test each decoder returns the stdlib result and maps bad JSON to LGLAPIError."""
+        if decoder == "orjson":
+            pytest.importorskip("orjson")
+        body = {"items": [constituent(1)], "total_items": 1, "next_item": None}
+        client = new_client(api_key="test_key", json_decoder=decoder)
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.return_value = make_response(body)
+            assert client.constituents.search(["name=ada"]) == body
+            mock_httpx.get.return_value = make_response(content=b"{not json")
+            with pytest.raises(LGLAPIError, match="Invalid JSON"):
+                client.constituents.search(["name=ada"])
+
+    def test_resolve_decoder(self):
+        """Test the default, unknown names and a missing orjson."""
+        assert resolve_decoder(None) == ("stdlib", None)
+        with pytest.raises(ValueError):
+            resolve_decoder("simdjson")
+        with patch.dict(sys.modules, {"orjson": None}):
+            with pytest.raises(ImportError, match="orjson"):
+                resolve_decoder("orjson")
+
+
+class TestDirectPages:
+    """Test pages validated straight from bytes with the pydantic decoder."""
+
+    def test_search_pages_become_models_without_dicts(self):
+        """Test iter_search builds the same models as the dict path and keeps paging keys."""
+        pages = [
+            {"items": [constituent(1), constituent(2)], "next_item": 2},
+            {"items": [constituent(3)], "next_item": None},
+        ]
+        client = new_client(api_key="test_key", json_decoder="pydantic")
+
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch.object(client._client, "_get") as dict_get:
+            mock_httpx.get.side_effect = [make_response(page) for page in pages]
+            found = list(client.constituents.iter_search(["name=ada"], expand="email_addresses"))
+
+        dict_get.assert_not_called()
+        assert found == [Constituent.from_dict(constituent(i)) for i in (1, 2, 3)]
+        assert found[0].email_addresses[0].address == "ada@example.com"
+        assert mock_httpx.get.call_args.kwargs["params"]["offset"] == 2
+
+    def test_invalid_items_and_trusted_reads(self):
+        """Test bad items raise validation errors and trusted reads keep the dict path."""
+        client = new_client(api_key="test_key", json_decoder="pydantic")
+        bad = {"items": [{"id": "not a number"}], "total_items": 1}
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.return_value = make_response(bad, path="constituents")
+            with pytest.raises(ModelValidationError):
+                list(client.constituents.iter_all())
+            mock_httpx.get.return_value = make_response(content=b' [{"id": 1', path="constituents")
+            with pytest.raises(LGLAPIError, match="Invalid JSON"):
+                list(client.constituents.iter_all())
+            mock_httpx.get.return_value = make_response(
+                {"items": [constituent(1)], "total_items": 1}, path="constituents"
+            )
+            with patch.object(client._client, "_decode_page") as direct:
+                assert len(client.constituents.fetch_all(trusted=True)) == 1
+            direct.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_gift_pages(self):
+        """Test the async client decodes gift pages directly as well."""
+        gift = {"id": 7, "constituent_id": 1, "gift_type_id": 1, "amount": 25.0,
+                "date": "2025-03-01", "created_at": "2025-03-01T10:00:00Z",
+                "updated_at": "2025-03-01T10:00:00Z"}
+        client = new_async_client(api_key="test_key", json_decoder="pydantic")
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get = AsyncMock(side_effect=[
+                make_response({"items": [gift], "total_items": 1}, path="constituents/1/gifts"),
+                make_response([gift], path="constituents/1/gifts"),
+            ])
+            paged = await client.gifts.fetch_all(1)
+            bare = await client.gifts.fetch_all(1)
+
+        assert paged == bare == [Gift.from_dict(gift)]
@@ -0,0 +1,127 @@
+"""Tests for the per-record entity cache behind retrieve()."""
+import pytest
+import httpx
+from unittest.mock import AsyncMock, patch
+
+from lgl_client import EntityCache, new_async_client, new_client
+
+CONSTITUENT = {
+    "id": 42, "first_name": "Ada", "last_name": "Lovelace",
+    "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-02T15:30:00Z",
+}
+GIFT = {
+    "id": 7, "constituent_id": 42, "gift_type_id": 1, "amount": 25.0,
+    "date": "2025-03-01", "created_at": "2025-03-01T10:00:00Z",
+    "updated_at": "2025-03-01T10:00:00Z",
+}
+NOTE = {
+    "id": 3, "constituent_id": 42, "text": "Called about the gala",
+    "created_at": "2025-03-01T10:00:00Z", "updated_at": "2025-03-01T10:00:00Z",
+}
+
+
+def make_response(json, path, method="GET", status_code=200):
+    """Build a real httpx response."""
+    request = httpx.Request(method, f"https://api.littlegreenlight.com/api/v1/{path}")
+    return httpx.Response(status_code, json=json, request=request)
+
+
+class TestEntityCache:
+    """Test read-through retrieves and write-through creates, updates and deletes."""
+
+    def test_retrieve_reads_through(self):
+        """Test a second retrieve is served locally and callers get their own copies."""
+        entities = EntityCache()
+        client = new_client(api_key="test_key", entity_cache=entities)
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.return_value = make_response(CONSTITUENT, "constituents/42")
+            first = client.constituents.retrieve(42)
+            client._client._get("constituents/42")["last_name"] = "mutated by the caller"
+            second = client.constituents.retrieve(42)
+            client._client._get("constituents/42", expand="email_addresses")
+
+        assert mock_httpx.get.call_count == 2
+        assert first == second and second.last_name == "Lovelace"
+        assert entities.stats()["constituents"] == {
+            "hits": 2, "misses": 1, "stores": 1, "invalidations": 0,
+        }
+
+    def test_update_refreshes_and_delete_evicts(self):
+        """Test a PATCH stores the returned record and a DELETE drops it."""
+        entities = EntityCache()
+        client = new_client(api_key="test_key", entity_cache=entities)
+        renamed = {**CONSTITUENT, "last_name": "King"}
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.return_value = make_response(CONSTITUENT, "constituents/42")
+            mock_httpx.patch.return_value = make_response(renamed, "constituents/42", "PATCH")
+            mock_httpx.delete.return_value = make_response({}, "constituents/42", "DELETE")
+            client.constituents.retrieve(42)
+            client.constituents.update(42, {"last_name": "King"})
+            assert client.constituents.retrieve(42).last_name == "King"
+            assert mock_httpx.get.call_count == 1
+            client.constituents.delete(42)
+            assert len(entities) == 0
+            client.constituents.retrieve(42)
+
+        assert mock_httpx.get.call_count == 2
+
+    def test_create_populates_shared_cache(self):
+        """Test creates fill the cache used by every resource of the client."""
+        entities = EntityCache()
+        client = new_client(api_key="test_key", entity_cache=entities)
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.post.side_effect = [
+                make_response(GIFT, "constituents/42/gifts", "POST"),
+                make_response(NOTE, "constituents/42/notes", "POST"),
+                make_response({"id": 5, "name": "Major donor"}, "constituents/42/keywords", "POST"),
+            ]
+            client.gifts.create(42, {"amount": 25.0, "gift_type_id": 1})
+            client.notes.create(42, {"text": NOTE["text"], "original_date": "2025-03-01"})
+            client.keywords.add_to_constituent(42, 5)
+            gift = client.gifts.retrieve(7)
+            note = client.notes.retrieve(3)
+
+        mock_httpx.get.assert_not_called()
+        assert gift.amount == 25.0 and note.text == NOTE["text"]
+        assert client.entity_cache is entities
+        assert set(entities.stats()) == {"gifts", "notes"}
+
+    def test_lru_and_ttl(self):
+        """Test the least recently used record is dropped and expired ones are refetched."""
+        entities = EntityCache(max_entries=2, ttl=60, ttls={"notes": 0})
+
+        with patch("lgl_client.lgl_api.entity_cache.time.monotonic", return_value=100.0) as now:
+            entities.put("gifts", 1, {"id": 1})
+            entities.put("gifts", 2, {"id": 2})
+            entities.get("gifts", 1)
+            entities.put("constituents", 1, {"id": 1})
+            entities.put("notes", 3, NOTE)
+            assert entities.get("gifts", 2) is None
+            assert entities.get("gifts", 1) == {"id": 1}
+            assert entities.get("notes", 3) is None
+            now.return_value = 160.0
+            assert entities.get("constituents", 1) is None
+
+        assert len(entities) == 1
+        with pytest.raises(ValueError):
+            EntityCache(max_entries=0)
+
+    @pytest.mark.asyncio
+    async def test_async_client(self):
+        """Test the async client reads and writes through the cache as well."""
+        entities = EntityCache()
+        client = new_async_client(api_key="test_key", entity_cache=entities)
+        bigger = {**GIFT, "amount": 50.0}
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get = AsyncMock(return_value=make_response(GIFT, "gifts/7"))
+            mock_httpx.patch = AsyncMock(return_value=make_response(bigger, "gifts/7", "PATCH"))
+            await client.gifts.retrieve(7)
+            await client.gifts.update(7, {"amount": 50.0})
+            gift = await client.gifts.retrieve(7)
+
+        assert mock_httpx.get.call_count == 1
+        assert gift.amount == 50.0
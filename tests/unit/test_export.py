@@ -0,0 +1,236 @@
+"""Tests for resumable and columnar exports."""
+import csv
+import json
+import os
+import pytest
+import sys
+from unittest.mock import patch
+
+from lgl_client import new_client
+from lgl_client.export import ColumnarExport, ExportJob, _CSVWriter, export_schema, read_export
+from lgl_client.lgl_api.exceptions import LGLAPIError
+from tests.fixtures import APIResponseMocker
+
+
+def note(note_id):
+    """Minimal note payload."""
+    return {
+        "id": note_id, "constituent_id": 1, "text": f"Note {note_id}",
+        "created_at": "2025-01-01T00:00:00Z", "updated_at": "2025-01-01T00:00:00Z",
+    }
+
+
+def gift(gift_id, updated_at):
+    """Minimal gift payload updated at the given second."""
+    return {
+        "id": gift_id, "constituent_id": 1, "gift_type_id": 1, "amount": 10.0,
+        "date": "2025-01-01", "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": updated_at,
+    }
+
+
+class FakeSearch:
+    """Search endpoint honouring updated_from and the date_updated sort."""
+
+    def __init__(self, records):
+        self.records = records
+        self.calls = []
+
+    def __call__(self, path, q=None, sort=None, limit=100, offset=0, **params):
+        self.calls.append({"q": q, "limit": limit, "offset": offset})
+        records = sorted(self.records, key=lambda r: (r["updated_at"], r["id"]))
+        for clause in q or []:
+            records = [r for r in records if r["updated_at"] >= clause.partition("=")[2]]
+        page = records[offset:offset + limit]
+        return APIResponseMocker.paginated_response(page, total=len(records), per_page=limit)
+
+
+class FlakyListing:
+    """Offset-paged endpoint that fails once at a given offset."""
+
+    def __init__(self, items, fail_at=None):
+        self.items = items
+        self.fail_at = fail_at
+        self.offsets = []
+
+    def __call__(self, path, limit=100, offset=0, **params):
+        self.offsets.append(offset)
+        if offset == self.fail_at:
+            self.fail_at = None
+            raise LGLAPIError("Service unavailable", status_code=503, url=path)
+        page = self.items[offset:offset + limit]
+        return APIResponseMocker.paginated_response(page, total=len(self.items), per_page=limit)
+
+
+class TestExportJob:
+    """Test ExportJob checkpointing and resume."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client."""
+        return new_client(api_key="test_key")
+
+    def test_offset_export_resumes_after_failure(self, client, tmp_path):
+        """Test a failed export continues at the last completed page."""
+        server = FlakyListing([note(i) for i in range(1, 26)], fail_at=20)
+        job = ExportJob(client, "notes", str(tmp_path / "notes.jsonl"), page_size=10)
+        progress = []
+
+        with patch.object(client._client, "_get", side_effect=server):
+            with pytest.raises(LGLAPIError):
+                job.run(on_progress=progress.append)
+            assert job.progress().written == 20 and not job.complete
+            final = job.run()
+
+        assert server.offsets == [0, 10, 20, 20]
+        assert [record["id"] for record in read_export(job.path)] == list(range(1, 26))
+        assert final.complete and final.written == 25 and final.eta == 0.0
+        assert progress[-1].total == 25 and progress[-1].fraction == 0.8
+        assert "20/25 records" in progress[-1].describe()
+
+    def test_partial_page_after_checkpoint_is_discarded(self, client, tmp_path):
+        """Test bytes written after the last checkpoint are cut off on resume."""
+        server = FlakyListing([note(i) for i in range(1, 16)], fail_at=10)
+        job = ExportJob(client, "notes", str(tmp_path / "notes.jsonl"), page_size=10)
+
+        with patch.object(client._client, "_get", side_effect=server):
+            with pytest.raises(LGLAPIError):
+                job.run()
+            with open(job.path, "a") as handle:
+                handle.write('{"id": 11, "text": "half a pa')
+            job.run()
+
+        assert [record["id"] for record in read_export(job.path)] == list(range(1, 16))
+
+    def test_update_order_export_resumes_from_cursor(self, client, tmp_path):
+        """Test gifts resume from the updated_at cursor rather than an offset."""
+        server = FakeSearch([gift(i, f"2025-03-01T10:00:{i:02d}Z") for i in range(1, 8)])
+        job = ExportJob(client, "gifts", str(tmp_path / "gifts.jsonl"), page_size=3)
+        pages = []
+
+        def interrupt(progress):
+            pages.append(progress.written)
+            if len(pages) == 1:
+                raise KeyboardInterrupt
+
+        with patch.object(client._client, "_get", side_effect=server):
+            with pytest.raises(KeyboardInterrupt):
+                job.run(on_progress=interrupt)
+            with open(job.checkpoint_path) as handle:
+                cursor = json.load(handle)["cursor"]
+            job.run()
+
+        assert cursor == {"updated_at": "2025-03-01T10:00:03Z", "boundary_ids": [3]}
+        assert server.calls[2]["q"] == ["updated_from=2025-03-01T10:00:03Z"]
+        assert [record["id"] for record in read_export(job.path)] == list(range(1, 8))
+        assert job.watermark() is not None
+
+    def test_rejects_foreign_checkpoint(self, client, tmp_path):
+        """Test a checkpoint of another resource is not reused."""
+        path = str(tmp_path / "export.jsonl")
+        with open(f"{path}.checkpoint", "w") as handle:
+            json.dump({"resource": "notes"}, handle)
+
+        with pytest.raises(ValueError):
+            ExportJob(client, "gifts", path).run()
+        with pytest.raises(ValueError):
+            ExportJob(client, "notes", path, expand="email_addresses")
+
+
+class TestColumnarExport:
+    """Test streaming exports to CSV, Parquet and Arrow."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client."""
+        return new_client(api_key="test_key")
+
+    @pytest.fixture
+    def gifts(self):
+        """Gifts with a tribute and custom attributes on the first one."""
+        records = [gift(i, f"2025-03-01T10:00:{i:02d}Z") for i in range(1, 8)]
+        records[0].update(
+            acknowledged=True,
+            tribute={"id": 5, "tribute_type": "In memory of", "honoree_name": "Ada"},
+            custom_attrs=[{"id": 9, "name": "Source", "value": "Web"}],
+        )
+        return records
+
+    def test_schema_follows_models(self):
+        """Test columns take the model fields and their scalar or JSON types."""
+        columns = dict(export_schema("gifts"))
+        assert list(columns)[:2] == ["id", "constituent_id"]
+        assert columns["amount"] == "float64" and columns["date"] == "date"
+        assert columns["deductible_amount"] == "float64"
+        assert columns["updated_at"] == "timestamp" and columns["acknowledged"] == "bool"
+        assert columns["tribute"] == "json" and columns["custom_attrs"] == "json"
+        assert dict(export_schema("notes"))["text"] == "string"
+        with pytest.raises(ValueError):
+            export_schema("funds")
+
+    def test_csv_streams_fixed_batches(self, client, gifts, tmp_path):
+        """Test rows reach the writer in batches and nested values become JSON."""
+        path = str(tmp_path / "gifts.csv")
+        export = ColumnarExport(client, "gifts", path, page_size=3, batch_size=2)
+        batches = []
+        write = _CSVWriter.write
+
+        def spy(writer, rows):
+            batches.append(len(rows))
+            write(writer, rows)
+
+        with patch.object(client._client, "_get", side_effect=FakeSearch(gifts)), \
+                patch.object(_CSVWriter, "write", spy):
+            final = export.run()
+
+        with open(path, newline="", encoding="utf-8") as handle:
+            rows = list(csv.DictReader(handle))
+        assert export.format == "csv"
+        assert batches == [2, 2, 2, 1]
+        assert final.complete and final.written == 7 and final.total == 7
+        assert list(rows[0]) == [name for name, _ in export_schema("gifts")]
+        assert [row["id"] for row in rows] == [str(i) for i in range(1, 8)]
+        assert rows[0]["acknowledged"] == "true" and rows[0]["date"] == "2025-01-01"
+        assert rows[0]["updated_at"].startswith("2025-03-01T10:00:01")
+        assert json.loads(rows[0]["tribute"])["honoree_name"] == "Ada"
+        assert json.loads(rows[0]["custom_attrs"])[0]["value"] == "Web"
+        assert rows[1]["tribute"] == "" and rows[1]["custom_attrs"] == "[]"
+
+    def test_failed_export_leaves_no_file(self, client, tmp_path):
+        """Test an interrupted export removes its partial output."""
+        path = str(tmp_path / "notes.csv")
+        server = FlakyListing([note(i) for i in range(1, 16)], fail_at=10)
+
+        with patch.object(client._client, "_get", side_effect=server):
+            with pytest.raises(LGLAPIError):
+                ColumnarExport(client, "notes", path, page_size=10).run()
+
+        assert os.listdir(tmp_path) == []
+
+    def test_formats_need_pyarrow(self, client, tmp_path):
+        """Test Parquet and Arrow fail clearly without pyarrow and CSV is the fallback."""
+        with patch.dict(sys.modules, {"pyarrow": None}), \
+                patch("lgl_client.export._pyarrow_available", return_value=False):
+            with pytest.raises(ImportError, match="pyarrow"):
+                ColumnarExport(client, "gifts", str(tmp_path / "gifts.parquet"))
+            assert ColumnarExport(client, "gifts", str(tmp_path / "gifts")).format == "csv"
+        with pytest.raises(ValueError):
+            ColumnarExport(client, "gifts", str(tmp_path / "gifts"), format="xlsx")
+
+    @pytest.mark.parametrize("suffix", ["parquet", "arrow"])
+    def test_arrow_formats(self, client, gifts, tmp_path, suffix):
+        """Test Parquet and Arrow files carry the typed schema."""
+        pa = pytest.importorskip("pyarrow")
+        path = str(tmp_path / f"gifts.{suffix}")
+
+        with patch.object(client._client, "_get", side_effect=FakeSearch(gifts)):
+            ColumnarExport(client, "gifts", path, page_size=3, batch_size=2).run()
+
+        if suffix == "parquet":
+            table = pytest.importorskip("pyarrow.parquet").read_table(path)
+        else:
+            table = pa.ipc.open_file(path).read_all()
+        assert table.num_rows == 7
+        assert table.schema.field("amount").type == pa.float64()
+        assert table.schema.field("date").type == pa.date32()
+        assert table.column("id").to_pylist() == list(range(1, 8))
@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 from typing import Dict, Any, List
 
 from lgl_client import new_client
+from lgl_client.models.trusted import build_trusted
 from tests.fixtures import (
     APIResponseMocker,
     DIRECT_ARRAY_RESOURCES,
@@ -314,4 +315,120 @@ class TestFetchAllMethods:
             
             assert len(result) == 2
             assert result[0].first_name == "John"
-            assert result[1].first_name == "Jane"
\ No newline at end of file
+            assert result[1].first_name == "Jane"
+
+class TestIterAllMethods:
+    """Test the streaming iter_all/iter_search generators behind fetch_all."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client."""
+        return new_client(api_key="test_key")
+
+    @staticmethod
+    def _constituent_pages(total: int):
+        """Build a _get side effect serving ``total`` constituents page by page."""
+        all_items = [
+            {"id": i, "first_name": f"First{i}", "last_name": "Doe",
+             "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-01T10:00:00Z"}
+            for i in range(1, total + 1)
+        ]
+
+        def mock_get(path, **kwargs):
+            offset, limit = kwargs.get("offset", 0), kwargs.get("limit", 100)
+            return APIResponseMocker.paginated_response(
+                all_items[offset:offset + limit], total=total, per_page=limit
+            )
+
+        return mock_get
+
+    def test_iter_all_fetches_pages_lazily(self, client):
+        """Test iter_all only requests a page when the consumer reaches it."""
+        with patch.object(client.constituents.client, '_get', side_effect=self._constituent_pages(250)) as mock:
+            iterator = client.constituents.iter_all()
+            assert mock.call_count == 0
+
+            first = next(iterator)
+            assert first.id == 1
+            assert mock.call_count == 1
+
+            remaining = list(iterator)
+            assert remaining[-1].id == 250
+            assert mock.call_count == 3
+
+    def test_fetch_all_wraps_iter_all(self, client):
+        """Test fetch_all returns exactly what iter_all yields."""
+        with patch.object(client.constituents.client, '_get', side_effect=self._constituent_pages(150)):
+            streamed = [c.id for c in client.constituents.iter_all()]
+            fetched = [c.id for c in client.constituents.fetch_all()]
+
+        assert streamed == fetched == list(range(1, 151))
+
+    def test_lookup_iter_all_yields_models(self, client):
+        """Test lookup resources stream typed models as well."""
+        response_data = {"items": [{"id": 1, "name": "Cash", "key": "cash", "ordinal": 1}]}
+
+        with patch.object(client.payment_types._client, '_get', return_value=response_data):
+            names = [item.name for item in client.payment_types.iter_all()]
+
+        assert names == ["Cash"]
+
+    def test_gifts_iter_search(self, client):
+        """Test gifts.iter_search streams search results across pages."""
+        gifts = [
+            {"id": i, "constituent_id": 1, "gift_type_id": 1, "amount": 10.0 * i,
+             "date": "2025-01-01", "created_at": "2025-01-01T10:00:00Z",
+             "updated_at": "2025-01-01T10:00:00Z"}
+            for i in range(1, 121)
+        ]
+
+        def mock_get(path, **kwargs):
+            assert path == 'gifts/search'
+            offset, limit = kwargs["offset"], kwargs["limit"]
+            return APIResponseMocker.paginated_response(
+                gifts[offset:offset + limit], total=len(gifts), per_page=limit
+            )
+
+        with patch.object(client.gifts.client, '_get', side_effect=mock_get) as mock:
+            result = [gift.id for gift in client.gifts.iter_search(amount_from=5)]
+
+        assert result == list(range(1, 121))
+        assert mock.call_count == 2
+
+    def test_constituents_iter_search_follows_next_item(self, client):
+        """Test constituents.iter_search pages using next_item."""
+        pages = {
+            0: {"items": [{"id": 1, "first_name": "A", "last_name": "Doe",
+                           "created_at": "2025-01-01T10:00:00Z",
+                           "updated_at": "2025-01-01T10:00:00Z"}], "next_item": 100},
+            100: {"items": [{"id": 2, "first_name": "B", "last_name": "Doe",
+                             "created_at": "2025-01-01T10:00:00Z",
+                             "updated_at": "2025-01-01T10:00:00Z"}], "next_item": None},
+        }
+
+        with patch.object(client.constituents.client, '_get',
+                          side_effect=lambda path, **kwargs: pages[kwargs["offset"]]):
+            iterator = client.constituents.iter_search(["name=doe"])
+            assert next(iterator).id == 1
+            assert [c.id for c in iterator] == [2]
+
+    def test_trusted_models_per_client_and_per_call(self, client):
+        """Test the client-wide trusted flag and its per-call override."""
+        trusted_client = new_client(api_key="test_key", trusted_models=True)
+
+        with patch("lgl_client.models.build_trusted",
+                   wraps=build_trusted) as mock_build:
+            with patch.object(client.constituents.client, '_get',
+                              side_effect=self._constituent_pages(3)):
+                validated = client.constituents.fetch_all()
+                assert mock_build.call_count == 0
+                assert client.constituents.fetch_all(trusted=True) == validated
+                assert mock_build.call_count == 3
+
+            mock_build.reset_mock()
+            with patch.object(trusted_client.constituents.client, '_get',
+                              side_effect=self._constituent_pages(3)):
+                assert trusted_client.constituents.fetch_all() == validated
+                assert mock_build.call_count == 3
+                trusted_client.constituents.fetch_all(trusted=False)
+                assert mock_build.call_count == 3
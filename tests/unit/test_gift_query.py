@@ -0,0 +1,126 @@
+"""Tests for planning gift queries onto gifts/search."""
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+from lgl_client import new_async_client, new_client
+from lgl_client.lgl_api.gift_query import GiftFilter
+from tests.fixtures import APIResponseMocker
+
+
+def gift(gift_id, constituent_id=1, campaign_id=5, acknowledged=False, gift_date="2025-02-01"):
+    """Gift payload."""
+    return {
+        "id": gift_id, "constituent_id": constituent_id, "gift_type_id": 1,
+        "campaign_id": campaign_id, "amount": 50.0, "date": gift_date,
+        "acknowledged": acknowledged,
+        "created_at": "2025-01-01T00:00:00Z", "updated_at": "2025-01-01T00:00:00Z",
+    }
+
+
+class FakeGifts:
+    """Donor gift list and search endpoint with configurable sizes."""
+
+    def __init__(self, listing, search):
+        self.listing = listing
+        self.search = search
+        self.calls = []
+
+    def __call__(self, path, limit=100, offset=0, **params):
+        self.calls.append((path, params.get("q"), offset))
+        items = self.search if path == "gifts/search" else self.listing
+        page = items[offset:offset + limit]
+        return APIResponseMocker.paginated_response(page, total=len(items), per_page=limit)
+
+
+class TestGiftQueryPlanning:
+    """Test where gift predicates are evaluated."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client."""
+        return new_client(api_key="test_key")
+
+    def test_account_wide_filters_are_pushed_down(self, client):
+        """Test supported criteria become one q[] term and nothing runs locally."""
+        plan = client.gifts.plan_query(GiftFilter(
+            date_from=date(2025, 1, 1), date_to=date(2025, 3, 31),
+            amount_from=100, campaign_ids=[5, 6], gift_ids=[9],
+        ))
+
+        assert plan.path == "gifts/search"
+        assert plan.params == {"q": [
+            "date_from=2025-01-01;date_to=2025-03-31;gift_amount=gte|100;"
+            "campaigns=in|5,6;gift_ids=9"
+        ]}
+        assert plan.local_filters == ()
+        assert "q[]: date_from=2025-01-01" in plan.explain()
+
+    def test_unsupported_predicates_run_locally(self, client):
+        """Test acknowledged is filtered in Python on top of the search."""
+        server = FakeGifts([], [gift(1, acknowledged=True), gift(2)])
+        criteria = GiftFilter(fund_ids=[3], acknowledged=False)
+        plan = client.gifts.plan_query(criteria)
+        assert plan.server_filters == ("fund_ids",)
+        assert plan.local_filters == ("acknowledged",)
+
+        with patch.object(client._client, "_get", side_effect=server):
+            assert [g.id for g in client.gifts.iter_plan(plan)] == [2]
+
+    def test_small_donor_list_is_used_without_extra_requests(self, client):
+        """Test a donor whose gifts fit one page is served by that page alone."""
+        listing = [gift(1), gift(2, campaign_id=6), gift(3)]
+        server = FakeGifts(listing, [])
+
+        with patch.object(client._client, "_get", side_effect=server):
+            gifts = client.gifts.get_gifts_by_campaign(1, 5)
+
+        assert [g.id for g in gifts] == [1, 3]
+        assert server.calls == [("constituents/1/gifts", None, 0)]
+
+    def test_large_donor_uses_the_smaller_search(self, client):
+        """Test a long donor history is replaced by the narrower search."""
+        listing = [gift(i) for i in range(1, 251)]
+        search = [gift(7), gift(8, constituent_id=2)]
+        server = FakeGifts(listing, search)
+
+        with patch.object(client._client, "_get", side_effect=server):
+            plan = client.gifts.plan_query(GiftFilter(constituent_id=1, campaign_ids=[5]))
+            gifts = list(client.gifts.iter_plan(plan))
+
+        assert plan.path == "gifts/search"
+        assert plan.local_filters == ("constituent_id",)
+        assert plan.estimates == {"constituents/1/gifts": 250, "gifts/search": 2}
+        assert [g.id for g in gifts] == [7]
+        # The probed search page is reused rather than fetched again
+        assert [call[0] for call in server.calls] == ["constituents/1/gifts", "gifts/search"]
+
+    def test_date_range_helper_checks_locally_on_donor_list(self, client):
+        """Test the date-range helper keeps inclusive bounds when filtering locally."""
+        listing = [gift(1, gift_date="2024-12-31"), gift(2, gift_date="2025-01-01"),
+                   gift(3, gift_date="2025-06-30"), gift(4, gift_date="2025-07-01")]
+        server = FakeGifts(listing, [])
+
+        with patch.object(client._client, "_get", side_effect=server):
+            gifts = client.gifts.get_gifts_by_date_range(
+                1, date(2025, 1, 1), date(2025, 6, 30)
+            )
+
+        assert [g.id for g in gifts] == [2, 3]
+
+    def test_empty_id_list_is_rejected(self):
+        """Test an empty ID list cannot silently match everything."""
+        with pytest.raises(ValueError):
+            GiftFilter(campaign_ids=[])
+
+    @pytest.mark.asyncio
+    async def test_async_unacknowledged_helper(self):
+        """Test the async helper plans the same way as the sync one."""
+        client = new_async_client(api_key="test_key")
+        server = FakeGifts([gift(1, acknowledged=True), gift(2)], [])
+
+        with patch.object(client._client, "_get", AsyncMock(side_effect=server)):
+            gifts = await client.gifts.get_unacknowledged_gifts(1)
+
+        assert [g.id for g in gifts] == [2]
+        assert server.calls == [("constituents/1/gifts", None, 0)]
@@ -0,0 +1,69 @@
+"""Cold-start regression tests for ``import lgl_client``."""
+import json
+import pytest
+import subprocess
+import sys
+
+from lgl_client import LGL, new_client
+
+# Seconds spent importing lgl_client on top of httpx, best of three runs
+IMPORT_BUDGET = 0.15
+
+PROBE = """
+import json, sys, time
+import httpx
+started = time.perf_counter()
+import lgl_client
+elapsed = time.perf_counter() - started
+client = lgl_client.new_client("test_key")
+loaded = sorted(name for name in sys.modules if name.startswith(("lgl_client", "pydantic")))
+client.funds
+after_funds = sorted(name for name in sys.modules if name.startswith("lgl_client.lgl_api."))
+print(json.dumps({"elapsed": elapsed, "loaded": loaded, "after_funds": after_funds}))
+"""
+
+
+def run_probe():
+    """Import lgl_client in a fresh interpreter and report what it loaded."""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+class TestImportTime:
+    """Test importing the package and creating a client stay cheap."""
+
+    def test_import_loads_no_resources_or_models(self):
+        """Test resource modules and pydantic models load only when used."""
+        probes = [run_probe() for _ in range(3)]
+        loaded = probes[0]["loaded"]
+
+        assert not any(name.startswith("pydantic") for name in loaded)
+        assert "lgl_client.models" not in loaded
+        assert "lgl_client.lgl_api.gifts" not in loaded
+        assert "lgl_client.lgl_api.funds" in probes[0]["after_funds"]
+        assert "lgl_client.lgl_api.gifts" not in probes[0]["after_funds"]
+        assert min(probe["elapsed"] for probe in probes) < IMPORT_BUDGET
+
+    def test_resources_are_created_once_on_first_access(self):
+        """Test lazy resources are cached, share the client and still list in dir()."""
+        client = new_client(api_key="test_key")
+        assert "gifts" not in vars(client)
+
+        gifts = client.gifts
+        assert client.gifts is gifts
+        assert gifts.client is client._client
+        assert set(LGL.__annotations__) <= set(dir(client))
+
+    def test_lazy_exports(self):
+        """Test exports served by module __getattr__ resolve and unknown names fail."""
+        import lgl_client
+
+        from lgl_client import GiftsAPI, SearchQuery
+        from lgl_client.lgl_api.gifts import GiftsAPI as Direct
+
+        assert GiftsAPI is Direct
+        assert SearchQuery("gifts").to_params() == {}
+        with pytest.raises(AttributeError):
+            lgl_client.NoSuchThing
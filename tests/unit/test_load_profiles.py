@@ -0,0 +1,117 @@
+"""Tests for batch loading of constituent profiles."""
+import pytest
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+from lgl_client import new_async_client, new_client
+from lgl_client.lgl_api.exceptions import NotFoundError
+from tests.fixtures import APIResponseMocker
+
+STAMP = "2025-01-01T00:00:00Z"
+
+
+def detail(constituent_id, **collections):
+    """Constituent detail response with the given embedded collections."""
+    return {
+        "api_version": "1.0", "id": constituent_id, "last_name": f"Donor{constituent_id}",
+        "created_at": STAMP, "updated_at": STAMP, **collections,
+    }
+
+
+def email(email_id):
+    """Email address payload."""
+    return {
+        "id": email_id, "address": f"e{email_id}@example.org", "email_address_type_id": 1,
+        "email_type_name": "Home", "created_at": STAMP, "updated_at": STAMP,
+    }
+
+
+class TestLoadProfiles:
+    """Test ConstituentsAPI.load_profiles."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client."""
+        return new_client(api_key="test_key", page_concurrency=4)
+
+    def test_one_concurrent_request_per_constituent(self, client):
+        """Test embedded collections need no further requests and run in parallel."""
+        in_flight, peak = [0], [0]
+        lock = threading.Lock()
+
+        def mock_get(path, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            constituent_id = int(path.rsplit("/", 1)[1])
+            return detail(constituent_id, email_addresses=[email(constituent_id)], memberships=[])
+
+        with patch.object(client._client, "_get", side_effect=mock_get) as mock:
+            profiles = client.constituents.load_profiles(
+                [3, 1, 2, 1], include=["email_addresses", "memberships"]
+            )
+
+        assert [p.id for p in profiles] == [3, 1, 2]
+        assert profiles[0].email_addresses[0].address == "e3@example.org"
+        assert mock.call_count == 3
+        assert peak[0] > 1
+
+    def test_missing_collections_fan_out_to_sub_resources(self, client):
+        """Test collections absent from the detail response come from their endpoints."""
+        calls = []
+
+        def mock_get(path, **kwargs):
+            calls.append(path)
+            if path == "constituents/7":
+                return detail(7, memberships=[])
+            assert path == "constituents/7/email_addresses"
+            return APIResponseMocker.paginated_response([email(70), email(71)], total=2)
+
+        with patch.object(client._client, "_get", side_effect=mock_get):
+            (profile,) = client.constituents.load_profiles(
+                [7], include=["email_addresses", "memberships", "categories"]
+            )
+
+        assert [e.id for e in profile.email_addresses] == [70, 71]
+        assert sorted(calls) == ["constituents/7", "constituents/7/email_addresses"]
+
+    def test_missing_constituents(self, client):
+        """Test deleted constituents raise unless skip_missing is set."""
+        def mock_get(path, **kwargs):
+            if path == "constituents/2":
+                raise NotFoundError("Not found", status_code=404, url=path)
+            return detail(int(path.rsplit("/", 1)[1]))
+
+        with patch.object(client._client, "_get", side_effect=mock_get):
+            with pytest.raises(NotFoundError):
+                client.constituents.load_profiles([1, 2], include=[])
+            profiles = client.constituents.load_profiles([1, 2], include=[], skip_missing=True)
+
+        assert [p.id for p in profiles] == [1]
+
+    def test_unknown_collection_rejected(self, client):
+        """Test include is validated before any request."""
+        with pytest.raises(ValueError):
+            client.constituents.load_profiles([1], include=["gifts"])
+
+    @pytest.mark.asyncio
+    async def test_async_load_profiles(self):
+        """Test the async loader assembles the same profiles."""
+        client = new_async_client(api_key="test_key")
+
+        async def mock_get(path, **kwargs):
+            if path.endswith("/phone_numbers"):
+                return APIResponseMocker.paginated_response([], total=0)
+            return detail(int(path.rsplit("/", 1)[1]), email_addresses=[email(1)])
+
+        with patch.object(client._client, "_get", AsyncMock(side_effect=mock_get)):
+            profiles = await client.constituents.load_profiles(
+                [5, 6], include=["email_addresses", "phone_numbers"]
+            )
+
+        assert [p.id for p in profiles] == [5, 6]
+        assert all(p.phone_numbers == [] for p in profiles)
@@ -0,0 +1,139 @@
+"""Tests for request event hooks and the metrics collector."""
+import pytest
+import httpx
+from unittest.mock import AsyncMock, patch
+
+from lgl_client import MetricsCollector, RequestEvent, RetryPolicy, new_async_client, new_client
+from lgl_client.lgl_api.exceptions import LGLAPIError
+
+
+def make_response(status_code, json=None, path="categories"):
+    """Build a real httpx response for the given status."""
+    request = httpx.Request("GET", f"https://api.littlegreenlight.com/api/v1/{path}")
+    return httpx.Response(status_code, json=json or {}, request=request)
+
+
+def event(latency, method="GET", endpoint="gifts", status=200):
+    """Request event with the given latency."""
+    return RequestEvent(method, endpoint, status, 10, latency, latency)
+
+
+class TestEventHooks:
+    """Test events emitted by the HTTP clients."""
+
+    def test_event_describes_request_with_retries_and_page(self):
+        """Test hooks see the template, status, size, retries and page number."""
+        events = []
+        client = new_client(
+            api_key="test_key", retry=RetryPolicy(max_attempts=3), event_hooks=[events.append]
+        )
+        body = {"items": [], "total_items": 0}
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.client.time.sleep"):
+            mock_httpx.get.side_effect = [
+                make_response(503, path="constituents/12/gifts"),
+                make_response(200, body, path="constituents/12/gifts"),
+            ]
+            client.gifts.list(12, limit=25, offset=50)
+
+        (seen,) = events
+        assert (seen.method, seen.endpoint, seen.status) == ("GET", "constituents/{id}/gifts", 200)
+        assert seen.retries == 1 and seen.page == 3
+        assert seen.bytes == len(make_response(200, body).content)
+        assert 0 <= seen.latency <= seen.elapsed
+
+    def test_concurrent_pages_report_their_page_number(self):
+        """Test pages fetched on the pool are numbered like the first one."""
+        events = []
+        client = new_client(api_key="test_key", page_concurrency=3, event_hooks=[events.append])
+
+        def get(url, params=None, **ignored):
+            offset = params["offset"]
+            items = [{"id": i} for i in range(offset, min(offset + 10, 45))]
+            body = {"items": items, "items_count": len(items), "total_items": 45}
+            return make_response(200, body, path="notes")
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.side_effect = get
+            items = list(client._client._paginate(
+                lambda **page: client._client._get("notes", **page), limit=10
+            ))
+
+        assert len(items) == 45
+        assert sorted(e.page for e in events) == [1, 2, 3, 4, 5]
+
+    def test_transport_errors_and_failing_hooks(self):
+        """Test transport errors are reported and a broken hook never breaks a request."""
+        events = []
+
+        def broken(event):
+            raise RuntimeError("hook bug")
+
+        client = new_client(api_key="test_key", event_hooks=[broken, events.append])
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.side_effect = httpx.ConnectError("down")
+            with pytest.raises(LGLAPIError):
+                client.categories.list()
+
+        assert events[0].status is None and events[0].error == "ConnectError"
+
+    def test_no_hooks_no_events(self):
+        """Test the default client builds no events."""
+        client = new_client(api_key="test_key")
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch.object(client._client, "_emit_event") as emit:
+            mock_httpx.get.return_value = make_response(200, {"items": []})
+            client.categories.list()
+
+        emit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_client_emits_events(self):
+        """Test the async client reports events the same way."""
+        metrics = MetricsCollector()
+        client = new_async_client(api_key="test_key", event_hooks=[metrics])
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get = AsyncMock(return_value=make_response(200, {"items": []}))
+            await client.categories.list()
+
+        assert metrics.endpoint("GET", "categories").count == 1
+
+
+class TestMetricsCollector:
+    """Test histogram aggregation and export."""
+
+    def test_histogram_and_quantiles(self):
+        """Test latencies land in buckets and quantiles interpolate within them."""
+        metrics = MetricsCollector(buckets=(0.1, 0.5, 1.0))
+        for latency in (0.05, 0.1, 0.3, 0.4, 2.0):
+            metrics(event(latency))
+        metrics(event(0.2, status=None))
+
+        entry = metrics.endpoint("GET", "gifts")
+        assert entry.bucket_counts == [2, 3, 0, 1]
+        assert entry.count == 6 and entry.errors == 1 and entry.statuses == {200: 5}
+        assert entry.quantile(0.5) == pytest.approx(0.1 + 0.4 * (3 - 2) / 3)
+        assert entry.quantile(1.0) == 1.0
+        assert metrics.snapshot()["GET gifts"]["count"] == 6
+
+        with pytest.raises(ValueError):
+            MetricsCollector(buckets=(1.0, 0.5))
+
+    def test_prometheus_export(self):
+        """Test the text exposition has cumulative buckets and escaped labels."""
+        metrics = MetricsCollector(buckets=(0.1, 1.0))
+        metrics(event(0.05, endpoint="constituents/{id}/gifts"))
+        metrics(event(0.5, endpoint="constituents/{id}/gifts", status=404))
+        metrics(event(0.5, method="POST", endpoint='odd"path'))
+
+        text = metrics.to_prometheus()
+        labels = 'method="GET",endpoint="constituents/{id}/gifts"'
+        assert "# TYPE lgl_client_request_duration_seconds histogram" in text
+        assert f'lgl_client_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+        assert f'lgl_client_request_duration_seconds_bucket{{{labels},le="1.0"}} 2' in text
+        assert f'lgl_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f'lgl_client_request_duration_seconds_count{{{labels}}} 2' in text
+        assert f'lgl_client_requests_total{{{labels},status="404"}} 1' in text
+        assert f'lgl_client_response_bytes_total{{{labels}}} 20' in text
+        assert 'endpoint="odd\\"path"' in text
+        assert text.endswith("\n")
@@ -0,0 +1,195 @@
+"""Tests for the local SQLite mirror."""
+import sqlite3
+import pytest
+from datetime import date
+from unittest.mock import patch
+
+from lgl_client import new_client
+from lgl_client.mirror import Mirror
+from lgl_client.models.constituent import Constituent
+from lgl_client.models.gift import Gift
+from tests.fixtures import APIResponseMocker
+
+STAMP = "2025-01-01T00:00:00Z"
+
+
+def constituent(constituent_id, updated_at, **fields):
+    """Constituent payload with expanded children."""
+    return {
+        "id": constituent_id, "last_name": f"Donor{constituent_id}",
+        "sort_name": f"Donor{constituent_id}", "created_at": STAMP,
+        "updated_at": updated_at,
+        "email_addresses": [{
+            "id": constituent_id * 10, "address": f"d{constituent_id}@example.org",
+            "email_address_type_id": 1, "email_type_name": "Home",
+            "created_at": STAMP, "updated_at": STAMP,
+        }],
+        "memberships": [{
+            "id": constituent_id * 100, "constituent_id": constituent_id,
+            "membership_level_id": 2, "membership_level_name": "Gold",
+            "finish_date": "2025-12-31", "created_at": STAMP, "updated_at": STAMP,
+        }],
+        "custom_attrs": [],
+        **fields,
+    }
+
+
+def gift(gift_id, constituent_id, updated_at, gift_date="2025-02-01", fund_id=7):
+    """Gift payload."""
+    return {
+        "id": gift_id, "constituent_id": constituent_id, "gift_type_id": 1,
+        "fund_id": fund_id, "amount": 25.0, "date": gift_date,
+        "created_at": STAMP, "updated_at": updated_at,
+    }
+
+
+class FakeAccount:
+    """In-memory LGL account answering the endpoints the mirror reads."""
+
+    def __init__(self):
+        self.records = {
+            "constituents/search": {1: constituent(1, "2025-03-01T10:00:00Z"),
+                                    2: constituent(2, "2025-03-01T11:00:00Z")},
+            "gifts/search": {5: gift(5, 1, "2025-03-01T10:00:00Z"),
+                             6: gift(6, 2, "2025-03-02T10:00:00Z", "2025-04-01", 8)},
+            "notes": {3: {"id": 3, "constituent_id": 1, "text": "Met at gala",
+                          "created_at": STAMP, "updated_at": "2025-03-01T10:00:00Z"}},
+            "volunteer_times/search": {},
+            "funds": {7: {"id": 7, "name": "General"}, 8: {"id": 8, "name": "Capital"}},
+        }
+        self.calls = []
+
+    def __call__(self, path, q=None, sort=None, limit=100, offset=0, **params):
+        self.calls.append({"path": path, "q": q, **params})
+        records = list(self.records.get(path, {}).values())
+        for clause in q or []:
+            _, _, value = clause.partition("=")
+            records = [r for r in records if r["updated_at"] >= value]
+        if sort == "date_updated":
+            records.sort(key=lambda r: (r["updated_at"], r["id"]))
+        page = records[offset:offset + limit]
+        return APIResponseMocker.paginated_response(page, total=len(records), per_page=limit)
+
+
+class TestMirror:
+    """Test loading, refreshing and reading the mirror."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client."""
+        return new_client(api_key="test_key")
+
+    @pytest.fixture
+    def account(self):
+        """Fake account data."""
+        return FakeAccount()
+
+    def refresh(self, mirror, client, account, **kwargs):
+        """Run one refresh against the fake account."""
+        with patch.object(client._client, "_get", side_effect=account):
+            return mirror.refresh(**kwargs)
+
+    def test_initial_load_and_reads(self, client, account, tmp_path):
+        """Test a full load returns the same models the live API would."""
+        mirror = Mirror(tmp_path / "lgl.sqlite", client)
+        counts = self.refresh(mirror, client, account)
+
+        assert counts["constituents"] == 2
+        assert counts["gifts"] == 2
+        assert counts["notes"] == 1
+        assert counts["funds"] == 2
+        constituent_calls = [c for c in account.calls if c["path"] == "constituents/search"]
+        assert "memberships" in constituent_calls[0]["expand"]
+
+        live = Constituent.from_dict(account.records["constituents/search"][1])
+        assert mirror.constituent(1) == live
+        assert mirror.constituent(99) is None
+        assert [c.id for c in mirror.constituents()] == [1, 2]
+        assert mirror.counts()["email_addresses"] == 2
+
+        assert mirror.gifts(constituent_id=2) == [
+            Gift.from_dict(account.records["gifts/search"][6])
+        ]
+        assert [g.id for g in mirror.gifts(date_from=date(2025, 3, 1))] == [6]
+        assert [g.id for g in mirror.gifts(fund_id=7)] == [5]
+        assert [m.finish_date for m in mirror.memberships(constituent_id=1)] == [
+            date(2025, 12, 31)
+        ]
+        assert [n.text for n in mirror.notes(constituent_id=1)] == ["Met at gala"]
+        assert [f.name for f in mirror.lookup("funds")] == ["General", "Capital"]
+        mirror.close()
+
+        # Persisted to disk and readable without a client
+        with Mirror(tmp_path / "lgl.sqlite") as reopened:
+            assert reopened.constituent(2).email_addresses[0].address == "d2@example.org"
+
+    def test_incremental_refresh_replaces_children(self, client, account):
+        """Test later refreshes request only changes and replace stale children."""
+        mirror = Mirror(lgl=client)
+        self.refresh(mirror, client, account, lookups=False)
+        account.calls.clear()
+
+        account.records["constituents/search"][1] = constituent(
+            1, "2025-03-05T10:00:00Z", email_addresses=[], first_name="Ada"
+        )
+        counts = self.refresh(mirror, client, account, lookups=False)
+
+        assert counts == {"constituents": 1, "gifts": 0, "notes": 0, "volunteer_times": 0}
+        first = account.calls[0]
+        assert first["q"] == ["updated_from=2025-03-01T11:00:00Z"]
+        updated = mirror.constituent(1)
+        assert updated.first_name == "Ada"
+        assert updated.email_addresses == []
+        assert len(mirror.constituent(2).email_addresses) == 1
+
+    def test_failed_refresh_keeps_committed_state(self, client, account):
+        """Test an error mid-refresh leaves records and watermark consistent."""
+        mirror = Mirror(lgl=client, page_size=1)
+
+        def fail_on_second_page(path, **kwargs):
+            if path == "constituents/search" and kwargs.get("q"):
+                raise RuntimeError("connection lost")
+            return account(path, **kwargs)
+
+        with patch.object(client._client, "_get", side_effect=fail_on_second_page):
+            with pytest.raises(RuntimeError):
+                mirror.refresh(lookups=False)
+
+        assert [c.id for c in mirror.constituents()] == [1]
+        assert mirror.state.load("constituents").boundary_ids == {1}
+        self.refresh(mirror, client, account, lookups=False)
+        assert [c.id for c in mirror.constituents()] == [1, 2]
+
+    def test_rebuild_drops_deleted_records(self, client, account):
+        """Test rebuild forgets records removed in LGL."""
+        mirror = Mirror(lgl=client)
+        self.refresh(mirror, client, account, lookups=False)
+        del account.records["gifts/search"][5]
+
+        with patch.object(client._client, "_get", side_effect=account):
+            mirror.rebuild()
+
+        assert [g.id for g in mirror.gifts()] == [6]
+
+    def test_execute_is_read_only(self, client, account):
+        """Test ad-hoc queries cannot modify the mirror."""
+        mirror = Mirror(lgl=client)
+        self.refresh(mirror, client, account, lookups=False)
+
+        assert mirror.execute("SELECT id FROM gifts WHERE id = ?", (6,)) == [(6,)]
+        for statement in ("DELETE FROM gifts", "DROP TABLE gifts"):
+            with pytest.raises(sqlite3.OperationalError):
+                mirror.execute(statement)
+
+        assert [g.id for g in mirror.gifts()] == [5, 6]
+        self.refresh(mirror, client, account, lookups=False)
+        assert mirror.counts()["gifts"] == 2
+
+    def test_invalid_arguments(self, client):
+        """Test unknown resources and missing clients are rejected."""
+        with pytest.raises(ValueError):
+            Mirror().refresh()
+        with pytest.raises(ValueError):
+            Mirror(lgl=client).refresh(["payment_types"])
+        with pytest.raises(ValueError):
+            Mirror().lookup("gifts")
@@ -2,9 +2,10 @@
 import pytest
 from datetime import date, datetime
 from typing import Dict, Any, List
-from pydantic import ValidationError
+from pydantic import Field, ValidationError
 
 # Import all models
+from lgl_client.models import LGLModel
 from lgl_client.models.appeal import Appeal
 from lgl_client.models.appeal_request import AppealRequest
 from lgl_client.models.campaign import Campaign
@@ -481,4 +482,86 @@ class TestModelValidation:
         category_dict = category.model_dump()
         assert isinstance(category_dict, dict)
         assert category_dict["id"] == 1
-        assert category_dict["name"] == "Test Category"
\ No newline at end of file
+        assert category_dict["name"] == "Test Category"
+
+class TestTrustedConstruction:
+    """Test the validation-free construction path for API payloads."""
+
+    @pytest.fixture
+    def gift_data(self):
+        """Well-formed gift payload as returned by the API."""
+        return {
+            "id": 1,
+            "constituent_id": 7,
+            "gift_type_id": 2,
+            "amount": 125.5,
+            "date": "2024-03-05",
+            "check_date": "",
+            "created_at": "2024-03-05T10:00:00Z",
+            "updated_at": "2024-03-06T11:30:00+02:00",
+            "custom_attrs": [{"id": 3, "key": "source", "value": "web"}],
+            "tribute": {"tribute_name": "In memory of A", "tribute_type": "memorial"},
+            "future_field": "kept as extra",
+        }
+
+    def test_trusted_matches_validated(self, gift_data):
+        """Test trusted construction builds the same model as validation."""
+        validated = Gift.from_dict(gift_data)
+        trusted = Gift.from_dict(gift_data, trusted=True)
+
+        assert trusted == validated
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_fields_set == validated.model_fields_set
+        assert trusted.date == date(2024, 3, 5)
+        assert trusted.check_date is None
+        assert isinstance(trusted.created_at, datetime)
+        assert trusted.tribute.tribute_type == "memorial"
+        assert trusted.custom_attrs[0].value == "web"
+        assert trusted.future_field == "kept as extra"
+
+    def test_trusted_nested_lists(self):
+        """Test nested model lists with datetime fields are converted."""
+        data = {
+            "id": 1,
+            "last_name": "Doe",
+            "created_at": "2025-01-01T10:00:00Z",
+            "updated_at": "2025-01-01T10:00:00Z",
+            "email_addresses": [{
+                "id": 5,
+                "address": "jane@example.com",
+                "email_address_type_id": 1,
+                "email_type_name": "Home",
+                "created_at": "2025-01-01T10:00:00Z",
+                "updated_at": "2025-01-01T10:00:00Z",
+            }],
+        }
+
+        trusted = Constituent.from_dict(data, trusted=True)
+
+        assert trusted == Constituent.from_dict(data)
+        assert trusted.email_addresses[0].created_at.year == 2025
+
+    def test_trusted_defaults_are_not_shared(self, gift_data):
+        """Test mutable defaults are copied per instance."""
+        del gift_data["custom_attrs"]
+        first = Gift.from_dict(gift_data, trusted=True)
+        second = Gift.from_dict(gift_data, trusted=True)
+
+        assert first.custom_attrs == []
+        assert first.custom_attrs is not second.custom_attrs
+
+    def test_trusted_factory_receives_data(self):
+        """Test default factories that take the model data are given it."""
+        class Named(LGLModel):
+            name: str
+            label: str = Field(default_factory=lambda data: data["name"].upper())
+
+        assert Named.from_dict({"name": "doe"}, trusted=True).label == "DOE"
+        assert Named.from_dict({"name": "doe", "label": "x"}, trusted=True).label == "x"
+
+    def test_trusted_models_stay_validated_on_assignment(self, gift_data):
+        """Test instances built on the fast path still validate later writes."""
+        gift = Gift.from_dict(gift_data, trusted=True)
+
+        with pytest.raises(ValidationError):
+            gift.amount = "not a number"
@@ -0,0 +1,141 @@
+"""Tests for adaptive page size selection in _paginate."""
+import pytest
+import httpx
+from unittest.mock import AsyncMock, patch
+
+from lgl_client import PageSizeTuner, new_async_client, new_client
+
+PADDING = "x" * 950
+
+
+def note(note_id):
+    """Note payload of roughly 1 KB."""
+    return {
+        "id": note_id, "constituent_id": 42, "text": PADDING,
+        "created_at": "2025-03-01T10:00:00Z", "updated_at": "2025-03-01T10:00:00Z",
+    }
+
+
+def paged(path, total):
+    """Side effect serving ``total`` notes for whatever limit/offset is requested."""
+    def get(url, params=None, **ignored):
+        offset, limit = params["offset"], params["limit"]
+        items = [note(i) for i in range(offset, min(offset + limit, total))]
+        request = httpx.Request("GET", f"https://api.littlegreenlight.com/api/v1/{path}")
+        body = {"items": items, "items_count": len(items), "total_items": total,
+                "offset": offset, "limit": limit}
+        return httpx.Response(200, json=body, request=request)
+    return get
+
+
+def limits(mock_get):
+    """Limits requested, in order."""
+    return [call.kwargs["params"]["limit"] for call in mock_get.call_args_list]
+
+
+class TestPageSizeTuner:
+    """Test the sizing rule on its own."""
+
+    def test_sizes_follow_latency_and_payload_budgets(self):
+        """Test heavy pages shrink, light pages stay at the maximum and growth is capped."""
+        tuner = PageSizeTuner(target_latency=1.0, max_bytes=50_000, min_size=10)
+
+        assert tuner.observe("gifts", items=100, latency=0.2, size=20_000) == 100
+        assert tuner.observe("constituents/search", items=100, latency=4.0, size=10_000) == 25
+        assert tuner.observe("notes", items=100, latency=0.1, size=1_000_000) == 10
+        assert tuner.stats()["constituents/search"]["page_size"] == 25
+
+        eager = PageSizeTuner(target_latency=1.0, smoothing=1)
+        eager.observe("funds", items=100, latency=10.0, size=100)
+        assert eager.page_size("funds") == 10
+        assert eager.observe("funds", items=10, latency=0.001, size=100) == 20
+
+    def test_overrides_hints_and_validation(self):
+        """Test fixed sizes are never tuned, hints map callers to endpoints and bad settings fail."""
+        tuner = PageSizeTuner(overrides={"gifts/search": 50})
+
+        assert tuner.observe("gifts/search", items=50, latency=30.0, size=10, hint="f") == 50
+        assert tuner.page_size(hint="f") == 50 and tuner.page_size(hint="g") == 100
+        assert tuner.stats()["gifts/search"]["overridden"] is True
+        tuner.reset()
+        assert tuner.page_size(hint="f") == 100
+        for settings in ({"min_size": 0}, {"initial": 500}, {"smoothing": 0},
+                         {"target_latency": 0}, {"overrides": {"gifts": 0}}):
+            with pytest.raises(ValueError):
+                PageSizeTuner(**settings)
+
+
+class TestAdaptivePagination:
+    """Test _paginate and constituent searches with a tuner."""
+
+    def test_paginate_shrinks_pages_to_the_payload_budget(self):
+        """Test later pages use the tuned limit and the next run starts from it."""
+        tuner = PageSizeTuner(max_bytes=20_000, target_latency=60.0)
+        events = []
+        client = new_client(api_key="test_key", page_size_tuner=tuner, event_hooks=[events.append])
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.side_effect = paged("constituents/42/notes", 130)
+            first = client.notes.fetch_all(42)
+            second = client.notes.fetch_all(42)
+
+        requested = limits(mock_httpx.get)
+        assert [n.id for n in first] == [n.id for n in second] == list(range(130))
+        assert requested[0] == 100 and set(requested[1:]) == {requested[1]}
+        assert 10 <= requested[1] < 20
+        # Events count pages as fetched, not offset // limit under the new size
+        first_pages = 1 + -(-30 // requested[1])
+        assert [e.page for e in events] == (
+            list(range(1, first_pages + 1)) + list(range(1, len(events) - first_pages + 1))
+        )
+        stats = tuner.stats()["constituents/{id}/notes"]
+        assert stats["page_size"] == requested[1] and stats["overridden"] is False
+
+    def test_explicit_limit_and_no_tuner(self):
+        """Test an explicit limit is kept and clients without a tuner request 100 items."""
+        tuned = new_client(api_key="test_key", page_size_tuner=PageSizeTuner(max_bytes=5_000))
+        plain = new_client(api_key="test_key")
+
+        for client, kwargs, expected in ((tuned, {"limit": 40}, 40), (plain, {}, 100)):
+            with patch.object(client._client, "_client") as mock_httpx:
+                mock_httpx.get.side_effect = paged("notes", 250)
+                items = list(client._client._paginate(
+                    lambda **page: client._client._get("notes", **page), **kwargs
+                ))
+            assert len(items) == 250
+            assert set(limits(mock_httpx.get)) == {expected}
+
+    def test_constituent_search_is_tuned(self):
+        """Test iter_search takes its page size from the tuner."""
+        tuner = PageSizeTuner(overrides={"constituents/search": 30})
+        client = new_client(api_key="test_key", page_size_tuner=tuner)
+        request = httpx.Request("GET", "https://api.littlegreenlight.com/api/v1/constituents/search")
+        person = {"id": 1, "first_name": "Ada", "last_name": "Lovelace",
+                  "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-02T15:30:00Z"}
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.side_effect = [
+                httpx.Response(200, json={"items": [person], "next_item": 1}, request=request),
+                httpx.Response(200, json={"items": [person], "next_item": None}, request=request),
+            ]
+            found = list(client.constituents.iter_search(["name=ada"]))
+
+        assert len(found) == 2
+        assert limits(mock_httpx.get) == [30, 30]
+
+    @pytest.mark.asyncio
+    async def test_async_paginate(self):
+        """Test the async paginator tunes pages as well."""
+        tuner = PageSizeTuner(max_bytes=20_000, target_latency=60.0)
+        events = []
+        client = new_async_client(
+            api_key="test_key", page_size_tuner=tuner, event_hooks=[events.append]
+        )
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get = AsyncMock(side_effect=paged("constituents/42/notes", 130))
+            notes = await client.notes.fetch_all(42)
+
+        assert len(notes) == 130
+        assert limits(mock_httpx.get)[0] == 100 and limits(mock_httpx.get)[1] < 20
+        assert [e.page for e in events] == list(range(1, len(events) + 1))
@@ -5,6 +5,7 @@ from typing import Dict, Any, List
 
 from lgl_client import new_client
 from lgl_client.lgl_api.client import LGLClient
+from lgl_client.lgl_api.exceptions import LGLAPIError
 from lgl_client.models.category import Category
 from tests.fixtures import (
     APIResponseMocker,
@@ -327,4 +328,112 @@ class TestPaginationFramework:
 
         with patch.object(client.categories._client, '_get', side_effect=mock_get_side_effect):
             with pytest.raises(Exception):
-                client.categories.fetch_all()
\ No newline at end of file
+                client.categories.fetch_all()
+
+class TestConcurrentPagination:
+    """Test concurrent page fetching driven by total_items."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client."""
+        return new_client(api_key="test_key")
+
+    @staticmethod
+    def _constituent_pages(total: int, delay_for=None, tracker=None):
+        """Build a thread-safe _get side effect serving ``total`` constituents."""
+        import threading
+        import time
+
+        all_items = [
+            {"id": i, "first_name": f"First{i}", "last_name": "Doe",
+             "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-01T10:00:00Z"}
+            for i in range(1, total + 1)
+        ]
+        lock = threading.Lock()
+
+        def mock_get(path, **kwargs):
+            offset, limit = kwargs["offset"], kwargs["limit"]
+            if tracker is not None:
+                with lock:
+                    tracker["active"] += 1
+                    tracker["peak"] = max(tracker["peak"], tracker["active"])
+            try:
+                if delay_for:
+                    time.sleep(delay_for(offset))
+                return APIResponseMocker.paginated_response(
+                    all_items[offset:offset + limit], total=total, per_page=limit
+                )
+            finally:
+                if tracker is not None:
+                    with lock:
+                        tracker["active"] -= 1
+
+        return mock_get
+
+    def test_results_come_back_in_offset_order(self, client):
+        """Test later pages finishing first does not reorder items."""
+        # Earlier offsets sleep longer so pages complete out of order
+        mock_get = self._constituent_pages(1000, delay_for=lambda offset: (1000 - offset) / 20000)
+
+        with patch.object(client.constituents.client, "_get", side_effect=mock_get) as mock:
+            constituents = client.constituents.fetch_all(concurrency=4)
+
+        assert [c.id for c in constituents] == list(range(1, 1001))
+        assert mock.call_count == 10
+
+    def test_in_flight_pages_are_bounded(self, client):
+        """Test no more than ``concurrency`` pages are requested at once."""
+        tracker = {"active": 0, "peak": 0}
+        mock_get = self._constituent_pages(1000, delay_for=lambda offset: 0.01, tracker=tracker)
+
+        with patch.object(client.constituents.client, "_get", side_effect=mock_get):
+            constituents = client.constituents.fetch_all(concurrency=3)
+
+        assert len(constituents) == 1000
+        assert 1 < tracker["peak"] <= 3
+
+    def test_client_default_concurrency(self):
+        """Test page_concurrency on the client is used when no override is given."""
+        client = new_client(api_key="test_key", page_concurrency=4)
+        tracker = {"active": 0, "peak": 0}
+        mock_get = self._constituent_pages(500, delay_for=lambda offset: 0.01, tracker=tracker)
+
+        with patch.object(client.constituents.client, "_get", side_effect=mock_get):
+            assert len(client.constituents.fetch_all()) == 500
+            assert tracker["peak"] > 1
+
+            # A per-call value wins over the client default
+            tracker["peak"] = 0
+            assert len(client.constituents.fetch_all(concurrency=1)) == 500
+            assert tracker["peak"] == 1
+
+    def test_list_responses_fall_back_to_sequential(self, client):
+        """Test pages without total_items are still walked one at a time."""
+        all_items = [{"id": i, "name": f"Item {i}", "item_type": "Constituent"} for i in range(1, 26)]
+
+        def _list_page(limit, offset):
+            return all_items[offset:offset + limit]
+
+        items = list(client.categories._client._paginate(_list_page, limit=10, concurrency=4))
+
+        assert [item["id"] for item in items] == list(range(1, 26))
+
+    def test_page_error_propagates(self, client):
+        """Test a failing page surfaces its error to the caller."""
+        good_pages = self._constituent_pages(400)
+
+        def mock_get(path, **kwargs):
+            if kwargs["offset"] == 200:
+                raise LGLAPIError("HTTP 500", status_code=500, url="constituents")
+            return good_pages(path, **kwargs)
+
+        with patch.object(client.constituents.client, "_get", side_effect=mock_get):
+            with pytest.raises(LGLAPIError):
+                client.constituents.fetch_all(concurrency=4)
+
+    def test_invalid_concurrency(self, client):
+        """Test concurrency below one is rejected."""
+        with pytest.raises(ValueError):
+            list(client.categories._client._paginate(lambda **kwargs: [], concurrency=0))
+        with pytest.raises(ValueError):
+            new_client(api_key="test_key", page_concurrency=0)
@@ -1,13 +1,25 @@
 """Performance benchmark tests for the LGL client."""
+import asyncio
+import importlib.util
+import json
 import pytest
+import socket
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
 from typing import List, Dict, Any
 import statistics
 
-from lgl_client import new_client
+import httpx
+
+from lgl_client import new_async_client, new_client
 from tests.fixtures import APIResponseMocker
 
+# Captured at import time, before the autouse fixture in conftest patches it
+REAL_HTTPX_CLIENT = httpx.Client
+
 
 class TestPerformance:
     """Performance benchmark tests."""
@@ -387,4 +399,360 @@ class TestPerformance:
             
             # Check throughput
             throughput = 10000 / pagination_time
-            assert throughput > 1000, f"Large dataset throughput {throughput:.1f} items/sec too low"
\ No newline at end of file
+            assert throughput > 1000, f"Large dataset throughput {throughput:.1f} items/sec too low"
+
+
+def _best_of(func, rounds: int = 5) -> float:
+    """Return the fastest of several timed runs in seconds."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+BENCH_TOTAL = 2000
+BENCH_CONSTITUENTS = [
+    {"id": i, "first_name": f"First{i}", "last_name": "Doe",
+     "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-01T10:00:00Z"}
+    for i in range(1, BENCH_TOTAL + 1)
+]
+
+
+def _constituents_page(target: str) -> bytes:
+    """Serve one page of the benchmark constituents for a request target."""
+    query = parse_qs(urlsplit(target).query)
+    offset = int(query.get("offset", ["0"])[0])
+    limit = int(query.get("limit", ["25"])[0])
+    items = BENCH_CONSTITUENTS[offset:offset + limit]
+    return json.dumps({
+        "items": items,
+        "items_count": len(items),
+        "total_items": BENCH_TOTAL,
+        "offset": offset,
+        "limit": limit,
+    }).encode()
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Keep-alive HTTP/1.1 stand-in for the LGL constituents endpoint."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = _constituents_page(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _serve_h2c(listener: socket.socket) -> None:
+    """Minimal cleartext HTTP/2 (prior knowledge) stand-in built on h2."""
+    import h2.config
+    import h2.connection
+    import h2.events
+
+    def handle(conn_sock):
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        conn_sock.sendall(conn.data_to_send())
+        pending = {}
+        with conn_sock:
+            while True:
+                data = conn_sock.recv(65535)
+                if not data:
+                    return
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        headers = dict(event.headers)
+                        path = headers.get(b":path", b"/").decode()
+                        pending[event.stream_id] = memoryview(_constituents_page(path))
+                        conn.send_headers(event.stream_id, [
+                            (":status", "200"),
+                            ("content-type", "application/json"),
+                            ("content-length", str(len(pending[event.stream_id]))),
+                        ])
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                # Send as much of each body as flow control currently allows
+                for stream_id in list(pending):
+                    body = pending[stream_id]
+                    window = min(conn.local_flow_control_window(stream_id), len(body))
+                    while window > 0:
+                        chunk = min(window, conn.max_outbound_frame_size)
+                        conn.send_data(stream_id, body[:chunk].tobytes())
+                        body = body[chunk:]
+                        window -= chunk
+                    if len(body) == 0:
+                        conn.end_stream(stream_id)
+                        del pending[stream_id]
+                    else:
+                        pending[stream_id] = body
+                conn_sock.sendall(conn.data_to_send())
+
+    while True:
+        try:
+            conn_sock, _ = listener.accept()
+        except OSError:
+            return
+        threading.Thread(target=handle, args=(conn_sock,), daemon=True).start()
+
+
+@pytest.mark.performance
+class TestTransportPerformance:
+    """Benchmark connection pooling and HTTP/2 against local stand-in servers."""
+
+    @pytest.fixture
+    def http1_server(self):
+        """Start a local keep-alive HTTP/1.1 server."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}/api/v1/"
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def h2c_server(self):
+        """Start a local cleartext HTTP/2 server (requires h2)."""
+        if importlib.util.find_spec("h2") is None:
+            pytest.skip("h2 is not installed (pip install lgl-client[http2])")
+        listener = socket.create_server(("127.0.0.1", 0))
+        thread = threading.Thread(target=_serve_h2c, args=(listener,), daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{listener.getsockname()[1]}/api/v1/"
+        listener.close()
+
+    @staticmethod
+    def _throughput(base_url: str, rounds: int = 3, **client_options) -> float:
+        """Fetch every stand-in constituent with 8 page workers; return items/sec."""
+        with patch("httpx.Client", REAL_HTTPX_CLIENT), \
+                patch("lgl_client.lgl_api.client.LGLClient.BASE_URL", base_url):
+            client = new_client(api_key="test_key", page_concurrency=8, **client_options)
+            try:
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    assert len(client.constituents.fetch_all()) == BENCH_TOTAL
+                elapsed = time.perf_counter() - start
+            finally:
+                client._client.close()
+        return BENCH_TOTAL * rounds / elapsed
+
+    @staticmethod
+    def _async_throughput(base_url: str, rounds: int = 3, **client_options) -> float:
+        """Like :meth:`_throughput`, with the async client and 8 page tasks."""
+        async def run():
+            async with new_async_client(
+                api_key="test_key", page_concurrency=8, **client_options
+            ) as client:
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    assert len(await client.constituents.fetch_all()) == BENCH_TOTAL
+                return time.perf_counter() - start
+
+        with patch("lgl_client.lgl_api.client.AsyncLGLClient.BASE_URL", base_url):
+            elapsed = asyncio.run(run())
+        return BENCH_TOTAL * rounds / elapsed
+
+    def test_pooled_http1_vs_no_keepalive(self, http1_server):
+        """Benchmark the default keep-alive pool against reconnecting per request."""
+        pooled = self._throughput(http1_server)
+        unpooled = self._throughput(
+            http1_server, limits=httpx.Limits(max_connections=16, max_keepalive_connections=0)
+        )
+
+        assert pooled > 1000, (
+            f"Pooled HTTP/1.1 throughput {pooled:.1f} items/sec too low "
+            f"(no keep-alive: {unpooled:.1f})"
+        )
+
+    def test_http2_vs_pooled_http1(self, http1_server, h2c_server):
+        """Benchmark HTTP/2 multiplexing against the pooled HTTP/1.1 default.
+
+        Runs on the async client: httpcore's sync HTTP/2 connection can send
+        the headers of concurrent streams out of ID order, which servers
+        reject as a protocol error.
+        """
+        pooled = self._async_throughput(http1_server)
+        multiplexed = self._async_throughput(
+            h2c_server, http2=True, transport=httpx.AsyncHTTPTransport(http1=False, http2=True)
+        )
+
+        assert multiplexed > 1000, (
+            f"HTTP/2 throughput {multiplexed:.1f} items/sec too low (HTTP/1.1 pooled: {pooled:.1f})"
+        )
+
+
+BULK_GIFTS = [
+    {"id": i, "constituent_id": i % 500 + 1, "gift_type_id": 1, "gift_type_name": "Gift",
+     "fund_id": 3, "fund_name": "General", "amount": 25.0 + i % 100, "date": "2024-03-05",
+     "deductible_amount": 25.0, "acknowledged": True, "acknowledged_date": "2024-03-07",
+     "created_at": "2024-03-05T10:00:00Z", "updated_at": "2024-03-06T08:15:00Z",
+     "custom_attrs": []}
+    for i in range(1, 20001)
+]
+
+
+@pytest.mark.performance
+class TestModelConstructionPerformance:
+    """Benchmark trusted model construction against full validation."""
+
+    def test_trusted_vs_validated_gifts(self):
+        """Benchmark building 20,000 gifts with and without validation."""
+        from lgl_client.models.gift import Gift
+
+        validated = _best_of(lambda: [Gift.from_dict(item) for item in BULK_GIFTS])
+        trusted = _best_of(
+            lambda: [Gift.from_dict(item, trusted=True) for item in BULK_GIFTS]
+        )
+
+        assert Gift.from_dict(BULK_GIFTS[0], trusted=True) == Gift.from_dict(BULK_GIFTS[0])
+        assert trusted < validated, (
+            f"Trusted construction {trusted:.3f}s should beat full validation {validated:.3f}s"
+        )
+
+    def test_trusted_fetch_all_end_to_end(self):
+        """Benchmark gifts.fetch_all over mocked pages with the client-wide flag."""
+        def mock_get(path, **kwargs):
+            offset, limit = kwargs.get("offset", 0), kwargs.get("limit", 100)
+            return APIResponseMocker.paginated_response(
+                BULK_GIFTS[offset:offset + limit], total=len(BULK_GIFTS), per_page=limit
+            )
+
+        timings = {}
+        for trusted in (False, True):
+            client = new_client(api_key="test_key", trusted_models=trusted)
+            with patch.object(client._client, "_get", side_effect=mock_get):
+                timings[trusted] = _best_of(lambda: client.gifts.fetch_all(1), rounds=2)
+
+        assert timings[True] < timings[False], (
+            f"Trusted fetch_all {timings[True]:.3f}s should beat validated {timings[False]:.3f}s"
+        )
+
+
+def legacy_validate_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Validation as it was before the patterns were precompiled (reference only)."""
+    import re
+
+    validated = {}
+    for key, value in params.items():
+        if not (re.match(r'^[a-zA-Z0-9_\[\]-]+$', key) and len(key) <= 100):
+            raise ValueError(key)
+        if isinstance(value, str):
+            for pattern in (r'<script', r'javascript:', r'[\'"];', r'<!--', r'\\x[0-9a-fA-F]{2}'):
+                re.search(pattern, value.lower())
+        validated[key] = value
+    return validated
+
+
+@pytest.mark.performance
+class TestValidationPerformance:
+    """Micro-benchmark the request validation hot path."""
+
+    PARAMS = {
+        "q": ["updated_from=2025-01-01T00:00:00Z;gift_types=in|1,7"],
+        "sort": "date_updated",
+        "expand": "email_addresses,phone_numbers",
+        "limit": 100,
+        "offset": 2500,
+    }
+
+    @pytest.fixture
+    def client(self):
+        """Create test client."""
+        return new_client(api_key="test_key")
+
+    def test_param_validation_beats_uncompiled_scan(self, client):
+        """Benchmark 10,000 validations of a typical search request."""
+        validate = client._client._validate_api_params
+        params = self.PARAMS
+        flat = {key: value for key, value in params.items() if key != "q"}
+        flat["name"] = params["q"][0]
+
+        current = _best_of(lambda: [validate(flat) for _ in range(10000)])
+        legacy = _best_of(lambda: [legacy_validate_params(flat) for _ in range(10000)])
+
+        assert validate(params) == params
+        assert current < legacy, (
+            f"10,000 param validations took {current:.3f}s (uncompiled scan {legacy:.3f}s)"
+        )
+
+    def test_oversized_payload_rejected_without_repr(self, client):
+        """Benchmark rejecting a 2 MB payload against measuring its repr."""
+        payload = {f"field_{i}": "A" * 1000 for i in range(2000)}
+        validate = client._client._validate_json_payload
+
+        def reject():
+            with pytest.raises(ValueError, match="Payload too large"):
+                validate(payload)
+
+        current = _best_of(lambda: [reject() for _ in range(20)])
+        with_repr = _best_of(lambda: [len(str(payload)) for _ in range(20)])
+
+        assert current < with_repr, (
+            f"20 oversized payloads rejected in {current:.4f}s (repr alone {with_repr:.4f}s)"
+        )
+
+
+@pytest.mark.performance
+class TestDecodingPerformance:
+    """Benchmark the JSON decoder backends on pages of gifts."""
+
+    PAGES = [
+        json.dumps({"items": BULK_GIFTS[offset:offset + 100], "total_items": len(BULK_GIFTS)})
+        .encode()
+        for offset in range(0, len(BULK_GIFTS), 100)
+    ]
+
+    def test_decoders(self):
+        """Benchmark decoding 200 pages with each backend."""
+        from lgl_client.lgl_api.decoding import resolve_decoder
+
+        timings = {}
+        for name in ("stdlib", "orjson", "pydantic"):
+            if name == "orjson" and importlib.util.find_spec("orjson") is None:
+                continue
+            loads = resolve_decoder(name)[1] or json.loads
+            timings[name] = _best_of(lambda: [loads(page) for page in self.PAGES], rounds=3)
+
+        if "orjson" in timings:
+            assert timings["orjson"] < timings["stdlib"], (
+                f"200 gift pages: orjson {timings['orjson']:.3f}s, "
+                f"stdlib {timings['stdlib']:.3f}s"
+            )
+
+    def test_direct_page_validation(self):
+        """Benchmark bytes-to-models against decoding to dicts and validating those."""
+        from lgl_client.lgl_api.decoding import page_adapter
+        from lgl_client.models.gift import Gift
+
+        adapter = page_adapter(Gift)
+
+        def via_dicts():
+            return [
+                [Gift.from_dict(item) for item in json.loads(page)["items"]]
+                for page in self.PAGES
+            ]
+
+        def direct():
+            return [adapter.validate_json(page).items for page in self.PAGES]
+
+        # Alternate the two so a burst of load cannot land on one side only
+        dicts = models = float("inf")
+        for _ in range(5):
+            dicts = min(dicts, _best_of(via_dicts, rounds=1))
+            models = min(models, _best_of(direct, rounds=1))
+
+        assert direct()[0] == via_dicts()[0]
+        assert models < dicts, (
+            f"20,000 gifts: validate_json {models:.3f}s, json.loads + validate {dicts:.3f}s"
+        )
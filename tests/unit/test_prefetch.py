@@ -0,0 +1,151 @@
+"""Tests for prefetching the next pages while the caller consumes the current one."""
+import asyncio
+import pytest
+import threading
+import time
+import httpx
+from unittest.mock import patch
+
+from lgl_client import new_async_client, new_client
+from lgl_client.lgl_api.exceptions import LGLAPIError
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() holds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+class Pages:
+    """Page function over ``total`` numbered items, recording each call."""
+
+    def __init__(self, total, fail_at=None):
+        self.total = total
+        self.fail_at = fail_at
+        self.offsets = []
+
+    def __call__(self, limit, offset):
+        self.offsets.append(offset)
+        if offset == self.fail_at:
+            raise LGLAPIError("HTTP 500", status_code=500, url="notes")
+        items = list(range(offset, min(offset + limit, self.total)))
+        return {"items": items, "items_count": len(items), "total_items": self.total}
+
+
+def prefetching_threads():
+    return [t for t in threading.enumerate() if t.name == "lgl-prefetch"]
+
+
+class TestPrefetch:
+    """Test the background-thread paginator."""
+
+    def test_next_page_is_fetched_while_the_caller_works(self):
+        """Test page 2 is requested before the caller finishes page 1, and not without prefetch."""
+        client = new_client(api_key="test_key", page_prefetch=1)
+        pages = Pages(250)
+
+        items = client._client._paginate(pages)
+        assert next(items) == 0
+        wait_for(lambda: len(pages.offsets) >= 2)
+        assert list(items) == list(range(1, 250))
+        assert pages.offsets == [0, 100, 200]
+
+        sequential = Pages(250)
+        items = client._client._paginate(sequential, prefetch=0)
+        next(items)
+        time.sleep(0.02)
+        assert sequential.offsets == [0]
+        items.close()
+
+    def test_backpressure_bounds_pages_ahead(self):
+        """Test a stalled caller holds at most ``prefetch`` pages plus one being handed over."""
+        client = new_client(api_key="test_key")
+        pages = Pages(1000)
+
+        items = client._client._paginate(pages, limit=10, prefetch=2)
+        next(items)
+        wait_for(lambda: len(pages.offsets) == 4)
+        time.sleep(0.05)
+        assert len(pages.offsets) == 4
+        assert len(list(items)) == 999
+
+    def test_errors_surface_in_order_and_early_exit_stops_the_thread(self):
+        """Test items before a failed page are delivered, then the error; closing stops fetching."""
+        client = new_client(api_key="test_key", page_prefetch=3)
+
+        received = []
+        with pytest.raises(LGLAPIError):
+            for item in client._client._paginate(Pages(500, fail_at=200)):
+                received.append(item)
+        assert received == list(range(200))
+
+        pages = Pages(10_000)
+        for item in client._client._paginate(pages, limit=10):
+            break
+        assert not prefetching_threads()
+        fetched = len(pages.offsets)
+        time.sleep(0.02)
+        assert len(pages.offsets) == fetched <= 5
+        with pytest.raises(ValueError):
+            list(client._client._paginate(pages, prefetch=-1))
+
+    def test_constituent_search_prefetches(self):
+        """Test iter_search takes a prefetch depth and yields every page in order."""
+        client = new_client(api_key="test_key")
+        request = httpx.Request("GET", "https://api.littlegreenlight.com/api/v1/constituents/search")
+
+        def person(i):
+            return {"id": i, "first_name": "Ada", "last_name": f"Donor {i}",
+                    "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-02T15:30:00Z"}
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.side_effect = [
+                httpx.Response(200, json={"items": [person(1), person(2)], "next_item": 2},
+                               request=request),
+                httpx.Response(200, json={"items": [person(3)], "next_item": None},
+                               request=request),
+            ]
+            found = list(client.constituents.iter_search(["name=ada"], prefetch=2))
+
+        assert [c.id for c in found] == [1, 2, 3]
+        assert not prefetching_threads()
+
+
+class TestAsyncPrefetch:
+    """Test the background-task paginator."""
+
+    @pytest.mark.asyncio
+    async def test_task_fetches_ahead_and_is_cancelled_on_exit(self):
+        """Test the next page is requested while the caller awaits, and fetching stops on break."""
+        client = new_async_client(api_key="test_key", page_prefetch=1)
+        pages = Pages(250)
+
+        items = client._client._paginate(pages)
+        assert await items.__anext__() == 0
+        for _ in range(10):
+            await asyncio.sleep(0)
+        # One page buffered, one more waiting for room
+        assert pages.offsets == [0, 100, 200]
+        assert [item async for item in items] == list(range(1, 250))
+
+        endless = Pages(10_000)
+        async for item in client._client._paginate(endless, limit=10, prefetch=2):
+            break
+        # The event loop closes the abandoned generator, cancelling its task
+        await asyncio.sleep(0.01)
+        fetched = len(endless.offsets)
+        await asyncio.sleep(0.01)
+        assert len(endless.offsets) == fetched <= 4
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_the_caller(self):
+        """Test a failed page raises after the items before it."""
+        client = new_async_client(api_key="test_key")
+
+        received = []
+        with pytest.raises(LGLAPIError):
+            async for item in client._client._paginate(Pages(300, fail_at=100), prefetch=2):
+                received.append(item)
+        assert received == list(range(100))
@@ -0,0 +1,191 @@
+"""Tests for client-side rate limiting."""
+import multiprocessing
+import sys
+import threading
+import pytest
+import httpx
+from unittest.mock import Mock, patch
+
+from lgl_client import FileTokenBucket, TokenBucket, new_client
+from lgl_client.lgl_api.exceptions import LGLAPIError
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Freeze both clocks used by the token buckets."""
+    fake = FakeClock()
+    with patch("lgl_client.lgl_api.rate_limit.time.monotonic", fake), \
+            patch("lgl_client.lgl_api.rate_limit.time.time", fake):
+        yield fake
+
+
+def _reserve_many(path: str, count: int, queue) -> None:
+    bucket = FileTokenBucket(path, rate=10, burst=5)
+    queue.put([bucket.reserve() for _ in range(count)])
+
+
+class TestTokenBucket:
+    """Test the in-process token bucket."""
+
+    def test_burst_then_rate(self, clock):
+        """Test a full bucket allows a burst, then spaces requests at the rate."""
+        bucket = TokenBucket(rate=10, burst=3)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.1)
+        assert bucket.reserve() == pytest.approx(0.2)
+
+        clock.now += 1.0
+        assert bucket.reserve() == 0.0
+
+    def test_thread_safe_reservations(self, clock):
+        """Test concurrent reservations never hand out the same slot twice."""
+        bucket = TokenBucket(rate=100, burst=10)
+        delays = []
+        lock = threading.Lock()
+
+        def worker():
+            mine = [bucket.reserve() for _ in range(50)]
+            with lock:
+                delays.extend(mine)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        waits = sorted(round(delay * 100) for delay in delays if delay > 0)
+        assert waits == list(range(1, 391))
+
+    def test_adapts_down_on_throttle_and_recovers(self, clock):
+        """Test a 429 halves the rate, which then climbs back over recovery_time."""
+        bucket = TokenBucket(rate=10, recovery_time=10.0)
+
+        bucket.on_throttle()
+        assert bucket.current_rate == pytest.approx(5.0)
+        bucket.on_throttle()
+        assert bucket.current_rate == pytest.approx(2.5)
+        assert bucket.throttle_count == 2
+
+        clock.now += 5.0
+        assert bucket.current_rate == pytest.approx(7.5)
+        clock.now += 60.0
+        assert bucket.current_rate == pytest.approx(10.0)
+
+    def test_retry_after_blocks_next_requests(self, clock):
+        """Test Retry-After on a 429 delays every subsequent reservation."""
+        bucket = TokenBucket(rate=10, burst=10, adaptive=False)
+
+        bucket.on_throttle(retry_after=2.0)
+
+        assert bucket.reserve() == pytest.approx(2.1)
+
+    def test_min_rate_floor(self, clock):
+        """Test repeated 429s do not push the rate below min_rate."""
+        bucket = TokenBucket(rate=10, min_rate=1.0)
+        for _ in range(10):
+            bucket.on_throttle()
+        assert bucket.current_rate == pytest.approx(1.0)
+
+    def test_invalid_settings(self):
+        """Test invalid bucket settings are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+
+class TestFileTokenBucket:
+    """Test the cross-process token bucket."""
+
+    def test_instances_share_one_budget(self, tmp_path, clock):
+        """Test two buckets on the same file draw from the same tokens."""
+        path = tmp_path / "lgl.bucket"
+        first = FileTokenBucket(path, rate=10, burst=2)
+        second = FileTokenBucket(path, rate=10, burst=2)
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+        assert first.reserve() == pytest.approx(0.1)
+        assert second.reserve() == pytest.approx(0.2)
+
+    def test_throttle_is_shared(self, tmp_path, clock):
+        """Test a 429 seen by one process slows the others down."""
+        path = tmp_path / "lgl.bucket"
+        first = FileTokenBucket(path, rate=10)
+        second = FileTokenBucket(path, rate=10)
+
+        first.on_throttle()
+
+        assert second.current_rate == pytest.approx(5.0)
+
+    def test_corrupt_state_file_is_reset(self, tmp_path, clock):
+        """Test an unreadable state file starts from a full bucket."""
+        path = tmp_path / "lgl.bucket"
+        path.write_text("not json")
+
+        assert FileTokenBucket(path, rate=10).reserve() == 0.0
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="requires fork")
+    def test_separate_processes_share_budget(self, tmp_path, clock):
+        """Test forked worker processes never receive the same slot."""
+        ctx = multiprocessing.get_context("fork")
+        queue = ctx.Queue()
+        path = str(tmp_path / "lgl.bucket")
+        workers = [ctx.Process(target=_reserve_many, args=(path, 20, queue)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        delays = [delay for _ in workers for delay in queue.get(timeout=30)]
+        for worker in workers:
+            worker.join(timeout=30)
+
+        waits = sorted(round(delay * 10) for delay in delays if delay > 0)
+        assert waits == list(range(1, 56))
+
+
+class TestClientRateLimiting:
+    """Test rate limiter integration in the HTTP client."""
+
+    def test_client_waits_for_limiter(self):
+        """Test each request waits for the slot reserved from the limiter."""
+        limiter = Mock()
+        limiter.reserve.return_value = 0.25
+        client = new_client(api_key="test_key", rate_limiter=limiter)
+
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.client.time.sleep") as mock_sleep:
+            mock_httpx.get.return_value = httpx.Response(
+                200, json={"items": []}, request=httpx.Request("GET", "https://x/categories")
+            )
+            client.categories.list()
+
+        limiter.reserve.assert_called_once()
+        mock_sleep.assert_called_once_with(0.25)
+        limiter.on_throttle.assert_not_called()
+
+    def test_429_is_reported_to_limiter(self):
+        """Test a 429 response adapts the limiter using its Retry-After."""
+        limiter = Mock()
+        limiter.reserve.return_value = 0.0
+        client = new_client(api_key="test_key", rate_limiter=limiter)
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.return_value = httpx.Response(
+                429, json={"error": "Too many requests"}, headers={"Retry-After": "3"},
+                request=httpx.Request("GET", "https://x/categories"),
+            )
+            with pytest.raises(LGLAPIError):
+                client.categories.list()
+
+        limiter.on_throttle.assert_called_once_with(3.0)
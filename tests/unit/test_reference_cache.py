@@ -0,0 +1,180 @@
+"""Tests for the opt-in reference-data cache on lookup resources."""
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from lgl_client import DiskBackend, ReferenceCache, new_async_client, new_client
+from lgl_client.models.fund import Fund
+from lgl_client.models.payment_type import PaymentType
+from tests.fixtures import APIResponseMocker
+
+FUNDS = [{"id": 1, "name": "General"}, {"id": 2, "name": "Building"}]
+
+
+def funds_page():
+    """Single page holding every fund."""
+    return APIResponseMocker.paginated_response(FUNDS, total=2, per_page=25)
+
+
+class TestReferenceCache:
+    """Test caching and invalidation of lookup resources."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create an in-memory reference cache."""
+        return ReferenceCache(ttl=300)
+
+    @pytest.fixture
+    def client(self, cache):
+        """Create test client sharing the cache across lookup resources."""
+        return new_client(api_key="test_key", reference_cache=cache)
+
+    def test_no_cache_by_default(self):
+        """Test lookups hit the API every time unless a cache is configured."""
+        client = new_client(api_key="test_key")
+        assert client.reference_cache is None
+
+        with patch.object(client._client, "_get", return_value=funds_page()) as mock_get:
+            client.funds.fetch_all()
+            client.funds.fetch_all()
+
+        assert mock_get.call_count == 2
+
+    def test_repeat_fetch_served_from_cache(self, client, cache):
+        """Test the second fetch_all makes no request and returns equal models."""
+        with patch.object(client._client, "_get", return_value=funds_page()) as mock_get:
+            first = client.funds.fetch_all()
+            second = client.funds.fetch_all()
+
+        assert mock_get.call_count == 1
+        assert second == first
+        assert all(isinstance(fund, Fund) for fund in second)
+        assert cache.stats()["funds"] == {"hits": 1, "misses": 1, "invalidations": 0}
+
+    def test_returned_list_is_a_copy(self, client):
+        """Test callers mutating the result do not corrupt the cached entry."""
+        with patch.object(client._client, "_get", return_value=funds_page()):
+            client.funds.fetch_all().clear()
+            assert len(client.funds.fetch_all()) == 2
+
+    def test_ttl_expiry(self, client):
+        """Test entries are reloaded once their TTL has elapsed."""
+        with patch.object(client._client, "_get", return_value=funds_page()) as mock_get, \
+                patch("lgl_client.lgl_api.cache.time.time", return_value=1000.0) as mock_time:
+            client.funds.fetch_all()
+            mock_time.return_value = 1299.0
+            client.funds.fetch_all()
+            assert mock_get.call_count == 1
+
+            mock_time.return_value = 1300.0
+            client.funds.fetch_all()
+            assert mock_get.call_count == 2
+
+    def test_per_resource_ttl(self):
+        """Test per-resource TTL overrides, with 0 disabling caching."""
+        cache = ReferenceCache(ttl=60, ttls={"funds": 0, "payment_types": 86400})
+        client = new_client(api_key="test_key", reference_cache=cache)
+        assert cache.ttl_for("payment_types") == 86400
+        assert cache.ttl_for("campaigns") == 60
+
+        with patch.object(client._client, "_get", return_value=funds_page()) as mock_get:
+            client.funds.fetch_all()
+            client.funds.fetch_all()
+
+        assert mock_get.call_count == 2
+        assert "funds" not in cache.stats()
+
+    def test_writes_invalidate_resource(self, client, cache):
+        """Test create, update and delete drop the cached entries for that resource."""
+        fund = Fund(id=3, name="Scholarship")
+        with patch.object(client._client, "_get", return_value=funds_page()) as mock_get, \
+                patch.object(client._client, "_post", return_value=fund.to_dict()), \
+                patch.object(client._client, "_patch", return_value=fund.to_dict()), \
+                patch.object(client._client, "_delete", return_value=None):
+            client.funds.fetch_all()
+            client.funds.create(fund)
+            client.funds.fetch_all()
+            client.funds.update(3, fund)
+            client.funds.fetch_all()
+            client.funds.delete(3)
+            client.funds.fetch_all()
+
+        assert mock_get.call_count == 4
+        assert cache.stats()["funds"]["invalidations"] == 3
+
+    def test_invalidation_is_per_resource(self, client, cache):
+        """Test writing one resource keeps other resources cached."""
+        payment_types = APIResponseMocker.paginated_response(
+            [{"id": 1, "name": "Cash", "key": "cash"}], total=1, per_page=25
+        )
+        with patch.object(client._client, "_get", side_effect=[funds_page(), payment_types]):
+            client.funds.fetch_all()
+            client.payment_types.fetch_all()
+
+        cache.invalidate("funds")
+        with patch.object(client._client, "_get") as mock_get:
+            assert client.payment_types.fetch_all()[0].name == "Cash"
+        mock_get.assert_not_called()
+
+        cache.invalidate()
+        assert cache.backend.get("payment_types", ReferenceCache.make_key("fetch_all", ())) is None
+
+    def test_arguments_are_part_of_the_key(self, client):
+        """Test categories filtered by item_type are cached separately."""
+        page = APIResponseMocker.paginated_response(
+            [{"id": 1, "name": "Region", "item_type": "Constituent"}], total=1, per_page=25
+        )
+        with patch.object(client._client, "_get", return_value=page) as mock_get:
+            client.categories.fetch_all(item_type="Gift")
+            client.categories.fetch_all(item_type="Constituent")
+            client.categories.fetch_all(item_type="Gift")
+
+        assert mock_get.call_count == 2
+
+    def test_disk_backend_round_trip(self, tmp_path):
+        """Test a second client process reuses models cached on disk."""
+        first = new_client(
+            api_key="test_key", reference_cache=ReferenceCache(backend=DiskBackend(tmp_path))
+        )
+        with patch.object(first._client, "_get", return_value=funds_page()):
+            expected = first.funds.fetch_all()
+
+        second = new_client(
+            api_key="test_key", reference_cache=ReferenceCache(backend=DiskBackend(tmp_path))
+        )
+        with patch.object(second._client, "_get") as mock_get:
+            assert second.funds.fetch_all() == expected
+        mock_get.assert_not_called()
+
+    def test_disk_backend_refuses_foreign_classes(self, tmp_path):
+        """Test a tampered cache file cannot instantiate arbitrary classes."""
+        backend = DiskBackend(tmp_path)
+        backend.set("funds", "key", [PaymentType(id=1, name="Cash", key="cash")], expires_at=2e9)
+        assert backend.get("funds", "key")[1] == [PaymentType(id=1, name="Cash", key="cash")]
+
+        path = backend._path("funds", "key")
+        with open(path, encoding="utf-8") as handle:
+            entry = json.load(handle)
+        entry["value"]["model"] = "subprocess.Popen"
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(entry, handle)
+
+        assert backend.get("funds", "key") is None
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_cache(self):
+        """Test the async lookup resources share the same cache semantics."""
+        cache = ReferenceCache()
+        client = new_async_client(api_key="test_key", reference_cache=cache)
+        fund = Fund(id=3, name="Scholarship")
+        with patch.object(client._client, "_get", new=AsyncMock(return_value=funds_page())) as mock_get, \
+                patch.object(client._client, "_post", new=AsyncMock(return_value=fund.to_dict())):
+            assert len(await client.funds.fetch_all()) == 2
+            assert len(await client.funds.fetch_all()) == 2
+            assert mock_get.await_count == 1
+
+            await client.funds.create(fund)
+            await client.funds.fetch_all()
+            assert mock_get.await_count == 2
+
+        assert cache.stats()["funds"] == {"hits": 1, "misses": 2, "invalidations": 1}
@@ -0,0 +1,159 @@
+"""Tests for the HTTP response cache."""
+import pytest
+import httpx
+from unittest.mock import AsyncMock, patch
+
+from lgl_client import DiskBackend, MemoryBackend, ResponseCache, new_async_client, new_client
+
+BODY = {"id": 42, "name": "General Fund"}
+
+
+def make_response(status_code=200, json=None, headers=None, path="funds/42"):
+    """Build a real httpx response with optional cache headers."""
+    request = httpx.Request("GET", f"https://api.littlegreenlight.com/api/v1/{path}")
+    if status_code == 304:
+        return httpx.Response(304, headers=headers, request=request)
+    return httpx.Response(
+        status_code, json=BODY if json is None else json, headers=headers, request=request
+    )
+
+
+def sent_headers(mock_get, call=-1):
+    """Headers passed to the httpx client on a call."""
+    return mock_get.call_args_list[call].kwargs.get("headers", {})
+
+
+class TestResponseCache:
+    """Test conditional requests, TTL fallback, bypass and invalidation."""
+
+    def test_etag_revalidation(self):
+        """Test stored ETags are sent back and a 304 serves the cached body."""
+        cache = ResponseCache()
+        client = new_client(api_key="test_key", response_cache=cache)
+        changed = {"id": 42, "name": "Renamed Fund"}
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.side_effect = [
+                make_response(headers={"ETag": '"v1"'}),
+                make_response(304, headers={"ETag": '"v1"'}),
+                make_response(json=changed, headers={"ETag": '"v2"'}),
+                make_response(304),
+            ]
+            first = client._client._get("funds/42")
+            first["name"] = "mutated by the caller"
+            second = client._client._get("funds/42")
+            third = client._client._get("funds/42")
+            fourth = client._client._get("funds/42")
+
+        assert "headers" not in mock_httpx.get.call_args_list[0].kwargs
+        assert sent_headers(mock_httpx.get, 1) == {"If-None-Match": '"v1"'}
+        assert sent_headers(mock_httpx.get, 3) == {"If-None-Match": '"v2"'}
+        assert second == BODY and third == fourth == changed
+        assert cache.stats()["funds/{id}"] == {
+            "hits": 0, "revalidated": 2, "misses": 2, "bypassed": 0, "invalidations": 0,
+        }
+
+    def test_ttl_fallback_without_validators(self):
+        """Test responses without validators are served locally until the TTL passes."""
+        cache = ResponseCache(ttl=30)
+        client = new_client(api_key="test_key", response_cache=cache)
+
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.http_cache.time.time", return_value=1000.0) as now:
+            mock_httpx.get.return_value = make_response(headers={"Cache-Control": "private"})
+            client._client._get("funds/42", limit=5)
+            client._client._get("funds/42", limit=5)
+            assert mock_httpx.get.call_count == 1
+            client._client._get("funds/42", limit=6)
+            now.return_value = 1031.0
+            client._client._get("funds/42", limit=5)
+
+        assert mock_httpx.get.call_count == 3
+        assert cache.stats()["funds/{id}"]["hits"] == 1
+
+    def test_last_modified_bypass_and_no_store(self):
+        """Test If-Modified-Since, bypassed paths and Cache-Control: no-store."""
+        stamp = "Wed, 01 Oct 2025 10:00:00 GMT"
+        cache = ResponseCache(bypass=("gifts/search",))
+        client = new_client(api_key="test_key", response_cache=cache)
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.side_effect = [
+                make_response(headers={"Last-Modified": stamp}),
+                make_response(304),
+                make_response(path="gifts/search"),
+                make_response(path="gifts/search"),
+                make_response(headers={"Cache-Control": "no-store"}, path="notes/1"),
+                make_response(path="notes/1"),
+            ]
+            client._client._get("funds/42")
+            client._client._get("funds/42")
+            client._client._get("gifts/search", q=["amount_from=5"])
+            client._client._get("gifts/search", q=["amount_from=5"])
+            client._client._get("notes/1")
+            client._client._get("notes/1")
+
+        assert sent_headers(mock_httpx.get, 1) == {"If-Modified-Since": stamp}
+        assert mock_httpx.get.call_count == 6
+        assert cache.stats()["gifts/search"]["bypassed"] == 2
+
+    def test_writes_invalidate_paths_of_the_same_shape(self):
+        """Test a PATCH drops cached GETs of the same path template."""
+        cache = ResponseCache()
+        client = new_client(api_key="test_key", response_cache=cache)
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.return_value = make_response(headers={"ETag": '"v1"'})
+            mock_httpx.patch.return_value = make_response()
+            client._client._get("funds/42")
+            client._client._patch("funds/42", {"name": "Renamed"})
+            client._client._get("funds/42")
+
+        assert "headers" not in mock_httpx.get.call_args.kwargs
+        assert cache.stats()["funds/{id}"]["invalidations"] == 1
+
+    def test_disk_backend_shared_between_clients(self, tmp_path):
+        """Test a second client revalidates with validators stored on disk."""
+        first = new_client(
+            api_key="test_key", response_cache=ResponseCache(backend=DiskBackend(str(tmp_path)))
+        )
+        second = new_client(
+            api_key="test_key", response_cache=ResponseCache(backend=DiskBackend(str(tmp_path)))
+        )
+
+        with patch.object(first._client, "_client") as mock_first, \
+                patch.object(second._client, "_client") as mock_second:
+            mock_first.get.return_value = make_response(headers={"ETag": '"v1"'})
+            mock_second.get.return_value = make_response(304)
+            first._client._get("funds/42")
+            assert second._client._get("funds/42") == BODY
+
+        assert sent_headers(mock_second.get) == {"If-None-Match": '"v1"'}
+
+    def test_memory_backend_lru(self):
+        """Test the bounded memory backend evicts the least recently used entry."""
+        backend = MemoryBackend(max_entries=2)
+        backend.set("funds", "a", 1, 9e9)
+        backend.set("funds", "b", 2, 9e9)
+        backend.get("funds", "a")
+        backend.set("campaigns", "c", 3, 9e9)
+
+        assert backend.get("funds", "b") is None
+        assert backend.get("funds", "a") == (9e9, 1) and len(backend) == 2
+        with pytest.raises(ValueError):
+            MemoryBackend(max_entries=0)
+
+    @pytest.mark.asyncio
+    async def test_async_client_revalidates(self):
+        """Test the async client sends conditional requests as well."""
+        client = new_async_client(api_key="test_key", response_cache=ResponseCache())
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get = AsyncMock(side_effect=[
+                make_response(headers={"ETag": '"v1"'}),
+                make_response(304),
+            ])
+            await client._client._get("funds/42")
+            assert await client._client._get("funds/42") == BODY
+
+        assert sent_headers(mock_httpx.get) == {"If-None-Match": '"v1"'}
@@ -0,0 +1,194 @@
+"""Tests for the retry policy and its integration in the HTTP clients."""
+import pytest
+import httpx
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, patch
+
+from lgl_client import RetryPolicy, new_async_client, new_client
+from lgl_client.lgl_api.exceptions import LGLAPIError
+from lgl_client.lgl_api.retry import parse_retry_after
+
+
+def make_response(status_code, json=None, headers=None, method="GET", path="categories"):
+    """Build a real httpx response for the given status."""
+    request = httpx.Request(method, f"https://api.littlegreenlight.com/api/v1/{path}")
+    return httpx.Response(status_code, json=json or {}, headers=headers, request=request)
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy delay computation and validation."""
+
+    def test_full_jitter_bounds(self):
+        """Test backoff delays stay between zero and the exponential ceiling."""
+        policy = RetryPolicy(backoff_base=0.5, backoff_cap=3.0)
+
+        for attempt, ceiling in [(1, 0.5), (2, 1.0), (3, 2.0), (4, 3.0), (10, 3.0)]:
+            delays = [policy.delay(attempt) for _ in range(200)]
+            assert all(0 <= delay <= ceiling for delay in delays)
+
+    def test_retry_after_takes_precedence(self):
+        """Test Retry-After overrides backoff but is capped."""
+        policy = RetryPolicy(max_retry_after=10.0)
+
+        assert policy.delay(1, "4") == 4.0
+        assert policy.delay(1, "120") == 10.0
+        # A malformed header falls back to jittered backoff
+        assert 0 <= policy.delay(1, "soon") <= policy.backoff_base
+
+    def test_parse_retry_after_http_date(self):
+        """Test Retry-After given as an HTTP date."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert 28 <= delay <= 30
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+
+    def test_idempotency_aware_defaults(self):
+        """Test only GET and DELETE are retried unless writes are opted in."""
+        policy = RetryPolicy()
+        assert policy.allows("GET", 1)
+        assert policy.allows("delete", 1)
+        assert not policy.allows("POST", 1)
+        assert not policy.allows("PATCH", 1)
+        assert not policy.allows("GET", policy.max_attempts)
+
+        opted_in = RetryPolicy(retry_methods={"GET", "DELETE", "post"})
+        assert opted_in.allows("POST", 1)
+
+    def test_invalid_settings(self):
+        """Test invalid policies are rejected."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(backoff_base=-1)
+
+
+class TestClientRetries:
+    """Test retry behaviour of LGLClient._send."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client with retries enabled."""
+        return new_client(api_key="test_key", retry=RetryPolicy(max_attempts=4))
+
+    def test_no_retries_by_default(self):
+        """Test the default client surfaces the first 503 unchanged."""
+        client = new_client(api_key="test_key")
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.client.time.sleep") as mock_sleep:
+            mock_httpx.get.return_value = make_response(503, {"error": "Unavailable"})
+            with pytest.raises(LGLAPIError):
+                client.categories.list()
+
+        assert mock_httpx.get.call_count == 1
+        mock_sleep.assert_not_called()
+        assert client._client.retry_stats.total_retries == 0
+
+    def test_get_retried_until_success(self, client):
+        """Test transient 5xx responses are retried and counted per endpoint."""
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.client.time.sleep") as mock_sleep:
+            mock_httpx.get.side_effect = [
+                make_response(503, path="constituents/12/gifts"),
+                make_response(502, path="constituents/12/gifts"),
+                make_response(200, {"items": []}, path="constituents/12/gifts"),
+            ]
+            result = client.gifts.list(12)
+
+        assert result == {"items": []}
+        assert mock_httpx.get.call_count == 3
+        assert mock_sleep.call_count == 2
+        stats = client._client.retry_stats.snapshot()
+        assert stats["GET constituents/{id}/gifts"]["retries"] == 2
+        assert stats["GET constituents/{id}/gifts"]["exhausted"] == 0
+
+    def test_retry_after_header_is_honored(self, client):
+        """Test a 429 waits for the server-provided Retry-After."""
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.client.time.sleep") as mock_sleep:
+            mock_httpx.get.side_effect = [
+                make_response(429, headers={"Retry-After": "7"}),
+                make_response(200, {"items": []}),
+            ]
+            client.categories.list()
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_exhausted_retries_raise_last_error(self, client):
+        """Test the last failure is raised once attempts run out."""
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.client.time.sleep"):
+            mock_httpx.get.return_value = make_response(500, {"error": "Internal server error"})
+            with pytest.raises(LGLAPIError) as exc_info:
+                client.categories.list()
+
+        assert exc_info.value.status_code == 500
+        assert mock_httpx.get.call_count == 4
+        stats = client._client.retry_stats.snapshot()["GET categories"]
+        assert stats["retries"] == 3
+        assert stats["exhausted"] == 1
+
+    def test_post_not_retried_unless_opted_in(self, client):
+        """Test POST is sent once by default and retried when opted in."""
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.client.time.sleep"):
+            mock_httpx.post.return_value = make_response(503, method="POST")
+            with pytest.raises(LGLAPIError):
+                client.constituents.create({"first_name": "Jane"})
+        assert mock_httpx.post.call_count == 1
+
+        opted_in = new_client(
+            api_key="test_key",
+            retry=RetryPolicy(retry_methods={"GET", "DELETE", "POST"}),
+        )
+        created = {"id": 1, "first_name": "Jane", "last_name": "Doe",
+                   "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-01T10:00:00Z"}
+        with patch.object(opted_in._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.client.time.sleep"):
+            mock_httpx.post.side_effect = [
+                make_response(503, method="POST"),
+                make_response(200, created, method="POST"),
+            ]
+            constituent = opted_in.constituents.create({"first_name": "Jane"})
+        assert constituent.id == 1
+        assert mock_httpx.post.call_count == 2
+
+    def test_transport_errors_are_retried(self, client):
+        """Test timeouts are retried before being mapped to LGLAPIError."""
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.client.time.sleep"):
+            mock_httpx.get.side_effect = [
+                httpx.ReadTimeout("timed out"),
+                make_response(200, {"items": []}),
+            ]
+            assert client.categories.list() == []
+
+        assert client._client.retry_stats.snapshot()["GET categories"]["retries"] == 1
+
+    def test_client_errors_are_not_retried(self, client):
+        """Test 4xx responses other than 429 fail immediately."""
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.client.time.sleep") as mock_sleep:
+            mock_httpx.get.return_value = make_response(404, {"error": "Not found"})
+            with pytest.raises(LGLAPIError):
+                client.categories.retrieve(1)
+
+        assert mock_httpx.get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_client_retries(self):
+        """Test the async client shares the retry policy and stats."""
+        client = new_async_client(api_key="test_key", retry=RetryPolicy())
+        with patch.object(client._client, "_client") as mock_httpx, \
+                patch("lgl_client.lgl_api.client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            mock_httpx.get = AsyncMock(side_effect=[
+                make_response(429, headers={"Retry-After": "2"}),
+                make_response(200, {"items": []}),
+            ])
+            assert await client.categories.list() == []
+
+        mock_sleep.assert_awaited_once_with(2.0)
+        assert client._client.retry_stats.snapshot()["GET categories"]["retries"] == 1
@@ -0,0 +1,92 @@
+"""Tests for the q[] search expression builder."""
+import subprocess
+import sys
+
+import pytest
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+from lgl_client import SearchQuery, new_client
+from tests.fixtures import APIResponseMocker
+
+
+class TestSearchQuery:
+    """Test serialization and validation of search terms."""
+
+    def test_terms_are_and_combined_in_one_expression(self):
+        """Test terms serialize to the documented field=op|values grammar."""
+        query = (
+            SearchQuery("gifts")
+            .where("gift_types", [1, 7])
+            .where("payment_types", op="bl")
+            .where("gift_amount", 100, 1000, op="btw")
+            .where("date_from", date(2025, 1, 1))
+            .where("updated_from", datetime(2025, 1, 1, 8, 30, tzinfo=timezone.utc))
+        )
+
+        assert query.to_params() == {"q": [
+            "gift_types=in|1,7;payment_types=bl;gift_amount=btw|100|1000;"
+            "date_from=2025-01-01;updated_from=2025-01-01T08:30:00Z"
+        ]}
+        assert SearchQuery("gifts").to_params() == {}
+
+    def test_constituent_value_formats(self):
+        """Test constituent-specific formats for classes and custom attributes."""
+        query = (
+            SearchQuery("constituents").where("groups", 4)
+            & SearchQuery("constituents")
+            .where("class", [516, 517], date(2000, 1, 1), date(2009, 12, 31))
+            .where("custom_attr", "background_info", "Ck returned", op="ft")
+            .where("custom_attr_int", "test_number", 5, 50, op="btw")
+            .where("constituent_type", True)
+        )
+
+        assert str(query) == (
+            "groups=4;class=516,517|2000-01-01 to 2009-12-31;"
+            "custom_attr=background_info|ft|Ck returned;"
+            "custom_attr_int=test_number|btw|5|50;constituent_type=1"
+        )
+
+    def test_query_modules_do_not_import_sync(self):
+        """Test the API layer does not pull in the incremental-sync module."""
+        code = (
+            "import sys\n"
+            "import lgl_client.lgl_api.search_query, lgl_client.lgl_api.gift_query\n"
+            "assert 'lgl_client.sync' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    @pytest.mark.parametrize("build", [
+        lambda: SearchQuery("payment_types"),
+        lambda: SearchQuery("gifts").where("constituent_id", 1),
+        lambda: SearchQuery("gifts").where("funds", [1], op="gte"),
+        lambda: SearchQuery("gifts").where("gift_amount", 5, op="btw"),
+        lambda: SearchQuery("gifts").where("gift_ids", []),
+        lambda: SearchQuery("constituents").where("name", "a;updated_from=2000-01-01"),
+        lambda: SearchQuery("gifts") & SearchQuery("constituents"),
+    ])
+    def test_invalid_queries_are_rejected(self, build):
+        """Test unknown fields, bad operators, arity and injection are rejected."""
+        with pytest.raises(ValueError):
+            build()
+
+    def test_resource_searches_send_q_expressions(self):
+        """Test named search arguments are compiled into q[] instead of flat params."""
+        client = new_client(api_key="test_key")
+        response = APIResponseMocker.empty_response()
+
+        with patch.object(client._client, "_get", return_value=response) as mock:
+            client.gifts.search(amount_from=50, fund_id=3, constituent_id=9, limit=10)
+            assert mock.call_args.args == ("gifts/search",)
+            assert mock.call_args.kwargs == {
+                "q": ["gift_amount=gte|50;funds=in|3"], "constituent_id": 9, "limit": 10,
+            }
+
+            client.volunteer_times.search(constituent_id=9, date_from=date(2025, 2, 1))
+            assert mock.call_args.kwargs["q"] == ["date_from=2025-02-01;constituent_id=9"]
+
+            client.constituents.search_by_group([1, 2])
+            assert mock.call_args.kwargs["q"] == ["groups=1,2"]
+
+            with pytest.raises(ValueError):
+                client.constituents.search(SearchQuery("gifts").where("funds", 1))
@@ -0,0 +1,141 @@
+"""Tests for coalescing identical in-flight GET requests."""
+import asyncio
+import pytest
+import threading
+import time
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch
+
+from lgl_client import new_async_client, new_client
+from lgl_client.lgl_api.exceptions import NotFoundError
+
+CONSTITUENT = {
+    "id": 42, "first_name": "Ada", "last_name": "Lovelace",
+    "created_at": "2025-01-01T10:00:00Z", "updated_at": "2025-01-02T15:30:00Z",
+}
+
+
+def make_response(status_code=200, json=None, path="constituents/42"):
+    """Build a real httpx response."""
+    request = httpx.Request("GET", f"https://api.littlegreenlight.com/api/v1/{path}")
+    return httpx.Response(status_code, json=CONSTITUENT if json is None else json, request=request)
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() holds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    """Test the thread-safe single-flight layer in LGLClient._get."""
+
+    def run_concurrently(self, client, response, callers=8):
+        """Call retrieve(42) from several threads while the first request is held open."""
+        release = threading.Event()
+        flight = client._client.single_flight
+
+        def slow_get(path, **kwargs):
+            release.wait(5)
+            return response
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.side_effect = slow_get
+            with ThreadPoolExecutor(callers) as pool:
+                futures = [
+                    pool.submit(client.constituents.retrieve, 42) for _ in range(callers)
+                ]
+                wait_for(lambda: flight.deduplicated == callers - 1)
+                release.set()
+                outcomes = []
+                for future in futures:
+                    try:
+                        outcomes.append(future.result())
+                    except Exception as e:
+                        outcomes.append(e)
+        return mock_httpx.get.call_count, outcomes
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        """Test eight threads retrieving the same constituent make one request."""
+        client = new_client(api_key="test_key", coalesce_requests=True)
+
+        calls, constituents = self.run_concurrently(client, make_response())
+
+        assert calls == 1
+        assert {constituent.id for constituent in constituents} == {42}
+        assert client._client.single_flight.snapshot() == {"calls": 1, "deduplicated": 7}
+        assert client._client.single_flight.in_flight == 0
+
+    def test_errors_are_shared(self):
+        """Test every waiter sees the error of the shared request."""
+        client = new_client(api_key="test_key", coalesce_requests=True)
+
+        calls, outcomes = self.run_concurrently(
+            client, make_response(404, {"error": "Not found"}), callers=4
+        )
+
+        assert calls == 1
+        assert all(isinstance(outcome, NotFoundError) for outcome in outcomes)
+
+    def test_only_overlapping_identical_requests_are_shared(self):
+        """Test sequential calls and different queries each send their own request."""
+        client = new_client(api_key="test_key", coalesce_requests=True)
+        key = client._client._request_key
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get.return_value = make_response()
+            client.constituents.retrieve(42)
+            client.constituents.retrieve(42)
+
+        assert mock_httpx.get.call_count == 2
+        assert key("gifts", {"limit": 5, "q": ["a"]}) == key("gifts", {"q": ["a"], "limit": 5})
+        assert key("gifts", {"limit": 5}) != key("gifts", {"limit": 6})
+        assert new_client(api_key="test_key")._client.single_flight is None
+
+
+class TestAsyncSingleFlight:
+    """Test the asyncio counterpart."""
+
+    @pytest.mark.asyncio
+    async def test_gathered_gets_share_one_request(self):
+        """Test concurrent coroutines retrieving the same gift make one request."""
+        client = new_async_client(api_key="test_key", coalesce_requests=True)
+
+        async def slow_get(path, **kwargs):
+            await asyncio.sleep(0.01)
+            return make_response()
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get = AsyncMock(side_effect=slow_get)
+            results = await asyncio.gather(*[client.constituents.retrieve(42) for _ in range(5)])
+
+        assert mock_httpx.get.call_count == 1
+        assert [result.id for result in results] == [42] * 5
+        assert client._client.single_flight.snapshot() == {"calls": 1, "deduplicated": 4}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        """Test a waiter repeats the request when the task running it is cancelled."""
+        client = new_async_client(api_key="test_key", coalesce_requests=True)
+        started = asyncio.Event()
+
+        async def slow_get(path, **kwargs):
+            started.set()
+            await asyncio.sleep(0.05)
+            return make_response()
+
+        with patch.object(client._client, "_client") as mock_httpx:
+            mock_httpx.get = AsyncMock(side_effect=slow_get)
+            leader = asyncio.create_task(client.constituents.retrieve(42))
+            await started.wait()
+            waiter = asyncio.create_task(client.constituents.retrieve(42))
+            await asyncio.sleep(0)
+            leader.cancel()
+            constituent = await waiter
+
+        assert constituent.id == 42 and leader.cancelled()
+        assert mock_httpx.get.call_count == 2
+        assert client._client.single_flight.snapshot() == {"calls": 2, "deduplicated": 0}
@@ -0,0 +1,185 @@
+"""Tests for incremental synchronisation based on updated_from."""
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from lgl_client import new_client
+from lgl_client.sync import (
+    FileSyncStateStore,
+    IncrementalSync,
+    MemorySyncStateStore,
+    Watermark,
+)
+from tests.fixtures import APIResponseMocker
+
+
+def gift(gift_id, updated_at):
+    """Minimal gift payload updated at the given second."""
+    return {
+        "id": gift_id, "constituent_id": 1, "gift_type_id": 1, "amount": 10.0,
+        "date": "2025-01-01", "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": updated_at,
+    }
+
+
+class FakeSearch:
+    """Stand-in for a search endpoint honouring updated_from and date_updated."""
+
+    def __init__(self, records):
+        self.records = {record["id"]: record for record in records}
+        self.calls = []
+        self.after_call = None
+
+    def __call__(self, path, q=None, sort=None, limit=100, offset=0, **params):
+        self.calls.append({"path": path, "q": q, "sort": sort, "offset": offset})
+        records = list(self.records.values())
+        for clause in q or []:
+            name, _, value = clause.partition("=")
+            assert name == "updated_from"
+            records = [r for r in records if r["updated_at"] >= value]
+        if sort == "date_updated":
+            records.sort(key=lambda r: (r["updated_at"], r["id"]))
+        page = records[offset:offset + limit]
+        response = APIResponseMocker.paginated_response(page, total=len(records), per_page=limit)
+        if self.after_call:
+            self.after_call(self)
+        return response
+
+    def update(self, record_id, updated_at):
+        """Simulate a record being edited in LGL."""
+        self.records[record_id] = {**self.records[record_id], "updated_at": updated_at}
+
+
+class TestIncrementalSync:
+    """Test watermark handling of IncrementalSync."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client."""
+        return new_client(api_key="test_key")
+
+    def run(self, client, server, sync, resource="gifts"):
+        """Consume one sync run against the fake server."""
+        with patch.object(client._client, "_get", side_effect=server):
+            return [record.id for record in sync.changes(resource)]
+
+    def test_first_run_streams_everything_in_update_order(self, client):
+        """Test the initial run delivers all records and stores the high-water mark."""
+        server = FakeSearch([
+            gift(3, "2025-03-01T10:00:00Z"),
+            gift(1, "2025-03-01T09:00:00Z"),
+            gift(2, "2025-03-01T10:00:00Z"),
+        ])
+        sync = IncrementalSync(client)
+
+        assert self.run(client, server, sync) == [1, 2, 3]
+        assert server.calls[0]["q"] is None
+        assert server.calls[0]["sort"] == "date_updated"
+        assert sync.watermark("gifts") == Watermark(
+            datetime(2025, 3, 1, 10, tzinfo=timezone.utc), frozenset({2, 3})
+        )
+
+    def test_second_run_fetches_only_changes(self, client):
+        """Test later runs query from the watermark and emit only new changes."""
+        server = FakeSearch([gift(i, f"2025-03-01T10:00:0{i}Z") for i in range(1, 4)])
+        sync = IncrementalSync(client)
+        self.run(client, server, sync)
+
+        assert self.run(client, server, sync) == []
+        assert server.calls[-1]["q"] == ["updated_from=2025-03-01T10:00:03Z"]
+
+        server.update(1, "2025-03-02T08:00:00Z")
+        server.records[4] = gift(4, "2025-03-02T09:00:00Z")
+        assert self.run(client, server, sync) == [1, 4]
+
+    def test_equal_timestamps_at_boundary(self, client):
+        """Test records sharing the watermark second are neither missed nor duplicated."""
+        server = FakeSearch([gift(1, "2025-03-01T10:00:00Z"), gift(2, "2025-03-01T10:00:00Z")])
+        sync = IncrementalSync(client)
+        assert self.run(client, server, sync) == [1, 2]
+
+        # Created later within the same second as the watermark
+        server.records[3] = gift(3, "2025-03-01T10:00:00Z")
+        assert self.run(client, server, sync) == [3]
+        assert sync.watermark("gifts").boundary_ids == {1, 2, 3}
+
+    def test_ties_larger_than_a_page(self, client):
+        """Test a bulk update sharing one second across several pages terminates."""
+        server = FakeSearch([gift(i, "2025-03-01T10:00:00Z") for i in range(1, 8)]
+                            + [gift(8, "2025-03-01T10:00:01Z")])
+        sync = IncrementalSync(client, page_size=3)
+
+        assert self.run(client, server, sync) == list(range(1, 9))
+        assert self.run(client, server, sync) == []
+
+    def test_update_during_run_does_not_hide_records(self, client):
+        """Test an edit that reorders results mid-run cannot skip another record."""
+        server = FakeSearch([gift(i, f"2025-03-01T10:00:0{i}Z") for i in range(1, 7)])
+
+        def edit_after_first_page(fake):
+            fake.after_call = None
+            fake.update(1, "2025-03-01T11:00:00Z")
+
+        server.after_call = edit_after_first_page
+        sync = IncrementalSync(client, page_size=3)
+
+        delivered = self.run(client, server, sync)
+        assert sorted(set(delivered)) == [1, 2, 3, 4, 5, 6]
+        assert delivered.count(1) == 2  # original and edited versions
+
+    def test_stopping_early_resumes_without_gaps(self, client):
+        """Test an interrupted run re-emits from the last saved page."""
+        server = FakeSearch([gift(i, f"2025-03-01T10:00:0{i}Z") for i in range(1, 7)])
+        sync = IncrementalSync(client, page_size=2)
+
+        with patch.object(client._client, "_get", side_effect=server):
+            stream = sync.changes("gifts")
+            assert [next(stream).id for _ in range(3)] == [1, 2, 3]
+            stream.close()
+
+        assert self.run(client, server, sync) == [3, 4, 5, 6]
+
+    def test_scan_resources_filter_and_commit_at_end(self, client):
+        """Test volunteer times use updated_from and notes are filtered client-side."""
+        base = {"constituent_id": 1, "created_at": "2025-01-01T00:00:00Z"}
+        volunteer_server = FakeSearch([
+            {**base, "id": 1, "volunteering_category_id": 2, "updated_at": "2025-03-01T10:00:00Z"},
+            {**base, "id": 2, "volunteering_category_id": 2, "updated_at": "2025-03-02T10:00:00Z"},
+        ])
+        sync = IncrementalSync(client)
+        assert self.run(client, volunteer_server, sync, "volunteer_times") == [1, 2]
+        assert self.run(client, volunteer_server, sync, "volunteer_times") == []
+        assert volunteer_server.calls[-1]["path"] == "volunteer_times/search"
+        assert volunteer_server.calls[-1]["q"] == ["updated_from=2025-03-02T10:00:00Z"]
+
+        notes_server = FakeSearch([
+            {**base, "id": 1, "text": "a", "updated_at": "2025-03-01T10:00:00Z"},
+            {**base, "id": 2, "text": "b", "updated_at": "2025-03-02T10:00:00Z"},
+        ])
+        assert self.run(client, notes_server, sync, "notes") == [1, 2]
+        notes_server.update(1, "2025-03-03T10:00:00Z")
+        assert self.run(client, notes_server, sync, "notes") == [1]
+        assert all(call["q"] is None for call in notes_server.calls)
+
+    def test_file_store_round_trip(self, client, tmp_path):
+        """Test watermarks survive in a JSON state file."""
+        path = tmp_path / "sync.json"
+        server = FakeSearch([gift(1, "2025-03-01T10:00:00Z")])
+        self.run(client, server, IncrementalSync(client, FileSyncStateStore(path)))
+
+        resumed = IncrementalSync(client, FileSyncStateStore(path))
+        assert resumed.watermark("gifts").boundary_ids == {1}
+        assert self.run(client, server, resumed) == []
+
+        resumed.reset("gifts")
+        assert resumed.watermark("gifts") is None
+
+    def test_invalid_arguments(self, client):
+        """Test unknown resources and unsupported expand are rejected."""
+        sync = IncrementalSync(client, MemorySyncStateStore())
+        with pytest.raises(ValueError):
+            list(sync.changes("payment_types"))
+        with pytest.raises(ValueError):
+            list(sync.changes("notes", expand="custom_attrs"))
+        with pytest.raises(ValueError):
+            IncrementalSync(client, page_size=0)
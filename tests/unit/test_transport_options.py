@@ -0,0 +1,94 @@
+"""Tests for connection pool, timeout and transport configuration."""
+import pytest
+import httpx
+from unittest.mock import patch
+
+from lgl_client import new_async_client, new_client
+from lgl_client.lgl_api.client import BaseLGLClient, LGLClient
+
+# Captured at import time, before the autouse fixture in conftest patches it
+REAL_CLIENT = httpx.Client
+
+
+class TestTransportOptions:
+    """Test httpx client options exposed through new_client."""
+
+    def test_default_limits_sized_for_pagination(self, disable_live_api):
+        """Test the default pool keeps a connection per page worker."""
+        new_client(api_key="test_key", page_concurrency=32)
+
+        limits = disable_live_api.call_args.kwargs["limits"]
+        assert limits.max_keepalive_connections == 32
+        assert limits.max_connections == 64
+        assert limits.keepalive_expiry == 30.0
+
+        assert BaseLGLClient.default_limits().max_keepalive_connections == 10
+
+    def test_custom_limits_and_http2_passed_through(self, disable_live_api):
+        """Test explicit limits, http2 and transport reach httpx.Client."""
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        transport = httpx.MockTransport(lambda request: httpx.Response(200))
+
+        new_client(api_key="test_key", limits=limits, http2=True, transport=transport)
+
+        kwargs = disable_live_api.call_args.kwargs
+        assert kwargs["limits"] is limits
+        assert kwargs["http2"] is True
+        assert kwargs["transport"] is transport
+
+    def test_sync_http2_rejects_concurrent_workers(self, disable_live_api):
+        """Test the sync client refuses to share an HTTP/2 connection between threads."""
+        with pytest.raises(ValueError, match="http2=True"):
+            new_client(api_key="test_key", http2=True, page_concurrency=4)
+
+        lgl = new_client(api_key="test_key", http2=True)
+        assert lgl._client._resolve_concurrency(None) == 1
+        with pytest.raises(ValueError, match="http2=True"):
+            lgl._client._resolve_concurrency(4)
+        with pytest.raises(ValueError, match="http2=True"):
+            list(lgl.constituents.iter_all(concurrency=4))
+
+    def test_async_http2_allows_concurrent_pages(self):
+        """Test the async client keeps page concurrency with HTTP/2."""
+        pytest.importorskip("h2")
+        lgl = new_async_client(api_key="test_key", http2=True, page_concurrency=4)
+
+        assert lgl._client._resolve_concurrency(8) == 8
+
+    def test_split_connect_timeout(self, disable_live_api):
+        """Test connect_timeout produces an httpx.Timeout with a separate connect limit."""
+        new_client(api_key="test_key", timeout=30.0, connect_timeout=2.0)
+
+        timeout = disable_live_api.call_args.kwargs["timeout"]
+        assert isinstance(timeout, httpx.Timeout)
+        assert timeout.connect == 2.0
+        assert timeout.read == 30.0
+
+    def test_custom_transport_serves_requests(self):
+        """Test a real client routes requests through a custom transport."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.path)
+            return httpx.Response(200, json={"items": [{"id": 1, "name": "Cash"}]})
+
+        with patch("httpx.Client", REAL_CLIENT):
+            client = LGLClient("test_key", transport=httpx.MockTransport(handler))
+            assert client._get("payment_types") == {"items": [{"id": 1, "name": "Cash"}]}
+            client.close()
+
+        assert seen == ["/api/v1/payment_types"]
+
+    @pytest.mark.asyncio
+    async def test_async_client_accepts_transport(self):
+        """Test the async client accepts an async transport and pool limits."""
+        async def handler(request):
+            return httpx.Response(200, json={"items": []})
+
+        client = new_async_client(
+            api_key="test_key",
+            transport=httpx.MockTransport(handler),
+            limits=httpx.Limits(max_connections=4),
+        )
+        assert await client.payment_types.list() == []
+        await client.close()